@@ -14,6 +14,7 @@ DEFAULT_PROXY = env_config.DEFAULT_PROXY
 DEFAULT_API = env_config.DEFAULT_API
 GRAPHQL = env_config.GRAPHQL
 HISTORY_PROXY = env_config.HISTORY_PROXY
+CHAIN_SIMULATOR = env_config.CHAIN_SIMULATOR     # blocks are generated on demand rather than produced by the network
 # TODO: try to override the default issue token price with testnet definition to tidy code up
 DEFAULT_ISSUE_TOKEN_PRICE = env_config.DEFAULT_ISSUE_TOKEN_PRICE
 
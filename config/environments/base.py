@@ -29,6 +29,10 @@ class BaseEnvironmentSettings(BaseSettings):
         default="",
         description="DeepHistory proxy URL (optional)"
     )
+    CHAIN_SIMULATOR: bool = Field(
+        default=False,
+        description="The proxy is a chain simulator, whose blocks are generated on demand"
+    )
     
     # Wallet configuration
     DEFAULT_OWNER: str = Field(
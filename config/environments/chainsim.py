@@ -8,6 +8,7 @@ class ChainSimSettings(BaseEnvironmentSettings):
     DEFAULT_PROXY: str = "http://localhost:8085"
     DEFAULT_API: str = "http://localhost:3001"
     GRAPHQL: str = "https://graph.xexchange.com/graphql"
+    CHAIN_SIMULATOR: bool = True
 
     DEFAULT_OWNER: str = "wallets/C1.pem"
     DEFAULT_ADMIN: str = "wallets/C1.pem"
@@ -5,28 +5,63 @@ import config
 from contracts.contract_identities import DEXContractInterface
 from contracts.farm_contract import FarmContract
 from contracts.metastaking_contract import MetaStakingContract
-from contracts.pair_contract import PairContract
-from deploy.dex_structure import DeployStructure
+from contracts.pair_contract import (PairContract, AddLiquidityEvent, RemoveLiquidityEvent, SwapFixedInputEvent,
+                                     SwapFixedOutputEvent, SetCorrectReservesEvent)
+from events.farm_events import EnterFarmEvent, ExitFarmEvent, ClaimRewardsFarmEvent, SetTokenBalanceEvent
+from events.metastake_events import EnterMetastakeEvent, ExitMetastakeEvent, ClaimRewardsMetastakeEvent
+from deploy.dex_structure import ContractStructure, DeployStructure
+from utils.context_cache import ContextCache
 from utils.results_logger import ResultsLogger
-from utils.utils_tx import NetworkProviders
+from utils.utils_tx import NETWORK_CONFIG_CACHE, NetworkProviders
 from trackers.farm_economics_tracking import FarmEconomics, FarmAccountEconomics
 from trackers.pair_economics_tracking import PairEconomics
 from trackers.staking_economics_tracking import StakingEconomics
 from trackers.metastaking_economics_tracking import MetastakingEconomics
 from trackers.concrete_observer import Observable
 from utils.utils_chain import Account, BunchOfAccounts, WrapperAddress as Address
+from utils.utils_generic import lazy_property
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 
 class Context:
-    def __init__(self):
+    """Shared state of scenarios and tools. Accounts, network providers and each contract group load on first
+    access, so a tool reading a single contract address doesn't pay for loading the whole setup.
+    Resolved tokens, contract configs and the network config are kept in a ContextCache between runs."""
+
+    def __init__(self, use_cache: bool = True):
+        self.cache = ContextCache() if use_cache else None
+        # off for unattended runs: partially saved contract groups then load without asking
+        self.confirm_partial_loads = True
+        self.nonces_file = config.DEFAULT_WORKSPACE / "_nonces.json"
+        self.debug_level = 1
+
+        # logger
+        self.start_time = datetime.now()
+        self.results_logger = ResultsLogger(f"{self.start_time.day}_{self.start_time.hour}_{self.start_time.minute}_event_results.json")
+
+        self.init_event_parameters()
+
+        # scenarios subscribe the trackers with init_observers when asked to (--observe)
+        self.observable = Observable()
 
-        self.deploy_structure = DeployStructure()
-        self.network_provider = NetworkProviders(config.DEFAULT_API, config.DEFAULT_PROXY)
+    @lazy_property
+    def network_provider(self) -> NetworkProviders:
+        cached = self.cache.get_network_config(config.DEFAULT_PROXY) if self.cache else None
+        if cached:
+            NETWORK_CONFIG_CACHE.put(config.DEFAULT_PROXY, *cached)
+        network_provider = NetworkProviders(config.DEFAULT_API, config.DEFAULT_PROXY)
+        if self.cache and not cached:
+            self.cache.set_network_config(config.DEFAULT_PROXY, network_provider.network,
+                                          NETWORK_CONFIG_CACHE.get_epoch(config.DEFAULT_PROXY))
 
-        self.deployer_account = Account.from_file(config.DEFAULT_OWNER)
+        logger.info(f"Using proxy: {network_provider.proxy.url}")
+        return network_provider
+
+    @lazy_property
+    def deployer_account(self) -> Account:
+        deployer_account = Account.from_file(config.DEFAULT_OWNER)
 
         if "shadowfork" in config.DEFAULT_PROXY and config.SF_DEX_REFERENCE_ADDRESS:
             # get owner of the SF reference contract
@@ -37,24 +72,78 @@ class Context:
             config.DEX_ADMIN_ADDRESS = owner if not config.DEX_ADMIN_ADDRESS else config.DEX_ADMIN_ADDRESS
 
         if config.DEX_OWNER_ADDRESS:    # manual override only for shadowforks
-            self.deployer_account.address = Address(config.DEX_OWNER_ADDRESS)
+            deployer_account.address = Address(config.DEX_OWNER_ADDRESS)
+
+        deployer_account.sync_nonce(self.network_provider.proxy)
+        logger.info(f"Using owner: {deployer_account.address.bech32()}")
+        return deployer_account
 
+    @lazy_property
+    def admin_account(self) -> Account:
+        deployer_account = self.deployer_account    # resolves the shadowfork admin override as well
         if config.DEFAULT_ADMIN == config.DEFAULT_OWNER:
-            self.admin_account = self.deployer_account
+            admin_account = deployer_account
         else:
-            self.admin_account = Account.from_file(config.DEFAULT_ADMIN)
-            
+            admin_account = Account.from_file(config.DEFAULT_ADMIN)
+
         if config.DEX_ADMIN_ADDRESS:  # manual override only for shadowforks
-            self.admin_account.address = Address(config.DEX_ADMIN_ADDRESS)
+            admin_account.address = Address(config.DEX_ADMIN_ADDRESS)
 
-        self.accounts = BunchOfAccounts.load_accounts_from_files([config.DEFAULT_ACCOUNTS])
-        self.nonces_file = config.DEFAULT_WORKSPACE / "_nonces.json"
-        self.debug_level = 1
+        if admin_account is not deployer_account:
+            admin_account.sync_nonce(self.network_provider.proxy)
+        return admin_account
 
-        # logger
-        self.start_time = datetime.now()
-        self.results_logger = ResultsLogger(f"{self.start_time.day}_{self.start_time.hour}_{self.start_time.minute}_event_results.json")
+    @lazy_property
+    def accounts(self) -> BunchOfAccounts:
+        return BunchOfAccounts.load_accounts_from_files([config.DEFAULT_ACCOUNTS])
+
+    @lazy_property
+    def deploy_structure(self) -> DeployStructure:
+        deploy_structure = self.get_saved_deploy_structure()
 
+        if any(contracts.deploy_clean for contracts in deploy_structure.contracts.values()):
+            # groups configured for a clean deploy are deployed and started right away, as they always were
+            deploy_structure.deploy_structure(self.deployer_account, self.network_provider, False)
+            deploy_structure.start_deployed_contracts(self.deployer_account, self.network_provider, False)
+            deploy_structure.print_deployed_contracts()
+            return deploy_structure
+
+        self.set_contract_loaders(deploy_structure)
+        return deploy_structure
+
+    def get_saved_deploy_structure(self) -> DeployStructure:
+        """Deploy structure with the saved tokens; contract groups are not loaded yet."""
+        deploy_structure = DeployStructure()
+
+        # TOKENS HANDLING
+        tokens = self.cache.get_tokens() if self.cache else None
+        if tokens is not None:
+            deploy_structure.tokens = tokens
+        elif deploy_structure.load_deployed_tokens() and self.cache:
+            self.cache.set_tokens(deploy_structure.tokens)
+        return deploy_structure
+
+    def set_contract_loaders(self, deploy_structure: DeployStructure):
+        """CONTRACTS LOADING - each group loads its saved contracts on its first access."""
+        for contracts in deploy_structure.contracts.values():
+            contracts.loader = self.load_contracts
+
+    def load_contracts(self, contracts: ContractStructure):
+        """Loads the saved contracts of a group, from the context cache when the saves haven't changed since."""
+        cached_configs = self.cache.get_contract_configs(contracts.label) if self.cache else None
+        contract_configs = cached_configs if cached_configs is not None else contracts.get_saved_contract_configs()
+
+        if self.confirm_partial_loads:
+            contracts.load_deployed_contracts(contract_configs)
+        else:
+            contracts.deployed_contracts = contracts.get_saved_deployed_contracts(contract_configs)
+
+        # partial loads are left out, so they're confirmed again on the next run
+        if self.cache and cached_configs is None and len(contract_configs) == len(contracts.deploy_structure_list):
+            self.cache.set_contract_configs(contracts.label, contract_configs)
+
+    def init_event_parameters(self):
+        """Amount limits used by the event generators."""
         self.add_liquidity_max_amount = 0.1
         self.remove_liquidity_max_amount = 0.5
         self.numEvents = 100  # sys.maxsize
@@ -68,58 +157,42 @@ class Context:
         self.enter_metastake_max_amount = 0.1
         self.exit_metastake_max_amount = 0.3
 
-        # BEGIN DEPLOY
-        self.deployer_account.sync_nonce(self.network_provider.proxy)
-        self.admin_account.sync_nonce(self.network_provider.proxy)
-
-        # TOKENS HANDLING
-        self.deploy_structure.deploy_tokens(self.deployer_account, self.network_provider, False)
-
-        # configure contracts and deploy them
-        # DEPLOY CONTRACTS
-        self.deploy_structure.deploy_structure(self.deployer_account, self.network_provider, False)
-
-        # CONTRACTS START
-        self.deploy_structure.start_deployed_contracts(self.deployer_account, self.network_provider, False)
-
-        # deploy closing
-        self.deploy_structure.print_deployed_contracts()
-
-        self.observable = Observable()
-        # self.init_observers()     # call should be parameterized so that observers can be disabled programmatically
-
-        logger.info(f"Using proxy: {self.network_provider.proxy.url}")
-        logger.info(f"Using owner: {self.deployer_account.address.bech32()}")
-
-    def init_observers(self):
+    def init_observers(self, workers: int = 0):
+        """Subscribes the economics trackers to the events of their contracts.
+        With workers > 0, verifications run in the background instead of blocking the event generators."""
+        self.observable = Observable(workers)
+        farm_events = [EnterFarmEvent, ExitFarmEvent, ClaimRewardsFarmEvent]
 
         farm_unlocked_contracts = self.deploy_structure.contracts[config.FARMS_UNLOCKED].deployed_contracts
         for contract in farm_unlocked_contracts:
             contract_dict = contract.get_config_dict()
             observer = FarmEconomics(contract_dict['address'], contract_dict['version'], self.network_provider)
-            self.observable.subscribe(observer)
+            self.observable.subscribe(observer, contract_dict['address'], farm_events)
 
         farm_locked_contracts = self.deploy_structure.contracts[config.FARMS_LOCKED].deployed_contracts
         for contract in farm_locked_contracts:
             contract_dict = contract.get_config_dict()
             observer = FarmEconomics(contract_dict['address'], contract_dict['version'], self.network_provider)
-            self.observable.subscribe(observer)
+            self.observable.subscribe(observer, contract_dict['address'], farm_events)
 
         for acc in self.accounts.get_all():
             account_observer = FarmAccountEconomics(acc.address, self.network_provider)
-            self.observable.subscribe(account_observer)
+            self.observable.subscribe(account_observer, event_types=farm_events + [SetTokenBalanceEvent],
+                                      user_address=acc.address.to_bech32())
 
         pair_contracts = self.deploy_structure.contracts[config.PAIRS].deployed_contracts
         for contract in pair_contracts:
             contract_dict = contract.get_config_dict()
             observer = PairEconomics(contract_dict['address'], contract.firstToken, contract.secondToken, self.network_provider)
-            self.observable.subscribe(observer)
+            self.observable.subscribe(observer, contract_dict['address'],
+                                      [AddLiquidityEvent, RemoveLiquidityEvent, SwapFixedInputEvent,
+                                       SwapFixedOutputEvent, SetCorrectReservesEvent])
 
         staking_contracts = self.deploy_structure.contracts[config.STAKINGS].deployed_contracts
         for contract in staking_contracts:
             contract_dict = contract.get_config_dict()
             observer = StakingEconomics(contract_dict['address'], self.network_provider)
-            self.observable.subscribe(observer)
+            self.observable.subscribe(observer, contract_dict['address'], farm_events)
 
         metastaking_contracts = self.deploy_structure.contracts[config.METASTAKINGS].deployed_contracts
         for contract in metastaking_contracts:
@@ -128,7 +201,13 @@ class Context:
             pair_contract = self.get_pair_contract_by_address(contract_dict['lp_address'])
             observer = MetastakingEconomics(contract_dict['address'], contract_dict['stake_address'],
                                             farm_contract, pair_contract, self.network_provider)
-            self.observable.subscribe(observer)
+            self.observable.subscribe(observer, contract_dict['address'],
+                                      [SetCorrectReservesEvent, EnterMetastakeEvent, ExitMetastakeEvent,
+                                       ClaimRewardsMetastakeEvent])
+
+    def close_observers(self):
+        """Waits for the pending background verifications and stops the observer lanes."""
+        self.observable.close()
 
     def get_slippaged_below_value(self, value: int):
         return value - int(value * self.pair_slippage)
@@ -207,4 +286,4 @@ class Context:
         return random.choice(self.deploy_structure.get_deployed_contracts(config.METASTAKINGS))
 
     def get_contract_index(self, contract_label: str, contract):
-        return self.deploy_structure.get_deployed_contracts(contract_label).index(contract)
+        return self.deploy_structure.get_deployed_contract_index(contract_label, contract)
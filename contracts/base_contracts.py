@@ -21,7 +21,7 @@ logger = get_logger(__name__)
 class BaseBoostedContract(DEXContractInterface, ABC):
     
     def get_user_total_farm_position(self, user_address: str, proxy: ProxyNetworkProvider) -> int:
-        data_fetcher = BaseBoostedContractDataFetcher(Address(self.address), proxy.url)
+        data_fetcher = BaseBoostedContractDataFetcher.for_contract(Address(self.address), proxy.url)
         raw_results = data_fetcher.get_data('getUserTotalFarmPosition', [AddressValue.new_from_address(Address(user_address))])
         if not raw_results:
             return 0
@@ -30,7 +30,7 @@ class BaseBoostedContract(DEXContractInterface, ABC):
         return user_farm_position
     
     def get_current_week(self, proxy: ProxyNetworkProvider) -> int:
-        data_fetcher = BaseBoostedContractDataFetcher(Address(self.address), proxy.url)
+        data_fetcher = BaseBoostedContractDataFetcher.for_contract(Address(self.address), proxy.url)
         raw_results = data_fetcher.get_data('getCurrentWeek')
         if not raw_results:
             return 0
@@ -39,7 +39,7 @@ class BaseBoostedContract(DEXContractInterface, ABC):
         return current_week
     
     def get_first_week_start_epoch(self, proxy: ProxyNetworkProvider) -> int:
-        data_fetcher = BaseBoostedContractDataFetcher(Address(self.address), proxy.url)
+        data_fetcher = BaseBoostedContractDataFetcher.for_contract(Address(self.address), proxy.url)
         raw_results = data_fetcher.get_data('getFirstWeekStartEpoch')
         if not raw_results:
             return 0
@@ -55,7 +55,7 @@ class BaseBoostedContract(DEXContractInterface, ABC):
         return next_week_at_epoch
     
     def get_last_global_update_week(self, proxy: ProxyNetworkProvider) -> int:
-        data_fetcher = BaseBoostedContractDataFetcher(Address(self.address), proxy.url)
+        data_fetcher = BaseBoostedContractDataFetcher.for_contract(Address(self.address), proxy.url)
         raw_results = data_fetcher.get_data('getLastGlobalUpdateWeek')
         if not raw_results:
             return 0
@@ -64,7 +64,7 @@ class BaseBoostedContract(DEXContractInterface, ABC):
         return result
     
     def get_user_energy_for_week(self, user_address: str, proxy: ProxyNetworkProvider, week: int) -> Dict[str, Any]:
-        data_fetcher = BaseBoostedContractDataFetcher(Address(self.address), proxy.url)
+        data_fetcher = BaseBoostedContractDataFetcher.for_contract(Address(self.address), proxy.url)
         raw_results = data_fetcher.get_data('getUserEnergyForWeek', [AddressValue.new_from_address(Address(user_address)), U64Value(week)])
         if not raw_results:
             return {}
@@ -73,7 +73,7 @@ class BaseBoostedContract(DEXContractInterface, ABC):
         return user_energy_for_week
     
     def get_last_active_week_for_user(self, user_address: str, proxy: ProxyNetworkProvider) -> int:
-        data_fetcher = BaseBoostedContractDataFetcher(Address(self.address), proxy.url)
+        data_fetcher = BaseBoostedContractDataFetcher.for_contract(Address(self.address), proxy.url)
         raw_results = data_fetcher.get_data('getLastActiveWeekForUser', [AddressValue.new_from_address(Address(user_address))])
         if not raw_results:
             return 0
@@ -82,7 +82,7 @@ class BaseBoostedContract(DEXContractInterface, ABC):
         return week
     
     def get_current_claim_progress_for_user(self, user_address: str, proxy: ProxyNetworkProvider) -> Dict[str, Any]:
-        data_fetcher = BaseBoostedContractDataFetcher(Address(self.address), proxy.url)
+        data_fetcher = BaseBoostedContractDataFetcher.for_contract(Address(self.address), proxy.url)
         raw_results = data_fetcher.get_data('getCurrentClaimProgress', [AddressValue.new_from_address(Address(user_address))])
         if not raw_results:
             return {}
@@ -91,49 +91,49 @@ class BaseBoostedContract(DEXContractInterface, ABC):
         return response
     
     def get_farm_supply_for_week(self, proxy: ProxyNetworkProvider, week: int) -> int:
-        data_fetcher = BaseBoostedContractDataFetcher(Address(self.address), proxy.url)
+        data_fetcher = BaseBoostedContractDataFetcher.for_contract(Address(self.address), proxy.url)
         raw_results = data_fetcher.get_data('getFarmSupplyForWeek', [U64Value(week)])
         if not raw_results:
             return 0
         return int(raw_results)
     
     def get_total_locked_tokens_for_week(self, proxy: ProxyNetworkProvider, week: int) -> int:
-        data_fetcher = BaseBoostedContractDataFetcher(Address(self.address), proxy.url)
+        data_fetcher = BaseBoostedContractDataFetcher.for_contract(Address(self.address), proxy.url)
         raw_results = data_fetcher.get_data('getTotalLockedTokensForWeek', [U64Value(week)])
         if not raw_results:
             return 0
         return int(raw_results)
 
     def get_accumulated_rewards_for_week(self, proxy: ProxyNetworkProvider, week: int) -> int:
-        data_fetcher = BaseBoostedContractDataFetcher(Address(self.address), proxy.url)
+        data_fetcher = BaseBoostedContractDataFetcher.for_contract(Address(self.address), proxy.url)
         raw_results = data_fetcher.get_data('getAccumulatedRewardsForWeek', [U64Value(week)])
         if not raw_results:
             return 0
         return int(raw_results)
     
     def get_total_energy_for_week(self, proxy: ProxyNetworkProvider, week: int) -> int:
-        data_fetcher = BaseBoostedContractDataFetcher(Address(self.address), proxy.url)
+        data_fetcher = BaseBoostedContractDataFetcher.for_contract(Address(self.address), proxy.url)
         raw_results = data_fetcher.get_data('getTotalEnergyForWeek', [U64Value(week)])
         if not raw_results:
             return 0
         return int(raw_results)
     
     def get_total_rewards_for_week(self, proxy: ProxyNetworkProvider, week: int) -> int:
-        data_fetcher = BaseBoostedContractDataFetcher(Address(self.address), proxy.url)
+        data_fetcher = BaseBoostedContractDataFetcher.for_contract(Address(self.address), proxy.url)
         raw_results = data_fetcher.get_data('getTotalRewardsForWeek', [U64Value(week)])
         if not raw_results:
             return 0
         return int(raw_results)
     
     def get_remaining_boosted_rewards_to_distribute(self, proxy: ProxyNetworkProvider, week: int) -> int:
-        data_fetcher = BaseBoostedContractDataFetcher(Address(self.address), proxy.url)
+        data_fetcher = BaseBoostedContractDataFetcher.for_contract(Address(self.address), proxy.url)
         raw_results = data_fetcher.get_data('getRemainingBoostedRewardsToDistribute', [U64Value(week)])
         if not raw_results:
             return 0
         return int(raw_results)
     
     def get_undistributed_boosted_rewards(self, proxy: ProxyNetworkProvider, week: int) -> int:
-        data_fetcher = BaseBoostedContractDataFetcher(Address(self.address), proxy.url)
+        data_fetcher = BaseBoostedContractDataFetcher.for_contract(Address(self.address), proxy.url)
         raw_results = data_fetcher.get_data('getUndistributedBoostedRewards', [U64Value(week)])
         if not raw_results:
             return 0
@@ -176,70 +176,70 @@ class BaseBoostedContract(DEXContractInterface, ABC):
 class BaseFarmContract(DEXContractInterface, ABC):
     
     def get_farm_token_supply(self, proxy: ProxyNetworkProvider) -> int:
-        data_fetcher = BaseFarmContractDataFetcher(Address(self.address), proxy.url)
+        data_fetcher = BaseFarmContractDataFetcher.for_contract(Address(self.address), proxy.url)
         raw_results = data_fetcher.get_data('getFarmTokenSupply')
         if not raw_results:
             return 0
         return int(raw_results)
     
     def get_reward_reserve(self, proxy: ProxyNetworkProvider) -> int:
-        data_fetcher = BaseFarmContractDataFetcher(Address(self.address), proxy.url)
+        data_fetcher = BaseFarmContractDataFetcher.for_contract(Address(self.address), proxy.url)
         raw_results = data_fetcher.get_data('getRewardReserve')
         if not raw_results:
             return 0
         return int(raw_results)
     
     def get_last_reward_block_nonce(self, proxy: ProxyNetworkProvider) -> int:
-        data_fetcher = BaseFarmContractDataFetcher(Address(self.address), proxy.url)
+        data_fetcher = BaseFarmContractDataFetcher.for_contract(Address(self.address), proxy.url)
         raw_results = data_fetcher.get_data('getLastRewardBlockNonce')
         if not raw_results:
             return 0
         return int(raw_results)
 
     def get_last_reward_timestamp(self, proxy: ProxyNetworkProvider) -> int:
-        data_fetcher = BaseFarmContractDataFetcher(Address(self.address), proxy.url)
+        data_fetcher = BaseFarmContractDataFetcher.for_contract(Address(self.address), proxy.url)
         raw_results = data_fetcher.get_data('getLastRewardTimestamp')
         if not raw_results:
             return 0
         return int(raw_results)
     
     def get_per_block_reward_amount(self, proxy: ProxyNetworkProvider) -> int:
-        data_fetcher = BaseFarmContractDataFetcher(Address(self.address), proxy.url)
+        data_fetcher = BaseFarmContractDataFetcher.for_contract(Address(self.address), proxy.url)
         raw_results = data_fetcher.get_data('getPerBlockRewardAmount')
         if not raw_results:
             return 0
         return int(raw_results)
     
     def get_reward_per_share(self, proxy: ProxyNetworkProvider) -> int:
-        data_fetcher = BaseFarmContractDataFetcher(Address(self.address), proxy.url)
+        data_fetcher = BaseFarmContractDataFetcher.for_contract(Address(self.address), proxy.url)
         raw_results = data_fetcher.get_data('getRewardPerShare')
         if not raw_results:
             return 0
         return int(raw_results)
     
     def get_division_safety_constant(self, proxy: ProxyNetworkProvider) -> int:
-        data_fetcher = BaseFarmContractDataFetcher(Address(self.address), proxy.url)
+        data_fetcher = BaseFarmContractDataFetcher.for_contract(Address(self.address), proxy.url)
         raw_results = data_fetcher.get_data('getDivisionSafetyConstant')
         if not raw_results:
             return 0
         return int(raw_results)
     
     def get_farm_token_id(self, proxy: ProxyNetworkProvider) -> str:
-        data_fetcher = BaseFarmContractDataFetcher(Address(self.address), proxy.url)
+        data_fetcher = BaseFarmContractDataFetcher.for_contract(Address(self.address), proxy.url)
         raw_results = data_fetcher.get_data('getFarmTokenId')
         if not raw_results:
             return ""
         return hex_to_string(raw_results)
     
     def get_farming_token_id(self, proxy: ProxyNetworkProvider) -> str:
-        data_fetcher = BaseFarmContractDataFetcher(Address(self.address), proxy.url)
+        data_fetcher = BaseFarmContractDataFetcher.for_contract(Address(self.address), proxy.url)
         raw_results = data_fetcher.get_data('getFarmingTokenId')
         if not raw_results:
             return ""
         return hex_to_string(raw_results)
     
     def get_state(self, proxy: ProxyNetworkProvider) -> int:
-        data_fetcher = BaseFarmContractDataFetcher(Address(self.address), proxy.url)
+        data_fetcher = BaseFarmContractDataFetcher.for_contract(Address(self.address), proxy.url)
         raw_results = data_fetcher.get_data('getState')
         if not raw_results:
             return 0
@@ -282,7 +282,7 @@ class BaseSCWhitelistContract(DEXContractInterface, ABC):
         return endpoint_call(proxy, gas_limit, deployer, Address(self.address), "removeSCAddressFromWhitelist", sc_args)
     
     def is_contract_whitelisted(self, address: str, proxy: ProxyNetworkProvider) -> bool:
-        data_fetcher = BaseContractWhitelistDataFetcher(Address(self.address), proxy.url)
+        data_fetcher = BaseContractWhitelistDataFetcher.for_contract(Address(self.address), proxy.url)
         raw_results = data_fetcher.get_data('isSCAddressWhitelisted', [AddressValue.new_from_address(Address(address))])
         if not raw_results:
             return False
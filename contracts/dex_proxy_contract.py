@@ -116,7 +116,7 @@ class DexProxyContract(DEXContractInterface):
 
     @classmethod
     def load_contract_by_address(cls, address: str):
-        data_fetcher = ProxyContractDataFetcher(Address(address), config.DEFAULT_PROXY)
+        data_fetcher = ProxyContractDataFetcher.for_contract(Address(address), config.DEFAULT_PROXY)
         locked_tokens = [hex_to_string(res) for res in data_fetcher.get_data("getLockedTokenIds")]
         token = hex_to_string(data_fetcher.get_data("getAssetTokenId"))
         proxy_lp_token = data_fetcher.get_data("getWrappedLpTokenId")
@@ -52,7 +52,7 @@ class FarmContract(BaseFarmContract, BaseBoostedContract, BaseSCWhitelistContrac
 
     @classmethod
     def load_contract_by_address(cls, address: str):
-        data_fetcher = FarmContractDataFetcher(Address(address), config.DEFAULT_PROXY)
+        data_fetcher = FarmContractDataFetcher.for_contract(Address(address), config.DEFAULT_PROXY)
         farming_token = hex_to_string(data_fetcher.get_data("getFarmingTokenId"))
         farm_token = hex_to_string(data_fetcher.get_data("getFarmTokenId"))
         farmed_token = hex_to_string(data_fetcher.get_data("getRewardTokenId"))
@@ -490,7 +490,7 @@ class FarmContract(BaseFarmContract, BaseBoostedContract, BaseSCWhitelistContrac
         return endpoint_call(proxy, gas_limit, deployer, Address(self.address), "endProduceRewards", sc_args)
 
     def get_lp_address(self, proxy: ProxyNetworkProvider) -> str:
-        data_fetcher = FarmContractDataFetcher(Address(self.address), proxy.url)
+        data_fetcher = FarmContractDataFetcher.for_contract(Address(self.address), proxy.url)
         raw_results = data_fetcher.get_data('getPairContractManagedAddress')
         if not raw_results:
             return ""
@@ -499,7 +499,7 @@ class FarmContract(BaseFarmContract, BaseBoostedContract, BaseSCWhitelistContrac
         return address
     
     def get_permissions(self, address: str, proxy: ProxyNetworkProvider) -> int:
-        data_fetcher = FarmContractDataFetcher(Address(self.address), proxy.url)
+        data_fetcher = FarmContractDataFetcher.for_contract(Address(self.address), proxy.url)
         raw_results = data_fetcher.get_data('getPermissions', [AddressValue.new_from_address(Address(address))])
         if not raw_results:
             return -1
@@ -355,7 +355,7 @@ class FeesCollectorContract(BaseBoostedContract):
             list[str]: List of reward token addresses
         """
         
-        data_fetcher = FeeCollectorContractDataFetcher(Address(self.address), proxy.url)
+        data_fetcher = FeeCollectorContractDataFetcher.for_contract(Address(self.address), proxy.url)
         hex_results = data_fetcher.get_data("getRewardTokens")
         if not hex_results:
             return []
@@ -369,7 +369,7 @@ class FeesCollectorContract(BaseBoostedContract):
             int: accumulated fees for token
         """
         
-        data_fetcher = FeeCollectorContractDataFetcher(Address(self.address), proxy.url)
+        data_fetcher = FeeCollectorContractDataFetcher.for_contract(Address(self.address), proxy.url)
         current_week = self.get_current_week(proxy)
         result = data_fetcher.get_data("getAccumulatedFees", [U64Value(current_week), StringValue(token)])
         if not result:
@@ -383,7 +383,7 @@ class FeesCollectorContract(BaseBoostedContract):
         Returns:
             list[TokenPayment]: List of reward tokens
         """        
-        data_fetcher = FeeCollectorContractDataFetcher(Address(self.address), proxy.url)
+        data_fetcher = FeeCollectorContractDataFetcher.for_contract(Address(self.address), proxy.url)
         hex_results = data_fetcher.get_data("getTotalRewardsForWeek", [U64Value(week)])
         if not hex_results:
             return []
@@ -399,7 +399,7 @@ class FeesCollectorContract(BaseBoostedContract):
         Returns:
             int: rewards claimed for week
         """
-        data_fetcher = FeeCollectorContractDataFetcher(Address(self.address), proxy.url)
+        data_fetcher = FeeCollectorContractDataFetcher.for_contract(Address(self.address), proxy.url)
         result = data_fetcher.get_data("getRewardsClaimed", [U64Value(week), StringValue(token)])
         if not result:
             return 0
@@ -412,7 +412,7 @@ class FeesCollectorContract(BaseBoostedContract):
         Returns:
             list[str]: List of known contract addresses
         """
-        data_fetcher = FeeCollectorContractDataFetcher(Address(self.address), proxy.url)
+        data_fetcher = FeeCollectorContractDataFetcher.for_contract(Address(self.address), proxy.url)
         hex_results = data_fetcher.get_data("getAllKnownContracts")
         if not hex_results:
             return []
@@ -131,7 +131,7 @@ class LiquidLockingContract(DEXContractInterface):
         return endpoint_call(proxy, gas_limit, user, Address(self.address), "unbond", sc_args)
     
     def get_locked_token_amounts(self, proxy: ProxyNetworkProvider, user_address: str) -> Dict[str, Any]:
-        data_fetcher = LiquidLockingContractDataFetcher(Address(self.address), proxy.url)
+        data_fetcher = LiquidLockingContractDataFetcher.for_contract(Address(self.address), proxy.url)
         raw_results = data_fetcher.get_data('lockedTokenAmounts', [AddressValue.new_from_address(Address(user_address))])
         if not raw_results:
             return {}
@@ -140,7 +140,7 @@ class LiquidLockingContract(DEXContractInterface):
         return locked_token_amounts
     
     def get_unlocked_token_amounts(self, proxy: ProxyNetworkProvider, user_address: str) -> Dict[str, Any]:
-        data_fetcher = LiquidLockingContractDataFetcher(Address(self.address), proxy.url)
+        data_fetcher = LiquidLockingContractDataFetcher.for_contract(Address(self.address), proxy.url)
         raw_results = data_fetcher.get_data('unlockedTokenAmounts', [AddressValue.new_from_address(Address(user_address))])
         if not raw_results:
             return {}
@@ -149,7 +149,7 @@ class LiquidLockingContract(DEXContractInterface):
         return unlocked_token_amounts
     
     def get_locked_tokens(self, proxy: ProxyNetworkProvider, user_address: str) -> Dict[str, Any]:
-        data_fetcher = LiquidLockingContractDataFetcher(Address(self.address), proxy.url)
+        data_fetcher = LiquidLockingContractDataFetcher.for_contract(Address(self.address), proxy.url)
         raw_results = data_fetcher.get_data('lockedTokens', [AddressValue.new_from_address(Address(user_address))])
         if not raw_results:
             return {}
@@ -158,7 +158,7 @@ class LiquidLockingContract(DEXContractInterface):
         return locked_tokens
 
     def get_unlocked_tokens(self, proxy: ProxyNetworkProvider, user_address: str) -> Dict[str, Any]:
-        data_fetcher = LiquidLockingContractDataFetcher(Address(self.address), proxy.url)
+        data_fetcher = LiquidLockingContractDataFetcher.for_contract(Address(self.address), proxy.url)
         raw_results = data_fetcher.get_data('unlockedTokens', [AddressValue.new_from_address(Address(user_address))])
         if not raw_results:
             return {}
@@ -167,7 +167,7 @@ class LiquidLockingContract(DEXContractInterface):
         return unlocked_tokens
     
     def get_whitelisted_tokens(self, proxy: ProxyNetworkProvider, user_address: str) -> Dict[str, Any]:
-        data_fetcher = LiquidLockingContractDataFetcher(Address(self.address), proxy.url)
+        data_fetcher = LiquidLockingContractDataFetcher.for_contract(Address(self.address), proxy.url)
         raw_results = data_fetcher.get_data('whitelistedTokens')
         if not raw_results:
             return {}
@@ -176,7 +176,7 @@ class LiquidLockingContract(DEXContractInterface):
         return tokens
     
     def get_unbond_period(self, proxy: ProxyNetworkProvider, user_address: str) -> Dict[str, Any]:
-        data_fetcher = LiquidLockingContractDataFetcher(Address(self.address), proxy.url)
+        data_fetcher = LiquidLockingContractDataFetcher.for_contract(Address(self.address), proxy.url)
         raw_results = data_fetcher.get_data('unbondPeriod')
 
         return raw_results
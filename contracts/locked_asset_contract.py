@@ -38,7 +38,7 @@ class LockedAssetContract(DEXContractInterface):
 
     @classmethod
     def load_contract_by_address(cls, address: str):
-        data_fetcher = LockedAssetContractDataFetcher(Address(address), config.DEFAULT_PROXY)
+        data_fetcher = LockedAssetContractDataFetcher.for_contract(Address(address), config.DEFAULT_PROXY)
         base_token = hex_to_string(data_fetcher.get_data("getAssetTokenId"))
         locked_token = hex_to_string(data_fetcher.get_data("getLockedAssetTokenId"))
 
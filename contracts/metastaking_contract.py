@@ -64,7 +64,7 @@ class MetaStakingContract(BaseSCWhitelistContract, BasePermissionsHubContract):
 
     @classmethod
     def load_contract_by_address(cls, address: str, version=MetaStakingContractVersion.V3Boosted):
-        data_fetcher = MetaStakingContractDataFetcher(Address(address), config.DEFAULT_PROXY)
+        data_fetcher = MetaStakingContractDataFetcher.for_contract(Address(address), config.DEFAULT_PROXY)
 
         staking_token = hex_to_string(data_fetcher.get_data("getStakingTokenId"))
         lp_token = hex_to_string(data_fetcher.get_data("getLpTokenId"))
@@ -269,7 +269,7 @@ class MetaStakingContract(BaseSCWhitelistContract, BasePermissionsHubContract):
                              [energy_address])
     
     def get_energy_factory_address(self, proxy: ProxyNetworkProvider) -> str:
-        data_fetcher = MetaStakingContractDataFetcher(Address(self.address), proxy.url)
+        data_fetcher = MetaStakingContractDataFetcher.for_contract(Address(self.address), proxy.url)
         raw_results = data_fetcher.get_data('getEnergyFactoryAddress')
         if not raw_results:
             return ""
@@ -283,7 +283,7 @@ class MetaStakingContract(BaseSCWhitelistContract, BasePermissionsHubContract):
         Proxy usage requires to know the holder address."""
         metastake_token_on_network = proxy.get_token_of_account(Address(holder_address), Token(self.metastake_token, token_nonce))
          
-        decoded_attributes = decode_merged_attributes(metastake_token_on_network.attributes.hex(), METASTAKE_TOKEN_ATTRIBUTES)
+        decoded_attributes = decode_merged_attributes(metastake_token_on_network.attributes, METASTAKE_TOKEN_ATTRIBUTES)
         logger.debug(f'Metastake Tokens: {decoded_attributes}')
 
         return decoded_attributes
@@ -295,15 +295,15 @@ class MetaStakingContract(BaseSCWhitelistContract, BasePermissionsHubContract):
         decoded_attributes = self.get_decoded_metastake_token_attributes_from_proxy(proxy, holder_address, token_nonce)
 
         farm_token_on_network = proxy.get_token_of_account(Address(self.address), Token(self.farm_token, decoded_attributes.get('lp_farm_token_nonce')))
-        farm_token_decoded_attributes = decode_merged_attributes(farm_token_on_network.attributes.hex(), FARM_TOKEN_ATTRIBUTES)
+        farm_token_decoded_attributes = decode_merged_attributes(farm_token_on_network.attributes, FARM_TOKEN_ATTRIBUTES)
         logger.debug(f'Underlying Farm Tokens: {farm_token_decoded_attributes}')
 
         stake_token_on_network = proxy.get_token_of_account(Address(self.address), Token(self.stake_token, decoded_attributes.get('staking_farm_token_nonce')))
         try:
-            stake_token_decoded_attributes = decode_merged_attributes(stake_token_on_network.attributes.hex(), STAKE_V2_TOKEN_ATTRIBUTES)
+            stake_token_decoded_attributes = decode_merged_attributes(stake_token_on_network.attributes, STAKE_V2_TOKEN_ATTRIBUTES)
         except ValueError as e:
             # handle for old stake token attributes
-            stake_token_decoded_attributes = decode_merged_attributes(stake_token_on_network.attributes.hex(), STAKE_V1_TOKEN_ATTRIBUTES)
+            stake_token_decoded_attributes = decode_merged_attributes(stake_token_on_network.attributes, STAKE_V1_TOKEN_ATTRIBUTES)
         logger.debug(f'Underlying Stake Tokens: {stake_token_decoded_attributes}')
 
         return decoded_attributes, farm_token_decoded_attributes, stake_token_decoded_attributes
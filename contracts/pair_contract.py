@@ -86,7 +86,7 @@ class PairContract(DEXContractInterface):
 
     @classmethod
     def load_contract_by_address(cls, address: str, version=PairContractVersion.V2, proxy_contract=None):
-        data_fetcher = PairContractDataFetcher(Address(address), config.DEFAULT_PROXY)
+        data_fetcher = PairContractDataFetcher.for_contract(Address(address), config.DEFAULT_PROXY)
         first_token = hex_to_string(data_fetcher.get_data("getFirstTokenId"))
         second_token = hex_to_string(data_fetcher.get_data("getSecondTokenId"))
         lp_token = hex_to_string(data_fetcher.get_data("getLpTokenIdentifier"))
@@ -445,7 +445,7 @@ class PairContract(DEXContractInterface):
         return endpoint_call(proxy, gas_limit, deployer, Address(self.address), "setStateActiveNoSwaps", sc_args)
     
     def get_safe_price_round_save_interval(self, proxy: ProxyNetworkProvider):
-        data_fetcher = PairContractDataFetcher(Address(self.address), proxy.url)
+        data_fetcher = PairContractDataFetcher.for_contract(Address(self.address), proxy.url)
         return data_fetcher.get_data("getSafePriceRoundSaveInterval")
 
     def contract_start(self, deployer: Account, proxy: ProxyNetworkProvider, args: list = []):
@@ -110,7 +110,7 @@ class PermissionsHubContract(DEXContractInterface):
         return endpoint_call(proxy, gas_limit, deployer, Address(self.address), "removeBlacklist", sc_args)
     
     def is_whitelisted(self, user: str, address: str, proxy: ProxyNetworkProvider) -> bool:
-        data_fetcher = PermissionsHubContractDataFetcher(Address(self.address), proxy.url)
+        data_fetcher = PermissionsHubContractDataFetcher.for_contract(Address(self.address), proxy.url)
         raw_results = data_fetcher.get_data('isWhitelisted', 
                                             [
                                                 AddressValue.new_from_address(Address(address)),
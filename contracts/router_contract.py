@@ -349,17 +349,17 @@ class RouterContract(DEXContractInterface):
         return endpoint_call(proxy, gas_limit, deployer, Address(self.address), "setDefaultSafePriceRoundsOffset", sc_args)
     
     def get_pair_template_address(self, proxy: ProxyNetworkProvider):
-        router_data_fetcher = RouterContractDataFetcher(Address(self.address), proxy.url)
+        router_data_fetcher = RouterContractDataFetcher.for_contract(Address(self.address), proxy.url)
         template_pair_address = Address.from_hex(router_data_fetcher.get_data("getPairTemplateAddress")).bech32()
         return template_pair_address
 
     def get_safe_price_round_save_interval(self, proxy: ProxyNetworkProvider):
-        router_data_fetcher = RouterContractDataFetcher(Address(self.address), proxy.url)
+        router_data_fetcher = RouterContractDataFetcher.for_contract(Address(self.address), proxy.url)
         interval = router_data_fetcher.get_data("getSafePriceRoundSaveInterval")
         return int(interval)
 
     def get_default_safe_price_rounds_offset(self, proxy: ProxyNetworkProvider):
-        router_data_fetcher = RouterContractDataFetcher(Address(self.address), proxy.url)
+        router_data_fetcher = RouterContractDataFetcher.for_contract(Address(self.address), proxy.url)
         offset = router_data_fetcher.get_data("getDefaultSafePriceRoundsOffset")
         return int(offset)
 
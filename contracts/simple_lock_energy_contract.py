@@ -47,7 +47,7 @@ class SimpleLockEnergyContract(DEXContractInterface):
 
     @classmethod
     def load_contract_by_address(cls, address: str):
-        data_fetcher = SimpleLockEnergyContractDataFetcher(Address(address), config.DEFAULT_PROXY)
+        data_fetcher = SimpleLockEnergyContractDataFetcher.for_contract(Address(address), config.DEFAULT_PROXY)
         base_token = hex_to_string(data_fetcher.get_data("getBaseAssetTokenId"))
         locked_token = hex_to_string(data_fetcher.get_data("getLockedTokenId"))
 
@@ -571,7 +571,7 @@ class SimpleLockEnergyContract(DEXContractInterface):
         log_substep(f"Locked Farm token: {self.farm_proxy_token}")
 
     def get_lock_options(self, proxy: ProxyNetworkProvider) -> List[Dict[str, Any]]:
-        data_fetcher = SimpleLockEnergyContractDataFetcher(Address(self.address), proxy.url)
+        data_fetcher = SimpleLockEnergyContractDataFetcher.for_contract(Address(self.address), proxy.url)
         raw_result = data_fetcher.get_data("getLockOptions")
         if not raw_result:
             return []
@@ -582,7 +582,7 @@ class SimpleLockEnergyContract(DEXContractInterface):
         return decoded_results
 
     def get_energy_for_user(self, proxy: ProxyNetworkProvider, user_address: str) -> Dict[str, Any]:
-        data_fetcher = SimpleLockEnergyContractDataFetcher(Address(self.address), proxy.url)
+        data_fetcher = SimpleLockEnergyContractDataFetcher.for_contract(Address(self.address), proxy.url)
         raw_results = data_fetcher.get_data('getEnergyEntryForUser', [AddressValue.new_from_address(Address(user_address))])
         if not raw_results:
             return {}
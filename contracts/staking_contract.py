@@ -58,7 +58,7 @@ class StakingContract(BaseFarmContract, BaseBoostedContract, BaseSCWhitelistCont
 
     @classmethod
     def load_contract_by_address(cls, address: str, version=StakingContractVersion.V3Boosted):
-        data_fetcher = StakingContractDataFetcher(Address(address), config.DEFAULT_PROXY)
+        data_fetcher = StakingContractDataFetcher.for_contract(Address(address), config.DEFAULT_PROXY)
         farming_token = hex_to_string(data_fetcher.get_data("getFarmingTokenId"))
         farm_token = hex_to_string(data_fetcher.get_data("getFarmTokenId"))
         max_apr = data_fetcher.get_data("getAnnualPercentageRewards")
@@ -457,28 +457,28 @@ class StakingContract(BaseFarmContract, BaseBoostedContract, BaseSCWhitelistCont
         return endpoint_call(proxy, gas_limit, deployer, Address(self.address), "updateOwnerOrAdmin", sc_args)
     
     def get_reward_capacity(self, proxy: ProxyNetworkProvider) -> int:
-        data_fetcher = StakingContractDataFetcher(Address(self.address), proxy.url)
+        data_fetcher = StakingContractDataFetcher.for_contract(Address(self.address), proxy.url)
         raw_results = data_fetcher.get_data('getRewardCapacity')
         if not raw_results:
             return 0
         return int(raw_results)
     
     def get_accumulated_rewards(self, proxy: ProxyNetworkProvider) -> int:
-        data_fetcher = StakingContractDataFetcher(Address(self.address), proxy.url)
+        data_fetcher = StakingContractDataFetcher.for_contract(Address(self.address), proxy.url)
         raw_results = data_fetcher.get_data('getAccumulatedRewards')
         if not raw_results:
             return 0
         return int(raw_results)
 
     def get_max_apr(self, proxy: ProxyNetworkProvider) -> int:
-        data_fetcher = StakingContractDataFetcher(Address(self.address), proxy.url)
+        data_fetcher = StakingContractDataFetcher.for_contract(Address(self.address), proxy.url)
         raw_results = data_fetcher.get_data('getAnnualPercentageRewards')
         if not raw_results:
             return 0
         return int(raw_results)
     
     def get_permissions(self, address: str, proxy: ProxyNetworkProvider) -> int:
-        data_fetcher = StakingContractDataFetcher(Address(self.address), proxy.url)
+        data_fetcher = StakingContractDataFetcher.for_contract(Address(self.address), proxy.url)
         raw_results = data_fetcher.get_data('getPermissions', [AddressValue.new_from_address(Address(address))])
         if not raw_results:
             return -1
@@ -491,14 +491,14 @@ class StakingContract(BaseFarmContract, BaseBoostedContract, BaseSCWhitelistCont
         farm_token_on_network = proxy.get_token_of_account(Address(holder_address), Token(self.farm_token, token_nonce))
 
         try:
-            farm_token_decoded_attributes = decode_merged_attributes(farm_token_on_network.attributes.hex(), STAKE_V2_TOKEN_ATTRIBUTES)
+            farm_token_decoded_attributes = decode_merged_attributes(farm_token_on_network.attributes, STAKE_V2_TOKEN_ATTRIBUTES)
         except ValueError as e:
             try:
                 # handle for old stake token attributes
-                farm_token_decoded_attributes = decode_merged_attributes(farm_token_on_network.attributes.hex(), STAKE_V1_TOKEN_ATTRIBUTES)
+                farm_token_decoded_attributes = decode_merged_attributes(farm_token_on_network.attributes, STAKE_V1_TOKEN_ATTRIBUTES)
             except ValueError as e:
                 # unstake token
-                farm_token_decoded_attributes = decode_merged_attributes(farm_token_on_network.attributes.hex(), STAKE_UNBOND_TOKEN_ATTRIBUTES)
+                farm_token_decoded_attributes = decode_merged_attributes(farm_token_on_network.attributes, STAKE_UNBOND_TOKEN_ATTRIBUTES)
 
         logger.debug(f'Farm Tokens: {farm_token_decoded_attributes}')
 
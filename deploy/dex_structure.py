@@ -1,7 +1,8 @@
+import threading
 import time
 from argparse import ArgumentParser
 from pathlib import Path
-from typing import List, Type, Dict, Optional
+from typing import Callable, List, Type, Dict, Optional
 
 import config
 from contracts.escrow_contract import EscrowContract
@@ -47,10 +48,37 @@ class ContractStructure:
         self.label = label
         self.contract_class = contract_class
         self.deploy_structure_list = populate_deploy_lists.populate_list(config.DEPLOY_STRUCTURE_JSON, label)
-        self.deployed_contracts: List[contract_class] = []
+        self._deployed_contracts: List[contract_class] = []
         self.deploy_clean = deploy_clean
         self.deploy_function = deploy_function
         self.bytecode = bytecode_path
+        # when set, called once to fill the deployed contracts on their first access
+        self.loader: Optional[Callable[[ContractStructure], None]] = None
+        self._load_lock = threading.RLock()
+        self._loading = False
+        # address -> position in deployed contracts, for the list object and length it was built from
+        self._address_index: Dict[str, int] = {}
+        self._indexed_contracts: Optional[list] = None
+        self._indexed_count = 0
+
+    @property
+    def deployed_contracts(self) -> List[DEXContractInterface]:
+        if self.loader is not None:
+            with self._load_lock:
+                # the loader itself may read the contracts; it sees them as they are so far
+                if self.loader is not None and not self._loading:
+                    self._loading = True
+                    try:
+                        self.loader(self)
+                        self.loader = None
+                    finally:
+                        self._loading = False
+        return self._deployed_contracts
+
+    @deployed_contracts.setter
+    def deployed_contracts(self, contracts: List[DEXContractInterface]):
+        self.loader = None
+        self._deployed_contracts = contracts
 
     def save_deployed_contracts(self):
         if self.deployed_contracts:
@@ -64,13 +92,16 @@ class ContractStructure:
             write_json_file(filepath, dump)
             log_step_pass(f"Saved deployed {self.label} contracts.")
 
-    def get_saved_deployed_contracts(self) -> list:
-        contracts_list = []
+    def get_saved_contract_configs(self) -> list:
         filepath = config.DEFAULT_CONFIG_SAVE_PATH / f"deployed_{self.label}.json"
         if not Path(filepath).is_file():    # no config available
             return []
 
-        retrieved_contract_configs = read_json_file(filepath)
+        return read_json_file(filepath)
+
+    def get_saved_deployed_contracts(self, contract_configs: Optional[list] = None) -> list:
+        contracts_list = []
+        retrieved_contract_configs = self.get_saved_contract_configs() if contract_configs is None else contract_configs
 
         for contract_config in retrieved_contract_configs:
             contract = self.contract_class.load_config_dict(contract_config)
@@ -78,22 +109,37 @@ class ContractStructure:
 
         return contracts_list
 
-    def get_deployed_contract_by_address(self, address: str) -> Optional[DEXContractInterface]:
-        found_contract = None
-        for contract in self.deployed_contracts:
-            if contract.address == address:
-                found_contract = contract
-                break
+    def _get_address_index(self, rebuild: bool = False) -> Dict[str, int]:
+        # deployed contracts are appended to or replaced from outside, so the index follows the list it was built for
+        contracts = self.deployed_contracts
+        if rebuild or contracts is not self._indexed_contracts or len(contracts) != self._indexed_count:
+            address_index = {}
+            for position, contract in enumerate(contracts):
+                address_index.setdefault(contract.address, position)
+            self._address_index, self._indexed_contracts, self._indexed_count = address_index, contracts, len(contracts)
+        return self._address_index
 
-        return found_contract
+    def get_deployed_contract_by_address(self, address: str) -> Optional[DEXContractInterface]:
+        position = self._get_address_index().get(address)
+        if position is not None and self.deployed_contracts[position].address != address:
+            # a contract got a new address in place since indexing
+            position = self._get_address_index(rebuild=True).get(address)
+        return None if position is None else self.deployed_contracts[position]
+
+    def get_deployed_contract_index(self, contract: DEXContractInterface) -> int:
+        """Position of the contract in the deployed contracts; raises ValueError if not there, like list.index."""
+        position = self._get_address_index().get(contract.address)
+        if position is not None and self.deployed_contracts[position] is contract:
+            return position
+        return self.deployed_contracts.index(contract)
 
     def get_deployed_contract_by_index(self, index: int) -> Optional[DEXContractInterface]:
         if index+1 > len(self.deployed_contracts):
             return None
         return self.deployed_contracts[index]
 
-    def load_deployed_contracts(self):
-        contracts_list = self.get_saved_deployed_contracts()
+    def load_deployed_contracts(self, contract_configs: Optional[list] = None):
+        contracts_list = self.get_saved_deployed_contracts(contract_configs)
         if len(self.deploy_structure_list) != len(contracts_list):
             log_warning(f"Uneven length of {self.label} deployed contracts! Attempt partial load?")
             if not get_continue_confirmation(config.FORCE_CONTINUE_PROMPT):
@@ -449,6 +495,9 @@ class DeployStructure:
     def get_deployed_contract_by_address(self, label: str, address: str):
         return self.contracts[label].get_deployed_contract_by_address(address)
 
+    def get_deployed_contract_index(self, label: str, contract: DEXContractInterface) -> int:
+        return self.contracts[label].get_deployed_contract_index(contract)
+
     # CONTRACT DEPLOYERS ------------------------------
     def egld_wrap_deploy(self, contracts_index: str, deployer_account: Account, network_providers: NetworkProviders):
         contract_structure = self.contracts[contracts_index]
@@ -1,18 +1,34 @@
+import copy
 import json
+import os
+from typing import Dict, Tuple
+
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# parsed structure files by path, kept until the file changes; every contract group reads the same structure file
+_loaded_files: Dict[str, Tuple[Tuple[int, int], dict]] = {}
 
-def load_json_as_dict(json_file: str) -> json:
-    with open(json_file, 'r') as file:
-        json_dict = json.load(file)
 
-    return json_dict
+def _get_loaded_file(json_file: str) -> dict:
+    stat = os.stat(json_file)
+    file_key = (stat.st_mtime_ns, stat.st_size)
+    entry = _loaded_files.get(str(json_file))
+    if entry is None or entry[0] != file_key:
+        with open(json_file, 'r') as file:
+            entry = (file_key, json.load(file))
+        _loaded_files[str(json_file)] = entry
+    return entry[1]
+
+
+def load_json_as_dict(json_file: str) -> json:
+    # callers own their copy, the deploy functions may alter the structure entries
+    return copy.deepcopy(_get_loaded_file(json_file))
 
 
 def populate_list(json_file: str, key: str) -> list:
-    json_dict = load_json_as_dict(json_file)
+    json_dict = _get_loaded_file(json_file)
     values = []
 
     if key not in json_dict:
@@ -20,20 +36,20 @@ def populate_list(json_file: str, key: str) -> list:
         return values
 
     for i in range(len(json_dict[key])):
-        values.append(json_dict[key][i])
+        values.append(copy.deepcopy(json_dict[key][i]))
 
     return values
 
 
 def get_token_prefix(json_file: str) -> str:
-    json_dict = load_json_as_dict(json_file)
+    json_dict = _get_loaded_file(json_file)
 
     prefix = json_dict['token']['token_prefix']
     return prefix
 
 
 def get_number_of_tokens(json_file: str) -> int:
-    json_dict = load_json_as_dict(json_file)
+    json_dict = _get_loaded_file(json_file)
 
     number_of_tokens = json_dict['token']['number_of_tokens']
     return number_of_tokens
@@ -0,0 +1,271 @@
+import importlib
+import multiprocessing
+import queue
+import random
+import threading
+import time
+import traceback
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from multiversx_sdk import Transaction
+
+import config
+from context import Context
+from deploy.dex_structure import ContractStructure, DeployStructure
+from utils.benchmark import LatencyHistogram
+from utils.logger import get_logger
+from utils.results_logger import ResultsLogger
+from utils.utils_chain import Account, BunchOfAccounts, NonceManager
+from utils.utils_generic import lazy_property, log_step_fail
+from utils.utils_tx import add_tx_listener
+
+logger = get_logger(__name__)
+
+STRESS_EXECUTOR_REPORT_INTERVAL = 30   # seconds between progress reports of the coordinator
+STRESS_EXECUTOR_JOIN_TIMEOUT = 60      # seconds to wait for workers to wind down after a stop
+
+# (pem file, pem index) of an account, enough for a worker to load its own keys
+AccountRef = Tuple[str, int]
+
+
+class WorkerContext(Context):
+    """Context for a stress worker process: holds only the accounts the worker owns and loads the saved contracts
+    of the given labels without prompting, as a worker can't answer prompts."""
+
+    def __init__(self, account_refs: List[AccountRef], worker_id: int = 0,
+                 labels: Optional[List[str]] = None, parameters: Optional[Dict[str, Any]] = None):
+        super().__init__()
+        self.labels = labels
+        self.confirm_partial_loads = False
+
+        self.accounts = BunchOfAccounts([Account(pem_file=pem_file, pem_index=pem_index)
+                                         for pem_file, pem_index in account_refs])
+        self.nonces_file = config.DEFAULT_WORKSPACE / f"_nonces_{worker_id}.json"
+        self.results_logger = ResultsLogger(f"{self.start_time.day}_{self.start_time.hour}_{self.start_time.minute}"
+                                            f"_worker_{worker_id}_event_results.json")
+        for name, value in (parameters or {}).items():
+            setattr(self, name, value)
+
+    @lazy_property
+    def deploy_structure(self) -> DeployStructure:
+        # the coordinator already deployed any group configured for a clean deploy, workers only load the saves
+        deploy_structure = self.get_saved_deploy_structure()
+        self.set_contract_loaders(deploy_structure)
+        return deploy_structure
+
+    def load_contracts(self, contracts: ContractStructure):
+        if self.labels is not None and contracts.label not in self.labels:
+            contracts.deployed_contracts = []
+            return
+        super().load_contracts(contracts)
+
+
+class _SendCounter:
+    """Counts the transactions sent and accepted per sender in a worker process."""
+
+    def __init__(self):
+        self.sent: Dict[str, int] = {}
+        self.accepted: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def on_built(self, tx: Transaction, build_time: float, sign_time: float):
+        pass
+
+    def on_sent(self, transactions: List[Transaction], hashes: List[str], send_time: float):
+        with self._lock:
+            for tx, tx_hash in zip(transactions, hashes):
+                sender = tx.sender.to_bech32()
+                self.sent[sender] = self.sent.get(sender, 0) + 1
+                if tx_hash:
+                    self.accepted[sender] = self.accepted.get(sender, 0) + 1
+
+    def get(self, sender: str) -> Tuple[int, int]:
+        with self._lock:
+            return self.sent.get(sender, 0), self.accepted.get(sender, 0)
+
+
+def load_job(job: str) -> Callable[[Context, Account], Any]:
+    """Resolves a job given as 'module:function', e.g. 'scenarios.stress_create_positions:stress_per_account'."""
+    module_name, _, function_name = job.partition(":")
+    return getattr(importlib.import_module(module_name), function_name)
+
+
+def run_worker(worker_id: int, account_refs: List[AccountRef], job: str, threads: int, repeats: int,
+               parameters: Dict[str, Any], labels: Optional[List[str]],
+               results: multiprocessing.Queue, stop_event: multiprocessing.Event):
+    """Worker process entry point. Runs the job on the worker's own accounts, each account used by
+    at most one thread at a time, and streams a result per job to the coordinator."""
+    try:
+        context = WorkerContext(account_refs, worker_id, labels, parameters)
+        job_function = load_job(job)
+        accounts = context.accounts.get_all()
+        # the worker is the only sender for its accounts, so its nonce manager is authoritative
+        NonceManager(context.network_provider.proxy).manage(accounts)
+    except Exception as ex:
+        results.put({"type": "error", "worker": worker_id, "error": f"{ex}\n{traceback.format_exc()}"})
+        results.put({"type": "done", "worker": worker_id, "jobs": 0})
+        return
+
+    counter = _SendCounter()
+    add_tx_listener(counter)
+    free_accounts: "queue.Queue[Account]" = queue.Queue()
+    for account in random.sample(accounts, len(accounts)):
+        free_accounts.put(account)
+
+    def run_job():
+        account = free_accounts.get()
+        address = account.address.to_bech32()
+        sent_before, accepted_before = counter.get(address)
+        start = time.perf_counter()
+        error = ""
+        try:
+            job_function(context, account)
+        except Exception as ex:
+            error = str(ex)
+        finally:
+            free_accounts.put(account)
+        sent, accepted = counter.get(address)
+        results.put({"type": "job", "worker": worker_id, "account": address, "shard": account.address.get_shard(),
+                     "duration": time.perf_counter() - start, "error": error,
+                     "sent": sent - sent_before, "accepted": accepted - accepted_before})
+
+    submitted = 0
+    try:
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            futures = set()
+            while not stop_event.is_set() and (repeats == 0 or submitted < repeats):
+                if len(futures) >= threads:
+                    done, futures = wait(futures, return_when=FIRST_COMPLETED)
+                futures.add(executor.submit(run_job))
+                submitted += 1
+            wait(futures)
+    except KeyboardInterrupt:
+        stop_event.set()
+    results.put({"type": "done", "worker": worker_id, "jobs": submitted})
+
+
+class StressReport:
+    """Aggregates the job results streamed by the workers."""
+
+    def __init__(self):
+        self.jobs = 0
+        self.failed_jobs = 0
+        self.sent = 0
+        self.accepted = 0
+        self.by_worker: Dict[int, Dict[str, int]] = {}
+        self.by_shard: Dict[int, Dict[str, int]] = {}
+        self.durations = LatencyHistogram()
+        self.started_at = time.monotonic()
+
+    def add(self, result: Dict[str, Any]):
+        self.jobs += 1
+        self.failed_jobs += 1 if result["error"] else 0
+        self.sent += result["sent"]
+        self.accepted += result["accepted"]
+        self.durations.record(result["duration"])
+        for totals in (self.by_worker.setdefault(result["worker"], {"jobs": 0, "accepted": 0}),
+                       self.by_shard.setdefault(result["shard"], {"jobs": 0, "accepted": 0})):
+            totals["jobs"] += 1
+            totals["accepted"] += result["accepted"]
+
+    def report(self) -> str:
+        elapsed = time.monotonic() - self.started_at
+        durations = self.durations.to_dict()
+        lines = [f"{self.jobs} jobs ({self.failed_jobs} failed) in {elapsed:.0f}s; {self.accepted}/{self.sent} "
+                 f"transactions accepted, {self.accepted / max(elapsed, 1e-9):.1f} tx/s"]
+        if self.durations.count:
+            lines.append(f"job duration: p50 {durations['p50_ms'] / 1000:.1f}s, p99 {durations['p99_ms'] / 1000:.1f}s")
+        lines += [f"worker {worker}: {totals['jobs']} jobs, {totals['accepted']} transactions"
+                  for worker, totals in sorted(self.by_worker.items())]
+        lines += [f"shard {shard}: {totals['jobs']} jobs, {totals['accepted']} transactions"
+                  for shard, totals in sorted(self.by_shard.items())]
+        return "\n".join(lines)
+
+
+class StressExecutor:
+    """Runs a stress job across worker processes, each owning a disjoint, shard-balanced share of the accounts.
+
+    Workers load only their own accounts and the saved deploy structure, and are the only senders for their accounts,
+    so nonces never collide across processes. Job results stream back to the coordinator for aggregation."""
+
+    def __init__(self, accounts: BunchOfAccounts, job: str, processes: int = 0, threads: int = 1,
+                 parameters: Optional[Dict[str, Any]] = None, labels: Optional[List[str]] = None):
+        self.processes = max(1, min(processes or multiprocessing.cpu_count(), len(accounts)))
+        self.partitions = accounts.partition(self.processes)
+        self.job = job
+        self.threads = threads
+        self.parameters = parameters or {}
+        self.labels = labels
+        self.report = StressReport()
+
+        # spawned rather than forked, so workers don't inherit the coordinator's threads and connections
+        self._mp = multiprocessing.get_context("spawn")
+        self.results = self._mp.Queue()
+        self.stop_event = self._mp.Event()
+
+    def run(self, repeats: int = 0, report_interval: float = STRESS_EXECUTOR_REPORT_INTERVAL) -> StressReport:
+        """Runs until repeats jobs are done in total (0 - until interrupted)."""
+        load_job(self.job)   # fail fast on a bad job reference
+        workers = []
+        for worker_id, partition in enumerate(self.partitions):
+            worker_repeats = repeats // self.processes + (1 if worker_id < repeats % self.processes else 0)
+            if repeats and not worker_repeats:
+                continue
+            refs = [(account.pem_file, account.pem_index) for account in partition.get_all()]
+            worker = self._mp.Process(target=run_worker, name=f"stress-worker-{worker_id}",
+                                      args=(worker_id, refs, self.job, self.threads, worker_repeats,
+                                            self.parameters, self.labels, self.results, self.stop_event))
+            worker.start()
+            workers.append(worker)
+        logger.info(f"Started {len(workers)} stress workers with {self.threads} threads each.")
+
+        running = len(workers)
+        last_report = time.monotonic()
+        try:
+            while running:
+                try:
+                    result = self.results.get(timeout=1)
+                except queue.Empty:
+                    if not any(worker.is_alive() for worker in workers):
+                        log_step_fail("All stress workers exited without reporting completion.")
+                        break
+                    continue
+
+                if self._handle(result):
+                    running -= 1
+                if time.monotonic() - last_report >= report_interval:
+                    logger.info(self.report.report())
+                    last_report = time.monotonic()
+        except KeyboardInterrupt:
+            logger.info("Stopping stress workers...")
+        finally:
+            self.stop_event.set()
+            self._join(workers)
+
+        logger.info(self.report.report())
+        return self.report
+
+    def _handle(self, result: Dict[str, Any]) -> bool:
+        """Processes a streamed result. Returns True if it marks a finished worker."""
+        if result["type"] == "job":
+            self.report.add(result)
+            if result["error"]:
+                log_step_fail(f"Worker {result['worker']} job failed for {result['account']}: {result['error']}")
+        elif result["type"] == "error":
+            log_step_fail(f"Worker {result['worker']} failed to start: {result['error']}")
+        return result["type"] == "done"
+
+    def _join(self, workers: List[multiprocessing.Process]):
+        # keep draining, a worker can't exit while its results are still queued
+        deadline = time.monotonic() + STRESS_EXECUTOR_JOIN_TIMEOUT
+        while any(worker.is_alive() for worker in workers) and time.monotonic() < deadline:
+            try:
+                self._handle(self.results.get(timeout=1))
+            except queue.Empty:
+                pass
+        for worker in workers:
+            if worker.is_alive():
+                log_step_fail(f"{worker.name} didn't stop in time, terminating it.")
+                worker.terminate()
+            worker.join()
@@ -0,0 +1,239 @@
+import hashlib
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+
+from multiversx_sdk import (Address, ProxyNetworkProvider, SmartContractTransactionsFactory, Transaction,
+                            TransactionsFactoryConfig)
+
+from contracts.farm_contract import FarmContract
+from contracts.pair_contract import PairContract
+from utils.logger import get_logger
+from utils.utils_chain import Account, get_esdt_inventory, sign_transactions
+from utils.utils_generic import log_step_fail
+from utils.utils_tx import (BROADCAST_CHUNK_SIZE, BROADCAST_MIN_RATE, TX_LISTENERS, ESDTToken,
+                            TransactionBroadcaster, TxStatusTracker, encode_unsigned_number, get_network_config,
+                            notify_tx_built)
+
+logger = get_logger(__name__)
+
+WORKLOAD_MIX = {
+    "swap_fixed_input": 40,
+    "add_liquidity": 20,
+    "remove_liquidity": 15,
+    "enter_farm": 15,
+    "exit_farm": 10,
+}
+WORKLOAD_GAS_LIMITS = {
+    "swap_fixed_input": 20000000,
+    "add_liquidity": 20000000,
+    "remove_liquidity": 20000000,
+    "enter_farm": 50000000,
+    "exit_farm": 50000000,
+}
+WORKLOAD_MIN_AMOUNT = 10 ** 4     # token atoms per transfer
+WORKLOAD_MAX_AMOUNT = 10 ** 6
+WORKLOAD_SYNC_WORKERS = 20
+
+# endpoint, payment tokens and encoded endpoint arguments of a workload transaction
+Call = Tuple[str, List[ESDTToken], List[bytes]]
+
+MIN_OUT = encode_unsigned_number(1)
+
+
+class WorkloadItem:
+    """One pre-built transaction of a workload, with the event and contract it was generated for."""
+    __slots__ = ("event", "contract", "tx", "build_time")
+
+    def __init__(self, event: str, contract: str, tx: Transaction, build_time: float = 0.0):
+        self.event = event
+        self.contract = contract
+        self.tx = tx
+        self.build_time = build_time
+
+
+def parse_workload_mix(value: str) -> Dict[str, int]:
+    """Parses a mix given as 'event=weight,...', e.g. 'swap_fixed_input=3,enter_farm=1'."""
+    mix = {}
+    for part in filter(None, value.split(",")):
+        event, _, weight = part.partition("=")
+        event = event.strip()
+        if event not in WORKLOAD_MIX:
+            raise ValueError(f"Unknown workload event: {event}. Known: {', '.join(WORKLOAD_MIX)}")
+        mix[event] = int(weight or 1)
+    return mix
+
+
+class WorkloadGenerator:
+    """Builds a whole stress workload up front, then replays it at a controlled rate.
+
+    Events, accounts, contracts and amounts are drawn from a seeded generator and nonces are assigned locally, so
+    the same seed and chain state always give the same workload. No balances are queried per event: amounts are
+    small random transfers, assuming accounts were funded beforehand (e.g. by stress_create_positions).
+    The only chain reads are the account nonces and, for exit_farm, the farm positions held at build time; exits
+    built earlier in the workload are deducted from those positions, so they're never over-drawn."""
+
+    def __init__(self, proxy: ProxyNetworkProvider, accounts: List[Account],
+                 pairs: List[PairContract], farms: List[FarmContract], seed: int = 0,
+                 mix: Optional[Dict[str, int]] = None,
+                 min_amount: int = WORKLOAD_MIN_AMOUNT, max_amount: int = WORKLOAD_MAX_AMOUNT):
+        self.proxy = proxy
+        self.accounts = accounts
+        self.pairs = pairs
+        self.farms = farms
+        self.seed = seed
+        self.min_amount = min_amount
+        self.max_amount = max_amount
+        self.network_config = get_network_config(proxy)
+        self.factory = SmartContractTransactionsFactory(TransactionsFactoryConfig(chain_id=self.network_config.chain_id))
+        # (account, farm token) -> {identifier: [nonce, balance left to exit]}, for the workload being built
+        self._positions: Dict[Tuple[str, str], Dict[str, List[int]]] = {}
+
+        self.builders: Dict[str, Tuple[list, Callable[[random.Random, Account, object], Optional[Call]]]] = {
+            "swap_fixed_input": (pairs, self._swap_fixed_input),
+            "add_liquidity": (pairs, self._add_liquidity),
+            "remove_liquidity": (pairs, self._remove_liquidity),
+            "enter_farm": (farms, self._enter_farm),
+            "exit_farm": (farms, self._exit_farm),
+        }
+        # events without contracts to target are dropped from the mix
+        self.mix = {event: weight for event, weight in (mix or WORKLOAD_MIX).items()
+                    if weight > 0 and self.builders[event][0]}
+        if not self.mix:
+            raise ValueError("Workload mix has no events with contracts to target")
+
+    def _amount(self, rng: random.Random) -> int:
+        return rng.randint(self.min_amount, self.max_amount)
+
+    def _swap_fixed_input(self, rng: random.Random, account: Account, pair: PairContract) -> Optional[Call]:
+        token_in, token_out = (pair.firstToken, pair.secondToken) if rng.random() < 0.5 else \
+            (pair.secondToken, pair.firstToken)
+        return "swapTokensFixedInput", [ESDTToken(token_in, 0, self._amount(rng))], [token_out.encode(), MIN_OUT]
+
+    def _add_liquidity(self, rng: random.Random, account: Account, pair: PairContract) -> Optional[Call]:
+        tokens = [ESDTToken(pair.firstToken, 0, self._amount(rng)), ESDTToken(pair.secondToken, 0, self._amount(rng))]
+        return "addLiquidity", tokens, [MIN_OUT, MIN_OUT]
+
+    def _remove_liquidity(self, rng: random.Random, account: Account, pair: PairContract) -> Optional[Call]:
+        return "removeLiquidity", [ESDTToken(pair.lpToken, 0, self._amount(rng))], [MIN_OUT, MIN_OUT]
+
+    def _enter_farm(self, rng: random.Random, account: Account, farm: FarmContract) -> Optional[Call]:
+        return "enterFarm", [ESDTToken(farm.farmingToken, 0, self._amount(rng))], []
+
+    def _get_positions(self, account: Account, farm: FarmContract) -> Dict[str, List[int]]:
+        key = (account.address.to_bech32(), farm.farmToken)
+        if key not in self._positions:
+            entries = get_esdt_inventory(key[0], self.proxy).get_entries(farm.farmToken)
+            self._positions[key] = {identifier: [int(entry.get('nonce', 0)), int(entry.get('balance', 0))]
+                                    for identifier, entry in entries.items() if int(entry.get('balance', 0)) > 0}
+        return self._positions[key]
+
+    def _exit_farm(self, rng: random.Random, account: Account, farm: FarmContract) -> Optional[Call]:
+        positions = self._get_positions(account, farm)
+        if not positions:
+            return None
+        identifier = rng.choice(sorted(positions))
+        nonce, balance = positions[identifier]
+        amount = min(balance, self._amount(rng))
+        if amount < balance:
+            positions[identifier][1] = balance - amount
+        else:
+            del positions[identifier]
+        return "exitFarm", [ESDTToken(farm.farmToken, nonce, amount)], []
+
+    def _sync_nonces(self) -> Dict[str, int]:
+        def fetch(account: Account) -> int:
+            return self.proxy.get_account(account.address).nonce
+
+        with ThreadPoolExecutor(max_workers=WORKLOAD_SYNC_WORKERS) as executor:
+            nonces = list(executor.map(fetch, self.accounts))
+        return {account.address.to_bech32(): nonce for account, nonce in zip(self.accounts, nonces)}
+
+    def build(self, count: int) -> List[WorkloadItem]:
+        """Builds count unsigned transactions with consecutive nonces per sender."""
+        rng = random.Random(self.seed)
+        nonces = self._sync_nonces()
+        self._positions = {}
+        events = list(self.mix)
+        weights = [self.mix[event] for event in events]
+
+        items: List[WorkloadItem] = []
+        for _ in range(count):
+            start = time.perf_counter()
+            event = rng.choices(events, weights)[0]
+            account = rng.choice(self.accounts)
+            contracts, builder = self.builders[event]
+            contract = rng.choice(contracts)
+
+            call = builder(rng, account, contract)
+            if call is None and event == "exit_farm":
+                # no position to exit at build time, so create one instead
+                event = "enter_farm"
+                call = self._enter_farm(rng, account, contract)
+
+            endpoint, tokens, args = call
+            tx = self.factory.create_transaction_for_execute(
+                account.address,
+                Address.new_from_bech32(contract.address),
+                endpoint,
+                WORKLOAD_GAS_LIMITS[event],
+                args,
+                0,
+                [token.to_token_transfer() for token in tokens]
+            )
+            sender = account.address.to_bech32()
+            tx.nonce = nonces[sender]
+            nonces[sender] += 1
+            items.append(WorkloadItem(event, contract.address, tx, time.perf_counter() - start))
+
+        # keep the accounts usable for regular sends after the workload
+        for account in self.accounts:
+            account.nonce = nonces[account.address.to_bech32()]
+
+        logger.info(f"Built workload of {len(items)} transactions from seed {self.seed}: "
+                    f"{summarize_workload(items)}")
+        return items
+
+    def sign(self, items: List[WorkloadItem]) -> List[WorkloadItem]:
+        start = time.perf_counter()
+        sign_transactions([item.tx for item in items], self.accounts)
+        if TX_LISTENERS and items:
+            # signed in bulk, so each transaction gets the average
+            sign_time = (time.perf_counter() - start) / len(items)
+            for item in items:
+                notify_tx_built(item.tx, item.build_time, sign_time)
+        return items
+
+    def replay(self, items: List[WorkloadItem], tps: float,
+               tracker: Optional[TxStatusTracker] = None) -> List[str]:
+        """Broadcasts the signed workload at no more than tps transactions per second.
+        Returns the hashes aligned with the items; empty for transactions that were never accepted."""
+        broadcaster = TransactionBroadcaster(self.proxy, rate=tps,
+                                             chunk_size=max(1, min(BROADCAST_CHUNK_SIZE, int(tps))),
+                                             min_rate=min(BROADCAST_MIN_RATE, tps), max_rate=tps,
+                                             tracker=tracker)
+        hashes = broadcaster.broadcast([item.tx for item in items])
+
+        # later nonces of a sender wait in the mempool behind a dropped one
+        stalled = {item.tx.sender.to_bech32() for item, tx_hash in zip(items, hashes) if not tx_hash}
+        if stalled:
+            log_step_fail(f"{len(stalled)} senders have dropped transactions; "
+                          f"their later workload transactions will not execute")
+        return hashes
+
+
+def summarize_workload(items: List[WorkloadItem]) -> Dict[str, int]:
+    summary: Dict[str, int] = {}
+    for item in items:
+        summary[item.event] = summary.get(item.event, 0) + 1
+    return summary
+
+
+def get_workload_fingerprint(items: List[WorkloadItem]) -> str:
+    """Hash of the workload content, nonces and signatures excluded, to check that two runs replay the same load."""
+    digest = hashlib.sha256()
+    for item in items:
+        digest.update(f"{item.event}|{item.tx.sender.to_bech32()}|{item.tx.receiver.to_bech32()}|".encode())
+        digest.update(item.tx.data)
+    return digest.hexdigest()
@@ -50,7 +50,7 @@ def main(cli_args: List[str]):
 
         transactions.append(transaction)
 
-    broadcast_transactions(transactions, proxy, 10, confirm_yes=True)
+    return broadcast_transactions(transactions, proxy, 10, confirm_yes=True)
 
 
 if __name__ == "__main__":
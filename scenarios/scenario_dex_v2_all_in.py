@@ -33,9 +33,13 @@ def main(cli_args: List[str]):
     parser.add_argument("--threads", required=False, default="2")  # number of concurrent threads to execute operations
     parser.add_argument("--repeats", required=False, default="0")  # number of total operations to execute; 0 - infinite
     parser.add_argument("--skip-minting", action="store_true", default=True)
+    parser.add_argument("--observe", action="store_true", default=False)  # verify events with the economics trackers
+    parser.add_argument("--observer-workers", required=False, default="0")  # background verification lanes; 0 - inline
     args = parser.parse_args(cli_args)
 
     context = Context()
+    if args.observe:
+        context.init_observers(int(args.observer_workers))
 
     if not args.skip_minting:
         send_tokens(context)
@@ -46,7 +50,10 @@ def main(cli_args: List[str]):
     create_nonce_file(context)
 
     # stress generator
-    scenarios(context, int(args.threads), int(args.repeats))
+    try:
+        scenarios(context, int(args.threads), int(args.repeats))
+    finally:
+        context.close_observers()
 
 
 def create_nonce_file(context: Context):
@@ -24,21 +24,33 @@ from utils.contract_data_fetchers import PairContractDataFetcher
 from utils.utils_generic import log_step_pass, log_step_fail
 from ported_arrows.stress.send_token_from_minter import main as send_token_from_minter
 from ported_arrows.stress.send_egld_from_minter import main as send_egld_from_minter
-from utils.utils_chain import Account, WrapperAddress as Address, nominated_amount
+from events.stress_executor import StressExecutor
+from utils.utils_chain import Account, BunchOfAccounts, NonceManager, WrapperAddress as Address, nominated_amount
 
 
 logger = get_logger(__name__)
 
+SETTLE_ROUNDS = 1   # rounds to wait after the setup swaps, for cross-shard results to land
+STRESS_PARAMETERS = {
+    "swap_min_tokens_to_spend": 0.0001,
+    "swap_max_tokens_to_spend": 0.001,
+}
+
 
 def main(cli_args: List[str]):
     parser = ArgumentParser()
     parser.add_argument("--threads", required=False, default="3")  # number of concurrent threads to execute operations
+    parser.add_argument("--processes", required=False, default="1")  # worker processes, each running --threads
     parser.add_argument("--repeats", required=False, default="0")  # number of total operations to execute; 0 - infinite
     parser.add_argument("--skip-swaping", action="store_true", default=False)
     parser.add_argument("--skip-minting", action="store_true", default=False)
+    parser.add_argument("--observe", action="store_true", default=False)  # verify events with the economics trackers
+    parser.add_argument("--observer-workers", required=False, default="0")  # background verification lanes; 0 - inline
     args = parser.parse_args(cli_args)
 
     context = Context()
+    if args.observe:
+        context.init_observers(int(args.observer_workers))
 
     # add initial liquidity in pair contracts if necessary
     add_initial_liquidity(context)
@@ -46,29 +58,31 @@ def main(cli_args: List[str]):
     if not args.skip_minting:
         # send eGLD for fees to users
         send_egld(context)
-        wait_time = 40
-        logger.info(f"eGLD account minting done. Waiting for the dust to settle: {wait_time}s")
-        time.sleep(wait_time)
+        logger.info("eGLD account minting done.")
 
     if not args.skip_swaping:
         # swap eGLD in minter for DEX tokens
         swap_tokens(context)
-        wait_time = 12
-        logger.info(f"Swapping tokens done. Waiting for the dust to settle: {wait_time}s")
-        time.sleep(wait_time)
+        logger.info(f"Swapping tokens done. Waiting {SETTLE_ROUNDS} round(s) for the dust to settle.")
+        context.network_provider.clock.wait_rounds(SETTLE_ROUNDS)
 
     if not args.skip_minting:
         # send DEX tokens to users
         send_tokens(context)
-        wait_time = 40
-        logger.info(f"Minting accounts with DEX tokens done. "
-                    f"Waiting for the dust to settle: {wait_time}s until execution start")
-        time.sleep(wait_time)
+        logger.info("Minting accounts with DEX tokens done.")
 
     create_nonce_file(context)
 
     # stress generator for adding liquidity, enter farm, enter metastaking, claim metastaking, exit metastaking
-    stress(context, int(args.threads), int(args.repeats))
+    try:
+        if int(args.processes) > 1:
+            if args.observe:
+                log_step_fail("Observers only see the events of this process, not those of the stress workers.")
+            stress_multiprocess(context, int(args.processes), int(args.threads), int(args.repeats))
+        else:
+            stress(context, int(args.threads), int(args.repeats))
+    finally:
+        context.close_observers()
 
 
 def create_nonce_file(context: Context):
@@ -125,8 +139,8 @@ def send_egld(context: Context):
     logger.info(f"Funding each account with {amount} eGLD.")
     args = [f'--proxy={proxy_url}', f'--accounts={accounts}',
             f'--minter={minter}', f'--value-atoms={amount}']
-    send_egld_from_minter(args)
-    time.sleep(7)
+    tx_hashes = send_egld_from_minter(args)
+    context.network_provider.clock.wait_for_final(tx_hashes)
     context.admin_account.sync_nonce(context.network_provider.proxy)
 
 
@@ -149,8 +163,8 @@ def send_tokens(context: Context):
                     f"from a total of {amount_on_deployer}.")
         args = [f'--proxy={proxy_url}', f'--accounts={accounts}',
                 f'--minter={minter}', f'--token={token}', f'--amount-atoms={amount}']
-        send_token_from_minter(args)
-        time.sleep(7)
+        tx_hashes = send_token_from_minter(args)
+        context.network_provider.clock.wait_for_final(tx_hashes)
     
     context.admin_account.sync_nonce(context.network_provider.proxy)
 
@@ -166,16 +180,20 @@ def add_initial_liquidity(context: Context):
                 pair_contract.firstToken, nominated_amount(10), 1,
                 pair_contract.secondToken, nominated_amount(10), 1
             )
-            pair_contract.add_initial_liquidity(context.network_provider, context.deployer_account, event)
-            time.sleep(6)
+            tx_hash = pair_contract.add_initial_liquidity(context.network_provider, context.deployer_account, event)
+            context.network_provider.clock.wait_for_final([tx_hash])
 
 
 def stress(context: Context, threads: int, repeats: int):
     deployer_shard = context.deployer_account.address.get_shard()
     accounts = context.accounts.get_in_shard(deployer_shard)
 
-    context.swap_min_tokens_to_spend = 0.0001
-    context.swap_max_tokens_to_spend = 0.001
+    # concurrent jobs may pick the same account, so nonces are handed out by a shared manager
+    nonce_manager = NonceManager(context.network_provider.proxy)
+    nonce_manager.manage(accounts)
+
+    for name, value in STRESS_PARAMETERS.items():
+        setattr(context, name, value)
 
     if threads == 1:
         """Sequential run"""
@@ -208,6 +226,15 @@ def stress(context: Context, threads: int, repeats: int):
         return
 
 
+def stress_multiprocess(context: Context, processes: int, threads: int, repeats: int):
+    deployer_shard = context.deployer_account.address.get_shard()
+    accounts = BunchOfAccounts(context.accounts.get_in_shard(deployer_shard))
+
+    executor = StressExecutor(accounts, "scenarios.stress_create_positions:stress_per_account",
+                              processes, threads, parameters=STRESS_PARAMETERS)
+    executor.run(repeats)
+
+
 def stress_per_account(context: Context, account: Account):
     min_time = 2
     max_time = 10
@@ -215,7 +242,8 @@ def stress_per_account(context: Context, account: Account):
     sleep_time = config.CROSS_SHARD_DELAY if account.address.get_shard() is not deployer_shard \
         else config.INTRA_SHARD_DELAY
 
-    account.sync_nonce(context.network_provider.proxy)
+    if account.nonce_manager is None:
+        account.sync_nonce(context.network_provider.proxy)
 
     for metastaking_contract in context.get_contracts(config.METASTAKINGS_V2):
         farm_contract = context.get_farm_contract_by_address(metastaking_contract.farm_address)
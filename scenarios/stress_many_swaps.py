@@ -1,14 +1,13 @@
 import sys
-import time
 from argparse import ArgumentParser
 from pathlib import Path
 from typing import List
-from multiversx_sdk import Address, Transaction, ProxyNetworkProvider
+from multiversx_sdk import Address, ApiNetworkProvider, Transaction, ProxyNetworkProvider
 from ported_arrows.stress.contracts.transaction_builder import (number_as_arg,
                                                          string_as_arg,
                                                          token_id_as_arg)
-from utils.utils_chain import Account
-from utils.utils_tx import broadcast_transactions
+from utils.utils_chain import Account, sign_transactions
+from utils.utils_tx import BlockClock, TxStatusTracker, broadcast_transactions
 from utils.utils_chain import BunchOfAccounts
 from multiversx_sdk.network_providers.network_config import NetworkConfig
 
@@ -16,6 +15,7 @@ from multiversx_sdk.network_providers.network_config import NetworkConfig
 def main(cli_args: List[str]):
     parser = ArgumentParser()
     parser.add_argument("--proxy", required=True)
+    parser.add_argument("--api", required=False, default="", help="api used to track the status of the sent transactions")
     parser.add_argument("--accounts", required=True)
     parser.add_argument("--token-one", required=True)
     parser.add_argument("--token-two", required=True)
@@ -26,6 +26,8 @@ def main(cli_args: List[str]):
     network = proxy.get_network_config()
     pair = Address(args.pair, "erd")
     accounts = BunchOfAccounts.load_accounts_from_files([Path(args.accounts)])
+    tracker = TxStatusTracker(ApiNetworkProvider(args.api)) if args.api else None
+    clock = BlockClock(proxy)
 
     for _ in range(0, 100):
         accounts.sync_nonces(proxy)
@@ -36,8 +38,14 @@ def main(cli_args: List[str]):
             transactions.append(create_swap_fixed_input(pair, account, args.token_one, args.token_two, network))
             transactions.append(create_swap_fixed_input(pair, account, args.token_two, args.token_one, network))
 
-        broadcast_transactions(transactions, proxy, 1000, confirm_yes=True)
-        time.sleep(60 * 3)
+        sign_transactions(transactions, accounts.get_all())
+        hashes = broadcast_transactions(transactions, proxy, 1000, confirm_yes=True, tracker=tracker)
+        if tracker is None:
+            clock.wait_for_final(hashes, timeout=60 * 3)
+            continue
+
+        tracker.wait(timeout=60 * 3)
+        print(tracker.report())
 
 
 def create_swap_fixed_input(pair: Address, caller: Account, token_from: str, token_to: str, network: NetworkConfig) -> Transaction:
@@ -57,9 +65,6 @@ def create_swap_fixed_input(pair: Address, caller: Account, token_from: str, tok
     transaction.gas_price = network.min_gas_price
     transaction.version = network.min_transaction_version
 
-    signature = caller.sign_transaction(transaction)
-    transaction.signature = signature
-
     return transaction
 
 
@@ -46,7 +46,7 @@ def safeprice_stress(context: Context):
             print("Noise tx")
             context.set_swap_spend_limits(0, 0.01)
             generate_swap_fixed_input(context, account, pair_contract)
-            time.sleep(5)
+            context.network_provider.clock.wait_rounds(1)
 
         wait_time = random.randrange(min_time, max_time)
         print(f"Waiting for {wait_time}s until next swap")
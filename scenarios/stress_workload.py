@@ -0,0 +1,41 @@
+import sys
+from argparse import ArgumentParser
+from typing import List
+
+import config
+from context import Context
+from events.workload_generator import (WORKLOAD_MIX, WorkloadGenerator, get_workload_fingerprint,
+                                       parse_workload_mix)
+from utils.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+
+def main(cli_args: List[str]):
+    parser = ArgumentParser()
+    parser.add_argument("--seed", required=False, default="0")  # same seed and chain state give the same workload
+    parser.add_argument("--count", required=False, default="10000")  # number of transactions in the workload
+    parser.add_argument("--tps", required=False, default="100")  # target broadcast rate
+    parser.add_argument("--mix", required=False, default="",
+                        help=f"event weights as event=weight,..., from: {', '.join(WORKLOAD_MIX)}")
+    parser.add_argument("--rounds", required=False, default="1")  # times to rebuild and replay the workload
+    parser.add_argument("--wait", action="store_true", default=False)  # wait for each round to complete
+    args = parser.parse_args(cli_args)
+
+    context = Context()
+    generator = WorkloadGenerator(context.network_provider.proxy, context.accounts.get_all(),
+                                  context.get_contracts(config.PAIRS_V2), context.get_contracts(config.FARMS_V2),
+                                  seed=int(args.seed), mix=parse_workload_mix(args.mix) or None)
+
+    for _ in range(int(args.rounds)):
+        items = generator.sign(generator.build(int(args.count)))
+        logger.info(f"Workload fingerprint: {get_workload_fingerprint(items)}")
+
+        hashes = generator.replay(items, float(args.tps))
+        if args.wait:
+            context.network_provider.clock.wait_for_final(hashes)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
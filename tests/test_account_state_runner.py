@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Tests for streaming account key exports with resumable checkpoints.
+"""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from typing import Optional
+
+# Add the project root to the Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from tools.runners.account_state_runner import AccountKeysExporter, read_exported_keys
+
+ADDRESS = "erd1qqqqqqqqqqqqqpgqeel2kumf0r8ffyhth7pqdujjat9nx0862jpsg2pqaq"
+PAGES = 5
+KEYS_PER_PAGE = 2
+
+
+class Interrupted(Exception):
+    pass
+
+
+class FakeKeysProxy:
+    """Serves PAGES pages of keys through iterate-keys; the block advances on every request."""
+
+    def __init__(self, interrupt_at_page: Optional[int] = None):
+        self.interrupt_at_page = interrupt_at_page
+        self.block_nonce = 100
+        self.requests = []
+
+    def do_post_generic(self, url: str, body: dict):
+        page = body["iteratorState"][0] if body["iteratorState"] else 0
+        self.requests.append((url, page))
+        if page == self.interrupt_at_page:
+            raise Interrupted()
+        self.block_nonce += 1
+        pairs = {f"{page:02x}{index:02x}": f"value{page}.{index}" for index in range(KEYS_PER_PAGE)}
+        return {"data": {"blockInfo": {"nonce": self.block_nonce}, "pairs": pairs,
+                         "newIteratorState": [page + 1] if page + 1 < PAGES else None}}
+
+
+def all_keys() -> dict:
+    return {f"{page:02x}{index:02x}": f"value{page}.{index}" for page in range(PAGES) for index in range(KEYS_PER_PAGE)}
+
+
+class TestAccountKeysExporter(unittest.TestCase):
+    """Test cases for AccountKeysExporter checkpoints, in both output formats."""
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.outputs = [Path(directory.name) / "keys.ndjson", Path(directory.name) / "keys.db"]
+
+    def export(self, output: Path, proxy: FakeKeysProxy, **kwargs) -> int:
+        return AccountKeysExporter(ADDRESS, proxy, output, page_size=KEYS_PER_PAGE).export(**kwargs)
+
+    def test_export_pins_the_first_block(self):
+        """Test that all keys are exported and every page after the first is read at its block."""
+        for output in self.outputs:
+            with self.subTest(output=output.name):
+                proxy = FakeKeysProxy()
+
+                self.assertEqual(self.export(output, proxy), PAGES * KEYS_PER_PAGE)
+                self.assertEqual(dict(read_exported_keys(output)), all_keys())
+                self.assertEqual(proxy.requests[0][0], "address/iterate-keys")
+                self.assertEqual({url for url, _ in proxy.requests[1:]}, {"address/iterate-keys?blockNonce=101"})
+
+    def test_interrupted_export_resumes(self):
+        """Test that an interrupted export resumes after the last checkpointed page, at the same block."""
+        for output in self.outputs:
+            with self.subTest(output=output.name):
+                with self.assertRaises(Interrupted):
+                    self.export(output, FakeKeysProxy(interrupt_at_page=3))
+
+                proxy = FakeKeysProxy()
+                self.assertEqual(self.export(output, proxy), PAGES * KEYS_PER_PAGE)
+                self.assertEqual(proxy.requests, [("address/iterate-keys?blockNonce=101", 3),
+                                                  ("address/iterate-keys?blockNonce=101", 4)])
+                pairs = list(read_exported_keys(output))
+                self.assertEqual(len(pairs), PAGES * KEYS_PER_PAGE)
+                self.assertEqual(dict(pairs), all_keys())
+
+    def test_unsaved_tail_is_dropped(self):
+        """Test that NDJSON written after the last checkpoint is discarded on resume."""
+        output = self.outputs[0]
+        with self.assertRaises(Interrupted):
+            self.export(output, FakeKeysProxy(interrupt_at_page=2))
+        with open(output, "a") as writer:
+            writer.write('{"key": "0200", "val')
+
+        self.export(output, FakeKeysProxy())
+        self.assertEqual(dict(read_exported_keys(output)), all_keys())
+
+    def test_complete_export_is_not_repeated(self):
+        """Test that exporting again to a complete output makes no requests, unless restarted."""
+        for output in self.outputs:
+            with self.subTest(output=output.name):
+                self.export(output, FakeKeysProxy())
+
+                proxy = FakeKeysProxy()
+                self.assertEqual(self.export(output, proxy), PAGES * KEYS_PER_PAGE)
+                self.assertEqual(proxy.requests, [])
+
+                self.assertEqual(self.export(output, proxy, restart=True), PAGES * KEYS_PER_PAGE)
+                self.assertEqual(len(proxy.requests), PAGES)
+
+    def test_other_export_is_not_resumed(self):
+        """Test that a partial export of another account isn't resumed into."""
+        for output in self.outputs:
+            with self.subTest(output=output.name):
+                with self.assertRaises(Interrupted):
+                    self.export(output, FakeKeysProxy(interrupt_at_page=1))
+
+                other = AccountKeysExporter(ADDRESS.replace("pqaq", "qqqq"), FakeKeysProxy(), output)
+                with self.assertRaises(ValueError):
+                    other.export()
+
+
+if __name__ == "__main__":
+    unittest.main()
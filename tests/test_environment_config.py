@@ -54,6 +54,7 @@ class TestEnvironmentConfig(unittest.TestCase):
         self.assertIn("devnet-gateway.multiversx.com", config.DEFAULT_PROXY)
         self.assertIn("devnet-api.multiversx.com", config.DEFAULT_API)
         self.assertIn("devnet-graph.xexchange.com", config.GRAPHQL)
+        self.assertFalse(config.CHAIN_SIMULATOR)
     
     def test_chainsim_configuration(self):
         """Test chainsim configuration values."""
@@ -68,6 +69,7 @@ class TestEnvironmentConfig(unittest.TestCase):
         self.assertEqual(config.DEFAULT_PROXY, "http://localhost:8085")
         self.assertEqual(config.DEFAULT_API, "http://localhost:3001")
         self.assertEqual(config.GRAPHQL, "https://graph.xexchange.com/graphql")
+        self.assertTrue(config.CHAIN_SIMULATOR)
     
     def test_config_save_paths(self):
         """Test that config save paths are environment-specific."""
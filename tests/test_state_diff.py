@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Tests for the bucketed state diff and the grouping of keys by storage mapper name.
+"""
+
+import os
+import sys
+import unittest
+from pathlib import Path
+
+# Add the project root to the Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from utils.state_diff import (STATE_DIFF_BUCKETS, diff_states, get_bucket_count, get_mapper_name,
+                              group_by_mapper_name)
+
+
+def hex_of(text: str) -> str:
+    return text.encode().hex()
+
+
+class TestStateDiff(unittest.TestCase):
+    """Test cases for diff_states."""
+
+    def setUp(self):
+        self.left = {hex_of(f"pair_reserve{index}"): f"{index:02x}" for index in range(100)}
+
+    def test_identical_states(self):
+        """Test that identical states skip every bucket."""
+        diff = diff_states(self.left.items, dict(self.left).items)
+
+        self.assertTrue(diff.identical)
+        self.assertEqual(diff.skipped_buckets, diff.buckets)
+        self.assertEqual(diff.left_keys, 100)
+
+    def test_added_removed_and_changed_keys(self):
+        """Test that keys only in one side and changed values are all reported."""
+        right = dict(self.left)
+        removed = right.pop(hex_of("pair_reserve1"))
+        right[hex_of("pair_reserve2")] = "ff"
+        right[hex_of("lp_token_supply")] = "01"
+
+        diff = diff_states(self.left.items, right.items)
+        entries = {kind: {} for kind in ("only_left", "only_right", "changed")}
+        for group in diff.groups.values():
+            for kind in entries:
+                entries[kind].update(group[kind])
+
+        self.assertEqual(entries["only_left"], {hex_of("pair_reserve1"): removed})
+        self.assertEqual(entries["only_right"], {hex_of("lp_token_supply"): "01"})
+        self.assertEqual(entries["changed"], {hex_of("pair_reserve2"): [self.left[hex_of("pair_reserve2")], "ff"]})
+
+    def test_more_differences_than_buckets(self):
+        """Test that large states are summarized again in finer buckets and every difference is still found."""
+        keys = STATE_DIFF_BUCKETS * 80
+        left = {f"{index:016x}": "aa" for index in range(keys)}
+        right = dict(left)
+        for index in range(0, keys, 40):
+            right[f"{index:016x}"] = "bb"
+
+        diff = diff_states(left.items, right.items)
+
+        self.assertEqual(diff.buckets, get_bucket_count(keys))
+        self.assertGreater(diff.buckets, STATE_DIFF_BUCKETS)
+        self.assertEqual(sum(diff.get_group_counts(group)[2] for group in diff.groups), keys // 40)
+
+
+class TestMapperNames(unittest.TestCase):
+    """Test cases for grouping keys by storage mapper name."""
+
+    def test_address_keyed_mapper(self):
+        """Test that keys of a mapper keyed by address form a single group, whatever the address bytes."""
+        keys = [hex_of("userEnergy") + os.urandom(32).hex() for _ in range(500)]
+        # addresses starting with printable bytes
+        keys += [hex_of("userEnergy") + (b"Ab.c" + os.urandom(28)).hex() for _ in range(10)]
+
+        self.assertEqual(set(group_by_mapper_name(keys).values()), {"userEnergy"})
+
+    def test_mapper_suffixes(self):
+        """Test that vec, set and map mapper keys are grouped under the mapper name."""
+        keys = [hex_of("users.len"), hex_of("users.item") + "00000001", hex_of("users.index") + "0a"]
+
+        self.assertEqual({get_mapper_name(key) for key in keys}, {"users"})
+
+    def test_known_name_prefix(self):
+        """Test that printable arguments are folded into the longest known mapper name."""
+        key = hex_of("pair_reserveWEGLD-abcdef")
+
+        self.assertEqual(get_mapper_name(key), "pair_reserveWEGLD-abcdef")
+        self.assertEqual(get_mapper_name(key, ["pair", "pair_reserve"]), "pair_reserve")
+
+    def test_reserved_keys(self):
+        """Test that protocol keys are grouped by their reserved prefix."""
+        self.assertEqual(get_mapper_name(hex_of("ELRONDesdtWEGLD-abcdef")), "ELRONDesdt")
+
+
+if __name__ == "__main__":
+    unittest.main()
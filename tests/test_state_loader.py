@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Tests for streaming account states out of state files.
+"""
+
+import io
+import json
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# Add the project root to the Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from tools import state_loader
+
+
+def make_state(index: int) -> dict:
+    return {"address": f"erd1{index:058d}", "balance": str(index), "pairs": {f"{index:04x}": "ab" * index}}
+
+
+class TestIterJsonValues(unittest.TestCase):
+    """Test cases for _iter_json_values."""
+
+    def parse(self, text: str, read_size: int) -> list:
+        with mock.patch.object(state_loader, "STATE_FILE_READ_SIZE", read_size):
+            return list(state_loader._iter_json_values(io.StringIO(text)))
+
+    def test_states_across_buffer_boundaries(self):
+        """Test that states split across reads, separators included, are all parsed whatever the read size."""
+        states = [make_state(index) for index in range(20)]
+        text = " [\n" + ",\n  ".join(json.dumps(state) for state in states) + "\n]\n"
+
+        for read_size in (1, 7, 64, 1000, len(text)):
+            with self.subTest(read_size=read_size):
+                self.assertEqual(self.parse(text, read_size), states)
+
+    def test_state_larger_than_buffer(self):
+        """Test that a state many times the read size is parsed."""
+        states = [make_state(1), make_state(400), make_state(2)]
+
+        self.assertEqual(self.parse(json.dumps(states), 16), states)
+
+    def test_nested_state_lists(self):
+        """Test that lists of states, as in *_all_keys.json, are flattened."""
+        states = [make_state(index) for index in range(4)]
+        text = json.dumps([states[:2], [], states[2:]])
+
+        self.assertEqual(self.parse(text, 10), states)
+
+    def test_single_state_object(self):
+        """Test that a file holding a single state object yields it."""
+        state = make_state(3)
+
+        self.assertEqual(self.parse(json.dumps(state), 8), [state])
+
+    def test_truncated_file(self):
+        """Test that a truncated file raises instead of silently dropping the last state."""
+        text = json.dumps([make_state(1), make_state(2)])[:-20]
+
+        with self.assertRaises(json.JSONDecodeError):
+            self.parse(text, 16)
+
+
+if __name__ == "__main__":
+    unittest.main()
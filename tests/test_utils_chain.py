@@ -0,0 +1,417 @@
+#!/usr/bin/env python3
+"""
+Tests for chain utilities: addresses, nonce management, batch signing, attribute decoding and ESDT inventories.
+"""
+
+import gc
+import pickle
+import random
+import sys
+import threading
+import time
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+# Add the project root to the Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from multiversx_sdk import Address, AddressComputer, Transaction, UserSecretKey, UserSigner
+
+from utils import utils_chain
+from utils import decoding_structures
+from utils.utils_chain import (Account, AttributesDecoder, BunchOfAccounts, EsdtInventory, NonceManager,
+                               WrapperAddress, decode_merged_attributes, get_attributes_decoder,
+                               get_shard_of_address, sign_transactions)
+
+
+def make_account(seed: int) -> Account:
+    account = Account()
+    account.signer = UserSigner(UserSecretKey(bytes([seed]) * 32))
+    account.address = WrapperAddress.from_hex(account.signer.get_pubkey().hex(), "erd")
+    return account
+
+
+class TestWrapperAddress(unittest.TestCase):
+    """Test cases for WrapperAddress interning and its cached forms."""
+
+    BECH32 = "erd1qqqqqqqqqqqqqpgqeel2kumf0r8ffyhth7pqdujjat9nx0862jpsg2pqaq"
+
+    def test_same_address_is_same_object(self):
+        """Test that an address built from bech32, hex or the sdk constructors is always the same instance."""
+        address = WrapperAddress(self.BECH32)
+        pubkey = Address.new_from_bech32(self.BECH32).pubkey
+
+        self.assertIs(WrapperAddress(self.BECH32), address)
+        self.assertIs(WrapperAddress.from_hex(pubkey.hex()), address)
+        self.assertIs(WrapperAddress.new_from_bech32(self.BECH32), address)
+        self.assertIs(WrapperAddress(pubkey), address)
+
+    def test_cached_forms_match_sdk(self):
+        """Test that the cached bech32 form and shard are those the sdk computes."""
+        for seed in range(1, 20):
+            address = make_account(seed).address
+            sdk_address = Address(address.pubkey, "erd")
+            with self.subTest(address=str(address)):
+                self.assertEqual(address.to_bech32(), sdk_address.to_bech32())
+                self.assertEqual(address.get_shard(), AddressComputer().get_shard_of_address(sdk_address))
+                self.assertEqual(address, sdk_address)
+
+    def test_unpickles_into_interned_instance(self):
+        """Test that pickled addresses, as sent to worker processes, come back as the interned instance."""
+        address = WrapperAddress(self.BECH32)
+
+        self.assertIs(pickle.loads(pickle.dumps(address)), address)
+
+    def test_unused_addresses_are_released(self):
+        """Test that interning doesn't keep addresses alive once they're no longer used."""
+        pubkey = bytes(31) + b"\x7f"
+        address = WrapperAddress(pubkey)
+        address.get_shard()
+        del address
+        gc.collect()
+
+        self.assertNotIn(pubkey, WrapperAddress._by_pubkey)
+
+
+class TestBunchOfAccounts(unittest.TestCase):
+    """Test cases for the address and shard indexes of BunchOfAccounts."""
+
+    def setUp(self):
+        self.accounts = BunchOfAccounts([make_account(seed) for seed in range(1, 31)])
+
+    def test_get_account(self):
+        """Test that accounts are found by address, including ones appended after indexing."""
+        account = self.accounts.get_all()[7]
+        self.assertIs(self.accounts.get_account(Address.new_from_bech32(account.address.to_bech32())), account)
+
+        appended = make_account(99)
+        self.accounts.accounts.append(appended)
+        self.assertIs(self.accounts.get_account(appended.address), appended)
+
+    def test_shard_groups_match_scan(self):
+        """Test that shard lookups return the same accounts, in the same order, as filtering the list."""
+        for shard in range(3):
+            in_shard = [account for account in self.accounts.get_all() if account.address.get_shard() == shard]
+            with self.subTest(shard=shard):
+                self.assertEqual(self.accounts.get_in_shard(shard), in_shard)
+                self.assertEqual(self.accounts.get_by_shard().get(shard, []), in_shard)
+                self.assertEqual(len(self.accounts.get_not_in_shard(shard)), len(self.accounts) - len(in_shard))
+
+    def test_replaced_list_is_reindexed(self):
+        """Test that replacing the accounts list drops the previous indexes."""
+        self.accounts.get_in_shard(0)
+        self.accounts.accounts = self.accounts.get_all()[:5]
+
+        self.assertEqual(sum(len(group) for group in self.accounts.get_by_shard().values()), 5)
+
+    def test_partition(self):
+        """Test that partitions are disjoint, cover all accounts and share each shard evenly."""
+        parts = self.accounts.partition(4)
+
+        self.assertEqual(sorted(id(account) for part in parts for account in part.get_all()),
+                         sorted(id(account) for account in self.accounts.get_all()))
+        for shard, accounts in self.accounts.get_by_shard().items():
+            counts = [len(part.get_in_shard(shard)) for part in parts]
+            self.assertLessEqual(max(counts) - min(counts), 1)
+
+
+class FakeProxy:
+    def __init__(self, nonce: int = 0):
+        self.nonce = nonce
+        self.account_requests = 0
+
+    def get_account(self, address):
+        self.account_requests += 1
+        return SimpleNamespace(nonce=self.nonce)
+
+
+class TestNonceManager(unittest.TestCase):
+    """Test cases for NonceManager reservations."""
+
+    def setUp(self):
+        self.proxy = FakeProxy(nonce=7)
+        self.manager = NonceManager(self.proxy, max_in_flight=3)
+        self.account = make_account(1)
+        self.manager.manage([self.account])
+
+    def test_reserve_consecutive_nonces(self):
+        """Test that reservations start at the chain nonce and advance the account nonce."""
+        self.assertEqual([self.account.reserve_nonce() for _ in range(3)], [7, 8, 9])
+        self.assertEqual(self.account.nonce, 10)
+
+    def test_concurrent_reservations_are_unique(self):
+        """Test that nonces reserved from several threads are never handed out twice."""
+        manager = NonceManager(self.proxy, max_in_flight=1000)
+        manager.manage([self.account])
+        reserved = []
+
+        def reserve():
+            for _ in range(100):
+                reserved.append(self.account.reserve_nonce())
+
+        threads = [threading.Thread(target=reserve) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(sorted(reserved), list(range(7, 807)))
+
+    def test_failed_last_send_is_rolled_back(self):
+        """Test that the nonce of a failed send is handed out again when it was the last one reserved."""
+        self.account.reserve_nonce()
+        nonce = self.account.reserve_nonce()
+        self.account.commit_nonce(nonce, sent=False)
+
+        self.assertEqual(self.account.reserve_nonce(), nonce)
+
+    def test_failed_send_gap_is_filled_first(self):
+        """Test that a failed nonce in the middle of the in-flight ones is reused before advancing."""
+        first, second, third = (self.account.reserve_nonce() for _ in range(3))
+        self.account.commit_nonce(second, sent=False)
+        self.account.commit_nonce(third, sent=True)
+
+        self.assertEqual(self.account.reserve_nonce(), second)
+        self.proxy.nonce = 10
+        self.assertEqual(self.account.reserve_nonce(), 10)
+
+    def test_full_in_flight_waits_for_chain_progress(self):
+        """Test that a full in-flight window is freed by the nonces executed on chain."""
+        for _ in range(3):
+            self.account.reserve_nonce()
+        self.proxy.nonce = 9
+
+        self.assertEqual(self.account.reserve_nonce(), 10)
+        self.assertEqual(self.manager.get_stuck_accounts(), [])
+
+    def test_resync(self):
+        """Test that an account marked for resync drops its local nonces and restarts from the chain nonce."""
+        for _ in range(3):
+            self.account.reserve_nonce()
+        self.proxy.nonce = 8
+        self.manager.mark_for_resync(self.account)
+
+        self.assertEqual(self.account.reserve_nonce(), 8)
+        self.assertEqual(self.account.nonce, 9)
+
+
+class TestSignTransactions(unittest.TestCase):
+    """Test cases for sign_transactions."""
+
+    def setUp(self):
+        self.accounts = [make_account(seed) for seed in range(1, 4)]
+
+    def make_transactions(self, count: int):
+        return [Transaction(sender=self.accounts[index % 3].address, receiver=self.accounts[0].address,
+                            gas_limit=50000, chain_id="localnet", nonce=index) for index in range(count)]
+
+    def test_process_pool_matches_in_process_signing(self):
+        """Test that batches signed across the process pool get the same signatures, in order."""
+        expected = self.make_transactions(40)
+        sign_transactions(expected, self.accounts)
+
+        transactions = self.make_transactions(40)
+        with mock.patch.object(utils_chain, "PARALLEL_SIGN_THRESHOLD", 10):
+            signed = sign_transactions(transactions, self.accounts, processes=2, chunk_size=7)
+
+        self.assertIs(signed, transactions)
+        self.assertEqual([tx.signature for tx in signed], [tx.signature for tx in expected])
+        self.assertEqual(expected[4].signature, self.accounts[1].sign_transaction(expected[4]))
+
+    def test_missing_signer(self):
+        """Test that a sender without an account is reported before signing anything."""
+        transactions = self.make_transactions(3)
+
+        with self.assertRaises(ValueError):
+            sign_transactions(transactions, self.accounts[:2])
+        self.assertFalse(any(tx.signature for tx in transactions))
+
+
+def legacy_decode_merged_attributes(attributes_hex: str, decode_struct: dict) -> dict:
+    """The hex slicing decoder AttributesDecoder replaced, as reference."""
+    def read(index: int, no_bytes: int):
+        result_hex = attributes_hex[index:index + no_bytes * 2]
+        return int(result_hex, 16), result_hex, index + no_bytes * 2
+
+    def fixed(no_bytes: int):
+        return lambda index: read(index, no_bytes)[::2]
+
+    def sized(convert):
+        def decode(index: int):
+            payload_size, _, index = read(index, 4)
+            if not payload_size:
+                return convert(""), index
+            _, result_hex, index = read(index, payload_size)
+            return convert(result_hex), index
+        return decode
+
+    primitives = {
+        'u8': fixed(1), 'u16': fixed(2), 'u32': fixed(4), 'u64': fixed(8),
+        'biguint': sized(lambda result_hex: int(result_hex, 16) if result_hex else 0),
+        'bigint': sized(lambda result_hex: int.from_bytes(bytes.fromhex(result_hex), "big", signed=True)),
+        'string': sized(lambda result_hex: bytearray.fromhex(result_hex).decode()),
+        'address': lambda index: (Address.new_from_hex(read(index, 32)[1], "erd").to_bech32(), index + 64),
+    }
+
+    results, index = {}, 0
+    for key, primitive in decode_struct.items():
+        if type(primitive) is dict:
+            results[key] = {}
+            for field_key, field_primitive in primitive.items():
+                if field_primitive in primitives:
+                    results[key][field_key], index = primitives[field_primitive](index)
+        elif primitive in primitives:
+            results[key], index = primitives[primitive](index)
+    return results
+
+
+def encode_random(decode_struct: dict, rng: random.Random) -> str:
+    def sized(payload: bytes) -> str:
+        return len(payload).to_bytes(4, "big").hex() + payload.hex()
+
+    def big(signed: bool) -> bytes:
+        value = rng.choice([0, 1, rng.getrandbits(200)]) * (rng.choice([1, -1]) if signed else 1)
+        length = (value.bit_length() + 8) // 8 if value else 0
+        return value.to_bytes(length, "big", signed=signed)
+
+    encoders = {
+        'u8': lambda: rng.getrandbits(8).to_bytes(1, "big").hex(),
+        'u16': lambda: rng.getrandbits(16).to_bytes(2, "big").hex(),
+        'u32': lambda: rng.getrandbits(32).to_bytes(4, "big").hex(),
+        'u64': lambda: rng.getrandbits(64).to_bytes(8, "big").hex(),
+        'biguint': lambda: sized(big(signed=False)),
+        'bigint': lambda: sized(big(signed=True)),
+        'string': lambda: sized(rng.choice(["", "WEGLD-abcdef", "MEX-455c57"]).encode()),
+        'address': lambda: rng.randbytes(32).hex(),
+    }
+    encoded = ""
+    for primitive in decode_struct.values():
+        fields = primitive.values() if type(primitive) is dict else [primitive]
+        encoded += "".join(encoders[field]() for field in fields if field in encoders)
+    return encoded
+
+
+class TestAttributesDecoder(unittest.TestCase):
+    """Test cases for AttributesDecoder against the hex slicing decoder it replaced."""
+
+    ALL_PRIMITIVES = {
+        'flag': 'u8', 'short': 'u16', 'week': 'u32', 'epoch': 'u64',
+        'nested': {'amount': 'bigint', 'token': 'string', 'unknown': 'u128'},
+        'supply': 'biguint', 'owner': 'address',
+    }
+
+    def test_matches_legacy_decoder(self):
+        """Test that hex and bytes attributes decode as before, for repo structures and every primitive."""
+        rng = random.Random(7)
+        structures = {name: getattr(decoding_structures, name) for name in
+                      ("FARM_TOKEN_ATTRIBUTES", "USER_CLAIM_PROGRESS", "LKMEX_ATTRIBUTES_V1", "XMEXFARM_ATTRIBUTES")}
+        structures["ALL_PRIMITIVES"] = self.ALL_PRIMITIVES
+
+        for name, decode_struct in structures.items():
+            decoder = AttributesDecoder(decode_struct)
+            with self.subTest(structure=name):
+                for _ in range(50):
+                    attributes = encode_random(decode_struct, rng)
+                    expected = legacy_decode_merged_attributes(attributes, decode_struct)
+                    self.assertEqual(decoder.decode(attributes), expected, attributes)
+                    self.assertEqual(decoder.decode(bytes.fromhex(attributes)), expected, attributes)
+                    self.assertEqual(decode_merged_attributes(attributes, decode_struct), expected, attributes)
+
+    def test_truncated_attributes(self):
+        """Test that truncated attributes raise ValueError, as the fallbacks to older structures expect."""
+        attributes = encode_random(decoding_structures.FARM_TOKEN_ATTRIBUTES, random.Random(1))[:-10]
+
+        with self.assertRaises(ValueError):
+            AttributesDecoder(decoding_structures.FARM_TOKEN_ATTRIBUTES).decode(attributes)
+
+    def test_decoders_are_cached(self):
+        """Test that a structure compiles once, and equal structures built per call share the decoder."""
+        decoder = get_attributes_decoder(decoding_structures.XMEX_ATTRIBUTES)
+
+        self.assertIs(get_attributes_decoder(decoding_structures.XMEX_ATTRIBUTES), decoder)
+        self.assertIs(get_attributes_decoder(dict(decoding_structures.XMEX_ATTRIBUTES)), decoder)
+
+
+class FakeEsdtProxy:
+    def __init__(self, esdts: dict, block_nonce: int):
+        self.esdts = esdts
+        self.block_nonce = block_nonce
+        self.listing_requests = 0
+
+    def do_get_generic(self, url: str):
+        self.listing_requests += 1
+        return {"esdts": {identifier: dict(token) for identifier, token in self.esdts.items()},
+                "blockInfo": {"nonce": self.block_nonce}}
+
+
+class TestEsdtInventory(unittest.TestCase):
+    """Test cases for EsdtInventory lookups and the ordering of applied transactions against the listing."""
+
+    def setUp(self):
+        self.address = make_account(1).address.to_bech32()
+        self.other = make_account(2).address.to_bech32()
+        self.proxy = FakeEsdtProxy({
+            "WEGLD-abcdef": {"tokenIdentifier": "WEGLD-abcdef", "balance": "100"},
+            "FARM-abcdef-01": {"tokenIdentifier": "FARM-abcdef-01", "balance": "5", "nonce": 1},
+            "FARM-abcdef-0a": {"tokenIdentifier": "FARM-abcdef-0a", "balance": "7", "nonce": 10},
+        }, block_nonce=50)
+        self.inventory = EsdtInventory(self.address, self.proxy)
+        self.shard = get_shard_of_address(Address.new_from_bech32(self.address))
+        self.inventory.refresh()
+
+    def transfer(self, identifier: str, value: int, incoming: bool = True) -> dict:
+        sender, receiver = (self.other, self.address) if incoming else (self.address, self.other)
+        return {"action": "transfer", "identifier": identifier, "value": str(value),
+                "sender": sender, "receiver": receiver}
+
+    def balance(self, identifier: str) -> int:
+        return int(self.inventory.get_entries(identifier).get(identifier, {}).get("balance", 0))
+
+    def test_collection_lookup_is_indexed(self):
+        """Test that a collection lookup gets all its nonces from the index, in listing order."""
+        self.assertEqual(self.inventory.by_token["FARM-abcdef"], ["FARM-abcdef-01", "FARM-abcdef-0a"])
+        self.assertEqual(list(self.inventory.get_entries("FARM-abcdef")), ["FARM-abcdef-01", "FARM-abcdef-0a"])
+        self.assertEqual(list(self.inventory.get_entries("FARM-abcdef-0a")), ["FARM-abcdef-0a"])
+
+    def test_transactions_in_the_listing_are_skipped(self):
+        """Test that a transaction executed at or before the listing block of the account's shard is not applied."""
+        self.inventory.apply_transaction("old", [self.transfer("WEGLD-abcdef", 10)], 50, shard=self.shard)
+
+        self.assertEqual(self.balance("WEGLD-abcdef"), 100)
+
+    def test_newer_transactions_are_applied_once(self):
+        """Test that a transaction after the listing block is applied, and only once."""
+        for _ in range(2):
+            self.inventory.apply_transaction("new", [self.transfer("WEGLD-abcdef", 10)], 51, shard=self.shard)
+        self.inventory.apply_transaction("sent", [self.transfer("WEGLD-abcdef", 30, incoming=False)], 52,
+                                         shard=self.shard)
+
+        self.assertEqual(self.balance("WEGLD-abcdef"), 80)
+        self.assertEqual(self.proxy.listing_requests, 1)
+
+    def test_spent_nonce_is_removed_from_the_index(self):
+        """Test that transferring a whole nonce out drops it from the listing and the collection index."""
+        self.inventory.apply_transaction("exit", [self.transfer("FARM-abcdef-01", 5, incoming=False)], 51,
+                                         shard=self.shard)
+
+        self.assertEqual(list(self.inventory.get_entries("FARM-abcdef")), ["FARM-abcdef-0a"])
+
+    def test_other_shard_blocks_do_not_order(self):
+        """Test that a block nonce of another shard isn't compared with the listing block: an older timestamp
+        re-reads the listing, a newer one is applied."""
+        other_shard = (self.shard + 1) % 3
+        self.inventory.apply_transaction("newer", [self.transfer("WEGLD-abcdef", 10)], 10,
+                                         int(time.time()) + 60, other_shard)
+        self.assertEqual(self.balance("WEGLD-abcdef"), 110)
+        self.assertEqual(self.proxy.listing_requests, 1)
+
+        self.inventory.apply_transaction("older", [self.transfer("WEGLD-abcdef", 10)], 99, 1, other_shard)
+        self.assertTrue(self.inventory.stale)
+        self.assertEqual(self.balance("WEGLD-abcdef"), 100)
+        self.assertEqual(self.proxy.listing_requests, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+Tests for the network config cache, the transaction cache and the transaction broadcaster.
+"""
+
+import json
+import sys
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+# Add the project root to the Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+import requests
+from multiversx_sdk import Address, Transaction
+from multiversx_sdk.network_providers.errors import NetworkProviderError
+
+from utils import utils_tx
+from utils.utils_tx import NetworkConfigCache, TokenBucket, TransactionBroadcaster, TxCache
+
+
+class FakeClock:
+    """Stands in for the time module: sleeping advances the clock instead of waiting."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.slept = 0.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        self.now += seconds
+        self.slept += seconds
+
+
+class FakeProxy:
+    def __init__(self, url: str = "http://proxy", epoch: int = 5):
+        self.url = url
+        self.epoch = epoch
+        self.config_requests = 0
+
+    def get_network_config(self):
+        self.config_requests += 1
+        return SimpleNamespace(requests=self.config_requests)
+
+    def get_network_status(self, shard=None):
+        return SimpleNamespace(current_epoch=self.epoch)
+
+
+class TestNetworkConfigCache(unittest.TestCase):
+    """Test cases for epoch invalidation of cached network configs."""
+
+    def setUp(self):
+        self.cache = NetworkConfigCache(ttl=3600)
+        self.proxy = FakeProxy()
+
+    def test_config_is_reused_within_epoch(self):
+        """Test that the config is fetched once and recorded with the epoch it was fetched in."""
+        first = self.cache.get(self.proxy)
+        self.cache.observe_epoch(self.proxy.url, 5)
+
+        self.assertIs(self.cache.get(self.proxy), first)
+        self.assertEqual(self.proxy.config_requests, 1)
+        self.assertEqual(self.cache.get_epoch(self.proxy.url), 5)
+
+    def test_new_epoch_invalidates(self):
+        """Test that observing another epoch drops the cached config."""
+        self.cache.get(self.proxy)
+        self.proxy.epoch = 6
+        self.cache.observe_epoch(self.proxy.url, 6)
+
+        self.cache.get(self.proxy)
+        self.assertEqual(self.proxy.config_requests, 2)
+        self.assertEqual(self.cache.get_epoch(self.proxy.url), 6)
+
+    def test_unknown_epoch_invalidates(self):
+        """Test that a config seeded without an epoch is dropped on the first observed epoch."""
+        self.cache.put(self.proxy.url, SimpleNamespace(requests=0))
+        self.cache.observe_epoch(self.proxy.url, 5)
+
+        self.cache.get(self.proxy)
+        self.assertEqual(self.proxy.config_requests, 1)
+
+    def test_other_proxies_are_kept(self):
+        """Test that an epoch observed on one proxy doesn't drop the config of another."""
+        other = FakeProxy("http://other")
+        self.cache.get(self.proxy)
+        self.cache.get(other)
+        self.cache.observe_epoch(self.proxy.url, 6)
+
+        self.cache.get(other)
+        self.assertEqual(other.config_requests, 1)
+
+
+def make_tx(status: str = "success", data: str = "") -> dict:
+    return {"status": status, "data": data, "operations": [{"action": "transfer", "identifier": "WEGLD-abcdef"}]}
+
+
+class TestTxCache(unittest.TestCase):
+    """Test cases for TxCache eviction."""
+
+    def setUp(self):
+        self.clock = FakeClock()
+        patcher = mock.patch.object(utils_tx, "time", self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_least_recently_used_is_evicted(self):
+        """Test that the entry limit evicts the least recently read entry first."""
+        cache = TxCache(max_entries=2)
+        cache.put("a", make_tx())
+        cache.put("b", make_tx())
+        cache.get("a")
+        cache.put("c", make_tx())
+
+        self.assertIn("a", cache)
+        self.assertNotIn("b", cache)
+        self.assertIn("c", cache)
+        self.assertEqual(cache.stats()["evictions"], 1)
+
+    def test_byte_limit(self):
+        """Test that entries are evicted until the cached size fits, keeping the newest one whatever its size."""
+        entry_size = len(json.dumps(make_tx(data="x" * 100)))
+        cache = TxCache(max_bytes=entry_size * 2)
+        for tx_hash in ("a", "b", "c"):
+            cache.put(tx_hash, make_tx(data="x" * 100))
+
+        self.assertEqual(len(cache), 2)
+        self.assertNotIn("a", cache)
+        self.assertEqual(cache.size, entry_size * 2)
+
+        cache.put("big", make_tx(data="x" * 1000))
+        self.assertEqual(len(cache), 1)
+        self.assertIn("big", cache)
+
+    def test_pending_transactions_expire(self):
+        """Test that transactions that aren't final expire after the pending ttl, while final ones are kept."""
+        cache = TxCache(pending_ttl=6)
+        cache.put("pending", make_tx(status="pending"))
+        cache.put("final", make_tx())
+
+        self.clock.sleep(5)
+        self.assertIsNotNone(cache.get("pending"))
+        self.clock.sleep(1)
+        self.assertIsNone(cache.get("pending"))
+        self.assertIsNotNone(cache.get("final"))
+        self.assertEqual(cache.size, cache.get_entry("final").size)
+
+    def test_replacing_an_entry(self):
+        """Test that putting a hash again replaces its entry and its accounted size."""
+        cache = TxCache()
+        cache.put("a", make_tx(status="pending"))
+        entry = cache.put("a", make_tx(data="x" * 10))
+
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache.size, entry.size)
+        self.assertIsNone(entry.expires_at)
+
+
+class TestTokenBucket(unittest.TestCase):
+    """Test cases for TokenBucket pacing."""
+
+    def setUp(self):
+        self.clock = FakeClock()
+        patcher = mock.patch.object(utils_tx, "time", self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_acquire_within_capacity(self):
+        """Test that a full bucket serves its capacity at once, then paces at the rate."""
+        bucket = TokenBucket(100)
+        bucket.acquire(100)
+        self.assertEqual(self.clock.slept, 0)
+
+        bucket.acquire(50)
+        self.assertAlmostEqual(self.clock.slept, 0.5)
+
+    def test_chunk_larger_than_capacity(self):
+        """Test that a chunk larger than the bucket costs its full size, paid in capacity sized slices."""
+        bucket = TokenBucket(100)
+        bucket.acquire(100)
+        bucket.acquire(300)
+
+        self.assertAlmostEqual(self.clock.slept, 3.0)
+        self.assertAlmostEqual(bucket.tokens, 0)
+
+    def test_rate_over_many_oversized_chunks(self):
+        """Test that the sustained rate holds when every chunk is larger than the bucket."""
+        bucket = TokenBucket(10)
+        for _ in range(10):
+            bucket.acquire(25)
+
+        # the first 10 tokens were in the bucket already
+        self.assertAlmostEqual(self.clock.now, (250 - 10) / 10)
+
+
+class FakeSendProxy:
+    """Fails the first sends with the given errors, then accepts every transaction whose nonce isn't rejected."""
+
+    def __init__(self, errors=(), rejected_nonces=()):
+        self.errors = list(errors)
+        self.rejected_nonces = set(rejected_nonces)
+        self.sent = 0
+
+    def send_transactions(self, transactions):
+        self.sent += len(transactions)
+        if self.errors:
+            raise self.errors.pop(0)
+        hashes = [b"" if tx.nonce in self.rejected_nonces else tx.nonce.to_bytes(32, "big") for tx in transactions]
+        return len([tx_hash for tx_hash in hashes if tx_hash]), hashes
+
+
+class TestTransactionBroadcaster(unittest.TestCase):
+    """Test cases for TransactionBroadcaster retries."""
+
+    def setUp(self):
+        sender = Address(bytes(31) + b"\x01", "erd")
+        self.transactions = [Transaction(sender=sender, receiver=sender, gas_limit=50000, chain_id="localnet",
+                                         nonce=nonce) for nonce in range(1, 5)]
+
+    def broadcast(self, proxy: FakeSendProxy):
+        broadcaster = TransactionBroadcaster(proxy, rate=None, chunk_size=2, max_workers=1, max_retries=3)
+        return broadcaster, broadcaster.broadcast(self.transactions)
+
+    def test_rejected_transactions_are_not_retried(self):
+        """Test that transactions the proxy rejected are dropped without being sent again."""
+        proxy = FakeSendProxy(rejected_nonces={2})
+        broadcaster, hashes = self.broadcast(proxy)
+
+        self.assertEqual([bool(tx_hash) for tx_hash in hashes], [True, False, True, True])
+        self.assertEqual(proxy.sent, 4)
+        self.assertEqual(broadcaster.stats["dropped"], 1)
+        self.assertEqual(broadcaster.stats["retried"], 0)
+
+    def test_throttled_chunks_are_retried(self):
+        """Test that chunks failing with throttling or transport errors are sent again."""
+        errors = [NetworkProviderError("send-multiple", "429 Too Many Requests"),
+                  NetworkProviderError("send-multiple", requests.ConnectionError("refused"))]
+        proxy = FakeSendProxy(errors)
+        broadcaster, hashes = self.broadcast(proxy)
+
+        self.assertTrue(all(hashes))
+        self.assertEqual(broadcaster.stats["retried"], 4)
+
+    def test_failed_chunks_are_not_retried(self):
+        """Test that a chunk the proxy refused for cause is dropped."""
+        proxy = FakeSendProxy([NetworkProviderError("send-multiple", "code:bad_request, error: invalid chain ID")])
+        broadcaster, hashes = self.broadcast(proxy)
+
+        self.assertEqual([bool(tx_hash) for tx_hash in hashes], [False, False, True, True])
+        self.assertEqual(broadcaster.stats["retried"], 0)
+        self.assertEqual(broadcaster.stats["dropped"], 2)
+
+    def test_retries_are_bounded(self):
+        """Test that a chunk throttled on every attempt is dropped after max_retries."""
+        proxy = FakeSendProxy([requests.Timeout("timed out")] * 100)
+        broadcaster, hashes = self.broadcast(proxy)
+
+        self.assertFalse(any(hashes))
+        self.assertEqual(proxy.sent, 4 * 4)
+        self.assertEqual(broadcaster.stats["retried"], 4 * 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
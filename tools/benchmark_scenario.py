@@ -0,0 +1,54 @@
+import importlib
+import inspect
+import sys
+from argparse import ArgumentParser
+from datetime import datetime
+from typing import List
+
+import config
+from utils.benchmark import BENCHMARK_FINALITY_TIMEOUT, BenchmarkRecorder
+from utils.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+
+def main(cli_args: List[str]):
+    """Runs a scenario under a BenchmarkRecorder, e.g.:
+    python3 tools/benchmark_scenario.py scenarios.stress_workload --name swaps -- --count 1000 --tps 200"""
+    parser = ArgumentParser()
+    parser.add_argument("scenario", help="scenario module, e.g. scenarios.stress_create_positions")
+    parser.add_argument("--name", required=False, default="", help="results file prefix; default is module and time")
+    parser.add_argument("--proxy", required=False, default=config.DEFAULT_PROXY)
+    parser.add_argument("--api", required=False, default="", help="api used to detect completion in batches")
+    parser.add_argument("--timeout", required=False, default=str(BENCHMARK_FINALITY_TIMEOUT),
+                        help="seconds to wait for sent transactions to complete after the scenario ends")
+    # everything after the first -- goes to the scenario untouched
+    if "--" in cli_args:
+        split = cli_args.index("--")
+        cli_args, scenario_args = cli_args[:split], cli_args[split + 1:]
+    else:
+        scenario_args = []
+    args = parser.parse_args(cli_args)
+
+    scenario_main = importlib.import_module(args.scenario).main
+    name = args.name or f"{args.scenario.split('.')[-1]}_{datetime.now().strftime('%d_%H_%M_%S')}"
+
+    recorder = BenchmarkRecorder(args.proxy, args.api)
+    recorder.start()
+    try:
+        # older scenarios take no arguments
+        if inspect.signature(scenario_main).parameters:
+            scenario_main(scenario_args)
+        else:
+            scenario_main()
+    except KeyboardInterrupt:
+        logger.info("Scenario interrupted, reporting what was sent so far.")
+    finally:
+        recorder.stop(float(args.timeout))
+        recorder.export(name)
+        logger.info(recorder.report())
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
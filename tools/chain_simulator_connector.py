@@ -1,4 +1,3 @@
-import os
 from pathlib import Path
 import subprocess
 import sys
@@ -9,16 +8,16 @@ import config
 from argparse import ArgumentParser
 from typing import Any, List
 from context import Context
-from contracts.contract_identities import DEXContractInterface
 import requests
-from utils.utils_chain import string_to_hex
 from utils.utils_chain import WrapperAddress
 from utils.logger import get_logger
 from utils.utils_generic import log_step_fail, log_step_pass, log_warning
-from tools.runners.account_state_runner import get_account_keys_online, get_account_data_online
+from tools.state_catalog import ROLE_CONTRACT, ROLE_SYSTEM_ACCOUNT, ROLE_USER, get_state_catalog, register_state_file
+from tools.state_loader import StateLoader, load_states
+from tools.state_snapshot import SYSTEM_ACCOUNT_ADDRESS, StateSnapshot, get_default_snapshots_folder
 from multiversx_sdk import ProxyNetworkProvider
 from multiversx_sdk.core.address import Address
-from utils.utils_tx import ESDTToken
+from utils.utils_tx import invalidate_network_config
 
 
 logger = get_logger(__name__)
@@ -48,79 +47,38 @@ def is_smart_contract(address: str) -> bool:
         return False
     
 
-def get_sc_states_files_in_folder(state_folder: Path) -> str | None:
-    state_files = list(state_folder.iterdir())
-    all_keys_file = None
+def get_sc_states_files_in_folder(state_folder: Path) -> Path | None:
+    return get_state_catalog(state_folder).get_sc_states_file()
 
-    for file in state_files:
-        if "all_all_keys.json" in file.name:
-            all_keys_file = file
-            break
 
-    return all_keys_file
+def get_address_state_files_in_folder(state_folder: Path, addresses: list[str]) -> list[Path]:
+    return get_state_catalog(state_folder).find([ROLE_USER, ROLE_CONTRACT, ROLE_SYSTEM_ACCOUNT], addresses, block=0)
 
 
 def get_address_states_in_folder(state_folder: Path, addresses: list[str]) -> list[dict[str, Any]] | None:
     states = []
     
-    for address in addresses:
-        logger.debug(f"Loading state for {address}")
-        user_path = f"0_{address}_0_chain_config_state.json"
-        system_account_path = f"0_system_account_state_{address}.json"
-        
-        user_file = state_folder / user_path
-        system_file = state_folder / system_account_path
-        
-        if user_file.exists():
-            with open(user_file, "r") as file:
-                user_state = json.load(file)
-                if user_state:
-                    logger.debug(f"Found {user_file.name}")
-                    states.append(user_state)
-                
-        if system_file.exists():
-            with open(system_file, "r") as file:
-                system_state = json.load(file)
-                if system_state:
-                    logger.debug(f"Found {system_file.name}")
-                    states.append(system_state)
+    for state_file in get_address_state_files_in_folder(state_folder, addresses):
+        logger.debug(f"Loading state from {state_file.name}")
+        with open(state_file, "r") as file:
+            state = json.load(file)
+            if state:
+                states.append(state)
             
     return states
 
 def get_standalone_addresses_in_folder(state_folder: Path) -> tuple[list[str], list[str]]:
-    state_files = list(state_folder.iterdir())
-    users = []
-    contracts = []
-    for file in state_files:
-        if "_chain_config_state.json" in file.name:
-            # Smart contracts are already in all_all_keys.json, except the manually fetched ones + user addresses
-            filename_no_ext = file.stem
-            potential_address = filename_no_ext.split("_")[1]
-            if is_valid_address(potential_address) and not is_smart_contract(potential_address): 
-                users.append(potential_address)
-            elif is_valid_address(potential_address) and is_smart_contract(potential_address): 
-                contracts.append(potential_address)
-    return users, contracts
+    # Smart contracts are already in all_all_keys.json, except the manually fetched ones + user addresses
+    catalog = get_state_catalog(state_folder)
+    return catalog.get_addresses(ROLE_USER), catalog.get_addresses(ROLE_CONTRACT)
 
 
 def get_standalone_contracts_in_folder(state_folder: Path) -> list[str]:
-    state_files = list(state_folder.iterdir())
-    contracts = []
-    for file in state_files:
-        if "_chain_config_state.json" in file.name:
-            filename_no_ext = file.stem
-            potential_address = filename_no_ext.split("_")[1]
-            if is_valid_address(potential_address) and is_smart_contract(potential_address): 
-                contracts.append(potential_address)
-    return contracts
+    return get_state_catalog(state_folder).get_addresses(ROLE_CONTRACT)
+
 
 def get_shard_chronology_in_folder(state_folder: Path) -> dict[str, int] | None:
-    state_files = list(state_folder.iterdir())
-    for file in state_files:
-        if "shard_chronology.json" in file.name:
-            with open(file, 'r', encoding="UTF-8") as f:
-                return json.load(f)
-    return None
+    return get_state_catalog(state_folder).get_chronology()
 
 
 def get_all_sc_states_in_folder(state_folder: Path) -> list[str]:
@@ -176,31 +134,35 @@ class ChainSimulator:
                 pass
         return process_running or instance_running
 
-    def apply_states(self, states: list[list[dict[str, Any]]]):
-        for state in states:
-            response = requests.post(f"{self.proxy_url}/simulator/set-state", json=state)
-            if response.status_code != 200:
-                logger.error(f"Failed to apply states: {response.text}")
-                return False
-        return True
+    def apply_states(self, states: list[list[dict[str, Any]]]) -> bool:
+        return load_states(self.proxy_url, (state for state_list in states for state in state_list))
 
-    def init_state_from_folder(self, state_folder: Path) -> list[str]:
-        all_sc_states = get_all_sc_states_in_folder(state_folder)
+    def init_state_from_folder(self, state_folder: Path, accounts: list[str] | None = None) -> list[str]:
+        """Applies the contracts states and the standalone account states found in the folder,
+        only those of the given accounts if any."""
+        sc_states_file = get_sc_states_files_in_folder(state_folder)
         user_addresses, contract_addresses = get_standalone_addresses_in_folder(state_folder)
-        all_user_states = get_address_states_in_folder(state_folder, user_addresses)
-        all_standalone_contract_states = get_address_states_in_folder(state_folder, contract_addresses)
+        if accounts is not None:
+            accounts = set(accounts)
+            user_addresses = [address for address in user_addresses if address in accounts]
+            contract_addresses = [address for address in contract_addresses if address in accounts]
 
-        if all_sc_states:
-            self.apply_states(all_sc_states)
-            logger.info("Smart contracts states applied.")
+        # states are streamed from disk; an account found in several files gets the later states on top
+        with StateLoader(self.proxy_url) as loader:
+            if sc_states_file:
+                loader.load_file(sc_states_file)
+                logger.info("Smart contracts states queued.")
 
-        if all_standalone_contract_states:
-            self.apply_states(all_standalone_contract_states)
-            logger.info("Standalone contract states applied.")
+            for state_file in get_address_state_files_in_folder(state_folder, contract_addresses):
+                loader.load_file(state_file)
+            logger.info(f"Standalone contract states queued for {len(contract_addresses)} contracts.")
 
-        if all_user_states:
-            self.apply_states(all_user_states)
-            logger.info("User states applied.") 
+            for state_file in get_address_state_files_in_folder(state_folder, user_addresses):
+                loader.load_file(state_file)
+            logger.info(f"User states queued for {len(user_addresses)} users.")
+
+            if loader.flush():
+                logger.info("All states applied.")
 
         # return found user addresses
         return user_addresses
@@ -212,7 +174,9 @@ class ChainSimulator:
     
     def advance_epochs(self, number_of_epochs: int):
         blocks_to_advance = self.blocks_per_epoch * number_of_epochs
-        return self.advance_blocks(blocks_to_advance)
+        response = self.advance_blocks(blocks_to_advance)
+        invalidate_network_config(self.proxy_url)
+        return response
     
     def advance_epochs_to_epoch(self, target_epoch: int):
         proxy = ProxyNetworkProvider(self.proxy_url)
@@ -220,7 +184,9 @@ class ChainSimulator:
         if current_epoch >= target_epoch:
             return
         blocks_to_advance = (target_epoch - current_epoch) * self.blocks_per_epoch
-        return self.advance_blocks(blocks_to_advance)
+        response = self.advance_blocks(blocks_to_advance)
+        invalidate_network_config(self.proxy_url)
+        return response
 
     def _update_docker_compose(self, block: int, round: int, epoch: int):
         # Load the docker-compose.yaml file
@@ -245,11 +211,7 @@ class ChainSimulator:
         logger.info(f"Updated {self.docker_path / 'docker-compose.yaml'} with block {block}, round {round}, epoch {epoch}.")
 
     def fund_users_w_egld(self, users: list[str], amount: int):
-        for user in users:
-            self.apply_states([[{
-                    "address": user,
-                    "balance": str(amount),
-                }]])
+        load_states(self.proxy_url, ({"address": user, "balance": str(amount)} for user in users))
         logger.debug(f'Funded {len(users)} users with {amount} EGLD')
         
     def fund_users_w_esdt_from_mainnet(self, users: list[str], esdt: str, amount: int):
@@ -277,13 +239,12 @@ class ChainSimulator:
         header = current_entry.value.hex()[:2]
         new_entry = f"{header}{dec_to_padded_hex(len(dec_to_padded_hex(amount)) // 2 + 1)}{'00'}{dec_to_padded_hex(amount)}"
 
-        for user in users:
-            self.apply_states([[{
-                    "address": user,
-                    "pairs": {
-                        current_entry.key.encode().hex(): new_entry
-                    }
-                }]])
+        load_states(self.proxy_url, ({
+                "address": user,
+                "pairs": {
+                    current_entry.key.encode().hex(): new_entry
+                }
+            } for user in users))
         logger.debug(f'Funded {len(users)} users with {amount} {esdt}')
 
 def get_retrieve_block(proxy: ProxyNetworkProvider, shard: int, block: int) -> int:
@@ -296,19 +257,6 @@ def get_retrieve_block(proxy: ProxyNetworkProvider, shard: int, block: int) -> i
     return block_number
 
 
-def get_current_shard_chronology(proxy: ProxyNetworkProvider, shard: int = None) -> dict:
-    # returns current epoch, round, block 
-    # TODO: not sure if timestamp is necessary as well
-    response = proxy.get_network_status(shard)
-    response_dict = {
-        "epoch": response.current_epoch,
-        "round": response.current_round,
-        "block": response.highest_final_block_nonce
-    }
-
-    return response_dict
-
-
 def get_contract_retrieval_labels(contracts: str) -> List[str]:
     labels = []
     base_labels = [config.EGLD_WRAPS, config.LOCKED_ASSETS, config.SIMPLE_LOCKS_ENERGY, 
@@ -336,207 +284,100 @@ def get_context_used_tokens(context: Context) -> List[str]:
     return contract_tokens
 
 
-def fetch_account_state(address: str, proxy: ProxyNetworkProvider, block_number: int,
-                        file_label: str, file_index: int) -> dict[str, Any]:
-    keys_file = f"{config.DEFAULT_WORKSPACE.absolute()}/{STATES_FOLDER}/{block_number}_{file_label}_{file_index}_state.json"
-    data_file = f"{config.DEFAULT_WORKSPACE.absolute()}/{STATES_FOLDER}/{block_number}_{file_label}_{file_index}_data.json"
-    chain_config_file = f"{config.DEFAULT_WORKSPACE.absolute()}/{STATES_FOLDER}/{block_number}_{file_label}_{file_index}_chain_config_state.json"
-    keys = get_account_keys_online(address, proxy.url, block_number, keys_file, paginated=False)
-    data = get_account_data_online(address, proxy.url, block_number, data_file)
-    data.pop("rootHash", None) # remove rootHash from data
-    
-    account_state = {}
-    account_state.update(data)
-    account_state['pairs'] = keys
-
-    # save account chain config state to file
-    with open(chain_config_file, 'w', encoding="UTF-8") as state_writer:
-        json.dump([account_state], state_writer, indent=4)
-    logger.info(f"Chain config account state for {address} has been saved to {chain_config_file}.")
-
-    return account_state
-
-
-def get_token_key_hex(token: ESDTToken) -> str:
-    return f"{string_to_hex('ELRONDesdt')}{string_to_hex(token.token_id)}"
-
-
-def get_token_nonce_key_hex(token: ESDTToken) -> str:
-    return f"{get_token_key_hex(token)}{token.get_token_nonce_hex()}"
-
-
-def fetch_token_system_account_attributes(proxy: ProxyNetworkProvider, token: ESDTToken, block_number: int = 0) -> dict[str, str]:
-    block_param = f"?blockNonce={block_number}" if block_number else ""
-    key = get_token_key_hex(token)
-    resource_url = f"address/erd1lllllllllllllllllllllllllllllllllllllllllllllllllllsckry7t/key/{key}{block_param}"
-    response = proxy.do_get_generic(resource_url)
-    return {key: response.get("value", "")}
-
-
-def fetch_token_nonce_system_account_attributes(proxy: ProxyNetworkProvider, token: ESDTToken, block_number: int = 0) -> dict[str, str]:
-    block_param = f"?blockNonce={block_number}" if block_number else ""
-    key = get_token_nonce_key_hex(token)
-    resource_url = f"address/erd1lllllllllllllllllllllllllllllllllllllllllllllllllllsckry7t/key/{key}{block_param}"
-    response = proxy.do_get_generic(resource_url)
-    return {key: response.get("value", "")}
-
-
-def fetch_context_system_account_state_from_account(proxy: ProxyNetworkProvider, context: Context, address: str, block_number: int = 0) -> dict[str, Any]:
-    """
-    Fetch system account keys for all the context related meta esdts the account owns.
-    """
-    sys_account_keys = {}
-
-    context_tokens = get_context_used_tokens(context)
-
-    try:
-        user_tokens = proxy.get_non_fungible_tokens_of_account(WrapperAddress(address))
-    except Exception as e:
-        logger.error(f"Error fetching non-fungible tokens of account {address}: {e}")
-        logger.error("System account state for this account will not be retrieved.")
-        return {}
-    
-    logger.debug(f"Starting retrieval of system account keys for context related meta esdts owned by {address}.")
-    logger.debug(f"Number of meta esdt tokens found in account: {len(user_tokens)}")
-    for token in user_tokens:
-        print(f"\rProcessing token {user_tokens.index(token) + 1}/{len(user_tokens)}", end="", flush=True) # this can take a while depending on the number of tokens
-
-        temp_token = ESDTToken.from_full_token_name(token.token.identifier)
-        if not temp_token.token_id in context_tokens:
-            continue
-        sys_account_token_attributes = fetch_token_nonce_system_account_attributes(proxy, temp_token, block_number)
-        sys_account_keys.update(sys_account_token_attributes)
-    print() # new line after progress bar
-
-    sys_account_state = {
-        "address": "erd1lllllllllllllllllllllllllllllllllllllllllllllllllllsckry7t",
-        "pairs": sys_account_keys
-    }
-
-    # save system account state to file
-    sys_account_state_file = f"{config.DEFAULT_WORKSPACE.absolute()}/{STATES_FOLDER}/{block_number}_system_account_state_{address}.json"
-    with open(sys_account_state_file, 'w', encoding="UTF-8") as state_writer:
-        json.dump([sys_account_state], state_writer, indent=4)
-    logger.info(f"System account state for tokens in {address} has been saved to {sys_account_state_file}.")
-
-    return sys_account_state
-
-
-def fetch_system_account_state_from_token(token: str, proxy: ProxyNetworkProvider, block_number: int = 0) -> dict[str, Any]:
-    sys_account_keys = fetch_token_nonce_system_account_attributes(proxy, ESDTToken.from_full_token_name(token), block_number)
-
-    # TODO: need a fix below to uncomment the fetch_token_system_account_attributes function; 
-    # TODO: transfer roles on chain simulator don't work correctly if this is active, but without it, some roles can't be correctly assigned
-    # sys_account_keys.update(fetch_token_system_account_attributes(proxy, ESDTToken.from_full_token_name(token), block_number))
-
-    sys_account_state = {
-        "address": "erd1lllllllllllllllllllllllllllllllllllllllllllllllllllsckry7t",
-        "pairs": sys_account_keys
-    }
-
-    # save system account state to file
-    sys_account_state_file = f"{config.DEFAULT_WORKSPACE.absolute()}/{STATES_FOLDER}/{block_number}_system_account_state_{token}.json"
-    with open(sys_account_state_file, 'w', encoding="UTF-8") as state_writer:
-        json.dump([sys_account_state], state_writer, indent=4)
-    logger.info(f"System account state for {token} has been saved to {sys_account_state_file}.")
-
-    return sys_account_state
-
-
-def compose_system_account_state_from_contract_state(contract: DEXContractInterface, contract_state: dict[str, Any], proxy: ProxyNetworkProvider, block_number: int = 0) -> dict[str, Any]:
-    """
-    Compose system account state from contract state by searching for meta esdts for which the contract is the creator (not owner). 
-    It looks for the existence of the last nonce of each token and fetches the system account state for that nonce.
-    """
-    system_account_state = {}
-    tokens = contract.get_contract_tokens()
-    
-    for token in tokens:
-        # Convert 'ELRONDnonce' and token name to hex
-        elrond_nonce_hex = string_to_hex('ELRONDnonce')
-        token_hex = string_to_hex(token)
-        search_key = f"{elrond_nonce_hex}{token_hex}"
-
-        # Search through contract state keys
-        if search_key in contract_state['pairs'].keys():
-            # Found matching key, get nonce value and fetch system account state
-            nonce = contract_state['pairs'][search_key]
-
-            token_with_nonce = f"{token}-{nonce}"
-            token_system_account_state = fetch_system_account_state_from_token(token_with_nonce, proxy, block_number)
-            # Merge the pairs from token_system_account_state into system_account_state
-            if not system_account_state:
-                system_account_state = token_system_account_state
-            else:
-                system_account_state["pairs"].update(token_system_account_state["pairs"])
-
-    return system_account_state
-
 def fetch_contract_states(context: Context, args, proxy: ProxyNetworkProvider, block_number: int = 0) -> dict[str, Any]:
-    contracts_shard = WrapperAddress(context.get_contracts(config.ROUTER_V2)[0].address).get_shard()
-    all_keys: list[dict] = []
-    
+    # all contracts and system account keys are fetched at the same block, the latest final one if none is given
+    snapshot = StateSnapshot(proxy.url, block_number, context_tokens=get_context_used_tokens(context))
+
     # get contracts state
     contract_labels = get_contract_retrieval_labels(args.contracts)
     for label in contract_labels:
-        logger.info(f"Retrieving {label} contracts state.")
         contracts = context.get_contracts(label)
 
         # if contract index is provided, retrieve only that contract state
+        indexes = range(len(contracts))
         if args.contract_index:
             index = int(args.contract_index)
             if index >= len(contracts):
                 log_step_fail(f"Contract index {index} is out of bounds for {label} contracts.")
                 return []
-            contracts = [contracts[index]]
-
-        # retrieve keys and data for each contract
-        for i, contract in enumerate(contracts):
-            logger.info(f"Retrieving state for {label} contract {i + 1}/{len(contracts)}.")
-            account_state = fetch_account_state(contract.address, proxy, block_number, label, i)
-            all_keys.append(account_state)
-
-            # search for meta esdts created by the contract and fetch the system account state for their last nonce
-            system_account_state = compose_system_account_state_from_contract_state(contract, account_state, proxy, block_number)
-            if system_account_state:
-                all_keys.append(system_account_state)
+            indexes = [index]
 
-            # get system account state for all the context related meta esdts the contract owns
-            system_account_state = fetch_context_system_account_state_from_account(proxy, context, contract.address, block_number)
-            if system_account_state:
-                all_keys.append(system_account_state)
+        # keys and data for each contract, plus the system account keys of the meta esdts it created or owns
+        for i in indexes:
+            contract = contracts[i]
+            snapshot.add_account(contract.address, label, i, contract.get_contract_tokens())
 
     # get ESDT issue account state
-    logger.info(f"Retrieving state for ESDT issue account.")
-    account_state = fetch_account_state(config.TOKENS_CONTRACT_ADDRESS, proxy, block_number, "esdt_issue", 0)
-    if account_state:
-        all_keys.append(account_state)
+    snapshot.add_account(config.TOKENS_CONTRACT_ADDRESS, "esdt_issue", 0, owned_tokens=False)
+
+    snapshot.take()
+    block_number = snapshot.block_number
+    all_keys = snapshot.get_states()
+    snapshot.save(get_default_snapshots_folder(), args.contracts.replace(",", "-"))
 
     # dump all keys to a file
     all_keys_file = f"{config.DEFAULT_WORKSPACE.absolute()}/{STATES_FOLDER}/{block_number}_{args.contracts}_all_keys.json"
     with open(all_keys_file, 'w', encoding="UTF-8") as state_writer:
         json.dump(all_keys, state_writer, indent=4)
+    register_state_file(all_keys_file)
     logger.info(f"State for {args.contracts} contracts has been retrieved and saved to {all_keys_file}.")
 
-    chronology = get_current_shard_chronology(proxy, contracts_shard)
-    logger.info(f"Current shard chronology: {chronology}")
+    chronology = snapshot.chronology
+    logger.info(f"Shard chronology: {chronology}")
     # save chronology to file
     chronology_file = f"{config.DEFAULT_WORKSPACE.absolute()}/{STATES_FOLDER}/{block_number}_shard_chronology.json"
     with open(chronology_file, 'w', encoding="UTF-8") as chronology_writer:
         json.dump(chronology, chronology_writer, indent=4)
+    register_state_file(chronology_file)
     logger.info(f"Shard chronology has been saved to {chronology_file}.")
 
     return all_keys
 
 
+def save_states_file(path: str, states: List[dict[str, Any]]):
+    with open(path, 'w', encoding="UTF-8") as state_writer:
+        json.dump(states, state_writer, indent=4)
+    register_state_file(path)
+
+
 def fetch_user_state_with_tokens(user_address: str, context: Context, proxy: ProxyNetworkProvider, block_number: int = 0) -> dict[str, Any]:
-    address = WrapperAddress(user_address)
+    """Fetches the state of a user account, plus the system account keys of the context related meta esdts it owns."""
+    address = WrapperAddress(user_address).bech32()
+    snapshot = StateSnapshot(proxy.url, block_number, pin=False, context_tokens=get_context_used_tokens(context))
+    snapshot.add_account(address, user_address, 0)
+    snapshot.take()
+    account_state = snapshot.accounts[0].state
+
+    states_folder = f"{config.DEFAULT_WORKSPACE.absolute()}/{STATES_FOLDER}"
+    data = {key: value for key, value in account_state.items() if key != "pairs"}
+    save_states_file(f"{states_folder}/{block_number}_{user_address}_0_state.json", account_state["pairs"])
+    save_states_file(f"{states_folder}/{block_number}_{user_address}_0_data.json", data)
+    chain_config_file = f"{states_folder}/{block_number}_{user_address}_0_chain_config_state.json"
+    save_states_file(chain_config_file, [account_state])
+    logger.info(f"Chain config account state for {address} has been saved to {chain_config_file}.")
+
+    sys_account_state_file = f"{states_folder}/{block_number}_system_account_state_{address}.json"
+    save_states_file(sys_account_state_file, [{"address": SYSTEM_ACCOUNT_ADDRESS, "pairs": snapshot.system_account_pairs}])
+    logger.info(f"System account state for tokens in {address} has been saved to {sys_account_state_file}.")
+
+    return account_state
+
+
+def fetch_system_account_state_from_token(token: str, proxy: ProxyNetworkProvider, block_number: int = 0) -> dict[str, Any]:
+    snapshot = StateSnapshot(proxy.url, block_number, pin=False)
+    snapshot.add_system_account_token(token)
+
+    # TODO: need a fix below to also add the token's own system account key (get_token_key_hex);
+    # TODO: transfer roles on chain simulator don't work correctly if this is active, but without it, some roles can't be correctly assigned
+    snapshot.take()
+    sys_account_state = {"address": SYSTEM_ACCOUNT_ADDRESS, "pairs": snapshot.system_account_pairs}
 
-    # get user account state
-    _ = fetch_account_state(address.bech32(), proxy, block_number, user_address, 0)
+    # save system account state to file
+    sys_account_state_file = f"{config.DEFAULT_WORKSPACE.absolute()}/{STATES_FOLDER}/{block_number}_system_account_state_{token}.json"
+    save_states_file(sys_account_state_file, [sys_account_state])
+    logger.info(f"System account state for {token} has been saved to {sys_account_state_file}.")
 
-    # compose system account token attributes
-    _ = fetch_context_system_account_state_from_account(proxy, context, address.bech32(), block_number)
+    return sys_account_state
 
 
 def retrieve_handler(args: Any):
@@ -593,10 +434,24 @@ def start_handler(args: Any) -> tuple[ChainSimulator, list[str]]:
     
     chain_sim = ChainSimulator(Path(args.docker_path))
     chain_sim.start(block=chronology["block"], round=chronology["round"], epoch=chronology["epoch"])
-    found_accounts = chain_sim.init_state_from_folder(Path(args.state_path))
+    accounts = args.accounts.split(",") if getattr(args, 'accounts', "") else None
+    found_accounts = chain_sim.init_state_from_folder(Path(args.state_path), accounts)
 
     return chain_sim, found_accounts
 
+def catalog_handler(args: Any):
+    state_path = Path(args.state_path) if args.state_path else config.DEFAULT_WORKSPACE.absolute() / STATES_FOLDER
+    if not state_path.is_dir():
+        log_step_fail(f"State path {state_path} does not exist.")
+        return
+
+    catalog = get_state_catalog(state_path)
+    catalog.refresh(force=True)
+    for role, totals in sorted(catalog.get_summary().items()):
+        logger.info(f"{role}: {totals['files']} files, {totals['size'] / 1024 / 1024:.1f} MB")
+    log_step_pass(f"Catalog of {state_path} saved in {catalog.path}.")
+
+
 def main(cli_args: List[str]):
     parser = ArgumentParser()
     subparsers = parser.add_subparsers()
@@ -614,7 +469,12 @@ def main(cli_args: List[str]):
     start_parser = subparsers.add_parser('start', help='start chain simulator')
     start_parser.add_argument("--docker-path", required=False, default="", help="path to full stack chain simulator docker compose folder")
     start_parser.add_argument("--state-path", required=False, default="", help="path to folder where chain simulator states are saved")
+    start_parser.add_argument("--accounts", required=False, default="", help="comma separated addresses of the standalone accounts to load; all if empty")
     start_parser.set_defaults(func=start_handler)
+
+    catalog_parser = subparsers.add_parser('catalog', help='rebuild and summarize the catalog of a state folder')
+    catalog_parser.add_argument("--state-path", required=False, default="", help="path to folder where chain simulator states are saved")
+    catalog_parser.set_defaults(func=catalog_handler)
     
     args = parser.parse_args(cli_args)
     if not hasattr(args, 'func'):
@@ -2,15 +2,19 @@ from pathlib import Path
 import binascii
 import os
 import json
-from typing import List
+from typing import Any, Dict, List, Optional, Type
 from multiversx_sdk import Address, ProxyNetworkProvider
 import requests
 from tools.runners.account_state_runner import get_account_keys_online, report_key_files_compare
+from tools.state_snapshot import StateSnapshot
+from utils.logger import get_logger
 from utils.utils_chain import Account, base64_to_hex
 import config
+from utils.contract_data_fetchers import DataFetcher, QueryBatch
 from utils.utils_tx import NetworkProviders
 from utils.utils_generic import ensure_folder
 
+logger = get_logger(__name__)
 
 PROXY = config.DEFAULT_PROXY
 OUTPUT_FOLDER = config.UPGRADER_OUTPUT_FOLDER
@@ -50,13 +54,44 @@ def fetch_and_save_contracts(contract_addresses: list, contract_label: str, save
         print(f"Dumped {contract_label} data in {save_path}")
 
 
+def fetch_contracts_view(fetcher_class: Type[DataFetcher], contract_addresses: List[str], proxy_url: str,
+                         view_name: str) -> Dict[str, Any]:
+    """Query the same view on all given contracts concurrently; returns results keyed by contract address"""
+
+    batch = QueryBatch()
+    for address in contract_addresses:
+        batch.add(fetcher_class.for_contract(Address.new_from_bech32(address), proxy_url), view_name)
+
+    return dict(zip(contract_addresses, batch.run()))
+
+
 def fetch_contracts_states(prefix: str, network_providers: NetworkProviders, contract_addresses: List[str], label: str):
     """Fetch contracts states"""
 
-    for contract_address in contract_addresses:
-        filename = get_contract_save_name(label, contract_address, prefix)
-        get_account_keys_online(contract_address, network_providers.proxy.url,
-                                with_save_in=str(OUTPUT_FOLDER / f"{filename}.json"))
+    fetch_labeled_contracts_states(prefix, network_providers, {label: contract_addresses}, pin=False, save_bundle=False)
+
+
+def fetch_labeled_contracts_states(prefix: str, network_providers: NetworkProviders, labeled_addresses: Dict[str, List[str]],
+                                   pin: bool = True, save_bundle: bool = True) -> Optional[Path]:
+    """Fetch the states of all given contracts concurrently, at the same block if pinned.
+    Saves each contract's keys and, if requested, the whole snapshot bundle, whose path is returned."""
+
+    snapshot = StateSnapshot(network_providers.proxy.url, pin=pin, with_account_data=False)
+    for label, contract_addresses in labeled_addresses.items():
+        for index, contract_address in enumerate(contract_addresses):
+            snapshot.add_account(contract_address, label, index)
+    snapshot.take()
+
+    ensure_folder(OUTPUT_FOLDER)
+    for account in snapshot.accounts:
+        if not account.state["pairs"]:
+            continue
+        filename = get_contract_save_name(account.label, account.address, prefix)
+        with open(OUTPUT_FOLDER / f"{filename}.json", 'w', encoding="UTF-8") as state_writer:
+            json.dump(account.state["pairs"], state_writer, indent=4)
+    logger.info(f"Dumped the retrieved states of {len(snapshot.accounts)} contracts in: {OUTPUT_FOLDER}")
+
+    return snapshot.save(OUTPUT_FOLDER, prefix) if save_bundle else None
 
 
 def fetch_new_and_compare_contract_states(contract_type: str, contract_address, network_providers: NetworkProviders):
@@ -5,8 +5,7 @@ from typing import Any, List
 from argparse import ArgumentParser
 from multiversx_sdk import Address
 from context import Context
-from tools.runners.account_state_runner import get_account_keys_online
-from tools.common import API, OUTPUT_FOLDER, PROXY, fetch_contracts_states, get_contract_save_name
+from tools.common import API, OUTPUT_FOLDER, PROXY, fetch_contracts_view, fetch_labeled_contracts_states
 from tools.runners import pair_runner, farm_runner, \
     staking_runner, metastaking_runner, router_runner, \
     proxy_runner, locked_asset_runner, fees_collector_runner, \
@@ -47,6 +46,7 @@ def setup_parser():
     commands.append(locked_token_position_creator_runner.setup_parser(subparsers))
     commands.append(simple_lock_runner.setup_parser(subparsers))
     commands.append(generic_runner.setup_parser(subparsers))
+    commands.append(account_state_runner.setup_parser(subparsers))
 
     all_subparser = subparsers.add_parser('all', help='general group commands')
     all_subgroup_parser = all_subparser.add_subparsers()
@@ -73,20 +73,12 @@ def fetch_and_save_pause_state(_):
     network_providers = NetworkProviders(API, PROXY)
 
     contract_states = {}
-    for pair_address in pair_addresses:
-        data_fetcher = PairContractDataFetcher(Address.new_from_bech32(pair_address), network_providers.proxy.url)
-        contract_state = data_fetcher.get_data("getState")
-        contract_states[pair_address] = contract_state
-
-    for staking_address in staking_addresses:
-        data_fetcher = StakingContractDataFetcher(Address.new_from_bech32(staking_address), network_providers.proxy.url)
-        contract_state = data_fetcher.get_data("getState")
-        contract_states[staking_address] = contract_state
-
-    for farm_address in farm_addresses:
-        data_fetcher = FarmContractDataFetcher(Address.new_from_bech32(farm_address), network_providers.proxy.url)
-        contract_state = data_fetcher.get_data("getState")
-        contract_states[farm_address] = contract_state
+    contract_states.update(fetch_contracts_view(PairContractDataFetcher, pair_addresses,
+                                                network_providers.proxy.url, "getState"))
+    contract_states.update(fetch_contracts_view(StakingContractDataFetcher, staking_addresses,
+                                                network_providers.proxy.url, "getState"))
+    contract_states.update(fetch_contracts_view(FarmContractDataFetcher, farm_addresses,
+                                                network_providers.proxy.url, "getState"))
 
     with open(output_pause_states, 'w', encoding="UTF-8") as writer:
         json.dump(contract_states, writer, indent=4)
@@ -102,60 +94,45 @@ def fetch_all_contracts_states(args: Any):
     locked_asset_address = context.get_contracts("locked_assets")[0].address
     router_address = context.get_contracts("router_v2")[0].address
 
+    # all contracts are fetched together, at the same block
+    labeled_addresses = {}
+
     # get locked asset state
     if locked_asset_address:
-        filename = get_contract_save_name(locked_asset_runner.LOCKED_ASSET_LABEL, locked_asset_address, prefix)
-        get_account_keys_online(locked_asset_address, network_providers.proxy.url,
-                                with_save_in=str(OUTPUT_FOLDER / f"{filename}.json"))
+        labeled_addresses[locked_asset_runner.LOCKED_ASSET_LABEL] = [locked_asset_address]
     else:
         log_step_fail("Locked asset factory address not available. No state saved for this!")
 
     # get proxy dex state
-    # filename = get_contract_save_name(PROXY_DEX_LABEL, PROXY_DEX_CONTRACT, prefix)
-    # get_account_keys_online(PROXY_DEX_CONTRACT, network_providers.proxy.url,
-    #                         with_save_in=str(OUTPUT_FOLDER / f"{filename}.json"))
+    # labeled_addresses[PROXY_DEX_LABEL] = [PROXY_DEX_CONTRACT]
 
     # get router state
     if router_address:
-        filename = get_contract_save_name(config.ROUTER_V2, router_address, prefix)
-        get_account_keys_online(router_address, network_providers.proxy.url,
-                                with_save_in=str(OUTPUT_FOLDER / f"{filename}.json"))
+        labeled_addresses[config.ROUTER_V2] = [router_address]
     else:
         log_step_fail("Router address not available. No state saved for this!")
 
     # get template state
     router_data_fetcher = RouterContractDataFetcher(Address.new_from_bech32(router_address), network_providers.proxy.url)
     template_pair_address = Address.new_from_bech32(router_data_fetcher.get_data("getPairTemplateAddress")).bech32()
-    filename = get_contract_save_name(router_runner.TEMPLATE_PAIR_LABEL, template_pair_address, prefix)
-    get_account_keys_online(template_pair_address, network_providers.proxy.url,
-                            with_save_in=str(OUTPUT_FOLDER / f"{filename}.json"))
+    labeled_addresses[router_runner.TEMPLATE_PAIR_LABEL] = [template_pair_address]
 
     # get pairs contract states
-    pair_addresses = pair_runner.get_all_pair_addresses()
-    fetch_contracts_states(prefix, network_providers, pair_addresses, pair_runner.PAIRS_LABEL)
+    labeled_addresses[pair_runner.PAIRS_LABEL] = pair_runner.get_all_pair_addresses()
 
     # get staking states
-    staking_addresses = staking_runner.get_all_staking_addresses()
-    fetch_contracts_states(prefix, network_providers, staking_addresses, staking_runner.STAKINGS_LABEL)
+    labeled_addresses[staking_runner.STAKINGS_LABEL] = staking_runner.get_all_staking_addresses()
 
     # get metastaking states
-    metastaking_addresses = metastaking_runner.get_metastaking_v1_addresses()
-    fetch_contracts_states(prefix, network_providers, metastaking_addresses, metastaking_runner.METASTAKINGS_V1_LABEL)
-
-    metastaking_addresses = metastaking_runner.get_metastaking_v2_addresses()
-    fetch_contracts_states(prefix, network_providers, metastaking_addresses, metastaking_runner.METASTAKINGS_V2_LABEL)
-
-    # get farm v12 states
-    farm_v12_addresses = farm_runner.get_all_farm_v12_addresses()
-    fetch_contracts_states(prefix, network_providers, farm_v12_addresses, farm_runner.FARMSV12_LABEL)
+    labeled_addresses[metastaking_runner.METASTAKINGS_V1_LABEL] = metastaking_runner.get_metastaking_v1_addresses()
+    labeled_addresses[metastaking_runner.METASTAKINGS_V2_LABEL] = metastaking_runner.get_metastaking_v2_addresses()
 
-    # get farm v13 states
-    farm_v13_addresses = farm_runner.get_all_farm_v13_addresses()
-    fetch_contracts_states(prefix, network_providers, farm_v13_addresses, farm_runner.FARMSV13_LABEL)
+    # get farm states
+    labeled_addresses[farm_runner.FARMSV12_LABEL] = farm_runner.get_all_farm_v12_addresses()
+    labeled_addresses[farm_runner.FARMSV13_LABEL] = farm_runner.get_all_farm_v13_addresses()
+    labeled_addresses[farm_runner.FARMSV2_LABEL] = farm_runner.get_all_farm_v2_addresses()
 
-    # get farm v2 states
-    farm_v2_addresses = farm_runner.get_all_farm_v2_addresses()
-    fetch_contracts_states(prefix, network_providers, farm_v2_addresses, farm_runner.FARMSV2_LABEL)
+    fetch_labeled_contracts_states(prefix, network_providers, labeled_addresses)
 
 if __name__ == '__main__':
     main(sys.argv[1:])
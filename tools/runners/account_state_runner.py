@@ -1,18 +1,69 @@
 import json
 import os
+import sqlite3
+import time
 from argparse import ArgumentParser
-from typing import Dict, Any, Tuple
+from pathlib import Path
+from typing import Callable, Dict, Any, Iterator, List, Optional, Tuple, Union
 from multiversx_sdk import ProxyNetworkProvider, NetworkProviderConfig
 from multiversx_sdk.network_providers.errors import NetworkProviderError
 from utils.errors import GenericError
 import requests
-from utils.utils_generic import log_step_fail, log_step_pass, log_warning, get_continue_confirmation
+import config
+from utils.utils_generic import log_step_fail, log_step_pass, log_warning, read_json_file, write_json_file
 from utils.logger import get_logger
+from utils.state_diff import PairsSource, StateDiff, decode_key, diff_states
 
 
 logger = get_logger(__name__)
 
 
+ACCOUNT_KEYS_PAGE_SIZE = 100       # keys per iterate-keys request
+ACCOUNT_KEYS_RETRIES = 8            # attempts per request before giving up
+ACCOUNT_KEYS_RETRY_DELAY = 1        # seconds, doubled after each failed attempt
+ACCOUNT_KEYS_MAX_RETRY_DELAY = 60   # seconds
+ACCOUNT_KEYS_PROGRESS_INTERVAL = 100    # pages between progress logs
+ACCOUNT_KEYS_EXPORT_FORMATS = ["ndjson", "sqlite"]
+
+
+def setup_parser(subparsers: ArgumentParser) -> ArgumentParser:
+    """Set up argument parser for account state commands"""
+    group_parser = subparsers.add_parser('account', help='account group commands')
+    subgroup_parser = group_parser.add_subparsers()
+
+    state_parser = subgroup_parser.add_parser('state', help='account state commands')
+    state_group = state_parser.add_subparsers()
+
+    command_parser = state_group.add_parser('export-keys', help='stream all keys of an account to a file, '
+                                                                'resuming an interrupted export of the same file')
+    command_parser.add_argument('--address', required=True)
+    command_parser.add_argument('--output', required=True, help='output file; .db/.sqlite are written as sqlite')
+    command_parser.add_argument('--block', type=int, default=0, help='block nonce to export at; 0 for latest')
+    command_parser.add_argument('--format', choices=ACCOUNT_KEYS_EXPORT_FORMATS, default="",
+                                help='output format; default is deduced from the output file extension')
+    command_parser.add_argument('--page-size', type=int, default=ACCOUNT_KEYS_PAGE_SIZE)
+    command_parser.add_argument('--proxy', default=config.DEFAULT_PROXY)
+    command_parser.add_argument('--restart', action='store_true', help='discard a previous partial export')
+    command_parser.set_defaults(func=export_account_keys_command)
+
+    command_parser = state_group.add_parser('compare', help='compare account state files in a folder')
+    add_parsed_arguments(command_parser)
+    command_parser.add_argument('--report', default="", help='save the compare report as json in this file')
+    command_parser.set_defaults(func=lambda args: report_key_files_compare(args.folder, args.left_prefix,
+                                                                           args.right_prefix, args.verbose,
+                                                                           args.report))
+
+    command_parser = state_group.add_parser('compare-snapshots', help='compare the accounts of two snapshot bundles')
+    command_parser.add_argument('--left', required=True)
+    command_parser.add_argument('--right', required=True)
+    command_parser.add_argument('--verbose', action='store_true', default=False)
+    command_parser.add_argument('--report', default="", help='save the compare report as json in this file')
+    command_parser.set_defaults(func=lambda args: report_snapshots_compare(args.left, args.right, args.verbose,
+                                                                           args.report))
+
+    return group_parser
+
+
 def add_parsed_arguments(parser: ArgumentParser):
     """Add the arguments to the parser"""
 
@@ -22,6 +73,21 @@ def add_parsed_arguments(parser: ArgumentParser):
     parser.add_argument("--verbose", action="store_true", default=False)
 
 
+def request_with_backoff(request: Callable[[], Dict[str, Any]], description: str,
+                         retries: int = ACCOUNT_KEYS_RETRIES) -> Dict[str, Any]:
+    """Runs a proxy request, retrying failures with exponential backoff. Raises the last error when out of retries."""
+    delay = ACCOUNT_KEYS_RETRY_DELAY
+    for attempt in range(1, retries + 1):
+        try:
+            return request()
+        except (requests.exceptions.RequestException, GenericError, NetworkProviderError) as e:
+            if attempt == retries:
+                raise
+            log_warning(f"Attempt {attempt}/{retries} to retrieve {description} failed: {e}. Retrying in {delay}s.")
+            time.sleep(delay)
+            delay = min(delay * 2, ACCOUNT_KEYS_MAX_RETRY_DELAY)
+
+
 def get_all_keys_online_with_retry(address: str, proxy_provider: ProxyNetworkProvider, block_number: int = 0) -> Dict[str, Any]:
     """Get account keys from chain with retry"""
 
@@ -30,20 +96,45 @@ def get_all_keys_online_with_retry(address: str, proxy_provider: ProxyNetworkPro
     else:
         resource_url = f"address/{address}/keys?blockNonce={block_number}"
 
-    while True:
-        try:
-            response = proxy_provider.do_get_generic(resource_url)
-            break
-        except (requests.exceptions.RequestException, GenericError, NetworkProviderError) as e:
-            log_step_fail(f"Exception occurred while retrieving keys: {e}")
-            if input("Do you want to retry? (y/n): ").lower() != "y":
-                break
+    try:
+        response = request_with_backoff(lambda: proxy_provider.do_get_generic(resource_url), f"keys of {address}")
+    except (requests.exceptions.RequestException, GenericError, NetworkProviderError) as e:
+        log_step_fail(f"Exception occurred while retrieving keys: {e}")
+        return {}
 
     keys = response.get("pairs", {})
 
     return keys
 
 
+def iterate_keys_online(address: str, proxy_provider: ProxyNetworkProvider, block_number: int = 0,
+                        num_keys_per_batch: int = ACCOUNT_KEYS_PAGE_SIZE,
+                        iterator_state: Optional[List[Any]] = None) -> Iterator[Tuple[Dict[str, str], Optional[List[Any]], int]]:
+    """Yields the account keys page by page, each with the iterator state to continue after it (None after the last)
+    and the block it was read at. Starts from the given iterator state, e.g. one saved by an interrupted iteration.
+    Without a block number, the block the proxy reports for the first page is used for all the following ones."""
+
+    iterator_state = iterator_state or []
+    while True:
+        resource_url = f"address/iterate-keys?blockNonce={block_number}" if block_number else "address/iterate-keys"
+        request_body = {
+            "address": address,
+            "numKeys": num_keys_per_batch,
+            "iteratorState": iterator_state
+        }
+        response = request_with_backoff(lambda: proxy_provider.do_post_generic(resource_url, request_body),
+                                        f"keys of {address}")
+
+        data = response.get("data", {})
+        if not block_number:
+            block_number = (data.get("blockInfo") or {}).get("nonce", 0)
+        iterator_state = data.get("newIteratorState")
+        yield data.get("pairs", {}), iterator_state, block_number
+
+        if iterator_state is None:
+            return
+
+
 def get_paginated_keys_online(address: str, proxy_provider: ProxyNetworkProvider, block_number: int = 0, num_keys_per_batch: int = 100) -> Dict[str, Any]:
     """Get paginated account keys from chain using iterate-keys endpoint
     
@@ -54,56 +145,180 @@ def get_paginated_keys_online(address: str, proxy_provider: ProxyNetworkProvider
         num_keys_per_batch: Number of keys to retrieve per batch (0 for maximum)
     
     Returns:
-        Dictionary containing all key-value pairs from the account
+        Dictionary containing all key-value pairs from the account; use AccountKeysExporter for large accounts
     """
     
-    if block_number == 0:
-        resource_url = "address/iterate-keys"
-    else:
-        resource_url = f"address/iterate-keys?blockNonce={block_number}"
-    
     all_pairs = {}
-    iterator_state = []
-    
-    while True:
-        # Prepare request body
-        request_body = {
-            "address": address,
-            "numKeys": num_keys_per_batch,
-            "iteratorState": iterator_state
-        }
-        
-        try:
-            # Make POST request to iterate-keys endpoint
-            response = proxy_provider.do_post_generic(resource_url, request_body)
-            
-            # Extract pairs from response
-            data = response.get("data", {})
-            pairs = data.get("pairs", {})
-            new_iterator_state = data.get("newIteratorState")
-            
-            # Add retrieved pairs to accumulated results
+    try:
+        for pairs, _, _ in iterate_keys_online(address, proxy_provider, block_number, num_keys_per_batch):
             all_pairs.update(pairs)
-            
-            # Log progress
             logger.debug(f"Retrieved {len(pairs)} keys. Total keys so far: {len(all_pairs)}")
-            
-            # Check if iteration is complete
-            if new_iterator_state is None:
-                logger.debug(f"Iteration complete. Total keys retrieved: {len(all_pairs)}")
-                break
-            
-            # Update iterator state for next request
-            iterator_state = new_iterator_state
-            
-        except (requests.exceptions.RequestException, GenericError, NetworkProviderError) as e:
-            log_step_fail(f"Exception occurred while retrieving keys: {e}")
-            if input("Do you want to retry? (y/n): ").lower() != "y":
-                break
-    
+    except (requests.exceptions.RequestException, GenericError, NetworkProviderError) as e:
+        log_step_fail(f"Exception occurred while retrieving keys: {e}")
+
+    logger.debug(f"Iteration complete. Total keys retrieved: {len(all_pairs)}")
     return all_pairs
 
 
+class AccountKeysExporter:
+    """Streams the keys of an account to disk page by page, so memory use doesn't grow with the account size.
+
+    Output is either NDJSON, one {"key": ..., "value": ...} object per line, or a sqlite file with a pairs table.
+    After each written page the iterator state is checkpointed (in <output>.checkpoint.json for NDJSON,
+    in the database itself for sqlite), so an interrupted export of the same output resumes where it stopped.
+    The block of the first page is kept in the checkpoint, so all pages, resumed ones included, read one state."""
+
+    def __init__(self, address: str, proxy_provider: ProxyNetworkProvider, output: Union[str, Path],
+                 block_number: int = 0, export_format: str = "", page_size: int = ACCOUNT_KEYS_PAGE_SIZE):
+        self.address = address
+        self.proxy = proxy_provider
+        self.output = Path(output)
+        self.block_number = block_number
+        self.format = export_format or get_export_format(self.output)
+        if self.format not in ACCOUNT_KEYS_EXPORT_FORMATS:
+            raise ValueError(f"Unknown export format {self.format}; expected one of {ACCOUNT_KEYS_EXPORT_FORMATS}.")
+        self.page_size = page_size
+        self.checkpoint_file = self.output.with_name(f"{self.output.name}.checkpoint.json")
+
+    def _new_checkpoint(self) -> Dict[str, Any]:
+        # block_number is the one asked for (0 - latest), block_nonce the one all pages are read at
+        return {"address": self.address, "block_number": self.block_number, "block_nonce": self.block_number,
+                "iterator_state": [], "pages": 0, "keys": 0, "offset": 0, "done": False}
+
+    def _check_resumable(self, checkpoint: Dict[str, Any]):
+        if checkpoint["address"] != self.address or checkpoint["block_number"] != self.block_number:
+            raise ValueError(f"{self.output} holds a partial export of {checkpoint['address']} at block "
+                             f"{checkpoint['block_number']}; use another output or restart the export.")
+        checkpoint.setdefault("block_nonce", checkpoint["block_number"])
+        if checkpoint["pages"] and not checkpoint["block_nonce"]:
+            raise ValueError(f"{self.output} holds a partial export without a pinned block, it can't be resumed "
+                             f"consistently; restart the export.")
+
+    def export(self, restart: bool = False) -> int:
+        """Exports all keys and returns their count."""
+        self.output.parent.mkdir(parents=True, exist_ok=True)
+        if self.format == "sqlite":
+            return self._export_sqlite(restart)
+        return self._export_ndjson(restart)
+
+    def _export_ndjson(self, restart: bool) -> int:
+        checkpoint = None
+        if not restart and self.checkpoint_file.exists():
+            checkpoint = read_json_file(self.checkpoint_file)
+            self._check_resumable(checkpoint)
+        if checkpoint is None:
+            checkpoint = self._new_checkpoint()
+            self.output.write_bytes(b"")
+            self._save_ndjson_checkpoint(checkpoint)
+        if checkpoint["done"]:
+            log_step_pass(f"Export of {self.address} in {self.output} is already complete: {checkpoint['keys']} keys.")
+            return checkpoint["keys"]
+        if checkpoint["pages"]:
+            logger.info(f"Resuming export of {self.address} after {checkpoint['keys']} keys.")
+
+        with open(self.output, "r+b") as writer:
+            # drop whatever was written after the last checkpoint
+            writer.truncate(checkpoint["offset"])
+            writer.seek(checkpoint["offset"])
+            for pairs, iterator_state, block_nonce in self._iterate(checkpoint):
+                writer.write("".join(json.dumps({"key": key, "value": value}) + "\n"
+                                     for key, value in pairs.items()).encode())
+                writer.flush()
+                os.fsync(writer.fileno())
+                self._advance(checkpoint, pairs, iterator_state, block_nonce)
+                checkpoint["offset"] = writer.tell()
+                self._save_ndjson_checkpoint(checkpoint)
+
+        log_step_pass(f"Exported {checkpoint['keys']} keys of {self.address} in {self.output}.")
+        return checkpoint["keys"]
+
+    def _save_ndjson_checkpoint(self, checkpoint: Dict[str, Any]):
+        temp_file = self.checkpoint_file.with_name(f"{self.checkpoint_file.name}.tmp")
+        write_json_file(str(temp_file), checkpoint)
+        os.replace(temp_file, self.checkpoint_file)
+
+    def _export_sqlite(self, restart: bool) -> int:
+        if restart and self.output.exists():
+            self.output.unlink()
+        db = sqlite3.connect(str(self.output))
+        try:
+            db.execute("CREATE TABLE IF NOT EXISTS pairs (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+            db.execute("CREATE TABLE IF NOT EXISTS checkpoint (id INTEGER PRIMARY KEY CHECK (id = 0), data TEXT NOT NULL)")
+            row = db.execute("SELECT data FROM checkpoint WHERE id = 0").fetchone()
+            checkpoint = json.loads(row[0]) if row else self._new_checkpoint()
+            self._check_resumable(checkpoint)
+            if checkpoint["done"]:
+                log_step_pass(f"Export of {self.address} in {self.output} is already complete: {checkpoint['keys']} keys.")
+                return checkpoint["keys"]
+            if checkpoint["pages"]:
+                logger.info(f"Resuming export of {self.address} after {checkpoint['keys']} keys.")
+
+            for pairs, iterator_state, block_nonce in self._iterate(checkpoint):
+                self._advance(checkpoint, pairs, iterator_state, block_nonce)
+                # a page and the checkpoint after it are committed together
+                with db:
+                    db.executemany("INSERT OR REPLACE INTO pairs (key, value) VALUES (?, ?)", pairs.items())
+                    db.execute("INSERT OR REPLACE INTO checkpoint (id, data) VALUES (0, ?)", (json.dumps(checkpoint),))
+        finally:
+            db.close()
+
+        log_step_pass(f"Exported {checkpoint['keys']} keys of {self.address} in {self.output}.")
+        return checkpoint["keys"]
+
+    def _iterate(self, checkpoint: Dict[str, Any]) -> Iterator[Tuple[Dict[str, str], Optional[List[Any]], int]]:
+        return iterate_keys_online(self.address, self.proxy, checkpoint["block_nonce"], self.page_size,
+                                   checkpoint["iterator_state"])
+
+    def _advance(self, checkpoint: Dict[str, Any], pairs: Dict[str, str], iterator_state: Optional[List[Any]],
+                 block_nonce: int):
+        if not checkpoint["block_nonce"]:
+            if not block_nonce:
+                log_warning(f"The proxy reported no block for the keys of {self.address}; "
+                            f"the export isn't pinned to a block.")
+            checkpoint["block_nonce"] = block_nonce
+            logger.info(f"Exporting the keys of {self.address} at block {block_nonce}.")
+        checkpoint["pages"] += 1
+        checkpoint["keys"] += len(pairs)
+        checkpoint["iterator_state"] = iterator_state
+        checkpoint["done"] = iterator_state is None
+        if checkpoint["pages"] % ACCOUNT_KEYS_PROGRESS_INTERVAL == 0:
+            logger.info(f"Exported {checkpoint['keys']} keys of {self.address} in {checkpoint['pages']} pages.")
+
+
+def get_export_format(output: Union[str, Path]) -> str:
+    return "sqlite" if Path(output).suffix in (".db", ".sqlite") else "ndjson"
+
+
+def read_exported_keys(path: Union[str, Path], export_format: str = "") -> Iterator[Tuple[str, str]]:
+    """Yields the (key, value) pairs of an export written by AccountKeysExporter, without loading it whole."""
+    if (export_format or get_export_format(path)) == "sqlite":
+        db = sqlite3.connect(str(path))
+        try:
+            yield from db.execute("SELECT key, value FROM pairs")
+        finally:
+            db.close()
+        return
+
+    with open(path, "r", encoding="UTF-8") as reader:
+        for line in reader:
+            if line.strip():
+                pair = json.loads(line)
+                yield pair["key"], pair["value"]
+
+
+def export_account_keys(address: str, proxy_url: str, output: Union[str, Path], block_number: int = 0,
+                        export_format: str = "", page_size: int = ACCOUNT_KEYS_PAGE_SIZE, restart: bool = False) -> int:
+    """Streams all keys of an account to output; resumes a previous interrupted export of the same file."""
+    network_config = NetworkProviderConfig(requests_options={"timeout": 60})
+    proxy = ProxyNetworkProvider(proxy_url, config=network_config)
+    return AccountKeysExporter(address, proxy, output, block_number, export_format, page_size).export(restart)
+
+
+def export_account_keys_command(args: Any):
+    """Export account keys command"""
+    export_account_keys(args.address, args.proxy, args.output, args.block, args.format, args.page_size, args.restart)
+
+
 def get_account_keys_online(address: str, proxy_url: str, block_number: int = 0, with_save_in: str = "", paginated: bool = False) -> Dict[str, Any]:
     """Get account keys from chain"""
 
@@ -169,40 +384,73 @@ def compare_keys(left_state: dict, right_state: dict) -> Tuple[bool, dict, dict,
     keys_in_left = {}
     common_keys_different_values = {}
     common_keys = {}
-    identical = False
 
     for left_key, left_value in left_state.items():
-        if left_key in right_state:
-            right_value = right_state[left_key]
-            if left_value != right_value:
-                # different values on key
-                common_keys_different_values[left_key] = [left_value, right_value]
-            else:
-                # same key and value
-                common_keys[left_key] = left_value
-            # remove found key from right
-            right_state.pop(left_key)
-        else:
+        if left_key not in right_state:
             # key only in left
             keys_in_left[left_key] = left_value
+        elif left_value != right_state[left_key]:
+            # different values on key
+            common_keys_different_values[left_key] = [left_value, right_state[left_key]]
+        else:
+            # same key and value
+            common_keys[left_key] = left_value
+
+    keys_in_right = {key: value for key, value in right_state.items() if key not in left_state}
+    identical = len(keys_in_left) == len(keys_in_right) == len(common_keys_different_values) == 0
 
-    # remaining keys in right are unique to right only
+    return identical, keys_in_left, keys_in_right, common_keys_different_values, common_keys
 
-    if len(keys_in_left) == len(right_state) == len(common_keys_different_values) == 0:
-        identical = True
 
-    return identical, keys_in_left, right_state, common_keys_different_values, common_keys
+def get_state_file_source(path: Union[str, Path]) -> PairsSource:
+    """Pairs source of a state file: a keys export (.ndjson, .db, .sqlite) streamed on each pass,
+    or a json file with the keys, or an account state holding them under 'pairs', loaded once."""
+    if Path(path).suffix in (".ndjson", ".db", ".sqlite"):
+        return lambda: read_exported_keys(path)
 
+    state = read_json_file(path)
+    if isinstance(state, list) and len(state) == 1:
+        # chain config states hold a single account
+        state = state[0]
+    if isinstance(state, dict) and isinstance(state.get("pairs"), dict):
+        state = state["pairs"]
+    return state.items
 
-def report_key_files_compare(folder_path: str, left_prefix: str, right_prefix: str, verbose: bool = False):
+
+def log_state_diff(diff: StateDiff, left_name: str, right_name: str, verbose: bool = False):
+    if diff.identical:
+        log_step_pass(f"\n{left_name} and {right_name} are identical.")
+        return
+
+    log_step_fail(f"\n{left_name} and {right_name} are not identical "
+                  f"({diff.left_keys} vs {diff.right_keys} keys, {diff.skipped_buckets}/{diff.buckets} identical key buckets skipped).")
+    for group, entries in sorted(diff.groups.items()):
+        only_left, only_right, changed = diff.get_group_counts(group)
+        log_warning(f"{group}: {only_left} only in {left_name}, {only_right} only in {right_name}, {changed} changed")
+        if not verbose:
+            continue
+        for key, value in entries["only_left"].items():
+            log_warning(f"Data only in {left_name}: {key}: {value}")
+            log_warning(f"Decoded key: {decode_key(key)}")
+        for key, value in entries["only_right"].items():
+            log_warning(f"Data only in {right_name}: {key}: {value}")
+            log_warning(f"Decoded key: {decode_key(key)}")
+        for key, value in entries["changed"].items():
+            log_warning(f"Common key with different values: {key}: {value}")
+            log_warning(f"Decoded key: {decode_key(key)}")
+
+
+def report_key_files_compare(folder_path: str, left_prefix: str, right_prefix: str, verbose: bool = False,
+                             report_file: str = "") -> List[Dict[str, Any]]:
     """Compare all key files in the given folder"""
 
-    compare_count = 0
+    reports = []
     if not os.path.exists(folder_path):
         log_step_fail("Given folder path doesn't exist.")
+        return reports
 
-    for file in os.listdir(folder_path):
-        if f"{left_prefix}" not in file:
+    for file in sorted(os.listdir(folder_path)):
+        if not file.startswith(left_prefix):
             continue
 
         sub_name = file[len(left_prefix):]
@@ -210,32 +458,43 @@ def report_key_files_compare(folder_path: str, left_prefix: str, right_prefix: s
         if not os.path.exists(os.path.join(folder_path, right_file)):
             continue
 
-        with open(os.path.join(folder_path, file), encoding="UTF-8") as reader:
-            left_state = json.load(reader)
-        with open(os.path.join(folder_path, right_file), encoding="UTF-8") as reader:
-            right_state = json.load(reader)
+        diff = diff_states(get_state_file_source(os.path.join(folder_path, file)),
+                           get_state_file_source(os.path.join(folder_path, right_file)))
+        log_state_diff(diff, file, right_file, verbose)
+        reports.append({"left": file, "right": right_file, **diff.to_dict()})
 
-        identical, keys_in_left, keys_in_right, common_keys_diff_values, _ = compare_keys(left_state,
-                                                                                          right_state)
+    logger.info(f"\nFound and compared {len(reports)} account state file pairs.")
+    if report_file:
+        write_json_file(report_file, reports)
+        logger.info(f"Compare report saved in {report_file}.")
+    return reports
 
-        if identical:
-            log_step_pass(f"\n{file} and {right_file} are identical.")
-        else:
-            log_step_fail(f"\n{file} and {right_file} are not identical.")
-            if verbose:
-                if keys_in_left:
-                    for key, value in keys_in_left.items():
-                        log_warning(f"Data only in {left_prefix}: {key}: {value}")
-                        log_warning(f"Decoded key: {bytearray.fromhex(key).decode('iso-8859-1')}")
-                if keys_in_right:
-                    for key, value in keys_in_right.items():
-                        log_warning(f"Data only in {right_prefix}: {key}: {value}")
-                        log_warning(f"Decoded key: {bytearray.fromhex(key).decode('iso-8859-1')}")
-                if common_keys_diff_values:
-                    for key, value in common_keys_diff_values.items():
-                        log_warning(f"Common key with different values: {key}: {value}")
-                        log_warning(f"Decoded key: {bytearray.fromhex(key).decode('iso-8859-1')}")
-
-        compare_count += 1
-
-    logger.info(f"\nFound and compared {compare_count} account state file pairs.")
+
+def report_snapshots_compare(left_path: str, right_path: str, verbose: bool = False,
+                             report_file: str = "") -> List[Dict[str, Any]]:
+    """Compare the accounts present in two snapshot bundles; accounts with the same content hash are skipped."""
+
+    left_bundle = read_json_file(left_path)
+    right_bundle = read_json_file(right_path)
+    right_accounts = {account["address"]: account for account in right_bundle["accounts"]}
+
+    reports = []
+    skipped = 0
+    for left_account in left_bundle["accounts"]:
+        right_account = right_accounts.get(left_account["address"])
+        if right_account is None:
+            continue
+        if left_account["hash"] == right_account["hash"]:
+            skipped += 1
+            continue
+
+        name = f"{left_account['label']}_{left_account['address']}"
+        diff = diff_states(left_account["state"]["pairs"].items, right_account["state"]["pairs"].items)
+        log_state_diff(diff, f"{name}@{left_bundle['block_number']}", f"{name}@{right_bundle['block_number']}", verbose)
+        reports.append({"label": left_account["label"], "address": left_account["address"], **diff.to_dict()})
+
+    logger.info(f"\nCompared {len(reports)} changed accounts, {skipped} unchanged accounts skipped.")
+    if report_file:
+        write_json_file(report_file, reports)
+        logger.info(f"Compare report saved in {report_file}.")
+    return reports
@@ -17,7 +17,7 @@ from tools.runners.common_runner import ExportedAccount, ExportedToken, add_gene
 
 from utils.utils_tx import ESDTToken, NetworkProviders, prepare_contract_call_tx, _prep_legacy_args
 from utils.utils_generic import get_file_from_url_or_path, split_to_chunks
-from utils.utils_chain import Account, WrapperAddress, get_bytecode_codehash, decode_merged_attributes, base64_to_hex, string_to_hex, dec_to_padded_hex, hex_to_base64
+from utils.utils_chain import Account, WrapperAddress, get_bytecode_codehash, sign_transactions, decode_merged_attributes, base64_to_bytes, string_to_hex, dec_to_padded_hex, hex_to_base64
 from utils.decoding_structures import XMEX_ATTRIBUTES, XMEXFARM_ATTRIBUTES
 
 
@@ -140,7 +140,8 @@ def generate_energy_change_transactions(args: Any):
                           network_config, 
                           200000000, 
                           "adjustUserEnergy", 
-                          batch)
+                          batch,
+                          sign=False)
         context.deployer_account.nonce += 1
         return tx
     
@@ -160,6 +161,7 @@ def generate_energy_change_transactions(args: Any):
         tx = compose_tx(current_batch)
         txs.append(tx)
 
+    sign_transactions(txs, [context.deployer_account])
     print(f"Created {len(txs)} transactions")
     if not get_user_continue(config.FORCE_CONTINUE_PROMPT):
         return
@@ -438,14 +440,14 @@ def generate_unlock_tokens_transactions(args: Any):
 
             # for energy contract, we need to check if the token is already unlockable to use another function
             if token.token_name == energy_contract.locked_token:
-                decoded_attributes = decode_merged_attributes(base64_to_hex(token.attributes), XMEX_ATTRIBUTES)
+                decoded_attributes = decode_merged_attributes(base64_to_bytes(token.attributes), XMEX_ATTRIBUTES)
                 if int(decoded_attributes.get("unlock_epoch")) < current_epoch:
                     function_name = "unlockTokens"
                 else:
                     function_name = "unlockEarly"
             # proxy farm tokens need to be unlocked using the according address for the underlying farm token
             elif token.token_name == proxy_v1_contract.proxy_farm_token:
-                decoded_attributes = decode_merged_attributes(base64_to_hex(token.attributes), XMEXFARM_ATTRIBUTES)
+                decoded_attributes = decode_merged_attributes(base64_to_bytes(token.attributes), XMEXFARM_ATTRIBUTES)
                 if decoded_attributes.get("farm_token_id") in searched_tokens_map:
                     destination_farm_address = searched_tokens_map[decoded_attributes.get("farm_token_id")]["contract_address"]
                     args = [Address.new_from_bech32(destination_farm_address)]
@@ -14,7 +14,7 @@ from contracts.simple_lock_contract import SimpleLockContract
 from events.farm_events import EnterFarmEvent, ExitFarmEvent
 from tools.common import API, OUTPUT_FOLDER, OUTPUT_PAUSE_STATES, \
     PROXY, fetch_and_save_contracts, fetch_new_and_compare_contract_states, \
-    get_owner, get_saved_contract_addresses, get_user_continue, run_graphql_query, fetch_contracts_states
+    get_owner, get_saved_contract_addresses, get_user_continue, run_graphql_query, fetch_contracts_states, fetch_contracts_view
 from tools.runners.common_runner import add_upgrade_all_command, add_upgrade_command, add_verify_command, fund_shadowfork_accounts, get_acounts_with_token, get_default_signature, read_accounts_from_json, sync_account_nonce, verify_contracts
 from utils.contract_data_fetchers import FarmContractDataFetcher, SimpleLockContractDataFetcher
 from utils.utils_tx import ESDTToken, NetworkProviders, _prep_legacy_args
@@ -100,12 +100,13 @@ def pause_farm_contracts(_):
     if not get_user_continue(config.FORCE_CONTINUE_PROMPT):
         return
 
+    contract_states = fetch_contracts_view(FarmContractDataFetcher, farm_addresses, network_providers.proxy.url, "getState")
+
     # pause all the farms
     count = 1
     for farm_address in farm_addresses:
         print(f"Processing contract {count} / {len(farm_addresses)}: {farm_address}")
-        data_fetcher = FarmContractDataFetcher(Address.from_bech32(farm_address), network_providers.proxy.url)
-        contract_state = data_fetcher.get_data("getState")
+        contract_state = contract_states[farm_address]
         contract = FarmContract("", "", "", farm_address, FarmContractVersion.V2Boosted)
         if contract_state != 0:
             tx_hash = contract.pause(dex_owner, network_providers.proxy)
@@ -7,7 +7,7 @@ from contracts.fees_collector_contract import FeesCollectorContract
 from contracts.pair_contract import PairContract
 from contracts.router_contract import RouterContract
 from tools.common import API, OUTPUT_FOLDER, OUTPUT_PAUSE_STATES, PROXY, \
-    fetch_contracts_states, fetch_new_and_compare_contract_states, get_owner, \
+    fetch_contracts_states, fetch_contracts_view, fetch_new_and_compare_contract_states, get_owner, \
     get_user_continue, run_graphql_query, fetch_and_save_contracts, get_saved_contract_addresses
 from tools.runners.common_runner import add_upgrade_all_command
 from utils.contract_data_fetchers import PairContractDataFetcher, RouterContractDataFetcher
@@ -79,12 +79,13 @@ def pause_pair_contracts(_):
     pair_addresses = get_all_pair_addresses()
     router_contract = RouterContract.load_contract_by_address(router_address)
 
+    contract_states = fetch_contracts_view(PairContractDataFetcher, pair_addresses, network_providers.proxy.url, "getState")
+
     # pause all the pairs
     count = 1
     for pair_address in pair_addresses:
         print(f"Processing contract {count} / {len(pair_addresses)}: {pair_address}")
-        data_fetcher = PairContractDataFetcher(Address.new_from_bech32(pair_address), network_providers.proxy.url)
-        contract_state = data_fetcher.get_data("getState")
+        contract_state = contract_states[pair_address]
         if contract_state != 0:
             tx_hash = router_contract.pair_contract_pause(dex_owner, network_providers.proxy, pair_address)
             if not network_providers.check_simple_tx_status(tx_hash, f"pause pair contract: {pair_address}"):
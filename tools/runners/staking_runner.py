@@ -10,7 +10,7 @@ from config import GRAPHQL
 from contracts.contract_identities import StakingContractVersion
 from contracts.staking_contract import StakingContract
 from tools.common import API, OUTPUT_FOLDER, OUTPUT_PAUSE_STATES, \
-    PROXY, fetch_and_save_contracts, fetch_contracts_states, \
+    PROXY, fetch_and_save_contracts, fetch_contracts_states, fetch_contracts_view, \
     fetch_new_and_compare_contract_states, get_owner, \
     get_saved_contract_addresses, get_user_continue, run_graphql_query
 from tools.runners.common_runner import add_generate_transaction_command, \
@@ -116,12 +116,13 @@ def pause_staking_contracts(staking_addresses: list[str]):
     network_providers = NetworkProviders(API, PROXY)
     dex_owner = get_owner(network_providers.proxy)
 
+    contract_states = fetch_contracts_view(StakingContractDataFetcher, staking_addresses, network_providers.proxy.url, "getState")
+
     # pause all the stakings
     count = 1
     for staking_address in staking_addresses:
         print(f"Processing contract {count} / {len(staking_addresses)}: {staking_address}")
-        data_fetcher = StakingContractDataFetcher(Address.new_from_bech32(staking_address), network_providers.proxy.url)
-        contract_state = data_fetcher.get_data("getState")
+        contract_state = contract_states[staking_address]
         contract = StakingContract("", 0, 0, 0, StakingContractVersion.V1, "", staking_address)
         if contract_state != 0:
             tx_hash = contract.pause(dex_owner, network_providers.proxy)
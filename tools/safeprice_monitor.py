@@ -1,5 +1,6 @@
 import csv
 from enum import Enum
+from functools import partial
 import sys
 import time
 import config
@@ -8,7 +9,8 @@ from multiversx_sdk import Address, SmartContractController
 from multiversx_sdk.abi import AddressValue, U64Value, TokenIdentifierValue, BigUIntValue, Abi
 from typing import List, Any
 from context import Context
-from utils.contract_data_fetchers import PairContractDataFetcher
+from utils.contract_data_fetchers import PairContractDataFetcher, QueryBatch
+from utils.utils_tx import get_network_config
 from utils.utils_chain import decode_merged_attributes, string_to_hex, dec_to_padded_hex
 from pathlib import Path
 from contracts.pair_contract import PairContract
@@ -41,7 +43,7 @@ zero_esdt_token_result = {
 def get_safe_price_by_offset(timebase: Timebase, context: Context, abi: Abi, pair_contract: PairContract, offset: int, token: str, reference_amount: int) -> tuple[int, str]:
     """ Returns the amount and token identifier of the safe price of the given token at the given offset """
     safe_price_view_contract = context.get_contracts(config.PAIRS_VIEW)[0]
-    view_controller = SmartContractController(context.network_provider.proxy.get_network_config().chain_id, context.network_provider.proxy, abi)
+    view_controller = SmartContractController(get_network_config(context.network_provider.proxy).chain_id, context.network_provider.proxy, abi)
     
     endpoint = f"getSafePriceBy{timebase.value}Offset"
     query = view_controller.create_query(Address.new_from_bech32(safe_price_view_contract.address), endpoint, 
@@ -60,7 +62,7 @@ def get_lp_safe_price_by_offset(timebase: Timebase, context: Context, abi: Abi,
         - nonce
         - amount"""
     safe_price_view_contract = context.get_contracts(config.PAIRS_VIEW)[0]
-    view_controller = SmartContractController(context.network_provider.proxy.get_network_config().chain_id, context.network_provider.proxy, abi)
+    view_controller = SmartContractController(get_network_config(context.network_provider.proxy).chain_id, context.network_provider.proxy, abi)
     
     endpoint = f"getLpTokensSafePriceBy{timebase.value}Offset"
     query = view_controller.create_query(Address.new_from_bech32(safe_price_view_contract.address), endpoint, 
@@ -72,7 +74,7 @@ def get_lp_safe_price_by_offset(timebase: Timebase, context: Context, abi: Abi,
 
 
 def get_safe_price_legacy(context: Context, abi: Abi, pair_contract: PairContract, token: str, reference_amount: int) -> tuple[int, str]:
-    contract_data_fetcher = PairContractDataFetcher(Address.new_from_bech32(pair_contract.address), context.network_provider.proxy.url)
+    contract_data_fetcher = PairContractDataFetcher.for_contract(Address.new_from_bech32(pair_contract.address), context.network_provider.proxy.url)
 
     view_payload_new = abi.encode_custom_type("EsdtTokenPayment", [token, 0, reference_amount])
     hex_val = contract_data_fetcher.get_data("updateAndGetSafePrice", [bytes.fromhex(view_payload_new)])
@@ -85,7 +87,7 @@ def get_safe_price_legacy(context: Context, abi: Abi, pair_contract: PairContrac
 
 
 def get_spot_price(context: Context, pair_contract: PairContract, token: str, reference_amount: int) -> tuple[int, str]:
-    contract_data_fetcher = PairContractDataFetcher(Address.new_from_bech32(pair_contract.address), context.network_provider.proxy.url)
+    contract_data_fetcher = PairContractDataFetcher.for_contract(Address.new_from_bech32(pair_contract.address), context.network_provider.proxy.url)
     spot_price = contract_data_fetcher.get_data("getEquivalent",
                                                     [TokenIdentifierValue(token),
                                                      BigUIntValue(reference_amount)])
@@ -110,7 +112,7 @@ def main(cli_args: List[str]):
     context = Context()
     pair_contract = context.get_pair_v2_contract(0)
     proxy = context.network_provider.proxy
-    ms_per_round = proxy.get_network_config().round_duration
+    ms_per_round = get_network_config(proxy).round_duration
 
     # add offline models
     offline_models: List[OfflineModel] = []
@@ -143,23 +145,40 @@ def main(cli_args: List[str]):
         query_start_time = time.time()
         reference_amount = 1 * 10 ** 18
         
-        safe_price, other_token = get_safe_price_legacy(context, abi, pair_contract, pair_contract.firstToken, reference_amount)
-        spot_price, _ = get_spot_price(context, pair_contract, pair_contract.firstToken, reference_amount)
-        last_block = proxy.get_network_status(1).current_round
+        # all views for this sample are independent, so run them as one concurrent batch
+        batch = QueryBatch()
+        batch.add_call(partial(get_safe_price_legacy, context, abi, pair_contract, pair_contract.firstToken, reference_amount), "updateAndGetSafePrice")
+        batch.add_call(partial(get_spot_price, context, pair_contract, pair_contract.firstToken, reference_amount), "getEquivalent")
+        batch.add_call(lambda: proxy.get_network_status(1).current_round, "network status")
+        if args.view_contract:
+            for samples in args.model_samples:
+                samples_to_timestamp = samples * ms_per_round // 1000
+                batch.add_call(partial(get_safe_price_by_offset, Timebase.ROUND, context, abi, pair_contract, samples,
+                                       pair_contract.firstToken, reference_amount), f"getSafePriceByRoundOffset({samples})")
+                batch.add_call(partial(get_safe_price_by_offset, Timebase.TIMESTAMP, context, abi, pair_contract, samples_to_timestamp,
+                                       pair_contract.firstToken, reference_amount), f"getSafePriceByTimestampOffset({samples_to_timestamp})")
+        results = batch.run()
+        if any(result is None for result in results):
+            print("Failed to sample all views; skipping this round.")
+            time.sleep(SAMPLE_INTERVAL)
+            continue
+
+        (safe_price, other_token), (spot_price, _), last_block = results[:3]
 
         print(f"SPOT PRICE: {spot_price} {other_token}")
         print(f"Online legacy safe price: {safe_price} {other_token}")
 
         online_averages = []
         if args.view_contract:
+            offset_results = iter(results[3:])
             for samples in args.model_samples:
                 samples_to_timestamp = samples * ms_per_round // 1000
-                
-                round_safe_price, _ = get_safe_price_by_offset(Timebase.ROUND, context, abi, pair_contract, samples, pair_contract.firstToken, reference_amount)
-                timestamp_safe_price, _ = get_safe_price_by_offset(Timebase.TIMESTAMP, context, abi, pair_contract, samples_to_timestamp, pair_contract.firstToken, reference_amount)
-                
+
+                round_safe_price, _ = next(offset_results)
+                timestamp_safe_price, _ = next(offset_results)
+
                 online_averages.extend([round_safe_price, timestamp_safe_price])
-                
+
                 print(f"{samples} online round safe price: {round_safe_price} {other_token}")
                 print(f"{samples_to_timestamp}s online timestamp safe price: {timestamp_safe_price} {other_token}")
 
@@ -0,0 +1,217 @@
+import json
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+from multiversx_sdk import Address
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+CATALOG_FILE = "_catalog.json"
+CATALOG_VERSION = 1
+
+# roles of the files in a state folder
+ROLE_ALL_KEYS = "all_keys"              # <block>_<contracts>_all_keys.json
+ROLE_CHRONOLOGY = "chronology"          # <block>_shard_chronology.json
+ROLE_CONTRACT = "contract"              # <block>_<contract address>_<index>_chain_config_state.json
+ROLE_USER = "user"                      # <block>_<user address>_<index>_chain_config_state.json
+ROLE_LABELED_CONTRACT = "labeled_contract"  # <block>_<label>_<index>_chain_config_state.json
+ROLE_SYSTEM_ACCOUNT = "system_account"  # <block>_system_account_state_<address or token>.json
+ROLE_KEYS = "keys"                      # <block>_<label>_<index>_state.json
+ROLE_DATA = "data"                      # <block>_<label>_<index>_data.json
+ROLE_OTHER = "other"
+
+_ALL_KEYS_FILE = re.compile(r"^(\d+)_(.+)_all_keys\.json$")
+_CHRONOLOGY_FILE = re.compile(r"^(\d+)_shard_chronology\.json$")
+_SYSTEM_ACCOUNT_FILE = re.compile(r"^(\d+)_system_account_state_(.+)\.json$")
+_ACCOUNT_FILE = re.compile(r"^(\d+)_(.+)_(\d+)_(chain_config_state|state|data)\.json$")
+
+
+def _get_address_role(name: str) -> Optional[str]:
+    try:
+        address = Address.new_from_bech32(name)
+    except Exception:
+        return None
+    return ROLE_CONTRACT if address.is_smart_contract() else ROLE_USER
+
+
+def classify_state_file(name: str) -> Dict[str, Any]:
+    """Role, block and account (address, label or token) of a state file, from its name."""
+    match = _CHRONOLOGY_FILE.match(name)
+    if match:
+        return {"role": ROLE_CHRONOLOGY, "block": int(match.group(1))}
+
+    match = _ALL_KEYS_FILE.match(name)
+    if match:
+        return {"role": ROLE_ALL_KEYS, "block": int(match.group(1)), "label": match.group(2)}
+
+    match = _SYSTEM_ACCOUNT_FILE.match(name)
+    if match:
+        subject = match.group(2)
+        entry = {"role": ROLE_SYSTEM_ACCOUNT, "block": int(match.group(1))}
+        if _get_address_role(subject):
+            entry["address"] = subject
+        else:
+            entry["token"] = subject
+        return entry
+
+    match = _ACCOUNT_FILE.match(name)
+    if match:
+        block, subject, index, kind = match.groups()
+        address_role = _get_address_role(subject)
+        entry = {"block": int(block), "index": int(index)}
+        if kind == "state":
+            entry["role"] = ROLE_KEYS
+        elif kind == "data":
+            entry["role"] = ROLE_DATA
+        else:
+            entry["role"] = address_role or ROLE_LABELED_CONTRACT
+        if address_role:
+            entry["address"] = subject
+        else:
+            entry["label"] = subject
+        return entry
+
+    return {"role": ROLE_OTHER}
+
+
+class StateCatalog:
+    """Manifest of a state folder, kept in <folder>/_catalog.json: the role, block, account and size of every state
+    file, so lookups don't scan the folder or decode file names. It is rebuilt incrementally when files were
+    added or removed behind its back, which shows in the folder's modification time."""
+
+    def __init__(self, folder: Union[str, Path]):
+        self.folder = Path(folder)
+        self.path = self.folder / CATALOG_FILE
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self._folder_mtime = 0
+        self._lock = threading.RLock()
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, "r", encoding="UTF-8") as reader:
+                data = json.load(reader)
+            if data.get("version") == CATALOG_VERSION:
+                self.entries = data["files"]
+                self._folder_mtime = data["folder_mtime"]
+        except (OSError, ValueError, KeyError):
+            pass
+        self.refresh()
+
+    def refresh(self, force: bool = False):
+        """Brings the catalog up to date with the folder; only new or changed files are classified."""
+        with self._lock:
+            if not self.folder.is_dir():
+                return
+            if not force and self.folder.stat().st_mtime_ns == self._folder_mtime:
+                return
+
+            entries = {}
+            for file in os.scandir(self.folder):
+                if not file.is_file() or not file.name.endswith(".json") or file.name == CATALOG_FILE:
+                    continue
+                stat = file.stat()
+                entry = self.entries.get(file.name)
+                if entry is None or entry["size"] != stat.st_size or entry["mtime"] != stat.st_mtime_ns:
+                    entry = {**classify_state_file(file.name), "size": stat.st_size, "mtime": stat.st_mtime_ns}
+                entries[file.name] = entry
+            logger.debug(f"State catalog of {self.folder} refreshed: {len(entries)} files, "
+                         f"{len(entries.keys() - self.entries.keys())} new.")
+            self.entries = entries
+            self.save()
+
+    def register(self, path: Union[str, Path]):
+        """Adds or updates a file just written in the folder."""
+        path = Path(path)
+        stat = path.stat()
+        with self._lock:
+            self.refresh()
+            self.entries[path.name] = {**classify_state_file(path.name), "size": stat.st_size,
+                                       "mtime": stat.st_mtime_ns}
+            self.save()
+
+    def save(self):
+        with self._lock:
+            if not self.path.exists():
+                # created before the folder time is taken, then written in place, so the catalog's own write
+                # doesn't make it look stale
+                self.path.touch()
+            self._folder_mtime = self.folder.stat().st_mtime_ns
+            try:
+                with open(self.path, "w", encoding="UTF-8") as writer:
+                    json.dump({"version": CATALOG_VERSION, "folder_mtime": self._folder_mtime,
+                               "files": self.entries}, writer)
+            except OSError as e:
+                logger.warning(f"Failed to save the state catalog of {self.folder}: {e}")
+
+    def find(self, roles: Optional[Iterable[str]] = None, addresses: Optional[Iterable[str]] = None,
+             block: Optional[int] = None) -> List[Path]:
+        """Paths of the files with any of the given roles, accounts and block, in name order."""
+        roles = set(roles) if roles is not None else None
+        addresses = set(addresses) if addresses is not None else None
+        with self._lock:
+            return [self.folder / name for name, entry in sorted(self.entries.items())
+                    if (roles is None or entry["role"] in roles)
+                    and (addresses is None or entry.get("address") in addresses)
+                    and (block is None or entry.get("block") == block)]
+
+    def get_addresses(self, role: str) -> List[str]:
+        with self._lock:
+            return sorted({entry["address"] for entry in self.entries.values()
+                           if entry["role"] == role and "address" in entry})
+
+    def _get_latest(self, role: str, label: Optional[str] = None) -> Optional[Path]:
+        with self._lock:
+            names = [name for name, entry in self.entries.items()
+                     if entry["role"] == role and (label is None or entry.get("label") == label)]
+            if not names:
+                return None
+            return self.folder / max(names, key=lambda name: (self.entries[name]["block"], name))
+
+    def get_sc_states_file(self, label: str = "all") -> Optional[Path]:
+        """The contracts states file retrieved for the given contracts, at the latest block."""
+        return self._get_latest(ROLE_ALL_KEYS, label)
+
+    def get_chronology(self) -> Optional[Dict[str, int]]:
+        """The shard chronology saved at the latest block."""
+        chronology_file = self._get_latest(ROLE_CHRONOLOGY)
+        if not chronology_file:
+            return None
+        with open(chronology_file, "r", encoding="UTF-8") as reader:
+            return json.load(reader)
+
+    def get_summary(self) -> Dict[str, Dict[str, int]]:
+        """Number of files and their total size per role."""
+        summary = {}
+        with self._lock:
+            for entry in self.entries.values():
+                role = summary.setdefault(entry["role"], {"files": 0, "size": 0})
+                role["files"] += 1
+                role["size"] += entry["size"]
+        return summary
+
+
+_catalogs: Dict[Path, StateCatalog] = {}
+_catalogs_lock = threading.Lock()
+
+
+def get_state_catalog(folder: Union[str, Path]) -> StateCatalog:
+    """Catalog of a state folder, shared in the process and refreshed if the folder changed."""
+    folder = Path(folder).absolute()
+    with _catalogs_lock:
+        catalog = _catalogs.get(folder)
+        if catalog is None:
+            catalog = _catalogs[folder] = StateCatalog(folder)
+            return catalog
+    catalog.refresh()
+    return catalog
+
+
+def register_state_file(path: Union[str, Path]):
+    path = Path(path)
+    get_state_catalog(path.parent).register(path)
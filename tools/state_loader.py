@@ -0,0 +1,223 @@
+import json
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Set, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from utils.logger import get_logger
+from utils.utils_generic import log_step_fail
+
+logger = get_logger(__name__)
+
+STATE_BATCH_MAX_BYTES = 4 * 1024 * 1024     # serialized size of a set-state request body
+STATE_BATCH_MAX_ACCOUNTS = 2000
+STATE_LOADER_WORKERS = 4                    # concurrent set-state requests
+STATE_LOADER_TIMEOUT = 120                  # seconds per set-state request
+STATE_LOADER_PROGRESS_INTERVAL = 5          # seconds between progress logs
+STATE_FILE_READ_SIZE = 1024 * 1024
+
+
+def iter_json_states(path: Union[str, Path]) -> Iterator[Dict[str, Any]]:
+    """Yields the account states of a state file without parsing it whole: a json array of states
+    (or of state lists, as in *_all_keys.json), a single state object, or one state per line (.ndjson)."""
+    with open(path, "r", encoding="UTF-8") as reader:
+        if Path(path).suffix == ".ndjson":
+            for line in reader:
+                if line.strip():
+                    yield json.loads(line)
+            return
+        yield from _iter_json_values(reader)
+
+
+def _iter_json_values(reader) -> Iterator[Dict[str, Any]]:
+    decoder = json.JSONDecoder()
+    buffer = reader.read(STATE_FILE_READ_SIZE).lstrip()
+    if not buffer.startswith("["):
+        # a single state object
+        state = json.loads(buffer + reader.read())
+        yield from _flatten_states(state)
+        return
+
+    position = 1
+    while True:
+        # skip separators, refilling the buffer as needed
+        while True:
+            while position < len(buffer) and buffer[position] in " \t\r\n,":
+                position += 1
+            if position < len(buffer):
+                break
+            chunk = reader.read(STATE_FILE_READ_SIZE)
+            if not chunk:
+                return
+            buffer, position = chunk, 0
+        if buffer[position] == "]":
+            return
+
+        try:
+            value, end = decoder.raw_decode(buffer, position)
+        except json.JSONDecodeError:
+            # the value continues past the buffer; reading as much again keeps large states linear to parse
+            chunk = reader.read(max(STATE_FILE_READ_SIZE, len(buffer) - position))
+            if not chunk:
+                raise
+            buffer = buffer[position:] + chunk
+            position = 0
+            continue
+        yield from _flatten_states(value)
+        position = end
+
+
+def _flatten_states(value: Union[Dict[str, Any], List[Any]]) -> Iterator[Dict[str, Any]]:
+    if isinstance(value, list):
+        for item in value:
+            yield from _flatten_states(item)
+    elif value:
+        yield value
+
+
+def merge_state(existing: Dict[str, Any], state: Dict[str, Any]):
+    """Merges a later state of the same account into an earlier one, the way applying both in order would."""
+    pairs = {**existing.get("pairs", {}), **state.get("pairs", {})}
+    existing.update(state)
+    if pairs:
+        existing["pairs"] = pairs
+
+
+class StateBatch:
+    def __init__(self):
+        self.states: Dict[str, Dict[str, Any]] = {}
+        self.encoded: Dict[str, bytes] = {}
+        self.size = 2
+        self.after_pending = False   # holds an account also present in a batch already sent
+
+    def add(self, state: Dict[str, Any]):
+        address = state.get("address", "")
+        if address in self.states:
+            self.size -= len(self.encoded[address]) + 1
+            merge_state(self.states[address], state)
+        else:
+            self.states[address] = dict(state)
+        self.encoded[address] = json.dumps(self.states[address], separators=(",", ":")).encode()
+        self.size += len(self.encoded[address]) + 1
+
+    def get_body(self) -> bytes:
+        return b"[" + b",".join(self.encoded.values()) + b"]"
+
+
+class StateLoader:
+    """Applies account states to a chain simulator in bulk: states are merged into size bounded set-state batches
+    sent concurrently over pooled connections. Later states of an account are applied after the earlier ones,
+    either merged into the same batch or sent once the batches holding the earlier ones are done."""
+
+    def __init__(self, proxy_url: str, workers: int = STATE_LOADER_WORKERS,
+                 max_batch_bytes: int = STATE_BATCH_MAX_BYTES, max_batch_accounts: int = STATE_BATCH_MAX_ACCOUNTS):
+        self.url = f"{proxy_url}/simulator/set-state"
+        self.workers = workers
+        self.max_batch_bytes = max_batch_bytes
+        self.max_batch_accounts = max_batch_accounts
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=workers)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self._executor = ThreadPoolExecutor(max_workers=workers)
+        self._pending: Set[Future] = set()
+        self._sent_addresses: Set[str] = set()
+        self._batch = StateBatch()
+        self._lock = threading.Lock()
+
+        self.applied_accounts = 0
+        self.applied_bytes = 0
+        self.failed_batches = 0
+        self._started_at = time.monotonic()
+        self._last_progress = self._started_at
+
+    def add_state(self, state: Dict[str, Any]):
+        address = state.get("address", "")
+        if address in self._sent_addresses and address not in self._batch.states:
+            self._batch.after_pending = True
+        self._batch.add(state)
+        if self._batch.size >= self.max_batch_bytes or len(self._batch.states) >= self.max_batch_accounts:
+            self._send_batch()
+
+    def add_states(self, states: Iterable[Dict[str, Any]]):
+        for state in states:
+            self.add_state(state)
+
+    def load_file(self, path: Union[str, Path]):
+        """Streams the states of a state file into the loader."""
+        self.add_states(iter_json_states(path))
+
+    def _send_batch(self):
+        batch, self._batch = self._batch, StateBatch()
+        if not batch.states:
+            return
+        if batch.after_pending:
+            # the batch overrides accounts of batches still in flight, let those land first
+            wait(self._pending)
+        self._pending = {future for future in self._pending if not future.done()}
+        if len(self._pending) >= self.workers:
+            wait(self._pending, return_when=FIRST_COMPLETED)
+        self._sent_addresses.update(batch.states)
+        self._pending.add(self._executor.submit(self._post_batch, batch))
+
+    def _post_batch(self, batch: StateBatch):
+        body = batch.get_body()
+        try:
+            response = self.session.post(self.url, data=body, headers={"Content-Type": "application/json"},
+                                         timeout=STATE_LOADER_TIMEOUT)
+            failure = response.text if response.status_code != 200 else ""
+        except requests.exceptions.RequestException as e:
+            failure = str(e)
+
+        with self._lock:
+            if failure:
+                self.failed_batches += 1
+                log_step_fail(f"Failed to apply a batch of {len(batch.states)} states: {failure}")
+                return
+            self.applied_accounts += len(batch.states)
+            self.applied_bytes += len(body)
+            now = time.monotonic()
+            if now - self._last_progress >= STATE_LOADER_PROGRESS_INTERVAL:
+                self._last_progress = now
+                logger.info(self.get_progress())
+
+    def get_progress(self) -> str:
+        elapsed = max(time.monotonic() - self._started_at, 1e-9)
+        return (f"Applied {self.applied_accounts} account states ({self.applied_bytes / 1024 / 1024:.1f} MB) "
+                f"in {elapsed:.1f}s, {self.applied_accounts / elapsed:.0f} accounts/s.")
+
+    def flush(self) -> bool:
+        """Sends the remaining states and waits for all batches. Returns False if any batch failed."""
+        self._send_batch()
+        wait(self._pending)
+        self._pending = set()
+        logger.info(self.get_progress())
+        return self.failed_batches == 0
+
+    def close(self):
+        self._executor.shutdown()
+        self.session.close()
+
+    def __enter__(self) -> "StateLoader":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def load_states(proxy_url: str, states: Iterable[Dict[str, Any]], workers: int = STATE_LOADER_WORKERS) -> bool:
+    with StateLoader(proxy_url, workers) as loader:
+        loader.add_states(states)
+        return loader.flush()
+
+
+def load_state_files(proxy_url: str, paths: Iterable[Union[str, Path]], workers: int = STATE_LOADER_WORKERS) -> bool:
+    with StateLoader(proxy_url, workers) as loader:
+        for path in paths:
+            loader.load_file(path)
+        return loader.flush()
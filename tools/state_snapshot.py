@@ -0,0 +1,209 @@
+import hashlib
+import json
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Union
+
+import config
+from tools.runners.account_state_runner import request_with_backoff
+from utils.logger import get_logger
+from utils.utils_chain import WrapperAddress, get_shard_of_address, string_to_hex
+from utils.utils_generic import log_step_pass
+from utils.utils_tx import ESDTToken, get_proxy_provider
+
+logger = get_logger(__name__)
+
+SNAPSHOT_WORKERS = 16
+SNAPSHOT_BUNDLE_VERSION = 1
+SYSTEM_ACCOUNT_ADDRESS = "erd1lllllllllllllllllllllllllllllllllllllllllllllllllllsckry7t"
+
+
+def get_token_key_hex(token: ESDTToken) -> str:
+    return f"{string_to_hex('ELRONDesdt')}{string_to_hex(token.token_id)}"
+
+
+def get_token_nonce_key_hex(token: ESDTToken) -> str:
+    return f"{get_token_key_hex(token)}{token.get_token_nonce_hex()}"
+
+
+def get_content_hash(data: Any) -> str:
+    """sha256 of the canonical JSON form of data, independent of key order and formatting."""
+    return hashlib.sha256(json.dumps(data, sort_keys=True, separators=(",", ":")).encode()).hexdigest()
+
+
+class SnapshotAccount:
+    __slots__ = ("address", "shard", "label", "index", "tokens", "owned_tokens", "state", "hash")
+
+    def __init__(self, address: str, label: str, index: int, tokens: List[str], owned_tokens: bool):
+        self.address = address
+        self.shard = get_shard_of_address(WrapperAddress(address))
+        self.label = label
+        self.index = index
+        self.tokens = tokens
+        self.owned_tokens = owned_tokens
+        self.state: Dict[str, Any] = {}
+        self.hash = ""
+
+
+class StateSnapshot:
+    """Fetches the state of many accounts at one block, concurrently, into a single content-addressed bundle.
+
+    Blocks are pinned once per shard, to the last final block unless given for the first account's shard, and
+    every request uses the pin of its account's shard. System account keys of the meta esdts the contracts created
+    or own are gathered for all accounts first, so a key shared by several contracts is fetched once."""
+
+    def __init__(self, proxy_url: str, block_number: int = 0, pin: bool = True, workers: int = SNAPSHOT_WORKERS,
+                 context_tokens: Optional[Iterable[str]] = None, with_account_data: bool = True):
+        self.proxy = get_proxy_provider(proxy_url)
+        self.block_number = block_number
+        self.pin = pin
+        self.workers = workers
+        # tokens of interest among the ones each account owns; None skips the owned tokens lookup
+        self.context_tokens: Optional[Set[str]] = set(context_tokens) if context_tokens is not None else None
+        self.with_account_data = with_account_data
+        self.accounts: List[SnapshotAccount] = []
+        self.system_account_keys: Set[str] = set()     # asked for explicitly, besides the accounts' ones
+        self.shard_blocks: Dict[int, int] = {}
+        self.system_account_pairs: Dict[str, str] = {}
+        self.chronology: Dict[str, int] = {}
+
+    def add_account(self, address: str, label: str = "", index: int = 0, tokens: Optional[List[str]] = None,
+                    owned_tokens: bool = True):
+        """Adds an account; tokens are the meta esdts it creates, whose last nonce attributes are included."""
+        self.accounts.append(SnapshotAccount(address, label, index, list(tokens or []), owned_tokens))
+
+    def add_system_account_token(self, token: str):
+        """Adds the system account attributes of a meta esdt nonce, given as its full name (e.g. TOKEN-abcdef-0a)."""
+        self.system_account_keys.add(get_token_nonce_key_hex(ESDTToken.from_full_token_name(token)))
+
+    def _block_param(self, shard: int) -> str:
+        block_number = self.shard_blocks.get(shard, 0)
+        return f"?blockNonce={block_number}" if block_number else ""
+
+    def pin_blocks(self):
+        """Pins the block of every shard the accounts live in; the first account's shard gives the chronology."""
+        if not self.accounts:
+            return
+        main_shard = self.accounts[0].shard
+        for shard in dict.fromkeys(account.shard for account in self.accounts):
+            status = self.proxy.get_network_status(shard)
+            if shard == main_shard:
+                self.chronology = {
+                    "epoch": status.current_epoch,
+                    "round": status.current_round,
+                    "block": status.highest_final_block_nonce
+                }
+                if self.block_number:
+                    self.shard_blocks[shard] = self.block_number
+                    continue
+            if self.pin:
+                self.shard_blocks[shard] = status.highest_final_block_nonce
+        self.block_number = self.shard_blocks.get(main_shard, 0)
+
+    def take(self) -> Dict[str, Any]:
+        """Fetches all added accounts and returns the snapshot bundle."""
+        self.pin_blocks()
+        logger.info(f"Taking snapshot of {len(self.accounts)} accounts at block {self.block_number or 'latest'}.")
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            list(executor.map(self._fetch_account_state, self.accounts))
+
+            system_account_keys = set(self.system_account_keys)
+            for keys in executor.map(self._get_system_account_keys, self.accounts):
+                system_account_keys.update(keys)
+            keys = sorted(system_account_keys)
+            self.system_account_pairs = dict(zip(keys, executor.map(self._fetch_system_account_key, keys)))
+
+        log_step_pass(f"Snapshot taken: {len(self.accounts)} accounts, "
+                      f"{len(self.system_account_pairs)} system account keys.")
+        return self.get_bundle()
+
+    def _fetch_account_state(self, account: SnapshotAccount):
+        keys = request_with_backoff(
+            lambda: self.proxy.do_get_generic(f"address/{account.address}/keys{self._block_param(account.shard)}"),
+            f"keys of {account.address}").get("pairs", {})
+
+        state = {"address": account.address}
+        if self.with_account_data:
+            state = request_with_backoff(
+                lambda: self.proxy.do_get_generic(f"address/{account.address}{self._block_param(account.shard)}"),
+                f"data of {account.address}").get("account", {})
+            state.pop("rootHash", None)
+        state["pairs"] = keys
+
+        account.state = state
+        account.hash = get_content_hash(state)
+
+    def _get_system_account_keys(self, account: SnapshotAccount) -> Set[str]:
+        keys = set()
+
+        # meta esdts created by the contract: attributes of their last nonce
+        pairs = account.state.get("pairs", {})
+        for token in account.tokens:
+            nonce = pairs.get(f"{string_to_hex('ELRONDnonce')}{string_to_hex(token)}")
+            if nonce:
+                keys.add(get_token_nonce_key_hex(ESDTToken.from_full_token_name(f"{token}-{nonce}")))
+
+        # context related meta esdts owned by the account
+        if self.context_tokens and account.owned_tokens:
+            # holdings are listed at the latest block, there is no pinned variant of this lookup
+            owned = request_with_backoff(
+                lambda: self.proxy.get_non_fungible_tokens_of_account(WrapperAddress(account.address)),
+                f"tokens of {account.address}")
+            for token in owned:
+                esdt = ESDTToken.from_full_token_name(token.token.identifier)
+                if esdt.token_id in self.context_tokens:
+                    keys.add(get_token_nonce_key_hex(esdt))
+        return keys
+
+    def _fetch_system_account_key(self, key: str) -> str:
+        # meta esdt attributes are read from the system account of the contracts' shard
+        block_param = f"?blockNonce={self.block_number}" if self.block_number else ""
+        return request_with_backoff(
+            lambda: self.proxy.do_get_generic(f"address/{SYSTEM_ACCOUNT_ADDRESS}/key/{key}{block_param}"),
+            f"system account key {key}").get("value", "")
+
+    def get_states(self) -> List[Dict[str, Any]]:
+        """Account states in set-state format, the system account keys included as one more account."""
+        states = [account.state for account in self.accounts]
+        if self.system_account_pairs:
+            states.append({"address": SYSTEM_ACCOUNT_ADDRESS, "pairs": self.system_account_pairs})
+        return states
+
+    def get_bundle(self) -> Dict[str, Any]:
+        return {
+            "version": SNAPSHOT_BUNDLE_VERSION,
+            "block_number": self.block_number,
+            "shard_blocks": {str(shard): block for shard, block in sorted(self.shard_blocks.items())},
+            "chronology": self.chronology,
+            "accounts": [{"label": account.label, "index": account.index, "address": account.address,
+                          "hash": account.hash, "state": account.state} for account in self.accounts],
+            "system_account": {"address": SYSTEM_ACCOUNT_ADDRESS, "pairs": self.system_account_pairs},
+        }
+
+    def save(self, folder: Union[str, Path], name: str = "snapshot") -> Path:
+        """Writes the bundle as <name>_<block>_<content hash>.json; an identical existing bundle is kept as is."""
+        bundle = self.get_bundle()
+        bundle_hash = get_content_hash(bundle)
+        folder = Path(folder)
+        folder.mkdir(parents=True, exist_ok=True)
+        path = folder / f"{name}_{self.block_number}_{bundle_hash[:16]}.json"
+        if path.exists():
+            logger.info(f"Identical snapshot already saved in {path}.")
+            return path
+
+        temp_path = path.with_name(f"{path.name}.tmp")
+        with open(temp_path, "w", encoding="UTF-8") as writer:
+            json.dump(bundle, writer, separators=(",", ":"))
+        temp_path.replace(path)
+        log_step_pass(f"Snapshot saved in {path}.")
+        return path
+
+
+def load_snapshot(path: Union[str, Path]) -> Dict[str, Any]:
+    with open(path, "r", encoding="UTF-8") as reader:
+        return json.load(reader)
+
+
+def get_default_snapshots_folder() -> Path:
+    return config.DEFAULT_WORKSPACE.absolute() / "states" / "snapshots"
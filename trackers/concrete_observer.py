@@ -1,34 +1,152 @@
-from typing import List, Any
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Dict, List, Any, Optional, Sequence, Set, Tuple
 from trackers.abstract_observer import Publisher, Subscriber
 from utils.utils_chain import Account
+from utils.logger import get_logger
 from contracts.contract_identities import DEXContractInterface
 
+logger = get_logger(__name__)
+
+OBSERVER_QUEUE_SIZE = 1000      # pending notifications before set_event blocks the publisher
+
+ANY = ""    # subscription key matching any contract/user address
+
+
+class Notification:
+    """Immutable copy of a published event, safe to hand to background workers."""
+    __slots__ = ("contract", "user", "event", "tx_hash")
+
+    def __init__(self, contract: Optional[DEXContractInterface], user: Account, event: Any, tx_hash: str):
+        self.contract = contract
+        self.user = user
+        self.event = event
+        self.tx_hash = tx_hash
+
 
 class Observable(Publisher):
-    observers: List[Subscriber] = []
-    contract: DEXContractInterface
-    user: Account
-    event: Any
-    tx_hash: str
+    """Dispatches events to the subscribers registered for the event's contract and class.
+
+    With workers > 0, notifications are verified in the background: each subscriber gets a fixed single-threaded
+    lane, so it still sees its events in publishing order, and at most queue_size notifications are pending.
+    Events without a transaction hash are state refreshes that must precede the next transaction, so set_event
+    waits for those to be processed."""
+
+    def __init__(self, workers: int = 0, queue_size: int = OBSERVER_QUEUE_SIZE):
+        self.observers: List[Subscriber] = []
+        self.contract: Optional[DEXContractInterface] = None
+        self.user: Optional[Account] = None
+        self.event: Any = None
+        self.tx_hash: str = ""
+
+        self._registry: Dict[Tuple[str, Optional[type]], List[Subscriber]] = {}
+        self._user_filters: Dict[int, str] = {}
+        self._lanes: List[ThreadPoolExecutor] = [ThreadPoolExecutor(max_workers=1) for _ in range(workers)]
+        self._lane_of: Dict[int, ThreadPoolExecutor] = {}
+        self._slots = threading.BoundedSemaphore(queue_size)
+        self._pending: Set[Future] = set()
+        self._lock = threading.Lock()
 
-    def subscribe(self, subscriber: Subscriber):
-        print('A new observer has subscribed')
-        self.observers.append(subscriber)
+    def subscribe(self, subscriber: Subscriber, contract_address: str = ANY,
+                  event_types: Sequence[type] = (), user_address: str = ANY):
+        """Registers a subscriber for events of the given classes (all if empty) published for the given contract
+        (any if empty). user_address limits it further to events of a single user account."""
+        with self._lock:
+            self.observers.append(subscriber)
+            for event_type in (event_types or [None]):
+                self._registry.setdefault((contract_address, event_type), []).append(subscriber)
+            if user_address:
+                self._user_filters[id(subscriber)] = user_address
+            if self._lanes:
+                self._lane_of[id(subscriber)] = self._lanes[(len(self.observers) - 1) % len(self._lanes)]
+        logger.debug(f'A new observer has subscribed: {type(subscriber).__name__}')
 
     def unsubscribe(self, subscriber: Subscriber):
-        print('A observer has unsubscribed')
-        self.observers.remove(subscriber)
+        with self._lock:
+            self.observers.remove(subscriber)
+            for subscribers in self._registry.values():
+                if subscriber in subscribers:
+                    subscribers.remove(subscriber)
+            self._user_filters.pop(id(subscriber), None)
+            self._lane_of.pop(id(subscriber), None)
+        logger.debug(f'An observer has unsubscribed: {type(subscriber).__name__}')
+
+    def _get_subscribers(self, notification: Notification) -> List[Subscriber]:
+        contract_address = notification.contract.address if notification.contract is not None else ANY
+        user_address = notification.user.address.to_bech32() if notification.user is not None else ANY
+        event_type = type(notification.event)
+
+        keys = [(contract_address, event_type), (contract_address, None)]
+        if contract_address != ANY:
+            keys += [(ANY, event_type), (ANY, None)]
+
+        matched, seen = [], set()
+        with self._lock:
+            for key in keys:
+                for subscriber in self._registry.get(key, []):
+                    if id(subscriber) in seen:
+                        continue
+                    seen.add(id(subscriber))
+                    wanted_user = self._user_filters.get(id(subscriber))
+                    if wanted_user and wanted_user != user_address:
+                        continue
+                    matched.append(subscriber)
+        return matched
 
     def notify(self):
-        for observer in self.observers:
-            observer.update(self)
+        self._dispatch(Notification(self.contract, self.user, self.event, self.tx_hash))
+
+    def _dispatch(self, notification: Notification):
+        subscribers = self._get_subscribers(notification)
+        if not self._lanes:
+            for observer in subscribers:
+                observer.update(notification)
+            return
+
+        submitted = [self._submit(observer, notification) for observer in subscribers]
+        if not notification.tx_hash:
+            wait(submitted)
+
+    def _submit(self, observer: Subscriber, notification: Notification) -> Future:
+        self._slots.acquire()
+        future = self._lane_of[id(observer)].submit(self._run_update, observer, notification)
+        with self._lock:
+            self._pending.add(future)
+        future.add_done_callback(self._release)
+        return future
+
+    def _release(self, future: Future):
+        with self._lock:
+            self._pending.discard(future)
+        self._slots.release()
+
+    @staticmethod
+    def _run_update(observer: Subscriber, notification: Notification):
+        try:
+            observer.update(notification)
+        except Exception as ex:
+            logger.exception(f"{type(observer).__name__} failed on {type(notification.event).__name__} "
+                             f"(tx {notification.tx_hash}): {ex}")
+
+    def drain(self):
+        """Waits until all notifications dispatched so far are processed."""
+        with self._lock:
+            pending = list(self._pending)
+        wait(pending)
+
+    def close(self):
+        self.drain()
+        for lane in self._lanes:
+            lane.shutdown(wait=True)
+        self._lanes = []
 
     def set_event(self, contract: DEXContractInterface, user: Account, event_data: Any, txhash: str):
         self.contract = contract
         self.user = user
         self.event = event_data
         self.tx_hash = txhash
-        self.notify()
+        # built here rather than from the attributes, so concurrent publishers don't mix up their events
+        self._dispatch(Notification(contract, user, event_data, txhash))
 
 
 class Observer(Subscriber):
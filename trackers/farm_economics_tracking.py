@@ -1,4 +1,4 @@
-from typing import Dict
+from typing import Any, Dict
 from multiversx_sdk import Address
 from utils.utils_chain import Account
 from utils.contract_data_fetchers import FarmContractDataFetcher, ChainDataFetcher
@@ -8,9 +8,13 @@ from events.farm_events import (EnterFarmEvent, ExitFarmEvent,
                                 ClaimRewardsFarmEvent, SetTokenBalanceEvent)
 from trackers.abstract_observer import Subscriber
 from trackers.concrete_observer import Observable
-from utils.utils_chain import get_current_tokens_for_address
+from trackers.tracking_state import get_account_esdt_state, get_contract_snapshot, STATIC_VIEWS_REFRESH_EVENTS
 from contracts.contract_identities import FarmContractVersion
 
+# views changed by enter/exit/claim events; the rest only change on admin calls
+FARM_EVENT_VIEWS = ["getFarmTokenSupply", "getRewardReserve", "getRewardPerShare", "getLastRewardBlockNonce"]
+FARM_STATIC_VIEWS = ["getPerBlockRewardAmount", "getDivisionSafetyConstant"]
+
 
 class DecodedTokenAttributes:
     rewards_per_share: int
@@ -32,16 +36,18 @@ class FarmAccountEconomics(Subscriber):
     def __init__(self, address: Address, network_provider: NetworkProviders):
         self.address = address
         self.network_provider = network_provider
-        self.tokens = get_current_tokens_for_address(self.address, self.network_provider.proxy)
+        # shared with every other tracker of this account; updated from the transfers of each tracked transaction
+        self.esdt_state = get_account_esdt_state(self.address, self.network_provider)
+        self.tokens = self.esdt_state.tokens
         self.report_current_tokens()
 
-    def enter_farm(self, event: EnterFarmEvent) -> None:
+    def enter_farm(self, event: EnterFarmEvent, tx_hash: str = "") -> None:
         old_farming_token_balance = int(self.tokens[event.farming_tk]['balance'])
         farm_token = self.tokens.get(event.farm_tk, None)
         old_farm_token_balance = farm_token['balance'] if farm_token else 0
         old_farm_token_nonce = farm_token['nonce'] if farm_token else 0
 
-        self.tokens = get_current_tokens_for_address(self.address, self.network_provider.proxy)
+        self.tokens = self.esdt_state.apply_transaction(tx_hash)
 
         new_farming_token_balance = int(self.tokens[event.farming_tk]['balance'])
         new_farm_token_balance = int(self.tokens[event.farm_tk]['balance'])
@@ -70,7 +76,7 @@ class FarmAccountEconomics(Subscriber):
 
         log_step_pass('Checked enter farm event economics for account')
 
-    def exit_farm(self, contract, event: ExitFarmEvent) -> None:
+    def exit_farm(self, contract, event: ExitFarmEvent, tx_hash: str = "") -> None:
         farm_token = self.tokens.get(event.farm_token, None)
         old_farm_token_balance = farm_token['balance'] if farm_token else 0
 
@@ -80,7 +86,7 @@ class FarmAccountEconomics(Subscriber):
         farmed_token = self.tokens.get(contract.farmedToken, None)
         old_farmed_token_balance = farmed_token['balance'] if farmed_token else 0
 
-        self.tokens = get_current_tokens_for_address(self.address, self.network_provider.proxy)
+        self.tokens = self.esdt_state.apply_transaction(tx_hash)
 
         new_farm_token_balance = int(self.tokens[event.farm_token]['balance'])
         expected_farm_token_balance = int(old_farm_token_balance) - event.amount
@@ -109,11 +115,11 @@ class FarmAccountEconomics(Subscriber):
 
         log_step_pass('Checked exit farm event economics for account')
 
-    def claim_rewards(self, contract, event: ClaimRewardsFarmEvent) -> None:
+    def claim_rewards(self, contract, event: ClaimRewardsFarmEvent, tx_hash: str = "") -> None:
         farmed_token = self.tokens.get(contract.farmedToken, None)
         old_farmed_token_balance = farmed_token['balance'] if farmed_token else 0
 
-        self.tokens = get_current_tokens_for_address(self.address, self.network_provider.proxy)
+        self.tokens = self.esdt_state.apply_transaction(tx_hash)
 
         new_farmed_token_balance = int(self.tokens[contract.farmedToken]['balance'])
         expected_farmed_token_balance = int(old_farmed_token_balance) + event.amount
@@ -132,13 +138,7 @@ class FarmAccountEconomics(Subscriber):
             log_substep(f'{key}: {self.tokens[key]["balance"]}')
 
     def set_token_balance(self, event: SetTokenBalanceEvent):
-        if event.token not in self.tokens:
-            token = {event.token: {'nonce': event.nonce, 'balance': event.balance}}
-
-            self.tokens.update(token)
-        else:
-            self.tokens[event.token]['nonce'] = event.nonce
-            self.tokens[event.token]['balance'] = event.balance
+        self.tokens = self.esdt_state.set_token_balance(event.token, event.nonce, event.balance)
 
         log_step_pass(f'Updated token balance for account {self.address.bech32()}')
 
@@ -147,11 +147,11 @@ class FarmAccountEconomics(Subscriber):
             if publisher.tx_hash:
                 self.network_provider.wait_for_tx_executed(publisher.tx_hash)
             if type(publisher.event) == EnterFarmEvent:
-                self.enter_farm(publisher.event)
+                self.enter_farm(publisher.event, publisher.tx_hash)
             elif type(publisher.event) == ExitFarmEvent:
-                self.exit_farm(publisher.contract, publisher.event)
+                self.exit_farm(publisher.contract, publisher.event, publisher.tx_hash)
             elif type(publisher.event) == ClaimRewardsFarmEvent:
-                self.claim_rewards(publisher.contract, publisher.event)
+                self.claim_rewards(publisher.contract, publisher.event, publisher.tx_hash)
             elif type(publisher.event) == SetTokenBalanceEvent:
                 self.set_token_balance(publisher.event)
 
@@ -164,15 +164,20 @@ class FarmEconomics(Subscriber):
         self.network_provider = network_provider
         self.farm_data_fetcher = FarmContractDataFetcher(self.contract_address, network_provider.proxy.url)
         self.chain_data_fetcher = ChainDataFetcher(network_provider.proxy.url)
+        self.snapshot = get_contract_snapshot(self.farm_data_fetcher)
+        self.event_block = 0
+        self.event_tx = ""
+        self.events_count = 0
         self.accounts: Dict[str, FarmAccountEconomics] = {}
 
-        self.rewards_per_block = self.farm_data_fetcher.get_data("getPerBlockRewardAmount")
-        self.farm_token_supply = self.farm_data_fetcher.get_data("getFarmTokenSupply")
-        self.rewards_reserve = self.farm_data_fetcher.get_data("getRewardReserve")
-        self.rewards_per_share = self.farm_data_fetcher.get_data("getRewardPerShare")
-        self.last_rewards_block_nonce = self.farm_data_fetcher.get_data("getLastRewardBlockNonce")
+        state = self.snapshot.read(FARM_EVENT_VIEWS + FARM_STATIC_VIEWS)
+        self.rewards_per_block = state["getPerBlockRewardAmount"]
+        self.farm_token_supply = state["getFarmTokenSupply"]
+        self.rewards_reserve = state["getRewardReserve"]
+        self.rewards_per_share = state["getRewardPerShare"]
+        self.last_rewards_block_nonce = state["getLastRewardBlockNonce"]
         self.last_block_calculated_rewards = self.last_rewards_block_nonce  # initialize with the last one from contract
-        self.division_safety_constant = self.farm_data_fetcher.get_data("getDivisionSafetyConstant")
+        self.division_safety_constant = state["getDivisionSafetyConstant"]
         self.rewards_per_share_wout_division = 0
 
         # only v1.2 farms
@@ -190,13 +195,30 @@ class FarmEconomics(Subscriber):
         print(f"Last rewards block nonce: {self.last_rewards_block_nonce}")
         print(f"Last block offline calculated rewards: {self.last_block_calculated_rewards}")
 
+    def begin_event(self, tx_hash: str):
+        """Pins the following reads to the block of the given transaction. Views already read for that
+        block by any tracker of this contract are taken from the shared snapshot."""
+        self.event_tx = tx_hash
+        self.event_block = self.chain_data_fetcher.get_tx_block_nonce_in_shard(tx_hash, self.snapshot.shard)
+        self.events_count += 1
+
+    def _read_event_views(self) -> Dict[str, Any]:
+        return self.snapshot.read(FARM_EVENT_VIEWS, self.event_block, self.event_tx)
+
+    def _read_static_views(self) -> Dict[str, Any]:
+        if (self.event_block or self.event_tx) and self.events_count % STATIC_VIEWS_REFRESH_EVENTS:
+            return {view: self.snapshot.get(view) for view in FARM_STATIC_VIEWS}
+        return self.snapshot.read(FARM_STATIC_VIEWS, self.event_block, self.event_tx)
+
     # checks and updates the farm contract invariant properties
     def check_invariant_properties(self):
         # TODO: replace test reporting with logger
-        new_rewards_per_share = self.farm_data_fetcher.get_data("getRewardPerShare")
-        new_last_rewards_block_nonce = self.farm_data_fetcher.get_data("getLastRewardBlockNonce")
-        chain_rewards_per_block = self.farm_data_fetcher.get_data("getPerBlockRewardAmount")
-        chain_division_safety_constant = self.farm_data_fetcher.get_data("getDivisionSafetyConstant")
+        state = self._read_event_views()
+        static_state = self._read_static_views()
+        new_rewards_per_share = state["getRewardPerShare"]
+        new_last_rewards_block_nonce = state["getLastRewardBlockNonce"]
+        chain_rewards_per_block = static_state["getPerBlockRewardAmount"]
+        chain_division_safety_constant = static_state["getDivisionSafetyConstant"]
 
         if self.rewards_per_share > new_rewards_per_share:
             log_step_fail("TEST CHECK FAIL: Rewards per share decreased!")
@@ -219,8 +241,9 @@ class FarmEconomics(Subscriber):
 
     def check_enter_farm_properties(self):
         # track event dependent properties
-        new_farm_token_supply = self.farm_data_fetcher.get_data("getFarmTokenSupply")
-        new_rewards_reserve = self.farm_data_fetcher.get_data("getRewardReserve")
+        state = self._read_event_views()
+        new_farm_token_supply = state["getFarmTokenSupply"]
+        new_rewards_reserve = state["getRewardReserve"]
 
         ENTER_FARM_FARM_TK_SUPPLY_FAIL = "TEST CHECK FAIL: Farm token supply did not increase!"
         ENTER_FARM_REWARDS_RESERVE_FAIL = "TEST CHECK FAIL: Rewards reserve decreased!"
@@ -237,10 +260,11 @@ class FarmEconomics(Subscriber):
         log_step_pass("Checked enter farm properties!")
 
     def check_enter_farm_tx_data(self, event: EnterFarmEvent, txhash: str):
-        new_contract_farm_token_supply = self.farm_data_fetcher.get_data("getFarmTokenSupply")
-        new_contract_rewards_reserve = self.farm_data_fetcher.get_data("getRewardReserve")
-        new_contract_rewards_per_share = self.farm_data_fetcher.get_data("getRewardPerShare")
-        new_last_rewards_block_nonce = self.farm_data_fetcher.get_data("getLastRewardBlockNonce")
+        state = self._read_event_views()
+        new_contract_farm_token_supply = state["getFarmTokenSupply"]
+        new_contract_rewards_reserve = state["getRewardReserve"]
+        new_contract_rewards_per_share = state["getRewardPerShare"]
+        new_last_rewards_block_nonce = state["getLastRewardBlockNonce"]
         tx_block = self.chain_data_fetcher.get_tx_block_nonce(txhash)
         new_exp_farm_token_supply = self.farm_token_supply + event.farming_tk_amount  # farming token amount is converted to farm token amount
 
@@ -300,7 +324,7 @@ class FarmEconomics(Subscriber):
 
     def check_exit_farm_properties(self):
         # track event dependent properties
-        new_farm_token_supply = self.farm_data_fetcher.get_data("getFarmTokenSupply")
+        new_farm_token_supply = self._read_event_views()["getFarmTokenSupply"]
 
         EXIT_FARM_FARM_TK_SUPPLY_FAIL = "TEST CHECK FAIL: Farm token supply did not decrease!"
 
@@ -321,10 +345,11 @@ class FarmEconomics(Subscriber):
     def check_exit_farm_tx_data(self, event: ExitFarmEvent, txhash: str):
         # TODO: check burned tokens if penalty applies
         # TODO: care for compounding as well when calculating penalty
-        new_contract_farm_token_supply = self.farm_data_fetcher.get_data("getFarmTokenSupply")
-        new_contract_rewards_reserve = self.farm_data_fetcher.get_data("getRewardReserve")
-        new_contract_rewards_per_share = self.farm_data_fetcher.get_data("getRewardPerShare")
-        new_last_rewards_block_nonce = self.farm_data_fetcher.get_data("getLastRewardBlockNonce")
+        state = self._read_event_views()
+        new_contract_farm_token_supply = state["getFarmTokenSupply"]
+        new_contract_rewards_reserve = state["getRewardReserve"]
+        new_contract_rewards_per_share = state["getRewardPerShare"]
+        new_last_rewards_block_nonce = state["getLastRewardBlockNonce"]
         tx_block = self.chain_data_fetcher.get_tx_block_nonce(txhash)
         new_exp_farm_token_supply = self.farm_token_supply - event.amount
 
@@ -392,7 +417,7 @@ class FarmEconomics(Subscriber):
 
     def check_claim_rewards_properties(self):
         # track event dependent properties
-        new_farm_token_supply = self.farm_data_fetcher.get_data("getFarmTokenSupply")
+        new_farm_token_supply = self._read_event_views()["getFarmTokenSupply"]
 
         CLAIM_REWARDS_FARM_TK_SUPPLY_FAIL = "TEST CHECK FAIL: Farm token supply modified!"
 
@@ -406,10 +431,11 @@ class FarmEconomics(Subscriber):
     def check_claim_rewards_farm_tx_data(self, event: ClaimRewardsFarmEvent, txhash: str):
         # TODO: check burned tokens if penalty applies
         # TODO: care for compounding as well when calculating penalty
-        new_contract_farm_token_supply = self.farm_data_fetcher.get_data("getFarmTokenSupply")
-        new_contract_rewards_reserve = self.farm_data_fetcher.get_data("getRewardReserve")
-        new_contract_rewards_per_share = self.farm_data_fetcher.get_data("getRewardPerShare")
-        new_last_rewards_block_nonce = self.farm_data_fetcher.get_data("getLastRewardBlockNonce")
+        state = self._read_event_views()
+        new_contract_farm_token_supply = state["getFarmTokenSupply"]
+        new_contract_rewards_reserve = state["getRewardReserve"]
+        new_contract_rewards_per_share = state["getRewardPerShare"]
+        new_last_rewards_block_nonce = state["getLastRewardBlockNonce"]
         tx_block = self.chain_data_fetcher.get_tx_block_nonce(txhash)
         new_exp_farm_token_supply = self.farm_token_supply
 
@@ -483,14 +509,15 @@ class FarmEconomics(Subscriber):
         # there are already existing positions in farm
 
     def update_tracking_data(self):
-        new_rewards_per_share = self.farm_data_fetcher.get_data("getRewardPerShare")
-        new_last_rewards_block_nonce = self.farm_data_fetcher.get_data("getLastRewardBlockNonce")
-        chain_rewards_per_block = self.farm_data_fetcher.get_data("getPerBlockRewardAmount")
-        new_farm_token_supply = self.farm_data_fetcher.get_data("getFarmTokenSupply")
-        new_rewards_reserve = self.farm_data_fetcher.get_data("getRewardReserve")
-        new_division_safety_constant = self.farm_data_fetcher.get_data("getDivisionSafetyConstant")
-
-        # TODO: update only the data that doesn't match
+        state = self._read_event_views()
+        state.update(self._read_static_views())
+        new_rewards_per_share = state["getRewardPerShare"]
+        new_last_rewards_block_nonce = state["getLastRewardBlockNonce"]
+        chain_rewards_per_block = state["getPerBlockRewardAmount"]
+        new_farm_token_supply = state["getFarmTokenSupply"]
+        new_rewards_reserve = state["getRewardReserve"]
+        new_division_safety_constant = state["getDivisionSafetyConstant"]
+
         self.last_rewards_block_nonce = new_last_rewards_block_nonce
         self.rewards_per_share = new_rewards_per_share
         self.rewards_per_block = chain_rewards_per_block
@@ -526,6 +553,7 @@ class FarmEconomics(Subscriber):
         if publisher.contract is not None:
             if str(self.contract_address) == publisher.contract.address:
                 self.network_provider.wait_for_tx_executed(publisher.tx_hash)
+                self.begin_event(publisher.tx_hash)
                 if type(publisher.event) == EnterFarmEvent:
                     self.enter_farm_event_tracking(publisher.user, publisher.event, publisher.tx_hash)
                 elif type(publisher.event) == ExitFarmEvent:
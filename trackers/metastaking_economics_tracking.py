@@ -164,6 +164,10 @@ class MetastakingEconomics(Subscriber):
             if str(self.contract_address) == publisher.contract.address:
                 if publisher.tx_hash:
                     self.network_provider.wait_for_tx_executed(publisher.tx_hash)
+                # sub-trackers share their contracts' snapshots with the standalone trackers of the same contracts
+                self.staking_tracker.begin_event(publisher.tx_hash)
+                self.farm_tracker.begin_event(publisher.tx_hash)
+                self.pair_tracker.begin_event(publisher.tx_hash)
                 if isinstance(publisher.event, SetCorrectReservesEvent):
                     self.update_trackers_data()
                 elif isinstance(publisher.event, EnterMetastakeEvent):
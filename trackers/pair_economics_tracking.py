@@ -2,7 +2,8 @@ from multiversx_sdk import Address
 from utils.utils_tx import NetworkProviders
 from trackers.abstract_observer import Subscriber
 from trackers.concrete_observer import Observable
-from utils.contract_data_fetchers import PairContractDataFetcher
+from utils.contract_data_fetchers import PairContractDataFetcher, ChainDataFetcher
+from trackers.tracking_state import get_contract_snapshot
 from utils.utils_generic import log_step_fail, log_step_pass, log_substep
 from contracts.pair_contract import AddLiquidityEvent, RemoveLiquidityEvent, \
     SwapFixedInputEvent, SwapFixedOutputEvent, SetCorrectReservesEvent
@@ -14,14 +15,25 @@ class PairEconomics(Subscriber):
         self.contract_address = Address(contract_address, "erd")
         self.network_provider = network_provider
         self.pair_data_fetcher = PairContractDataFetcher(self.contract_address, self.network_provider.proxy.url)
+        self.chain_data_fetcher = ChainDataFetcher(self.network_provider.proxy.url)
+        self.snapshot = get_contract_snapshot(self.pair_data_fetcher)
+        self.event_block = 0
+        self.event_tx = ""
         self._get_tokens_reserve_and_total_supply()
         self.fee = 0
         self.report_current_tracking_data()
         self.first_token = first_token
         self.second_token = second_token
 
+    def begin_event(self, tx_hash: str):
+        """Pins the following reads to the block of the given transaction, so trackers sharing the
+        pair snapshot don't read the reserves again for the same block."""
+        self.event_tx = tx_hash
+        self.event_block = self.chain_data_fetcher.get_tx_block_nonce_in_shard(tx_hash, self.snapshot.shard)
+
     def _get_tokens_reserve_and_total_supply(self):
-        reserves_and_total_supply = self.pair_data_fetcher.get_data("getReservesAndTotalSupply")
+        reserves_and_total_supply = self.snapshot.read(["getReservesAndTotalSupply"],
+                                                       self.event_block, self.event_tx)["getReservesAndTotalSupply"]
         if reserves_and_total_supply:
             self.first_token_reserve = reserves_and_total_supply[0]
             self.second_token_reserve = reserves_and_total_supply[1]
@@ -200,6 +212,7 @@ class PairEconomics(Subscriber):
             if self.contract_address.bech32() == publisher.contract.address:
                 if publisher.tx_hash:
                     self.network_provider.wait_for_tx_executed(publisher.tx_hash)
+                self.begin_event(publisher.tx_hash)
                 if type(publisher.event) == AddLiquidityEvent:
                     self.check_add_liquidity(publisher.event)
                 elif type(publisher.event) == RemoveLiquidityEvent:
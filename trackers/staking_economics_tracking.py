@@ -1,3 +1,4 @@
+from typing import Any, Dict
 from multiversx_sdk import Address
 from utils.utils_tx import NetworkProviders
 from trackers.abstract_observer import Subscriber
@@ -5,6 +6,12 @@ from trackers.concrete_observer import Observable
 from events.farm_events import EnterFarmEvent, ExitFarmEvent, ClaimRewardsFarmEvent
 from utils.contract_data_fetchers import StakingContractDataFetcher, ChainDataFetcher
 from utils.utils_generic import log_step_fail, log_step_pass, log_substep
+from trackers.tracking_state import get_contract_snapshot, STATIC_VIEWS_REFRESH_EVENTS
+
+# views changed by enter/exit/claim events; the rest only change on admin calls
+STAKING_EVENT_VIEWS = ['getFarmTokenSupply', 'getRewardPerShare', 'getLastRewardBlockNonce']
+STAKING_STATIC_VIEWS = ['getPerBlockRewardAmount', 'getAnnualPercentageRewards', 'getRewardCapacity',
+                        'getMinUnbondEpochs', 'getDivisionSafetyConstant']
 
 
 class StakingEconomics(Subscriber):
@@ -13,6 +20,10 @@ class StakingEconomics(Subscriber):
         self.network_provider = network_provider
         self.data_fetcher = StakingContractDataFetcher(self.contract_address, self.network_provider.proxy.url)
         self.chain_data_fetcher = ChainDataFetcher(self.network_provider.proxy.url)
+        self.snapshot = get_contract_snapshot(self.data_fetcher)
+        self.event_block = 0
+        self.event_tx = ""
+        self.events_count = 0
 
         self.min_unbond_epochs = None
         self.division_safety_constant = None
@@ -28,15 +39,32 @@ class StakingEconomics(Subscriber):
 
         self.report_current_tracking_data()
 
+    def begin_event(self, tx_hash: str):
+        """Pins the following reads to the block of the given transaction. Views already read for that
+        block by any tracker of this contract are taken from the shared snapshot."""
+        self.event_tx = tx_hash
+        self.event_block = self.chain_data_fetcher.get_tx_block_nonce_in_shard(tx_hash, self.snapshot.shard)
+        self.events_count += 1
+
+    def _read_event_views(self) -> Dict[str, Any]:
+        return self.snapshot.read(STAKING_EVENT_VIEWS, self.event_block, self.event_tx)
+
+    def _read_static_views(self) -> Dict[str, Any]:
+        if (self.event_block or self.event_tx) and self.events_count % STATIC_VIEWS_REFRESH_EVENTS:
+            return {view: self.snapshot.get(view) for view in STAKING_STATIC_VIEWS}
+        return self.snapshot.read(STAKING_STATIC_VIEWS, self.event_block, self.event_tx)
+
     def update_data(self):
-        self.token_supply = self.data_fetcher.get_data('getFarmTokenSupply')
-        self.last_rewards_block_nonce = self.data_fetcher.get_data('getLastRewardBlockNonce')
-        self.rewards_per_block = self.data_fetcher.get_data('getPerBlockRewardAmount')
-        self.annual_percentage_rewards = self.data_fetcher.get_data('getAnnualPercentageRewards')
-        self.rewards_capacity = self.data_fetcher.get_data('getRewardCapacity')
-        self.rewards_per_share = self.data_fetcher.get_data('getRewardPerShare')
-        self.min_unbond_epochs = self.data_fetcher.get_data('getMinUnbondEpochs')
-        self.division_safety_constant = self.data_fetcher.get_data('getDivisionSafetyConstant')
+        state = self._read_event_views()
+        state.update(self._read_static_views())
+        self.token_supply = state['getFarmTokenSupply']
+        self.last_rewards_block_nonce = state['getLastRewardBlockNonce']
+        self.rewards_per_block = state['getPerBlockRewardAmount']
+        self.annual_percentage_rewards = state['getAnnualPercentageRewards']
+        self.rewards_capacity = state['getRewardCapacity']
+        self.rewards_per_share = state['getRewardPerShare']
+        self.min_unbond_epochs = state['getMinUnbondEpochs']
+        self.division_safety_constant = state['getDivisionSafetyConstant']
 
     def report_current_tracking_data(self):
         print(f"Staking contract address: {self.contract_address.bech32()}")
@@ -48,10 +76,12 @@ class StakingEconomics(Subscriber):
         print(f"Rewards per share: {self.rewards_per_share}")
 
     def check_invariant_properties(self):
-        new_rewards_per_share = self.data_fetcher.get_data("getRewardPerShare")
-        new_last_rewards_block_nonce = self.data_fetcher.get_data("getLastRewardBlockNonce")
-        chain_rewards_per_block = self.data_fetcher.get_data("getPerBlockRewardAmount")
-        chain_division_safety_constant = self.data_fetcher.get_data("getDivisionSafetyConstant")
+        state = self._read_event_views()
+        static_state = self._read_static_views()
+        new_rewards_per_share = state["getRewardPerShare"]
+        new_last_rewards_block_nonce = state["getLastRewardBlockNonce"]
+        chain_rewards_per_block = static_state["getPerBlockRewardAmount"]
+        chain_division_safety_constant = static_state["getDivisionSafetyConstant"]
 
         if self.rewards_per_share > new_rewards_per_share:
             log_step_fail("TEST CHECK FAIL: Rewards per share decreased!")
@@ -73,7 +103,7 @@ class StakingEconomics(Subscriber):
         log_step_pass("Checked invariant properties!")
 
     def check_enter_staking_properties(self):
-        new_token_supply = self.data_fetcher.get_data("getFarmTokenSupply")
+        new_token_supply = self._read_event_views()["getFarmTokenSupply"]
         if self.token_supply >= new_token_supply:
             log_step_fail('Staking farm token supply did not increase')
             log_substep(f"Old token supply: {self.token_supply}")
@@ -82,9 +112,10 @@ class StakingEconomics(Subscriber):
         log_step_pass('Checked enter staking properties!')
 
     def check_enter_staking_data(self, event: EnterFarmEvent, tx_hash: str):
-        new_staking_token_supply = self.data_fetcher.get_data("getFarmTokenSupply")
-        new_contract_rewards_per_share = self.data_fetcher.get_data("getRewardPerShare")
-        new_last_rewards_block_nonce = self.data_fetcher.get_data("getLastRewardBlockNonce")
+        state = self._read_event_views()
+        new_staking_token_supply = state["getFarmTokenSupply"]
+        new_contract_rewards_per_share = state["getRewardPerShare"]
+        new_last_rewards_block_nonce = state["getLastRewardBlockNonce"]
         tx_block = self.chain_data_fetcher.get_tx_block_nonce(tx_hash)
 
         aggregated_rewards = (tx_block - self.last_block_calculated_rewards) * self.rewards_per_block
@@ -117,7 +148,7 @@ class StakingEconomics(Subscriber):
         log_step_pass('Checked enter staking data!')
 
     def check_exit_staking_properties(self):
-        new_token_supply = self.data_fetcher.get_data('getFarmTokenSupply')
+        new_token_supply = self._read_event_views()['getFarmTokenSupply']
         if self.token_supply <= new_token_supply:
             log_step_fail('Staking farm token supply did not decrease')
             log_substep(f"Old token supply: {self.token_supply}")
@@ -126,9 +157,10 @@ class StakingEconomics(Subscriber):
         log_step_pass('Checked exit staking properties')
 
     def check_exit_staking_data(self, event: ExitFarmEvent, tx_hash: str):
-        new_token_supply = self.data_fetcher.get_data('getFarmTokenSupply')
-        new_contract_rewards_per_share = self.data_fetcher.get_data("getRewardPerShare")
-        new_last_rewards_block_nonce = self.data_fetcher.get_data("getLastRewardBlockNonce")
+        state = self._read_event_views()
+        new_token_supply = state['getFarmTokenSupply']
+        new_contract_rewards_per_share = state["getRewardPerShare"]
+        new_last_rewards_block_nonce = state["getLastRewardBlockNonce"]
         tx_block = self.chain_data_fetcher.get_tx_block_nonce(tx_hash)
         expected_token_supply = self.token_supply - event.amount
 
@@ -157,7 +189,7 @@ class StakingEconomics(Subscriber):
         log_step_pass('Checked exit staking data')
 
     def check_claim_rewards_properties(self):
-        new_token_supply = self.data_fetcher.get_data('getFarmTokenSupply')
+        new_token_supply = self._read_event_views()['getFarmTokenSupply']
         if self.token_supply != new_token_supply:
             log_step_fail('Token supply modified!')
             log_substep(f"Old Farm token supply: {self.token_supply}")
@@ -166,9 +198,10 @@ class StakingEconomics(Subscriber):
         log_step_pass("Checked claim rewards properties!")
 
     def check_claim_rewards_data(self, tx_hash):
-        new_token_supply = self.data_fetcher.get_data('getFarmTokenSupply')
-        new_rewards_per_share = self.data_fetcher.get_data("getRewardPerShare")
-        new_last_rewards_block_nonce = self.data_fetcher.get_data("getLastRewardBlockNonce")
+        state = self._read_event_views()
+        new_token_supply = state['getFarmTokenSupply']
+        new_rewards_per_share = state["getRewardPerShare"]
+        new_last_rewards_block_nonce = state["getLastRewardBlockNonce"]
         tx_block = self.chain_data_fetcher.get_tx_block_nonce(tx_hash)
         aggregated_rewards = (tx_block - self.last_block_calculated_rewards) * self.rewards_per_block
 
@@ -219,6 +252,7 @@ class StakingEconomics(Subscriber):
         if publisher.contract is not None:
             if self.contract_address.bech32() == publisher.contract.address:
                 self.network_provider.wait_for_tx_executed(publisher.tx_hash)
+                self.begin_event(publisher.tx_hash)
                 if type(publisher.event) == EnterFarmEvent:
                     self.enter_staking_event(publisher.event, publisher.tx_hash)
                 elif type(publisher.event) == ExitFarmEvent:
@@ -0,0 +1,167 @@
+import threading
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Set
+
+from multiversx_sdk import Address
+
+from utils.contract_data_fetchers import DataFetcher
+from utils.logger import get_logger
+from utils.utils_chain import get_current_tokens_for_address, get_shard_of_address, get_token_ticker
+from utils.utils_tx import NetworkProviders
+
+logger = get_logger(__name__)
+
+STATIC_VIEWS_REFRESH_EVENTS = 50    # events between re-reads of views that no tracked event changes
+APPLIED_TXS_MEMORY = 1000           # per account, guards against applying the same transaction twice
+
+
+class ContractStateSnapshot:
+    """Last known view values of a contract, each tagged with the block nonce of the contract's shard it is known
+    to be valid at. All trackers of a contract share one snapshot, so views read after a transaction are reused by
+    all of them."""
+
+    def __init__(self, data_fetcher: DataFetcher):
+        self.data_fetcher = data_fetcher
+        self.shard = get_shard_of_address(data_fetcher.contract_address)
+        self.values: Dict[str, Any] = {}
+        self.blocks: Dict[str, int] = {}
+        self.read_for: Dict[str, str] = {}     # transaction each view was last read for
+        self.version = 0
+        self.reads = 0
+        self._lock = threading.Lock()
+
+    def read(self, views: List[str], block: int = 0, tx_hash: str = "") -> Dict[str, Any]:
+        """Returns the given views as of at least the given block of the contract's shard. Only views not yet known
+        at that block are fetched, concurrently. Without a block (0) a view is only reused if it was read for the
+        same transaction, and without either everything is fetched, since freshness can't be told."""
+        with self._lock:
+            stale = [view for view in views if view not in self.values or not (
+                (block and self.blocks[view] >= block) or (tx_hash and self.read_for[view] == tx_hash))]
+            if stale:
+                results = self.data_fetcher.get_many([(view, []) for view in stale])
+                for view, value in zip(stale, results):
+                    self.values[view] = value
+                    self.blocks[view] = block
+                    self.read_for[view] = tx_hash
+                self.reads += len(stale)
+                self.version += 1
+            return {view: self.values[view] for view in views}
+
+    def get(self, view: str, default: Any = None) -> Any:
+        return self.values.get(view, default)
+
+
+class AccountEsdtState:
+    """ESDT balances of an account, keyed by token ticker with the latest nonce held. Kept up to date from the
+    transfer operations of the account's transactions instead of re-reading the whole ESDT list from chain."""
+
+    def __init__(self, address: Address, network_provider: NetworkProviders):
+        self.address = address
+        self.network_provider = network_provider
+        self.tokens: Dict[str, Dict[str, int]] = {}
+        self.version = 0
+        self._applied: Set[str] = set()
+        self._applied_order: Deque[str] = deque()
+        self._lock = threading.Lock()
+        self.refresh()
+
+    def refresh(self) -> Dict[str, Dict[str, int]]:
+        with self._lock:
+            self.tokens = get_current_tokens_for_address(self.address, self.network_provider.proxy)
+            self.version += 1
+            return self.tokens
+
+    def apply_transaction(self, tx_hash: str) -> Dict[str, Dict[str, int]]:
+        """Applies the transfers of an executed transaction and returns the new token state.
+        Falls back to a full refresh if the transaction's operations aren't available."""
+        if not tx_hash:
+            return self.refresh()
+
+        with self._lock:
+            if tx_hash in self._applied:
+                return self.tokens
+            try:
+                operations = self.network_provider.get_tx_operations(tx_hash)
+            except Exception as ex:
+                logger.debug(f"Operations for {tx_hash} not available: {ex}")
+                operations = []
+
+        if not operations:
+            return self.refresh()
+
+        with self._lock:
+            # copy, so earlier returned states stay untouched for before/after comparisons
+            tokens = {token: dict(details) for token, details in self.tokens.items()}
+            address = self.address.to_bech32()
+            for operation in operations:
+                if operation.get('action') != 'transfer' or not operation.get('identifier'):
+                    continue
+                if address == operation.get('receiver'):
+                    self._apply_transfer(tokens, operation, 1)
+                if address == operation.get('sender'):
+                    self._apply_transfer(tokens, operation, -1)
+
+            self.tokens = tokens
+            self.version += 1
+            self._applied.add(tx_hash)
+            self._applied_order.append(tx_hash)
+            if len(self._applied_order) > APPLIED_TXS_MEMORY:
+                self._applied.discard(self._applied_order.popleft())
+            return self.tokens
+
+    def set_token_balance(self, token: str, nonce: int, balance: int) -> Dict[str, Dict[str, int]]:
+        """Overrides the balance held of a token and returns the new token state."""
+        with self._lock:
+            tokens = {ticker: dict(details) for ticker, details in self.tokens.items()}
+            tokens[token] = {'nonce': nonce, 'balance': balance}
+            self.tokens = tokens
+            self.version += 1
+            return self.tokens
+
+    @staticmethod
+    def _apply_transfer(tokens: Dict[str, Dict[str, int]], operation: dict, sign: int):
+        # keyed by ticker, as get_current_tokens_for_address does, with the nonce held apart
+        ticker = operation.get('collection') or get_token_ticker(operation['identifier'])
+        nonce = 0
+        if ticker != operation['identifier']:
+            nonce = int(operation['identifier'][len(ticker) + 1:], 16)
+        value = int(operation.get('value', 0))
+
+        token = tokens.get(ticker)
+        if token is None:
+            tokens[ticker] = {'nonce': nonce, 'balance': value if sign > 0 else 0}
+        elif nonce > token['nonce'] and sign > 0:
+            tokens[ticker] = {'nonce': nonce, 'balance': value}
+        elif nonce == token['nonce']:
+            token['balance'] = max(int(token['balance']) + sign * value, 0)
+
+
+_SNAPSHOTS: Dict[str, ContractStateSnapshot] = {}
+_ESDT_STATES: Dict[str, AccountEsdtState] = {}
+_REGISTRY_LOCK = threading.Lock()
+
+
+def get_contract_snapshot(data_fetcher: DataFetcher) -> ContractStateSnapshot:
+    """Returns the snapshot shared by all trackers of the fetcher's contract."""
+    key = data_fetcher.contract_address.to_bech32()
+    with _REGISTRY_LOCK:
+        snapshot = _SNAPSHOTS.get(key)
+        if snapshot is None:
+            snapshot = ContractStateSnapshot(data_fetcher)
+            _SNAPSHOTS[key] = snapshot
+        return snapshot
+
+
+def get_account_esdt_state(address: Address, network_provider: NetworkProviders,
+                           refresh: bool = False) -> AccountEsdtState:
+    """Returns the ESDT state shared by all trackers of an account."""
+    key = address.to_bech32()
+    with _REGISTRY_LOCK:
+        state: Optional[AccountEsdtState] = _ESDT_STATES.get(key)
+        if state is None:
+            state = AccountEsdtState(address, network_provider)
+            _ESDT_STATES[key] = state
+            return state
+    if refresh:
+        state.refresh()
+    return state
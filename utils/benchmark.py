@@ -0,0 +1,348 @@
+import csv
+import json
+import math
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from multiversx_sdk import Address, ApiNetworkProvider, Transaction, TransactionStatus
+
+from utils.logger import get_logger
+from utils.results_logger import RESULTS_FOLDER
+from utils.utils_chain import WrapperAddress
+from utils.utils_generic import ensure_folder
+from utils.utils_tx import TxStatusTracker, add_tx_listener, get_proxy_provider, remove_tx_listener
+
+logger = get_logger(__name__)
+
+BENCHMARK_METRICS = ("build", "sign", "send", "inclusion", "finality")
+BENCHMARK_PERCENTILES = (50, 90, 99, 99.9)
+BENCHMARK_POLL_INTERVAL = 1     # seconds between completion checks
+BENCHMARK_POLL_WORKERS = 16
+BENCHMARK_FINALITY_TIMEOUT = 300    # seconds to wait for pending transactions when stopping
+HISTOGRAM_SUB_BUCKET_BITS = 7   # 128 sub-buckets per power of two, i.e. under 1% relative error
+HISTOGRAM_UNIT = 1e-6   # seconds, values are counted in microseconds
+
+
+class LatencyHistogram:
+    """HDR style histogram of durations: exact below 2^(sub_bits+1) units, then log-linear buckets with
+    2^sub_bits sub-buckets per power of two. Memory stays bounded and percentiles keep a fixed relative precision."""
+
+    def __init__(self, sub_bucket_bits: int = HISTOGRAM_SUB_BUCKET_BITS, unit: float = HISTOGRAM_UNIT):
+        self.sub_bucket_bits = sub_bucket_bits
+        self.unit = unit
+        self.counts: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def _index(self, units: int) -> int:
+        shift = max(units.bit_length() - self.sub_bucket_bits - 1, 0)
+        return (shift << (self.sub_bucket_bits + 1)) + (units >> shift)
+
+    def _value(self, index: int) -> float:
+        """Middle of the bucket's range, in seconds."""
+        shift = index >> (self.sub_bucket_bits + 1)
+        mantissa = index & ((1 << (self.sub_bucket_bits + 1)) - 1)
+        return ((mantissa << shift) + ((1 << shift) - 1) / 2) * self.unit
+
+    def record(self, value: float):
+        value = max(value, 0.0)
+        index = self._index(int(value / self.unit))
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.count += 1
+        self.total += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def merge(self, other: "LatencyHistogram"):
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def percentile(self, percent: float) -> float:
+        if not self.count:
+            return 0.0
+        rank = max(math.ceil(percent / 100 * self.count), 1)
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                return min(max(self._value(index), self.min), self.max)
+        return self.max
+
+    def to_dict(self) -> dict:
+        """Summary in milliseconds."""
+        if not self.count:
+            return {"count": 0}
+        summary = {"count": self.count,
+                   "min_ms": self.min * 1000,
+                   "mean_ms": self.total / self.count * 1000}
+        for percent in BENCHMARK_PERCENTILES:
+            summary[f"p{percent:g}_ms"] = self.percentile(percent) * 1000
+        summary["max_ms"] = self.max * 1000
+        return summary
+
+
+class TxTimings:
+    """Timings of a single transaction. Durations are in seconds, *_at fields are wall clock timestamps."""
+    __slots__ = ("sender", "nonce", "event", "contract", "shard", "tx_hash", "status",
+                 "build", "sign", "send", "sent_at", "included_at", "finalized_at")
+
+    def __init__(self, tx: Transaction):
+        self.sender = tx.sender.to_bech32()
+        self.nonce = tx.nonce
+        self.event, self.contract = describe_transaction(tx)
+        self.shard = WrapperAddress(self.sender).get_shard()
+        self.tx_hash = ""
+        self.status = ""
+        self.build: Optional[float] = None
+        self.sign: Optional[float] = None
+        self.send: Optional[float] = None
+        self.sent_at: Optional[float] = None
+        self.included_at: Optional[float] = None
+        self.finalized_at: Optional[float] = None
+
+    def get_durations(self) -> Dict[str, Optional[float]]:
+        inclusion = finality = None
+        if self.sent_at is not None and self.included_at is not None:
+            inclusion = max(self.included_at - self.sent_at, 0.0)
+        if self.sent_at is not None and self.finalized_at is not None:
+            finality = self.finalized_at - self.sent_at
+        return {"build": self.build, "sign": self.sign, "send": self.send,
+                "inclusion": inclusion, "finality": finality}
+
+
+def _bech32_from_hex(pubkey_hex: str) -> str:
+    return Address(bytes.fromhex(pubkey_hex), "erd").to_bech32()
+
+
+def describe_transaction(tx: Transaction) -> Tuple[str, str]:
+    """Returns the called endpoint and the destination contract, looking through ESDT transfer wrappers."""
+    receiver = tx.receiver.to_bech32()
+    parts = tx.data.decode(errors="replace").split("@") if tx.data else [""]
+    function = parts[0]
+    try:
+        if function == "ESDTTransfer":
+            endpoint = bytes.fromhex(parts[3]).decode() if len(parts) > 3 else "transfer"
+        elif function == "ESDTNFTTransfer":
+            receiver = _bech32_from_hex(parts[4])
+            endpoint = bytes.fromhex(parts[5]).decode() if len(parts) > 5 else "transfer"
+        elif function == "MultiESDTNFTTransfer":
+            receiver = _bech32_from_hex(parts[1])
+            endpoint_index = 3 + 3 * int(parts[2], 16)
+            endpoint = bytes.fromhex(parts[endpoint_index]).decode() if len(parts) > endpoint_index else "transfer"
+        else:
+            endpoint = function or "transfer"
+    except Exception:
+        endpoint = function or "unknown"
+    return endpoint, receiver
+
+
+class BenchmarkRecorder:
+    """Records per-transaction build, sign, send, inclusion and finality timings of everything built and sent
+    through utils.utils_tx while started, and aggregates them in histograms per event type, contract and shard.
+
+    Completion is detected online, by polling the api in batches if one is given or else the proxy; the inclusion
+    time comes from the block timestamp, so it has the chain's one second resolution."""
+
+    def __init__(self, proxy_url: str, api_url: str = "", poll_interval: float = BENCHMARK_POLL_INTERVAL):
+        self.proxy = get_proxy_provider(proxy_url)
+        self.tracker = TxStatusTracker(ApiNetworkProvider(api_url), on_complete=self._on_complete) if api_url else None
+        self.poll_interval = poll_interval
+        self.records: Dict[Tuple[str, int], TxTimings] = {}
+        self.started_at = 0.0
+        self.stopped_at = 0.0
+        self._by_hash: Dict[str, TxTimings] = {}
+        self._pending: Dict[str, None] = {}     # insertion ordered set
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._poller: Optional[threading.Thread] = None
+
+    def on_built(self, tx: Transaction, build_time: float, sign_time: float):
+        with self._lock:
+            record = TxTimings(tx)
+            record.build, record.sign = build_time, sign_time
+            self.records[(record.sender, record.nonce)] = record
+
+    def on_sent(self, transactions: List[Transaction], hashes: List[str], send_time: float):
+        sent_at = time.time() - send_time
+        accepted = []
+        with self._lock:
+            for tx, tx_hash in zip(transactions, hashes):
+                key = (tx.sender.to_bech32(), tx.nonce)
+                record = self.records.get(key)
+                if record is None:
+                    record = TxTimings(tx)
+                    self.records[key] = record
+                if record.tx_hash:
+                    # already accepted in an earlier attempt
+                    continue
+                record.send, record.sent_at = send_time, sent_at
+                if tx_hash:
+                    record.tx_hash = tx_hash
+                    self._by_hash[tx_hash] = record
+                    accepted.append(tx_hash)
+            if self.tracker is None:
+                self._pending.update(dict.fromkeys(accepted))
+        if self.tracker is not None:
+            self.tracker.track(accepted)
+
+    def _on_complete(self, tx_hash: str, status: TransactionStatus):
+        with self._lock:
+            record = self._by_hash.get(tx_hash)
+            if record is not None and record.finalized_at is None:
+                record.finalized_at = time.time()
+                record.status = status.status
+            self._pending.pop(tx_hash, None)
+
+    def _check_status(self, tx_hash: str):
+        try:
+            status = self.proxy.get_transaction_status(tx_hash)
+        except Exception as ex:
+            logger.debug(f"Status of {tx_hash} not available yet: {ex}")
+            return
+        if status.is_completed:
+            self._on_complete(tx_hash, status)
+
+    def _poll(self):
+        with self._lock:
+            pending = list(self._pending)
+        if pending:
+            with ThreadPoolExecutor(max_workers=BENCHMARK_POLL_WORKERS) as executor:
+                list(executor.map(self._check_status, pending))
+
+    def start(self):
+        self.started_at = time.time()
+        add_tx_listener(self)
+        if self.tracker is not None:
+            self.tracker.start(self.poll_interval)
+            return
+
+        def run():
+            while not self._stop_event.is_set():
+                self._poll()
+                self._stop_event.wait(self.poll_interval)
+
+        self._stop_event.clear()
+        self._poller = threading.Thread(target=run, daemon=True)
+        self._poller.start()
+
+    def stop(self, timeout: float = BENCHMARK_FINALITY_TIMEOUT):
+        """Stops recording new transactions, waits up to timeout for the sent ones to complete,
+        then resolves the inclusion times."""
+        remove_tx_listener(self)
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline and (self.tracker.pending if self.tracker is not None else self._pending):
+            time.sleep(self.poll_interval)
+
+        if self.tracker is not None:
+            self.tracker.stop()
+        else:
+            self._stop_event.set()
+            if self._poller is not None:
+                self._poller.join()
+                self._poller = None
+        self.stopped_at = time.time()
+        self._resolve_inclusion()
+
+    def _resolve_inclusion(self):
+        completed = [record for record in self.records.values()
+                     if record.finalized_at is not None and record.included_at is None]
+
+        def resolve(record: TxTimings):
+            try:
+                record.included_at = self.proxy.get_transaction(record.tx_hash).timestamp or None
+            except Exception as ex:
+                logger.debug(f"Block timestamp of {record.tx_hash} not available: {ex}")
+
+        with ThreadPoolExecutor(max_workers=BENCHMARK_POLL_WORKERS) as executor:
+            list(executor.map(resolve, completed))
+
+    def get_histograms(self) -> Dict[str, Dict[str, Dict[str, LatencyHistogram]]]:
+        """Histograms keyed by dimension ("overall", "event", "contract", "shard"), group and metric."""
+        histograms: Dict[str, Dict[str, Dict[str, LatencyHistogram]]] = {
+            "overall": {}, "event": {}, "contract": {}, "shard": {}
+        }
+        with self._lock:
+            records = list(self.records.values())
+
+        for record in records:
+            groups = {"overall": "all", "event": record.event, "contract": record.contract, "shard": str(record.shard)}
+            for metric, value in record.get_durations().items():
+                if value is None:
+                    continue
+                for dimension, group in groups.items():
+                    metrics = histograms[dimension].setdefault(group, {})
+                    metrics.setdefault(metric, LatencyHistogram()).record(value)
+        return histograms
+
+    def get_summary(self) -> dict:
+        with self._lock:
+            records = list(self.records.values())
+        sent = [record for record in records if record.tx_hash]
+        completed = [record for record in sent if record.finalized_at is not None]
+        failed = [record for record in completed if TransactionStatus(record.status).is_failed]
+
+        summary = {
+            "transactions": len(records),
+            "accepted": len(sent),
+            "completed": len(completed),
+            "failed": len(failed),
+            "send_tps": 0.0,
+            "completed_tps": 0.0,
+        }
+        if sent:
+            first_sent = min(record.sent_at for record in sent)
+            last_sent = max(record.sent_at + record.send for record in sent)
+            summary["send_tps"] = len(sent) / max(last_sent - first_sent, 1e-9)
+            if completed:
+                last_completed = max(record.finalized_at for record in completed)
+                summary["completed_tps"] = len(completed) / max(last_completed - first_sent, 1e-9)
+
+        for dimension, groups in self.get_histograms().items():
+            summary[dimension] = {group: {metric: metrics[metric].to_dict()
+                                          for metric in BENCHMARK_METRICS if metric in metrics}
+                                  for group, metrics in groups.items()}
+        return summary
+
+    def export(self, name: str, folder: str = RESULTS_FOLDER) -> Tuple[Path, Path]:
+        """Writes the summary as JSON and the per-transaction timings as CSV, next to the results log."""
+        ensure_folder(folder)
+        json_path = Path(folder) / f"{name}_benchmark.json"
+        csv_path = Path(folder) / f"{name}_benchmark.csv"
+
+        with open(json_path, "w") as f:
+            json.dump(self.get_summary(), f, indent=4)
+
+        with self._lock:
+            records = list(self.records.values())
+        with open(csv_path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["tx_hash", "sender", "nonce", "event", "contract", "shard", "status", "sent_at",
+                             *BENCHMARK_METRICS])
+            for record in records:
+                durations = record.get_durations()
+                writer.writerow([record.tx_hash, record.sender, record.nonce, record.event, record.contract,
+                                 record.shard, record.status, record.sent_at,
+                                 *[durations[metric] for metric in BENCHMARK_METRICS]])
+
+        logger.info(f"Benchmark results saved in {json_path} and {csv_path}")
+        return json_path, csv_path
+
+    def report(self) -> str:
+        summary = self.get_summary()
+        lines = [f"{summary['accepted']} transactions accepted, {summary['completed']} completed "
+                 f"({summary['failed']} failed); {summary['send_tps']:.1f} tx/s sent, "
+                 f"{summary['completed_tps']:.1f} tx/s completed"]
+        for metric, stats in summary["overall"].get("all", {}).items():
+            if stats["count"]:
+                lines.append(f"{metric:>10}: p50 {stats['p50_ms']:.1f}ms, p99 {stats['p99_ms']:.1f}ms, "
+                             f"max {stats['max_ms']:.1f}ms ({stats['count']} samples)")
+        return "\n".join(lines)
@@ -0,0 +1,117 @@
+import atexit
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from multiversx_sdk import NetworkConfig
+from multiversx_sdk.network_providers.http_resources import network_config_from_response
+
+import config
+from utils.logger import get_logger
+from utils.utils_tx import NETWORK_CONFIG_TTL
+
+logger = get_logger(__name__)
+
+CONTEXT_CACHE_FILE = "_context_cache.json"
+CONTEXT_CACHE_VERSION = 1
+
+
+def get_saves_fingerprint() -> str:
+    """Fingerprint of the deploy structure and deployed_*.json saves; changes whenever any of them is written."""
+    files = [Path(config.DEPLOY_STRUCTURE_JSON)] + sorted(Path(config.DEFAULT_CONFIG_SAVE_PATH).glob("deployed_*.json"))
+    entries = []
+    for file in files:
+        try:
+            stat = file.stat()
+        except OSError:
+            continue
+        entries.append(f"{file.absolute()}:{stat.st_mtime_ns}:{stat.st_size}")
+    return hashlib.sha256("\n".join(entries).encode()).hexdigest()
+
+
+class ContextCache:
+    """Pre-resolved context data kept between runs: saved tokens, contract configs per label and network configs
+    per proxy. Tokens and contracts are dropped as soon as any deploy save changes;
+    network configs expire after NETWORK_CONFIG_TTL. Changes are written once, at exit."""
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path) if path else config.DEFAULT_WORKSPACE / CONTEXT_CACHE_FILE
+        self.fingerprint = get_saves_fingerprint()
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._data = self._read()
+
+    def _read(self) -> Dict[str, Any]:
+        data = {}
+        try:
+            with open(self.path, "r") as file:
+                data = json.load(file)
+        except (OSError, ValueError):
+            pass
+
+        if data.get("version") != CONTEXT_CACHE_VERSION:
+            data = {"version": CONTEXT_CACHE_VERSION, "networks": {}}
+        if data.get("fingerprint") != self.fingerprint:
+            logger.debug("Deploy saves changed since the context cache was written, dropping cached contracts.")
+            data["fingerprint"] = self.fingerprint
+            data["tokens"] = None
+            data["contracts"] = {}
+        return data
+
+    def _mark_dirty(self):
+        if not self._dirty:
+            self._dirty = True
+            atexit.register(self.save)
+
+    def get_tokens(self) -> Optional[List[str]]:
+        with self._lock:
+            return self._data["tokens"]
+
+    def set_tokens(self, tokens: List[str]):
+        with self._lock:
+            self._data["tokens"] = list(tokens)
+            self._mark_dirty()
+
+    def get_contract_configs(self, label: str) -> Optional[List[dict]]:
+        with self._lock:
+            return self._data["contracts"].get(label)
+
+    def set_contract_configs(self, label: str, contract_configs: List[dict]):
+        with self._lock:
+            self._data["contracts"][label] = contract_configs
+            self._mark_dirty()
+
+    def get_network_config(self, proxy_url: str) -> Optional[Tuple[NetworkConfig, float, Optional[int]]]:
+        """Cached network config of proxy_url with its age in seconds and the epoch it was fetched in, if not expired."""
+        with self._lock:
+            entry = self._data["networks"].get(proxy_url, {}).get("network_config")
+        if entry is None:
+            return None
+        age = time.time() - entry["saved_at"]
+        if not 0 <= age < NETWORK_CONFIG_TTL:
+            return None
+        return network_config_from_response(entry["raw"]), age, entry.get("epoch")
+
+    def set_network_config(self, proxy_url: str, network_config: NetworkConfig, epoch: Optional[int] = None):
+        with self._lock:
+            network = self._data["networks"].setdefault(proxy_url, {})
+            network["network_config"] = {"raw": network_config.raw, "saved_at": time.time(), "epoch": epoch}
+            self._mark_dirty()
+
+    def save(self):
+        with self._lock:
+            if not self._dirty:
+                return
+            # written aside and swapped in, so concurrent runs never read a partial file
+            temp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            try:
+                with open(temp_path, "w") as file:
+                    json.dump(self._data, file)
+                os.replace(temp_path, self.path)
+                self._dirty = False
+            except OSError as ex:
+                logger.warning(f"Failed to save the context cache: {ex}")
@@ -1,19 +1,55 @@
 import sys
+import threading
 import traceback
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 
 from multiversx_sdk import Address, ProxyNetworkProvider, SmartContractController, Token
 
 from utils.logger import get_logger
-from typing import List, Any
+from utils.utils_tx import get_network_config, get_proxy_provider
+from typing import Callable, Dict, List, Any, Optional, Sequence, Tuple
 
 logger = get_logger(__name__)
 
+QUERY_BATCH_WORKERS = 16
+TX_BLOCK_NONCES_MAX = 10000
+
+# block nonce and (sender, receiver) shards of an executed transaction don't change,
+# so they're shared by all trackers asking for them
+_TX_BLOCK_NONCES: Dict[str, Tuple[int, int, int]] = {}
+
+
+_FETCHERS: Dict[Tuple[type, str, str], "DataFetcher"] = {}
+_FETCHERS_LOCK = threading.Lock()
+
 
 class DataFetcher:
     def __init__(self, contract_address: Address, proxy_url: str):
-        self.proxy = ProxyNetworkProvider(proxy_url)
+        self.proxy: ProxyNetworkProvider = get_proxy_provider(proxy_url)
         self.contract_address = contract_address
         self.view_handler_map = {}
+        self._controller: Optional[SmartContractController] = None
+        self._controller_lock = threading.Lock()
+
+    @classmethod
+    def for_contract(cls, contract_address: Address, proxy_url: str):
+        """Returns the shared fetcher of this type for (contract, proxy), creating it on first use."""
+        key = (cls, contract_address.to_bech32(), proxy_url)
+        with _FETCHERS_LOCK:
+            fetcher = _FETCHERS.get(key)
+            if fetcher is None:
+                fetcher = cls(contract_address, proxy_url)
+                _FETCHERS[key] = fetcher
+            return fetcher
+
+    @property
+    def controller(self) -> SmartContractController:
+        if self._controller is None:
+            with self._controller_lock:
+                if self._controller is None:
+                    self._controller = SmartContractController(get_network_config(self.proxy).chain_id, self.proxy)
+        return self._controller
 
     def get_data(self, view_name: str, attrs: List[Any] = []) -> Any:
         if view_name in self.view_handler_map:
@@ -22,14 +58,20 @@ class DataFetcher:
             logger.error(f"View name not registered in {type(self).__name__}")
             raise ValueError(f"View name not registered in {type(self).__name__}")
 
+    def get_many(self, views: Sequence[Tuple[str, List[Any]]], max_workers: int = QUERY_BATCH_WORKERS) -> List[Any]:
+        """Runs the given (view_name, attrs) queries concurrently; results keep the order of views."""
+        batch = QueryBatch(max_workers)
+        for view_name, attrs in views:
+            batch.add(self, view_name, attrs)
+        return batch.run()
+
     def _query_contract(self, view_name: str, attrs: List[Any] = []):
-        controller = SmartContractController(self.proxy.get_network_config().chain_id,self.proxy)
-        query = controller.create_query(
+        query = self.controller.create_query(
             contract=self.contract_address,
             function=view_name,
             arguments=attrs
         )
-        return controller.run_query(query)
+        return self.controller.run_query(query)
 
     def _get_int_view(self, view_name: str, attrs: List[Any]) -> int:
         result = None
@@ -80,6 +122,44 @@ class DataFetcher:
         return []
 
 
+class QueryBatch:
+    """Collects view queries across any number of contracts and runs them over a bounded thread pool.
+    Results are returned in the order queries were added; a failing query yields None without affecting the others."""
+
+    def __init__(self, max_workers: int = QUERY_BATCH_WORKERS):
+        self.max_workers = max_workers
+        self._queries: List[Tuple[str, Callable[[], Any]]] = []
+
+    def __len__(self):
+        return len(self._queries)
+
+    def add(self, fetcher: DataFetcher, view_name: str, attrs: Optional[List[Any]] = None) -> int:
+        """Queues a registered view of the given fetcher. Returns the index of its result."""
+        label = f"{view_name} on {fetcher.contract_address.to_bech32()}"
+        return self.add_call(partial(fetcher.get_data, view_name, attrs or []), label)
+
+    def add_call(self, query: Callable[[], Any], label: str = "") -> int:
+        """Queues an arbitrary query callable, for views not served by a DataFetcher. Returns the index of its result."""
+        self._queries.append((label or getattr(query, "__name__", "query"), query))
+        return len(self._queries) - 1
+
+    def run(self) -> List[Any]:
+        if not self._queries:
+            return []
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(self._queries))) as executor:
+            return list(executor.map(self._run_query, self._queries))
+
+    @staticmethod
+    def _run_query(query: Tuple[str, Callable[[], Any]]) -> Any:
+        label, func = query
+        try:
+            return func()
+        except Exception as ex:
+            logger.error(f"Batched query {label} failed: {ex}")
+            logger.debug(traceback.format_exc())
+        return None
+
+
 class LockedAssetContractDataFetcher(DataFetcher):
     def __init__(self, contract_address: Address, proxy_url: str):
         super().__init__(contract_address, proxy_url)
@@ -385,21 +465,44 @@ class LkWrapContractDataFetcher(DataFetcher):
 
 class ChainDataFetcher:
     def __init__(self, proxy_url: str):
-        self.proxy = ProxyNetworkProvider(proxy_url)
+        self.proxy = get_proxy_provider(proxy_url)
+
+    def _get_tx_block(self, txhash: str) -> Tuple[int, int, int]:
+        if txhash in _TX_BLOCK_NONCES:
+            return _TX_BLOCK_NONCES[txhash]
+        response = self.proxy.get_transaction(txhash)
+        block = (response.raw.get("blockNonce", 0), response.raw.get("senderShard", -1),
+                 response.raw.get("receiverShard", -1))
+        if block[0]:
+            if len(_TX_BLOCK_NONCES) >= TX_BLOCK_NONCES_MAX:
+                _TX_BLOCK_NONCES.clear()
+            _TX_BLOCK_NONCES[txhash] = block
+        return block
 
     def get_tx_block_nonce(self, txhash: str) -> int:
         if txhash == "":
             print("No hash provided")
             return 0
         try:
-            response = self.proxy.get_transaction(txhash)
-            return response.nonce
+            return self._get_tx_block(txhash)[0]
 
         except Exception as ex:
             print("Exception encountered:", ex)
             traceback.print_exception(*sys.exc_info())
             return 0
 
+    def get_tx_block_nonce_in_shard(self, txhash: str, shard: int) -> int:
+        """Block nonce of a transaction executed entirely within the given shard; 0 if it crossed shards or is
+        unknown, as the reported block nonce then belongs to another shard's chain."""
+        if not txhash:
+            return 0
+        try:
+            block_nonce, sender_shard, receiver_shard = self._get_tx_block(txhash)
+        except Exception as ex:
+            logger.debug(f"Block of {txhash} not available: {ex}")
+            return 0
+        return block_nonce if sender_shard == receiver_shard == shard else 0
+
     def get_current_block_nonce(self) -> int:
         try:
             response = self.proxy.get_network_status(1)
@@ -7,6 +7,8 @@ from utils.contract_data_fetchers import FarmContractDataFetcher
 from utils.utils_chain import WrapperAddress as Address, get_all_token_nonces_details_for_account
 from utils.utils_generic import ensure_folder, dump_out_json
 
+RESULTS_FOLDER = "arrows/stress/dex/results/"
+
 
 class AccountSnapshotLogData:
 
@@ -97,7 +99,7 @@ class ResultsLogger:
 
             # out_filename = filename + "_" + str(run_time.day) + str(run_time.hour) + str(run_time.minute) + str(run_time.second)
             out_filename = self.filename
-            filepath = "arrows/stress/dex/results/" + out_filename
+            filepath = RESULTS_FOLDER + out_filename
 
             ensure_folder(Path(filepath).parent)
             with open(filepath, "a") as f:
@@ -105,7 +107,7 @@ class ResultsLogger:
 
     def __save_backup_log(self, log_event: dict):
         if self.active:
-            filepath = f"arrows/stress/dex/results/{self.filename}_backup.json"
+            filepath = f"{RESULTS_FOLDER}{self.filename}_backup.json"
             ensure_folder(Path(filepath).parent)
             with open(filepath, "a") as f:
                 dump_out_json(log_event, f)
@@ -0,0 +1,182 @@
+import re
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+STATE_DIFF_BUCKETS = 4096               # hashed key buckets of the first state summary; a power of two
+STATE_DIFF_KEYS_PER_BUCKET = 64         # keys per bucket aimed at when summarizing large states again
+STATE_DIFF_MAX_BUCKETS = 1 << 22
+STATE_DIFF_DIGEST_MODULO = 1 << 64
+BINARY_KEYS_GROUP = "<binary>"
+ADDRESS_LENGTH = 32
+
+# printable prefix of a key, holding the storage mapper name and possibly printable bytes of its arguments
+_PRINTABLE_PREFIX = re.compile(rb"[!-~]*")
+_RESERVED_KEY = re.compile(r"ELROND[a-z]*")
+
+# a re-iterable source of (hex key, hex value) pairs: called once per pass over the state
+PairsSource = Callable[[], Iterable[Tuple[str, str]]]
+
+
+def _decode_mapper_name(key: str) -> Tuple[str, bool]:
+    """Mapper name of a hex encoded key and whether it is certain, i.e. not possibly glued to argument bytes."""
+    try:
+        raw = bytes.fromhex(key)
+    except ValueError:
+        return BINARY_KEYS_GROUP, True
+    prefix = _PRINTABLE_PREFIX.match(raw).group()
+    if prefix.startswith(b"ELROND"):
+        return _RESERVED_KEY.match(prefix.decode()).group(), True
+
+    certain = False
+    if len(raw) > ADDRESS_LENGTH and len(prefix) >= len(raw) - ADDRESS_LENGTH and \
+            len(_PRINTABLE_PREFIX.match(raw, len(raw) - ADDRESS_LENGTH).group()) < ADDRESS_LENGTH:
+        # a name followed by an address, whose bytes may start printable
+        prefix, certain = raw[:-ADDRESS_LENGTH], True
+    if b"." in prefix:
+        # mapper suffixes: .len, .item, .index, .mapped, .info, .node_links ...
+        prefix, certain = prefix[:prefix.index(b".")], True
+    return prefix.decode() or BINARY_KEYS_GROUP, certain
+
+
+def get_mapper_name(key: str, known_names: Iterable[str] = ()) -> str:
+    """Storage mapper name of a hex encoded key, e.g. 'pair_reserve' or 'ELRONDesdt' for protocol keys.
+    A name that may hold printable argument bytes is folded into the longest known name it starts with."""
+    name, certain = _decode_mapper_name(key)
+    if certain:
+        return name
+    return max((known for known in known_names if name.startswith(known)), key=len, default=name)
+
+
+def group_by_mapper_name(keys: Iterable[str], known_names: Iterable[str] = ()) -> Dict[str, str]:
+    """Mapper name of each key; the certain names found among the keys are known names for the others."""
+    names, uncertain = {}, []
+    known = set(known_names)
+    for key in keys:
+        name, certain = _decode_mapper_name(key)
+        names[key] = name
+        if certain:
+            known.add(name)
+        else:
+            uncertain.append(key)
+    for key in uncertain:
+        names[key] = max((name for name in known if names[key].startswith(name)), key=len, default=names[key])
+    return names
+
+
+def decode_key(key: str) -> str:
+    return bytearray.fromhex(key).decode('iso-8859-1')
+
+
+def get_bucket_count(keys: int) -> int:
+    """Power of two number of buckets holding about STATE_DIFF_KEYS_PER_BUCKET keys each."""
+    buckets = STATE_DIFF_BUCKETS
+    while buckets * STATE_DIFF_KEYS_PER_BUCKET < keys and buckets < STATE_DIFF_MAX_BUCKETS:
+        buckets *= 2
+    return buckets
+
+
+class StateSummary:
+    """Merkle-like summary of a state: a root over hashed buckets of keys, each holding its number of keys and an
+    order independent digest of its pairs. Built in one pass; memory is one entry per bucket.
+
+    Digests use the interpreter's hash and are only comparable within the same process."""
+
+    def __init__(self, pairs: Iterable[Tuple[str, str]], buckets: int = STATE_DIFF_BUCKETS):
+        counts = [0] * buckets
+        digests = [0] * buckets
+        for key, value in pairs:
+            bucket = hash(key) % buckets
+            counts[bucket] += 1
+            digests[bucket] += hash((key, value))
+        self.keys = sum(counts)
+        self.buckets = [(count, digest % STATE_DIFF_DIGEST_MODULO) for count, digest in zip(counts, digests)]
+        self.root = hash(tuple(self.buckets))
+
+    def get_differing_buckets(self, other: "StateSummary") -> Set[int]:
+        if self.root == other.root:
+            return set()
+        return {bucket for bucket in range(len(self.buckets)) if self.buckets[bucket] != other.buckets[bucket]}
+
+
+class StateDiff:
+    """Differences between two states, grouped by storage mapper name."""
+
+    def __init__(self, left_keys: int = 0, right_keys: int = 0):
+        self.left_keys = left_keys
+        self.right_keys = right_keys
+        self.buckets = STATE_DIFF_BUCKETS
+        self.skipped_buckets = 0
+        self.groups: Dict[str, Dict[str, Dict[str, Any]]] = {}
+
+    def set_differences(self, only_left: Dict[str, str], only_right: Dict[str, str],
+                        changed: Dict[str, List[str]], mapper_names: Iterable[str] = ()):
+        names = group_by_mapper_name([*only_left, *only_right, *changed], mapper_names)
+        self.groups = {}
+        for kind, entries in (("only_left", only_left), ("only_right", only_right), ("changed", changed)):
+            for key, value in entries.items():
+                group = self.groups.setdefault(names[key], {"only_left": {}, "only_right": {}, "changed": {}})
+                group[kind][key] = value
+
+    @property
+    def identical(self) -> bool:
+        return not self.groups
+
+    def get_group_counts(self, group: str) -> Tuple[int, int, int]:
+        """Number of keys only in left, only in right and changed of a mapper group."""
+        entries = self.groups[group]
+        return len(entries["only_left"]), len(entries["only_right"]), len(entries["changed"])
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "identical": self.identical,
+            "left_keys": self.left_keys,
+            "right_keys": self.right_keys,
+            "buckets": self.buckets,
+            "skipped_buckets": self.skipped_buckets,
+            "groups": {group: self.groups[group] for group in sorted(self.groups)},
+        }
+
+
+def _within_buckets(pairs: Iterable[Tuple[str, str]], buckets: int,
+                    selected: Set[int]) -> Iterable[Tuple[str, str]]:
+    return ((key, value) for key, value in pairs if hash(key) % buckets in selected)
+
+
+def diff_states(left: PairsSource, right: PairsSource, mapper_names: Optional[Iterable[str]] = None) -> StateDiff:
+    """Compares two states in passes. The first summarizes both sides in STATE_DIFF_BUCKETS buckets, so identical
+    states and buckets are skipped. Large states are summarized again within the differing buckets, in as many
+    buckets as keep about STATE_DIFF_KEYS_PER_BUCKET keys each. The last pass collects only the left pairs of the
+    differing buckets and streams the right side against them, so memory is about the number of differences times
+    the keys per bucket (up to STATE_DIFF_MAX_BUCKETS buckets) rather than the size of the states.
+
+    mapper_names are known storage mapper names, used to group keys whose name may hold argument bytes."""
+    left_summary = StateSummary(left())
+    right_summary = StateSummary(right())
+    diff = StateDiff(left_summary.keys, right_summary.keys)
+
+    buckets = STATE_DIFF_BUCKETS
+    differing_buckets = left_summary.get_differing_buckets(right_summary)
+    fine_buckets = get_bucket_count(max(left_summary.keys, right_summary.keys))
+    if differing_buckets and fine_buckets > buckets:
+        # the bucket count is a multiple of the first one, so a fine bucket lies within a single coarse one
+        left_summary = StateSummary(_within_buckets(left(), buckets, differing_buckets), fine_buckets)
+        right_summary = StateSummary(_within_buckets(right(), buckets, differing_buckets), fine_buckets)
+        buckets = fine_buckets
+        differing_buckets = left_summary.get_differing_buckets(right_summary)
+
+    diff.buckets = buckets
+    diff.skipped_buckets = buckets - len(differing_buckets)
+    if not differing_buckets:
+        return diff
+
+    left_pairs = dict(_within_buckets(left(), buckets, differing_buckets))
+    only_right, changed = {}, {}
+    for key, right_value in _within_buckets(right(), buckets, differing_buckets):
+        if key not in left_pairs:
+            only_right[key] = right_value
+            continue
+        left_value = left_pairs.pop(key)
+        if left_value != right_value:
+            changed[key] = [left_value, right_value]
+    diff.set_differences(left_pairs, only_right, changed, mapper_names or ())
+
+    return diff
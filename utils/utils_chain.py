@@ -1,15 +1,21 @@
 import base64
+import threading
 import time
+import weakref
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
 from getpass import getpass
 from hashlib import blake2b
 from multiprocessing.dummy import Pool
+import os
 from os import path
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple, cast
+from typing import Any, Dict, List, Optional, Set, Tuple, Union, cast
 
 from multiversx_sdk import (Address, AddressComputer, Message, MessageComputer,
                             ProxyNetworkProvider, Transaction,
-                            TransactionComputer, UserSigner)
+                            TransactionComputer, UserSecretKey, UserSigner)
 from multiversx_sdk.wallet.pem_entry import PemEntry
 
 from utils import utils_generic
@@ -17,19 +23,77 @@ from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+NONCE_MAX_IN_FLIGHT = 50        # pending transactions accepted per sender before reserve() waits
+NONCE_STUCK_TIMEOUT = 60        # seconds without on-chain progress before in-flight nonces are considered lost
+NONCE_REFRESH_INTERVAL = 1      # seconds between on-chain checks while waiting for in-flight room
+PARALLEL_SIGN_THRESHOLD = 2000  # below this, batches are signed in process
+SIGN_CHUNK_SIZE = 500
+ESDT_INVENTORY_MAX_AGE = 30         # seconds before an account's token listing is re-read regardless
+ESDT_INVENTORY_SETTLE_TIME = 12     # seconds after which a sent transaction is expected to be executed
+ESDT_INVENTORY_APPLIED_MEMORY = 1000    # per account, guards against applying the same transaction twice
+ATTRIBUTES_DECODERS_MAX_IDS = 1024      # decoding structures cached by identity
+
+# stateless, so a single instance serves all signing
+TX_COMPUTER = TransactionComputer()
+ADDRESS_COMPUTER = AddressComputer()
+
 
 class WrapperAddress(Address):
-    def __init__(self, address: str):
-        self_instance = Address.new_from_bech32(address)
-        super().__init__(self_instance.pubkey, "erd")
+    """Address built from a bech32 string, with its bech32 form and shard cached.
+    Instances are interned: the same address, from bech32 or pubkey, is always the same object, so like the sdk
+    Address it must never be mutated."""
+    __slots__ = ("pubkey", "hrp", "_bech32", "_shard")
+
+    _by_bech32: "weakref.WeakValueDictionary[str, WrapperAddress]" = weakref.WeakValueDictionary()
+    _by_pubkey: "weakref.WeakValueDictionary[bytes, WrapperAddress]" = weakref.WeakValueDictionary()
+
+    def __new__(cls, address: Union[str, bytes], hrp: Optional[str] = None):
+        if isinstance(address, (bytes, bytearray)):     # pubkey, as passed by the sdk Address constructors
+            return cls._from_pubkey(bytes(address))
+
+        instance = cls._by_bech32.get(address)
+        if instance is None:
+            decoded = Address.new_from_bech32(address)
+            instance = cls._from_pubkey(decoded.pubkey)
+            if decoded.hrp == "erd" and address.islower():
+                instance._bech32 = address
+            cls._by_bech32[address] = instance
+        return instance
+
+    def __init__(self, address: Union[str, bytes], hrp: Optional[str] = None):
+        pass    # set up once, in __new__
+
+    @classmethod
+    def _from_pubkey(cls, pubkey: bytes) -> "WrapperAddress":
+        instance = cls._by_pubkey.get(pubkey)
+        if instance is None:
+            instance = object.__new__(cls)
+            Address.__init__(instance, pubkey, "erd")
+            instance._bech32 = None
+            instance._shard = None
+            instance = cls._by_pubkey.setdefault(pubkey, instance)
+        return instance
 
     @classmethod
     def from_hex(cls, value: str, hrp: str = "erd") -> 'Address':
-        self_instance = Address.new_from_hex(value, hrp)
-        return cls(self_instance.bech32())
-    
+        return cls._from_pubkey(bytes.fromhex(value))
+
+    def to_bech32(self) -> str:
+        if self._bech32 is None:
+            self._bech32 = super().to_bech32()
+        return self._bech32
+
     def get_shard(self) -> int:
-        return AddressComputer().get_shard_of_address(self)
+        if self._shard is None:
+            self._shard = ADDRESS_COMPUTER.get_shard_of_address(self)
+        return self._shard
+
+    def __hash__(self):
+        return hash(self.pubkey)
+
+    def __reduce__(self):
+        # unpickles into the interned instance of the receiving process
+        return self.__class__._from_pubkey, (self.pubkey,)
 
     def __str__(self):
         return self.to_bech32()
@@ -38,6 +102,13 @@ class WrapperAddress(Address):
         return self.to_bech32()
 
 
+def get_shard_of_address(address: Address) -> int:
+    """Shard of any address; cached for WrapperAddress."""
+    if isinstance(address, WrapperAddress):
+        return address.get_shard()
+    return ADDRESS_COMPUTER.get_shard_of_address(address)
+
+
 class Account:
     def __init__(self,
                  address: Optional[str] = None,
@@ -50,6 +121,7 @@ class Account:
         self.pem_file = pem_file
         self.pem_index = int(pem_index)
         self.nonce: int = 0
+        self.nonce_manager: Optional["NonceManager"] = None
         self.ledger = ledger
 
         if self.pem_file:
@@ -66,10 +138,22 @@ class Account:
         else:
             raise Exception("Account.address is not set.")
 
+    def reserve_nonce(self) -> int:
+        """Nonce to be used by the next transaction. Atomic if the account is managed by a NonceManager."""
+        if self.nonce_manager is not None:
+            return self.nonce_manager.reserve(self)
+        return self.nonce
+
+    def commit_nonce(self, nonce: int, sent: bool):
+        """Reports whether the transaction using a reserved nonce was accepted for broadcast."""
+        if self.nonce_manager is not None:
+            self.nonce_manager.commit(self, nonce, sent)
+        elif sent:
+            self.nonce += 1
+
     def sign_transaction(self, transaction: Transaction) -> bytes:
         assert self.signer is not None
-        tx_computer = TransactionComputer()
-        return self.signer.sign(tx_computer.compute_bytes_for_signing(transaction))
+        return self.signer.sign(TX_COMPUTER.compute_bytes_for_signing(transaction))
     
     def sign_message(self, data: bytes) -> bytes:
         assert self.signer is not None
@@ -97,6 +181,23 @@ class Account:
 class BunchOfAccounts:
     def __init__(self, items: List[Account]) -> None:
         self.accounts = items
+        # bech32 -> account and shard -> accounts, for the list object and length they were built from
+        self._by_address: Dict[str, Account] = {}
+        self._by_shard: Dict[int, List[Account]] = {}
+        self._indexed_accounts: Optional[List[Account]] = None
+        self._indexed_count = 0
+
+    def _ensure_indexes(self):
+        accounts = self.accounts
+        if accounts is self._indexed_accounts and len(accounts) == self._indexed_count:
+            return
+        by_address: Dict[str, Account] = {}
+        by_shard: Dict[int, List[Account]] = {}
+        for account in accounts:
+            by_address.setdefault(account.address.to_bech32(), account)
+            by_shard.setdefault(get_shard_of_address(account.address), []).append(account)
+        self._by_address, self._by_shard = by_address, by_shard
+        self._indexed_accounts, self._indexed_count = accounts, len(accounts)
 
     @classmethod
     def load_accounts_from_files(cls, files: List[Path]):
@@ -122,7 +223,12 @@ class BunchOfAccounts:
         return BunchOfAccounts(deduplicated)
 
     def get_account(self, address: Address) -> Account:
-        return next(account for account in self.accounts if account.address.to_bech32() == address.to_bech32())
+        self._ensure_indexes()
+        account = self._by_address.get(address.to_bech32())
+        if account is None or account.address.to_bech32() != address.to_bech32():
+            # not indexed or the account took another address since; same outcome as a scan
+            return next(account for account in self.accounts if account.address.to_bech32() == address.to_bech32())
+        return account
 
     def get_all(self) -> List[Account]:
         return self.accounts
@@ -131,12 +237,28 @@ class BunchOfAccounts:
         return len(self.accounts)
 
     def get_not_in_shard(self, shard: int):
-        address_computer = AddressComputer()
-        return [account for account in self.accounts if address_computer.get_shard_of_address(account.address) != shard]
+        self._ensure_indexes()
+        in_shard = set(map(id, self._by_shard.get(shard, [])))
+        return [account for account in self.accounts if id(account) not in in_shard]
 
     def get_in_shard(self, shard: int) -> List[Account]:
-        address_computer = AddressComputer()
-        return [account for account in self.accounts if address_computer.get_shard_of_address(account.address) == shard]
+        self._ensure_indexes()
+        return list(self._by_shard.get(shard, []))
+
+    def get_by_shard(self) -> Dict[int, List[Account]]:
+        self._ensure_indexes()
+        return {shard: list(accounts) for shard, accounts in self._by_shard.items()}
+
+    def partition(self, parts: int) -> List["BunchOfAccounts"]:
+        """Splits the accounts into disjoint groups, dealing each shard's accounts round robin,
+        so every group gets a similar share of each shard."""
+        partitions: List[List[Account]] = [[] for _ in range(parts)]
+        dealt = 0
+        for shard, accounts in sorted(self.get_by_shard().items()):
+            for account in accounts:
+                partitions[dealt % parts].append(account)
+                dealt += 1
+        return [BunchOfAccounts(accounts) for accounts in partitions]
 
     def sync_nonces(self, proxy: ProxyNetworkProvider):
         logger.debug(f"Sync nonces for {len(self.accounts)} accounts")
@@ -177,6 +299,170 @@ class BunchOfAccounts:
         print("Loaded nonces for", len(self.accounts), "accounts")
 
 
+class AccountNonceState:
+    def __init__(self, nonce: int):
+        self.lock = threading.Lock()
+        self.next_nonce = nonce
+        self.chain_nonce = nonce
+        self.in_flight: Set[int] = set()
+        self.gaps: Set[int] = set()     # handed out nonces whose send failed; reused before advancing
+        self.needs_refresh = False
+        self.needs_resync = False
+        self.last_progress = time.monotonic()
+
+
+class NonceManager:
+    """Thread-safe nonce bookkeeping for accounts sending concurrently.
+    Nonces are handed out atomically so several transactions per sender can be in flight (up to max_in_flight).
+    Nonces of failed sends are reused to fill the gap, and only the affected accounts are re-read from chain."""
+
+    def __init__(self, proxy: ProxyNetworkProvider, max_in_flight: int = NONCE_MAX_IN_FLIGHT,
+                 stuck_timeout: float = NONCE_STUCK_TIMEOUT):
+        self.proxy = proxy
+        self.max_in_flight = max_in_flight
+        self.stuck_timeout = stuck_timeout
+        self._states: Dict[str, AccountNonceState] = {}
+        self._lock = threading.Lock()
+
+    def manage(self, accounts: List[Account], max_workers: int = 20):
+        """Attaches the accounts to this manager and syncs their nonces from chain."""
+        def fetch(account: Account) -> int:
+            return self.proxy.get_account(account.address).nonce
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            nonces = list(executor.map(fetch, accounts))
+
+        with self._lock:
+            for account, nonce in zip(accounts, nonces):
+                self._states[account.address.to_bech32()] = AccountNonceState(nonce)
+                account.nonce = nonce
+                account.nonce_manager = self
+        logger.debug(f"NonceManager synced {len(accounts)} accounts")
+
+    def _get_state(self, account: Account) -> AccountNonceState:
+        with self._lock:
+            state = self._states.get(account.address.to_bech32())
+        if state is None:
+            self.manage([account])
+            return self._get_state(account)
+        return state
+
+    def _refresh(self, account: Account, state: AccountNonceState):
+        """Drops nonces already executed on chain and resets the account if stuck or marked for resync.
+        Must be called with the state lock held."""
+        chain_nonce = self.proxy.get_account(account.address).nonce
+        if chain_nonce > state.chain_nonce:
+            state.chain_nonce = chain_nonce
+            state.last_progress = time.monotonic()
+        state.in_flight = {nonce for nonce in state.in_flight if nonce >= chain_nonce}
+        state.gaps = {nonce for nonce in state.gaps if nonce >= chain_nonce}
+
+        stuck = state.in_flight and time.monotonic() - state.last_progress > self.stuck_timeout
+        if stuck:
+            logger.warning(f"Nonces {sorted(state.in_flight)} of {account.address.to_bech32()} "
+                           f"stuck at on-chain nonce {chain_nonce}. Resyncing.")
+        if stuck or state.needs_resync:
+            state.in_flight.clear()
+            state.gaps.clear()
+            state.next_nonce = chain_nonce
+            state.last_progress = time.monotonic()
+        state.next_nonce = max(state.next_nonce, chain_nonce)
+        state.needs_refresh = False
+        state.needs_resync = False
+        account.nonce = state.next_nonce
+
+    def reserve(self, account: Account) -> int:
+        state = self._get_state(account)
+        while True:
+            with state.lock:
+                if state.needs_refresh or state.needs_resync or len(state.in_flight) >= self.max_in_flight:
+                    self._refresh(account, state)
+                if state.gaps:
+                    nonce = min(state.gaps)
+                    state.gaps.remove(nonce)
+                    state.in_flight.add(nonce)
+                    return nonce
+                if len(state.in_flight) < self.max_in_flight:
+                    nonce = state.next_nonce
+                    state.next_nonce += 1
+                    state.in_flight.add(nonce)
+                    account.nonce = state.next_nonce
+                    return nonce
+            time.sleep(NONCE_REFRESH_INTERVAL)
+
+    def commit(self, account: Account, nonce: int, sent: bool):
+        if sent:
+            return
+
+        state = self._get_state(account)
+        with state.lock:
+            state.in_flight.discard(nonce)
+            if nonce == state.next_nonce - 1:
+                state.next_nonce = nonce
+                account.nonce = nonce
+            else:
+                logger.debug(f"Nonce gap at {nonce} for {account.address.to_bech32()}.")
+                state.gaps.add(nonce)
+            # the send may have failed because of a stale nonce, so check the chain on the next reservation
+            state.needs_refresh = True
+
+    def mark_for_resync(self, account: Account):
+        """Drops all local nonce state of the account on its next reservation, e.g. after a mempool eviction."""
+        state = self._get_state(account)
+        with state.lock:
+            state.needs_resync = True
+
+    def get_stuck_accounts(self) -> List[str]:
+        """Addresses whose in-flight transactions made no on-chain progress for longer than the stuck timeout."""
+        now = time.monotonic()
+        with self._lock:
+            states = list(self._states.items())
+        return [address for address, state in states
+                if state.in_flight and now - state.last_progress > self.stuck_timeout]
+
+
+_WORKER_SIGNERS: Dict[str, UserSigner] = {}
+
+
+def _init_signing_worker(secret_keys: Dict[str, bytes]):
+    global _WORKER_SIGNERS
+    _WORKER_SIGNERS = {address: UserSigner(UserSecretKey(key)) for address, key in secret_keys.items()}
+
+
+def _sign_chunk(transactions: List[Transaction]) -> List[bytes]:
+    return [_WORKER_SIGNERS[tx.sender.to_bech32()].sign(TX_COMPUTER.compute_bytes_for_signing(tx))
+            for tx in transactions]
+
+
+def sign_transactions(transactions: List[Transaction], accounts: List[Account],
+                      processes: Optional[int] = None, chunk_size: int = SIGN_CHUNK_SIZE) -> List[Transaction]:
+    """Signs the transactions in place, each with the account matching its sender, and returns them in order.
+    Large batches are signed across a process pool, since signing is CPU bound."""
+    signers = {account.address.to_bech32(): account for account in accounts}
+    missing = {tx.sender.to_bech32() for tx in transactions} - signers.keys()
+    if missing:
+        raise ValueError(f"No signer available for senders: {missing}")
+
+    processes = processes or os.cpu_count() or 1
+    if len(transactions) < PARALLEL_SIGN_THRESHOLD or processes == 1:
+        for tx in transactions:
+            tx.signature = signers[tx.sender.to_bech32()].sign_transaction(tx)
+        return transactions
+
+    # only hand out the keys of the senders actually present in the batch
+    secret_keys = {address: signers[address].signer.secret_key.buffer
+                   for address in {tx.sender.to_bech32() for tx in transactions}}
+    chunks = list(utils_generic.split_to_chunks(transactions, chunk_size))
+    with ProcessPoolExecutor(max_workers=processes, initializer=_init_signing_worker,
+                             initargs=(secret_keys,)) as executor:
+        for chunk, signatures in zip(chunks, executor.map(_sign_chunk, chunks)):
+            for tx, signature in zip(chunk, signatures):
+                tx.signature = signature
+
+    logger.debug(f"Signed {len(transactions)} transactions in {len(chunks)} chunks")
+    return transactions
+
+
 def prevent_spam_crash_elrond_proxy_go():
     time.sleep(1)
 
@@ -193,6 +479,10 @@ def string_to_base64(s: str) -> str:
     return base64.b64encode(s.encode('utf-8'))
 
 
+def base64_to_bytes(b: str) -> bytes:
+    return base64.b64decode(b)
+
+
 def base64_to_string(b: str) -> str:
     return base64.b64decode(b).decode('utf-8')
 
@@ -233,6 +523,170 @@ def _get_all_esdts_for_account(address: str, proxy: ProxyNetworkProvider):
     return esdts
 
 
+class EsdtInventory:
+    """In-memory ESDT listing of an account (as returned by the proxy), indexed by token id and collection, and
+    tagged with the block it was read at. Transfers of our own transactions are applied as they are seen; the listing is
+    re-read lazily, only when it's too old or a transaction sent by the account had time to execute."""
+
+    def __init__(self, address: str, proxy: ProxyNetworkProvider, max_age: float = ESDT_INVENTORY_MAX_AGE):
+        self.address = address
+        self.proxy = proxy
+        self.max_age = max_age
+        self.shard = get_shard_of_address(Address.new_from_bech32(address))
+        self.tokens: Dict[str, dict] = {}
+        self.by_token: Dict[str, List[str]] = {}
+        self.block_nonce = 0    # of the account's shard
+        self.fetched_at = 0.0
+        self.stale = True
+        self.refreshes = 0
+        self._pending: Dict[str, float] = {}    # sent tx hash -> time after which it's expected to be executed
+        self._applied: Set[str] = set()
+        self._applied_order: deque = deque()
+        self._lock = threading.RLock()
+
+    def refresh(self):
+        with self._lock:
+            url = f'address/{self.address}/esdt'
+            response = self.proxy.do_get_generic(url)
+            self.tokens = response.get('esdts') or {}
+            block_info = response.get('blockInfo') or {}
+            self.block_nonce = block_info.get('nonce', 0)
+            self.fetched_at = time.time()
+            self.stale = False
+            # transactions still executing aren't in this listing yet
+            self._pending = {tx_hash: settles_at for tx_hash, settles_at in self._pending.items()
+                             if settles_at > self.fetched_at}
+            self._reindex()
+            self.refreshes += 1
+
+    def _reindex(self):
+        self.by_token = {}
+        for identifier, token in self.tokens.items():
+            self._index(identifier, token)
+
+    def _index(self, identifier: str, token: dict):
+        token_id = token.get('tokenIdentifier', identifier)
+        self.by_token.setdefault(token_id, []).append(identifier)
+        ticker = get_token_ticker(token_id)
+        if ticker != token_id:
+            # lookups by collection, e.g. a farm token, get all its nonces
+            self.by_token.setdefault(ticker, []).append(identifier)
+
+    def invalidate(self):
+        with self._lock:
+            self.stale = True
+
+    def note_sent_transaction(self, tx_hash: str, settle_time: float = ESDT_INVENTORY_SETTLE_TIME):
+        """Marks a transaction sent by the account; if its transfers aren't applied until it had time to
+        execute, the next lookup re-reads the listing."""
+        with self._lock:
+            self._pending[tx_hash] = time.time() + settle_time
+
+    def _ensure_fresh(self):
+        now = time.time()
+        if self.stale or now - self.fetched_at > self.max_age or \
+                any(settles_at <= now for settles_at in self._pending.values()):
+            self.refresh()
+
+    def apply_transaction(self, tx_hash: str, operations: List[dict], block_nonce: int = 0, timestamp: int = 0,
+                          shard: Optional[int] = None):
+        """Applies the transfers of an executed transaction to the listing, unless the listing already includes it.
+        block_nonce is the block the transaction was executed in on the given shard."""
+        with self._lock:
+            if tx_hash in self._applied:
+                return
+            self._applied.add(tx_hash)
+            self._applied_order.append(tx_hash)
+            if len(self._applied_order) > ESDT_INVENTORY_APPLIED_MEMORY:
+                self._applied.discard(self._applied_order.popleft())
+            self._pending.pop(tx_hash, None)
+            if self.stale or not self.fetched_at:
+                return
+
+            if block_nonce and self.block_nonce and shard == self.shard:
+                if block_nonce <= self.block_nonce:
+                    return
+            elif not timestamp or timestamp <= self.fetched_at:
+                # block nonces of other shards don't order against the listing; when the transaction isn't known
+                # to be newer, re-read the listing rather than risk counting its transfers twice
+                self.stale = True
+                return
+
+            for operation in operations:
+                if operation.get('action') != 'transfer' or not operation.get('identifier'):
+                    continue
+                if operation.get('receiver') == self.address:
+                    self._apply_transfer(operation, 1)
+                if operation.get('sender') == self.address:
+                    self._apply_transfer(operation, -1)
+
+    def _apply_transfer(self, operation: dict, sign: int):
+        identifier = operation['identifier']
+        value = int(operation.get('value', 0))
+        token = self.tokens.get(identifier)
+        if token is None:
+            if sign < 0:
+                return
+            if operation.get('collection'):
+                # attributes of a new nonce are only known from chain, read them on next lookup
+                self.stale = True
+                return
+            self.tokens[identifier] = {'tokenIdentifier': identifier, 'balance': str(value)}
+            self._index(identifier, self.tokens[identifier])
+            return
+
+        balance = int(token.get('balance', 0)) + sign * value
+        if balance > 0:
+            token['balance'] = str(balance)
+        else:
+            del self.tokens[identifier]
+            self._reindex()
+
+    def get_entries(self, in_token: str) -> Dict[str, dict]:
+        """Returns copies of the listing entries whose identifier contains in_token, in listing order."""
+        with self._lock:
+            self._ensure_fresh()
+            if in_token in self.by_token:
+                return {identifier: dict(self.tokens[identifier]) for identifier in self.by_token[in_token]}
+            return {identifier: dict(token) for identifier, token in self.tokens.items() if in_token in identifier}
+
+
+ESDT_INVENTORIES: Dict[str, EsdtInventory] = {}
+_ESDT_INVENTORIES_LOCK = threading.Lock()
+
+
+def get_esdt_inventory(address: str, proxy: ProxyNetworkProvider) -> EsdtInventory:
+    if isinstance(address, Address):
+        address = address.to_bech32()
+    with _ESDT_INVENTORIES_LOCK:
+        inventory = ESDT_INVENTORIES.get(address)
+        if inventory is None:
+            inventory = EsdtInventory(address, proxy)
+            ESDT_INVENTORIES[address] = inventory
+        return inventory
+
+
+def apply_transaction_to_inventories(transaction: dict):
+    """Feeds an executed transaction (api format) to the inventories of the accounts it transferred tokens for."""
+    operations = transaction.get('operations', [])
+    if not operations or not ESDT_INVENTORIES:
+        return
+    addresses = {operation.get(side) for operation in operations for side in ('sender', 'receiver')}
+    for address in addresses:
+        inventory = ESDT_INVENTORIES.get(address)
+        if inventory is not None:
+            # the api reports the block of the sender shard
+            inventory.apply_transaction(transaction.get('txHash', ''), operations,
+                                        transaction.get('blockNonce', 0), transaction.get('timestamp', 0),
+                                        transaction.get('senderShard'))
+
+
+def note_sent_transaction(address: str, tx_hash: str):
+    inventory = ESDT_INVENTORIES.get(address)
+    if inventory is not None and tx_hash:
+        inventory.note_sent_transaction(tx_hash)
+
+
 def get_all_token_nonces_details_for_account(in_token: str, address: str, proxy: ProxyNetworkProvider):
     """
     Result list will contain all in_tokens with following indexes:
@@ -242,34 +696,41 @@ def get_all_token_nonces_details_for_account(in_token: str, address: str, proxy:
         ['attributes'] - if existent
         ['creator']
     """
-    # TODO: to refactor into supporting the new mxpy sdk
-    esdts = cast(List, _get_all_esdts_for_account(address, proxy))
     filtered_tokens_list = []
 
-    for token in esdts:
-        if in_token not in token:
-            continue
-        if 'nonce' not in esdts[token]:
-            esdts[token]['nonce'] = 0
-        filtered_tokens_list.append(esdts[token])
+    for token in get_esdt_inventory(address, proxy).get_entries(in_token).values():
+        if 'nonce' not in token:
+            token['nonce'] = 0
+        filtered_tokens_list.append(token)
 
     return filtered_tokens_list
 
 
-def get_current_tokens_for_address(address: Address, proxy: ProxyNetworkProvider):
+def get_token_ticker(identifier: str) -> str:
+    """Collection ticker of a token identifier: 'FARM-abcdef-0a' -> 'FARM-abcdef'; fungible identifiers are kept."""
+    parts = identifier.split('-')
+    if len(parts) > 2:
+        return '-'.join(parts[:2])
+    return identifier
+
+
+def get_current_tokens_for_address(address: Address, proxy: ProxyNetworkProvider) -> Dict[str, Dict[str, int]]:
+    """Returns {ticker: {'nonce', 'balance'}}; for tokens held on several nonces, the latest nonce is kept."""
     # TODO: This is a temporary adaptor between new specs of mxpy sdk and old specs of the rest of the code.
     # Went with this granular approach to reduce api calls (one call for all esdts instead
     # of two calls for fungibles and non-fungibles).
-    esdts = _get_all_esdts_for_account(address.bech32(), proxy)
+    esdts = _get_all_esdts_for_account(address.bech32(), proxy) or {}
 
     tokens_dict = {}
 
-    for token in esdts:
-        if token.get('nonce', '') == '':
-            token['nonce'] = 0
-        tokens_dict[token['identifier']] = {
-            'nonce': token['nonce'],
-            'balance': token['balance']
+    for token in esdts.values():
+        ticker = get_token_ticker(token.get('tokenIdentifier', ''))
+        nonce = int(token.get('nonce') or 0)
+        if ticker in tokens_dict and tokens_dict[ticker]['nonce'] > nonce:
+            continue
+        tokens_dict[ticker] = {
+            'nonce': nonce,
+            'balance': int(token.get('balance', 0))
         }
 
     return tokens_dict
@@ -277,14 +738,9 @@ def get_current_tokens_for_address(address: Address, proxy: ProxyNetworkProvider
 
 def get_token_details_for_address(in_token: str, address: str, proxy: ProxyNetworkProvider, underlying_tk: str = "") -> Tuple[int, int, str]:
     """Returns nonce, amount, attributes_hex"""
-    # TODO: This is a temporary adaptor between new specs of mxpy sdk and old specs of the rest of the code.
-    prevent_spam_crash_elrond_proxy_go()
-    tokens = cast(List, _get_all_esdts_for_account(address, proxy))
+    tokens = get_esdt_inventory(address, proxy).get_entries(in_token)
 
     for token in tokens:
-        if in_token not in token:
-            continue
-
         attributes_hex = ""
         if 'attributes' in tokens[token]:
             attributes_hex = base64_to_hex(tokens[token]['attributes'])
@@ -333,91 +789,166 @@ def get_account_key(address_bech32: str, key_hex: str, proxy: ProxyNetworkProvid
     return value
 
 
-def decode_merged_attributes(attributes_hex: str, decode_struct: dict) -> dict:
-    def slide_indexes(j, no_bytes: int):
-        index_f = j
-        index_l = j + (no_bytes * 2)
-        return index_f, index_l
-
-    def fixed_length_primitive(attributes: str, start_index: int, primitive_len: int):
-        index_first, index_last = slide_indexes(start_index, primitive_len)
-        result_hex = attributes[index_first:index_last]
-        result_int = int(result_hex, 16)
-        return result_int, result_hex, index_last
-
-    def u8(attributes: str, start_index: int):
-        result, _, index = fixed_length_primitive(attributes, start_index, 1)
-        return result, index
-
-    def u16(attributes: str, start_index: int):
-        result, _, index = fixed_length_primitive(attributes, start_index, 2)
-        return result, index
-
-    def u32(attributes: str, start_index: int):
-        result, _, index = fixed_length_primitive(attributes, start_index, 4)
-        return result, index
-
-    def u64(attributes: str, start_index: int):
-        result, _, index = fixed_length_primitive(attributes, start_index, 8)
-        return result, index
-
-    def biguint(attributes: str, start_index: int):
-        payload_size, _, index = fixed_length_primitive(attributes, start_index, 4)
-        result = 0
-        if payload_size:
-            result, _, index = fixed_length_primitive(attributes, index, payload_size)
-        return result, index
-    
-    def bigint(attributes: str, start_index: int):
-        payload_size, _, index = fixed_length_primitive(attributes, start_index, 4)
-        result = 0
-        if payload_size:
-            _, hex, index = fixed_length_primitive(attributes, index, payload_size)
-            result = int.from_bytes(bytes.fromhex(hex), byteorder="big", signed=True)
-        return result, index
-
-    def string(attributes: str, start_index: int):
-        payload_size, _, index = fixed_length_primitive(attributes, start_index, 4)
-        result_string = ""
-        if payload_size:
-            _, result, index = fixed_length_primitive(attributes, index, payload_size)
-            result_string = bytearray.fromhex(result).decode()
-        return result_string, index
-    
-    def address(attributes: str, start_index: int):
-        _, result, index = fixed_length_primitive(attributes, start_index, 32)
-        bech32 = Address.new_from_hex(result, "erd").to_bech32()
-        return bech32, index
+def _read_uint(buf, offset: int, size: int) -> Tuple[int, int]:
+    end = offset + size
+    chunk = buf[offset:end]
+    if not len(chunk):
+        # keep the behaviour of the former hex parser, which failed on empty reads
+        raise ValueError(f"attributes too short: no data at offset {offset}")
+    return int.from_bytes(chunk, "big"), end
 
-    results_dict = {}
-    sliding_index = 0
-    implemented_primitives = {'u8': u8,
-                              'u16': u16,
-                              'u32': u32,
-                              'u64': u64,
-                              'biguint': biguint,
-                              'bigint': bigint,
-                              'string': string,
-                              'address': address}
-
-    for key, primitive in decode_struct.items():
-        if type(primitive) is dict:
-            # primitive now becomes a dictionary of keys/primitives
-            list_decode_fields = primitive
-            decoded_list_fields = {}
-            for field_key, field_primitive in list_decode_fields.items():
-                if field_primitive in implemented_primitives:
-                    decoded_result, sliding_index = implemented_primitives[field_primitive](
-                        attributes_hex, sliding_index)
-                    decoded_list_fields[field_key] = decoded_result
-
-            results_dict[key] = decoded_list_fields
-
-        elif primitive in implemented_primitives:
-            decoded_result, sliding_index = implemented_primitives[primitive](attributes_hex, sliding_index)
-            results_dict[key] = decoded_result
-
-    return results_dict
+
+def _read_sized(buf, offset: int) -> Tuple[Any, int]:
+    size, offset = _read_uint(buf, offset, 4)
+    if not size:
+        return None, offset
+    end = offset + size
+    chunk = buf[offset:end]
+    if not len(chunk):
+        raise ValueError(f"attributes too short: no payload at offset {offset}")
+    return chunk, end
+
+
+def _decode_u8(buf, offset: int):
+    return _read_uint(buf, offset, 1)
+
+
+def _decode_u16(buf, offset: int):
+    return _read_uint(buf, offset, 2)
+
+
+def _decode_u32(buf, offset: int):
+    return _read_uint(buf, offset, 4)
+
+
+def _decode_u64(buf, offset: int):
+    return _read_uint(buf, offset, 8)
+
+
+def _decode_biguint(buf, offset: int):
+    chunk, offset = _read_sized(buf, offset)
+    return (int.from_bytes(chunk, "big") if chunk is not None else 0), offset
+
+
+def _decode_bigint(buf, offset: int):
+    chunk, offset = _read_sized(buf, offset)
+    return (int.from_bytes(chunk, "big", signed=True) if chunk is not None else 0), offset
+
+
+def _decode_string(buf, offset: int):
+    chunk, offset = _read_sized(buf, offset)
+    return (bytes(chunk).decode() if chunk is not None else ""), offset
+
+
+@lru_cache(maxsize=65536)
+def _pubkey_to_bech32(pubkey: bytes) -> str:
+    # holders repeat a lot across positions and bech32 encoding dominates decoding time
+    return Address(pubkey, "erd").to_bech32()
+
+
+def _decode_address(buf, offset: int):
+    end = offset + 32
+    pubkey = buf[offset:end]
+    if len(pubkey) != 32:
+        # callers rely on ValueError to fall back to older attribute structures
+        raise ValueError(f"attributes too short: expected address at offset {offset}")
+    return _pubkey_to_bech32(pubkey), end
+
+
+ATTRIBUTE_PRIMITIVES = {
+    'u8': _decode_u8,
+    'u16': _decode_u16,
+    'u32': _decode_u32,
+    'u64': _decode_u64,
+    'biguint': _decode_biguint,
+    'bigint': _decode_bigint,
+    'string': _decode_string,
+    'address': _decode_address,
+}
+
+
+class AttributesDecoder:
+    """Decoder compiled once for a decoding structure (see utils.decoding_structures).
+    Works directly on bytes in a single pass; hex strings are accepted as well."""
+
+    def __init__(self, decode_struct: dict):
+        self.decode_struct = decode_struct
+        self._steps = self._compile(decode_struct)
+
+    @staticmethod
+    def _compile(decode_struct: dict) -> List[Tuple[str, Any]]:
+        steps = []
+        for key, primitive in decode_struct.items():
+            if type(primitive) is dict:
+                # nested structure, decoded into its own dict; unknown primitives are skipped
+                nested = [(field_key, ATTRIBUTE_PRIMITIVES[field_primitive])
+                          for field_key, field_primitive in primitive.items()
+                          if type(field_primitive) is str and field_primitive in ATTRIBUTE_PRIMITIVES]
+                steps.append((key, tuple(nested)))
+            elif primitive in ATTRIBUTE_PRIMITIVES:
+                steps.append((key, ATTRIBUTE_PRIMITIVES[primitive]))
+        return steps
+
+    def decode(self, attributes) -> dict:
+        """Decode a single attributes blob given as bytes, memoryview or hex string."""
+        if isinstance(attributes, str):
+            buf = bytes.fromhex(attributes)
+        elif isinstance(attributes, bytes):
+            buf = attributes
+        else:
+            buf = bytes(attributes)
+        result = {}
+        offset = 0
+        for key, step in self._steps:
+            if type(step) is tuple:
+                nested = {}
+                for field_key, decode_field in step:
+                    nested[field_key], offset = decode_field(buf, offset)
+                result[key] = nested
+            else:
+                result[key], offset = step(buf, offset)
+        return result
+
+    def decode_many(self, blobs) -> List[dict]:
+        return [self.decode(blob) for blob in blobs]
+
+
+def _struct_key(decode_struct: dict) -> tuple:
+    return tuple((key, _struct_key(value) if type(value) is dict else value)
+                 for key, value in decode_struct.items())
+
+
+ATTRIBUTES_DECODERS: Dict[tuple, AttributesDecoder] = {}
+# by id of the structure dict, holding a reference to it so the id isn't reused while cached
+_ATTRIBUTES_DECODERS_BY_ID: Dict[int, Tuple[dict, AttributesDecoder]] = {}
+
+
+def get_attributes_decoder(decode_struct: dict) -> AttributesDecoder:
+    """Decoder compiled for the structure. Structures are looked up by identity first, so they shouldn't be
+    changed once used; callers decoding in a loop can hold the returned decoder instead."""
+    cached = _ATTRIBUTES_DECODERS_BY_ID.get(id(decode_struct))
+    if cached is not None:
+        return cached[1]
+
+    key = _struct_key(decode_struct)
+    decoder = ATTRIBUTES_DECODERS.get(key)
+    if decoder is None:
+        decoder = AttributesDecoder(decode_struct)
+        ATTRIBUTES_DECODERS[key] = decoder
+    if len(_ATTRIBUTES_DECODERS_BY_ID) >= ATTRIBUTES_DECODERS_MAX_IDS:
+        # structures built per call would otherwise pile up; rebuilt ones are found by key
+        _ATTRIBUTES_DECODERS_BY_ID.clear()
+    _ATTRIBUTES_DECODERS_BY_ID[id(decode_struct)] = (decode_struct, decoder)
+    return decoder
+
+
+def decode_merged_attributes(attributes_hex: str | bytes, decode_struct: dict) -> dict:
+    return get_attributes_decoder(decode_struct).decode(attributes_hex)
+
+
+def decode_merged_attributes_batch(attributes_list: List[Any], decode_struct: dict) -> List[dict]:
+    """Decode many attribute blobs (bytes or hex strings) sharing the same structure."""
+    return get_attributes_decoder(decode_struct).decode_many(attributes_list)
 
 
 def encode_merged_attributes(encode_data: dict, encode_struct: dict):
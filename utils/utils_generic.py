@@ -5,6 +5,7 @@ import shutil
 import stat
 import sys
 import tarfile
+import threading
 import zipfile
 import wget
 
@@ -43,6 +44,30 @@ class BasicEncoder(json.JSONEncoder):
         return json.JSONEncoder.default(self, o)
     
 
+class lazy_property:
+    """Computes an attribute on first access and stores it on the instance, like functools.cached_property,
+    but guarded by a lock so concurrent first accesses compute it once. Assigning the attribute overrides it.
+    Locks are per instance and property, so instances don't wait on each other's loads."""
+
+    def __init__(self, func: Callable[[Any], Any]):
+        self.func = func
+        self.name = func.__name__
+        self.__doc__ = func.__doc__
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        # dict.setdefault is atomic, so concurrent first accesses end up with the same lock
+        locks = instance.__dict__.setdefault("_lazy_property_locks", {})
+        with locks.setdefault(self.name, threading.RLock()):
+            if self.name not in instance.__dict__:
+                instance.__dict__[self.name] = self.func(instance)
+        return instance.__dict__[self.name]
+
+
 def execute_parallel(func: Callable, iterable: Iterable[Any], max_workers: int = 10) -> List[Any]:
     processed = 0
     total = len(iterable)
@@ -1,3 +1,5 @@
+import threading
+
 from multiversx_sdk import ProxyNetworkProvider, ApiNetworkProvider
 from utils.utils_chain import Account, WrapperAddress as Address, get_all_token_nonces_details_for_account, get_token_details_for_address
 from multiprocessing.dummy import Pool
@@ -25,15 +27,23 @@ class FetchedUser:
 class FetchedUsers:
     def __init__(self) -> None:
         self.users: List[FetchedUser] = []
+        self._by_address: Dict[str, FetchedUser] = {}
+        self._lock = threading.Lock()   # users are added from the collection thread pool
 
     def add_user(self, user: FetchedUser) -> None:
-        # check if user already exists
-        if user.address in [user.address for user in self.users]:
-            return
-        self.users.append(user)
+        address = user.address.to_bech32()
+        with self._lock:
+            # check if user already exists
+            if address in self._by_address:
+                return
+            self._by_address[address] = user
+            self.users.append(user)
 
     def address_exists(self, address: Address) -> bool:
-        return address in [user.address for user in self.users]
+        return address.to_bech32() in self._by_address
+
+    def get_user(self, address: Address) -> Optional[FetchedUser]:
+        return self._by_address.get(address.to_bech32())
 
     # getter for users having farming tokens
     def get_users_with_farming_tokens(self) -> list[FetchedUser]:
@@ -87,14 +97,16 @@ def collect_farm_contract_users(users_count: int,
 
     fetched_users = FetchedUsers()
     set_users = set()
+    set_users_lock = threading.Lock()
 
     def process_tx(tx: TransactionOnNetwork):
         user = Address(tx.sender.to_bech32())
         
         # avoid duplicates
-        if user.to_bech32() in set_users:
-            return
-        set_users.add(user.to_bech32())
+        with set_users_lock:
+            if user.to_bech32() in set_users:
+                return
+            set_users.add(user.to_bech32())
 
         logger.debug(f'Processing user {user.to_bech32()} ...')
         try:
@@ -1,9 +1,18 @@
+import asyncio
+import json
+import sqlite3
 import sys
+import threading
 import time
 import traceback
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from multiversx_sdk.core.constants import INTEGER_MAX_NUM_BYTES
+from collections import OrderedDict, deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Any, Dict, List, Protocol, Sequence, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Protocol, Sequence, Tuple, Union
 
 from multiversx_sdk import (Address, ApiNetworkProvider, ProxyNetworkProvider, Transaction)
 from multiversx_sdk import Token, TokenTransfer
@@ -16,20 +25,281 @@ from multiversx_sdk import find_events_by_identifier
 from multiversx_sdk import TransactionEvent
 from multiversx_sdk import TransactionStatus
 from multiversx_sdk.abi import Abi
-from multiversx_sdk.network_providers.errors import TransactionFetchingError
+from multiversx_sdk.network_providers.errors import NetworkProviderError, TransactionFetchingError
+from multiversx_sdk.network_providers.resources import GenericResponse
+import config
 from utils.logger import get_logger
 from utils.errors import GenericError
-from utils.utils_chain import Account, WrapperAddress, log_explorer_transaction, get_bytecode_codehash
+from utils.utils_chain import (Account, WrapperAddress, log_explorer_transaction, get_bytecode_codehash,
+                               apply_transaction_to_inventories, note_sent_transaction)
 from utils.utils_generic import (get_continue_confirmation, log_step_fail,
                                  log_unexpected_args, split_to_chunks, get_file_from_url_or_path)
 
-TX_CACHE: Dict[str, dict] = {}
 logger = get_logger(__name__)
 
 API_TX_DELAY = 3
 API_LONG_TX_DELAY = 6
 API_TX_STATUS_REFETCH_DELAY = 2
 MAX_TX_FETCH_RETRIES = 50 // API_TX_DELAY
+ASYNC_TX_TIMEOUT = 300     # seconds
+TX_TRACKER_BATCH_SIZE = 50
+NETWORK_CONFIG_TTL = 600    # seconds
+PROXY_POOL_SIZE = 32
+BROADCAST_RATE = 500        # starting rate, tx/s
+BROADCAST_MIN_RATE = 10
+BROADCAST_MAX_RATE = 5000
+BROADCAST_CHUNK_SIZE = 100
+BROADCAST_WORKERS = 4
+BROADCAST_MAX_RETRIES = 3
+BROADCAST_BACKPRESSURE_RATIO = 0.9
+BROADCAST_SLOWDOWN_INTERVAL = 1  # seconds
+# proxy errors that mean the chain or the proxy is overloaded, as opposed to transactions rejected for cause
+BROADCAST_THROTTLING_ERRORS = ("429", "too many requests", "timeout", "timed out", "max retries", "connection aborted",
+                               "connection reset", "mempool is full", "cache full")
+TX_CACHE_MAX_ENTRIES = 5000
+TX_CACHE_MAX_BYTES = 256 * 1024 * 1024
+TX_CACHE_PENDING_TTL = 6    # seconds
+BLOCK_CLOCK_TIMEOUT = 600   # seconds
+BLOCK_CLOCK_STATUS_WORKERS = 16  # concurrent proxy status requests when waiting for finality without an api
+METACHAIN_ID = 4294967295
+
+
+class NetworkConfigCache:
+    """Process-wide network config cache, keyed by proxy url.
+    Entries expire after ttl seconds and are dropped when a new epoch is observed for their proxy."""
+
+    def __init__(self, ttl: int = NETWORK_CONFIG_TTL):
+        self.ttl = ttl
+        self._entries: Dict[str, Tuple[NetworkConfig, float, Optional[int]]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, proxy: ProxyNetworkProvider) -> NetworkConfig:
+        with self._lock:
+            entry = self._entries.get(proxy.url)
+            if entry is not None and time.monotonic() - entry[1] < self.ttl:
+                return entry[0]
+
+        network_config = proxy.get_network_config()
+        # the config doesn't hold the epoch it was fetched in, the network status does
+        try:
+            epoch = proxy.get_network_status().current_epoch
+        except Exception as ex:
+            logger.debug(f"Failed to get the current epoch from {proxy.url}: {ex}")
+            epoch = None
+        with self._lock:
+            self._entries[proxy.url] = (network_config, time.monotonic(), epoch)
+        return network_config
+
+    def get_epoch(self, proxy_url: str) -> Optional[int]:
+        """Epoch in which the cached config of proxy_url was fetched, if known."""
+        with self._lock:
+            entry = self._entries.get(proxy_url)
+            return entry[2] if entry is not None else None
+
+    def put(self, proxy_url: str, network_config: NetworkConfig, age: float = 0, epoch: Optional[int] = None):
+        """Seeds the cache with a config fetched age seconds ago in the given epoch, e.g. one saved by a previous run."""
+        with self._lock:
+            self._entries[proxy_url] = (network_config, time.monotonic() - age, epoch)
+
+    def observe_epoch(self, proxy_url: str, epoch: int):
+        """Records the current epoch for a proxy; a change in epoch invalidates its cached config.
+        A config fetched in an unknown epoch is invalidated as well, as it can't be told apart from a stale one."""
+        with self._lock:
+            entry = self._entries.get(proxy_url)
+            if entry is None or entry[2] == epoch:
+                return
+            logger.debug(f"Epoch {epoch} observed on {proxy_url}, config was fetched in epoch {entry[2]}. "
+                         f"Dropping cached network config.")
+            self._entries.pop(proxy_url)
+
+    def invalidate(self, proxy_url: str = ""):
+        """Drops the cached config for the given proxy url or for all proxies if none given."""
+        with self._lock:
+            if proxy_url:
+                self._entries.pop(proxy_url, None)
+            else:
+                self._entries.clear()
+
+
+NETWORK_CONFIG_CACHE = NetworkConfigCache()
+
+
+def get_network_config(proxy: ProxyNetworkProvider) -> NetworkConfig:
+    return NETWORK_CONFIG_CACHE.get(proxy)
+
+
+def invalidate_network_config(proxy_url: str = ""):
+    NETWORK_CONFIG_CACHE.invalidate(proxy_url)
+
+
+class TxCacheEntry:
+    __slots__ = ("transaction", "operations_index", "size", "expires_at")
+
+    def __init__(self, transaction: dict, size: int, expires_at: Optional[float]):
+        self.transaction = transaction
+        self.size = size
+        self.expires_at = expires_at
+        self.operations_index: Dict[Tuple[str, str], List[dict]] = {}
+        for operation in transaction.get('operations', []):
+            action, identifier = operation.get('action', ""), operation.get('identifier', "")
+            self.operations_index.setdefault((action, ""), []).append(operation)
+            if identifier:
+                self.operations_index.setdefault((action, identifier), []).append(operation)
+
+
+class TxCache:
+    """Bounded LRU cache for fetched transactions (raw api json), limited by entry count and approximate size.
+    Transactions that aren't final yet expire after pending_ttl seconds. Final transactions can optionally be
+    persisted in a sqlite file, so re-runs of verification passes don't fetch them again."""
+
+    def __init__(self, max_entries: int = TX_CACHE_MAX_ENTRIES, max_bytes: int = TX_CACHE_MAX_BYTES,
+                 pending_ttl: float = TX_CACHE_PENDING_TTL):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.pending_ttl = pending_ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.size = 0
+        self._entries: OrderedDict[str, TxCacheEntry] = OrderedDict()
+        self._lock = threading.RLock()
+        self._db: Optional[sqlite3.Connection] = None
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, tx_hash: str):
+        return self.get_entry(tx_hash, count=False) is not None
+
+    def enable_persistence(self, db_path: Union[str, Path]):
+        """Stores final transactions in the given sqlite file and looks them up there on memory misses."""
+        with self._lock:
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(str(db_path), check_same_thread=False)
+            self._db.execute("CREATE TABLE IF NOT EXISTS transactions (hash TEXT PRIMARY KEY, data TEXT NOT NULL)")
+            self._db.commit()
+
+    def get_entry(self, tx_hash: str, count: bool = True) -> Optional[TxCacheEntry]:
+        with self._lock:
+            entry = self._entries.get(tx_hash)
+            if entry is not None and entry.expires_at is not None and time.monotonic() >= entry.expires_at:
+                self._remove(tx_hash)
+                entry = None
+
+            if entry is None and self._db is not None:
+                row = self._db.execute("SELECT data FROM transactions WHERE hash = ?", (tx_hash,)).fetchone()
+                if row is not None:
+                    entry = self._insert(tx_hash, json.loads(row[0]), persist=False)
+
+            if entry is None:
+                if count:
+                    self.misses += 1
+                return None
+
+            self._entries.move_to_end(tx_hash)
+            if count:
+                self.hits += 1
+            return entry
+
+    def get(self, tx_hash: str) -> Optional[dict]:
+        entry = self.get_entry(tx_hash)
+        return entry.transaction if entry is not None else None
+
+    def put(self, tx_hash: str, transaction: dict) -> TxCacheEntry:
+        with self._lock:
+            return self._insert(tx_hash, transaction, persist=True)
+
+    def _insert(self, tx_hash: str, transaction: dict, persist: bool) -> TxCacheEntry:
+        serialized = json.dumps(transaction)
+        is_final = TransactionStatus(transaction.get('status', "")).is_completed
+        expires_at = None if is_final else time.monotonic() + self.pending_ttl
+
+        self._remove(tx_hash)
+        entry = TxCacheEntry(transaction, len(serialized), expires_at)
+        self._entries[tx_hash] = entry
+        self.size += entry.size
+
+        if persist and is_final and self._db is not None:
+            self._db.execute("INSERT OR REPLACE INTO transactions (hash, data) VALUES (?, ?)", (tx_hash, serialized))
+            self._db.commit()
+
+        while self._entries and (len(self._entries) > self.max_entries or self.size > self.max_bytes):
+            evicted_hash = next(iter(self._entries))
+            if evicted_hash == tx_hash:
+                break
+            self._remove(evicted_hash)
+            self.evictions += 1
+        return entry
+
+    def _remove(self, tx_hash: str):
+        entry = self._entries.pop(tx_hash, None)
+        if entry is not None:
+            self.size -= entry.size
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self.size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+TX_CACHE = TxCache()
+
+
+class PooledProxyNetworkProvider(ProxyNetworkProvider):
+    """Proxy provider that keeps one requests session (and its keep-alive connection pool) for its lifetime,
+    instead of opening a new connection for every GET/POST."""
+
+    def __init__(self, url: str, pool_size: int = PROXY_POOL_SIZE, **kwargs):
+        super().__init__(url, **kwargs)
+        retry_strategy = Retry(
+            total=self.config.requests_retry_options.retries,
+            backoff_factor=self.config.requests_retry_options.backoff_factor,
+            status_forcelist=self.config.requests_retry_options.status_forcelist,
+        )
+        adapter = HTTPAdapter(max_retries=retry_strategy, pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session = requests.Session()
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def _do_get(self, url: str) -> GenericResponse:
+        return self._do_request(url, lambda: self.session.get(url, **self.config.requests_options))
+
+    def _do_post(self, url: str, payload: Any) -> GenericResponse:
+        return self._do_request(url, lambda: self.session.post(url, json=payload, **self.config.requests_options))
+
+    def _do_request(self, url: str, send) -> GenericResponse:
+        try:
+            response = send()
+            response.raise_for_status()
+            return self._get_data(response.json(), url)
+        except requests.HTTPError as err:
+            raise NetworkProviderError(url, self._extract_error_from_response(err.response))
+        except Exception as err:
+            raise NetworkProviderError(url, err)
+
+
+PROXY_PROVIDERS: Dict[str, PooledProxyNetworkProvider] = {}
+_PROXY_PROVIDERS_LOCK = threading.Lock()
+
+
+def get_proxy_provider(proxy_url: str) -> PooledProxyNetworkProvider:
+    """Returns the shared pooled provider for the given proxy url, creating it on first use."""
+    with _PROXY_PROVIDERS_LOCK:
+        provider = PROXY_PROVIDERS.get(proxy_url)
+        if provider is None:
+            provider = PooledProxyNetworkProvider(proxy_url)
+            PROXY_PROVIDERS[proxy_url] = provider
+        return provider
 
 
 class IArgument(Protocol):
@@ -37,6 +307,37 @@ class IArgument(Protocol):
         ...
 
 
+class TxListener(Protocol):
+    """Receives the timings of transactions built and sent through this module, e.g. a benchmark recorder."""
+    def on_built(self, tx: Transaction, build_time: float, sign_time: float):
+        ...
+
+    def on_sent(self, transactions: List[Transaction], hashes: List[str], send_time: float):
+        ...
+
+
+TX_LISTENERS: List[TxListener] = []
+
+
+def add_tx_listener(listener: TxListener):
+    TX_LISTENERS.append(listener)
+
+
+def remove_tx_listener(listener: TxListener):
+    if listener in TX_LISTENERS:
+        TX_LISTENERS.remove(listener)
+
+
+def notify_tx_built(tx: Transaction, build_time: float, sign_time: float):
+    for listener in TX_LISTENERS:
+        listener.on_built(tx, build_time, sign_time)
+
+
+def notify_tx_sent(transactions: List[Transaction], hashes: List[str], send_time: float):
+    for listener in TX_LISTENERS:
+        listener.on_sent(transactions, hashes, send_time)
+
+
 class ESDTToken:
     token_id: str
     token_nonce: int
@@ -82,11 +383,90 @@ class ESDTToken:
         return TokenTransfer(Token(self.token_id, self.token_nonce), self.token_amount)
 
 
+class BlockClock:
+    """Waits for chain progress instead of fixed delays: a shard nonce, a number of rounds or the finality of
+    transactions. Polls once per round; on the chain simulator the awaited blocks are generated instead.
+    Given an api, transaction statuses are polled in batches (see TxStatusTracker) instead of one by one."""
+
+    def __init__(self, proxy: ProxyNetworkProvider, simulator: Optional[bool] = None,
+                 api: Optional[ApiNetworkProvider] = None):
+        self.proxy = proxy
+        self.api = api
+        self.simulator = config.CHAIN_SIMULATOR if simulator is None else simulator
+        self.round_duration = get_network_config(proxy).round_duration / 1000
+
+    def get_nonce(self, shard: int = METACHAIN_ID) -> int:
+        return self.proxy.get_network_status(shard).block_nonce
+
+    def generate_blocks(self, count: int = 1):
+        self.proxy.do_post_generic(f"simulator/generate-blocks/{count}", {})
+
+    def _tick(self, blocks: int = 1):
+        if self.simulator:
+            self.generate_blocks(max(blocks, 1))
+        else:
+            time.sleep(self.round_duration)
+
+    def wait_for_nonce(self, nonce: int, shard: int = METACHAIN_ID, timeout: float = BLOCK_CLOCK_TIMEOUT) -> bool:
+        """Waits until the shard reaches the given block nonce. Returns False on timeout."""
+        deadline = time.monotonic() + timeout
+        while True:
+            current = self.get_nonce(shard)
+            if current >= nonce:
+                return True
+            if time.monotonic() >= deadline:
+                logger.warning(f"Timed out waiting for nonce {nonce} on shard {shard}, at {current}")
+                return False
+            self._tick(nonce - current)
+
+    def wait_rounds(self, rounds: int = 1, shard: int = METACHAIN_ID, timeout: float = BLOCK_CLOCK_TIMEOUT) -> bool:
+        return self.wait_for_nonce(self.get_nonce(shard) + rounds, shard, timeout)
+
+    def wait_for_final(self, tx_hashes: List[str], timeout: float = BLOCK_CLOCK_TIMEOUT) -> bool:
+        """Waits until all given transactions are completed (successful or failed). Returns False on timeout."""
+        if self.api is not None:
+            tracker = TxStatusTracker(self.api)
+            tracker.track(tx_hashes)
+
+            def poll_batches() -> int:
+                tracker.poll()
+                return len(tracker.pending)
+            return self._wait_until_resolved(poll_batches, len(tx_hashes), timeout)
+
+        pending = [tx_hash for tx_hash in dict.fromkeys(tx_hashes) if tx_hash]
+        with ThreadPoolExecutor(max_workers=BLOCK_CLOCK_STATUS_WORKERS) as executor:
+            def poll_each() -> int:
+                completed = list(executor.map(self._is_completed, pending))
+                pending[:] = [tx_hash for tx_hash, done in zip(pending, completed) if not done]
+                return len(pending)
+            return self._wait_until_resolved(poll_each, len(tx_hashes), timeout)
+
+    def _is_completed(self, tx_hash: str) -> bool:
+        try:
+            return self.proxy.get_transaction_status(tx_hash).is_completed
+        except Exception as ex:
+            logger.debug(f"Status of {tx_hash} not available yet: {ex}")
+            return False
+
+    def _wait_until_resolved(self, poll: Callable[[], int], total: int, timeout: float) -> bool:
+        """Ticks until poll returns no pending transactions. Returns False on timeout."""
+        deadline = time.monotonic() + timeout
+        while True:
+            pending = poll()
+            if not pending:
+                return True
+            if time.monotonic() >= deadline:
+                logger.warning(f"Timed out waiting for {pending} of {total} transactions")
+                return False
+            self._tick()
+
+
 class NetworkProviders:
     def __init__(self, api: str, proxy: str):
         self.api = ApiNetworkProvider(api)
-        self.proxy = ProxyNetworkProvider(proxy)
-        self.network = self.proxy.get_network_config()
+        self.proxy = get_proxy_provider(proxy)
+        self.network = get_network_config(self.proxy)
+        self.clock = BlockClock(self.proxy, api=self.api)
 
     def _get_initial_tx_status(self, tx_hash: str) -> Union[None, TransactionStatus]:
         # due to API data propagation delays, some transactions may not be indexed yet at the time of the request
@@ -178,85 +558,78 @@ class NetworkProviders:
         logger.debug(f"Transaction {tx_hash} status: {results.status}")
         return True
 
-    def get_tx_operations(self, tx_hash: str, no_cache: bool = False) -> list:
-        if no_cache or tx_hash not in TX_CACHE:
+    def _get_cached_transaction(self, tx_hash: str, no_cache: bool = False) -> TxCacheEntry:
+        entry = None if no_cache else TX_CACHE.get_entry(tx_hash)
+        if entry is None:
             # TODO replace with get_transaction after operations are added to the transaction object
             transaction = self.api.do_get_generic(f'transactions/{tx_hash}')
-            TX_CACHE[tx_hash] = transaction     # add it into the hash cache to avoid fetching it again
-        else:
-            transaction = TX_CACHE[tx_hash]     # take it from hash cache
+            entry = TX_CACHE.put(tx_hash, transaction)     # add it into the hash cache to avoid fetching it again
+            if entry.expires_at is None:
+                # executed, so its transfers can keep the accounts' token inventories current
+                apply_transaction_to_inventories(transaction)
+        return entry
+
+    def get_tx_operations(self, tx_hash: str, no_cache: bool = False) -> list:
+        transaction = self._get_cached_transaction(tx_hash, no_cache).transaction
 
         if 'operations' in transaction:
             return transaction['operations']
 
         return []
 
+    def get_tx_operations_by(self, tx_hash: str, action: str, identifier: str = "") -> List[dict]:
+        """Returns the operations of a transaction with the given action and identifier (any identifier if empty)."""
+        return self._get_cached_transaction(tx_hash).operations_index.get((action, identifier), [])
+
     def check_for_burn_operation(self, tx_hash: str, token: ESDTToken) -> bool:
-        operations = self.get_tx_operations(tx_hash)
-        if not operations:
-            return False
+        operations = self.get_tx_operations_by(tx_hash, "localBurn", token.get_full_token_name()) + \
+            self.get_tx_operations_by(tx_hash, "burn", token.get_full_token_name())
 
         for operation in operations:
-            if (operation['action'] == "localBurn" or operation['action'] == "burn") \
-                    and operation['identifier'] == token.get_full_token_name() \
-                    and operation['value'] == str(token.token_amount):
+            if operation['value'] == str(token.token_amount):
                 return True
         return False
 
     def check_for_add_quantity_operation(self, tx_hash: str, token: ESDTToken) -> bool:
-        operations = self.get_tx_operations(tx_hash)
-        if not operations:
-            return False
+        operations = self.get_tx_operations_by(tx_hash, "addQuantity", token.get_full_token_name())
 
         for operation in operations:
-            if operation['action'] == "addQuantity" \
-                    and operation['identifier'] == token.get_full_token_name() \
-                    and operation['value'] == str(token.token_amount):
+            if operation['value'] == str(token.token_amount):
                 return True
         return False
 
     def check_for_mint_operation(self, tx_hash: str, token: ESDTToken) -> bool:
-        operations = self.get_tx_operations(tx_hash)
-        if not operations:
-            return False
+        operations = self.get_tx_operations_by(tx_hash, "localMint", token.get_full_token_name())
 
         for operation in operations:
-            if operation['action'] == "localMint" \
-                    and operation['identifier'] == token.get_full_token_name() \
-                    and operation['value'] == str(token.token_amount):
+            if operation['value'] == str(token.token_amount):
                 return True
         return False
 
     def check_for_transfer_operation(self, tx_hash: str, token: ESDTToken, sender: str = "", destination: str = ""):
-        operations = self.get_tx_operations(tx_hash)
-        if not operations:
-            return False
+        operations = self.get_tx_operations_by(tx_hash, "transfer", token.get_full_token_name())
 
         for operation in operations:
-            if operation['action'] == "transfer" \
-                    and operation['identifier'] == token.get_full_token_name() \
-                    and operation['value'] == str(token.token_amount) \
+            if operation['value'] == str(token.token_amount) \
                     and (operation['sender'] == sender or sender == "") \
                     and (operation['receiver'] == destination or destination == ""):
                 return True
         return False
 
     def check_for_error_operation(self, tx_hash: str, message: str):
-        operations = self.get_tx_operations(tx_hash)
-        if not operations:
-            return False
+        operations = self.get_tx_operations_by(tx_hash, "signalError")
 
         for operation in operations:
-            if operation['action'] == "signalError" \
-                    and operation['message'] == message:
+            if operation['message'] == message:
                 return True
         return False
 
     def wait_for_epoch(self, target_epoch: int, idle_time: int = 30):
         status = self.proxy.get_network_status()
         while status.current_epoch < target_epoch:
-            status = self.proxy.get_network_status
+            status = self.proxy.get_network_status()
             time.sleep(idle_time)
+        NETWORK_CONFIG_CACHE.observe_epoch(self.proxy.url, status.current_epoch)
 
     def wait_for_nonce_in_shard(self, shard_id: int, target_nonce: int, idle_time: int = 6):
         status = self.proxy.get_network_status(shard_id)
@@ -270,12 +643,212 @@ class NetworkProviders:
         while status.current_epoch < next_epoch:
             status = self.proxy.get_network_status()
             time.sleep(idle_time)
+        NETWORK_CONFIG_CACHE.observe_epoch(self.proxy.url, status.current_epoch)
 
     def get_round(self, shard_id: int = 1) -> int:
         status = self.proxy.get_network_status(shard_id)
         return status.current_round
 
 
+class AsyncNetworkProviders:
+    """Asyncio counterpart of NetworkProviders, meant for awaiting many transactions from a single event loop.
+    Blocking provider calls run in worker threads (bounded by max_concurrency) over pooled proxy/api sessions,
+    and polling is paced by the network round duration instead of fixed sleeps."""
+
+    def __init__(self, api: str, proxy: str, max_concurrency: int = PROXY_POOL_SIZE):
+        self.api = ApiNetworkProvider(api)
+        self.proxy = get_proxy_provider(proxy)
+        self.network = get_network_config(self.proxy)
+        self.round_duration = self.network.round_duration / 1000
+        self.max_concurrency = max_concurrency
+
+    # the semaphore bounding concurrent calls belongs to the event loop of a run, so each run creates its own
+    # and passes it down; calls without one are a single request anyway
+
+    async def _call(self, semaphore: Optional[asyncio.Semaphore], func, *args):
+        if semaphore is None:
+            return await asyncio.to_thread(func, *args)
+        async with semaphore:
+            return await asyncio.to_thread(func, *args)
+
+    async def get_tx_status(self, tx_hash: str, semaphore: Optional[asyncio.Semaphore] = None) -> Union[None, TransactionStatus]:
+        """Returns the current status of the transaction or None if the api didn't index it yet."""
+        try:
+            transaction = await self._call(semaphore, self.api.get_transaction, tx_hash)
+        except NetworkProviderError as e:
+            logger.debug(f"Transaction {tx_hash} not available yet: {e.data}")
+            return None
+        return transaction.status
+
+    async def wait_for_tx_executed(self, tx_hash: str, timeout: float = ASYNC_TX_TIMEOUT,
+                                   semaphore: Optional[asyncio.Semaphore] = None) -> Union[None, TransactionStatus]:
+        """Polls once per round until the transaction is completed. Returns None on timeout."""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            status = await self.get_tx_status(tx_hash, semaphore)
+            if status is not None and status.is_completed:
+                return status
+            await asyncio.sleep(self.round_duration)
+
+        log_step_fail(f"Wait failed. Transaction {tx_hash} not completed after {timeout}s!")
+        return None
+
+    async def check_simple_tx_status(self, tx_hash: str, msg_label: str = "",
+                                     semaphore: Optional[asyncio.Semaphore] = None) -> bool:
+        if not tx_hash:
+            if msg_label:
+                log_step_fail(f"FAIL: no tx hash for {msg_label} transaction!")
+            return False
+
+        status = await self.wait_for_tx_executed(tx_hash, semaphore=semaphore)
+        if status is None:
+            log_step_fail(f"FAIL: couldn't retrieve transaction {tx_hash} status!")
+            return False
+
+        if status.is_failed:
+            if msg_label:
+                log_step_fail(f"Transaction to {msg_label} failed!")
+            return False
+        logger.debug(f"Transaction {tx_hash} status: {status.status}")
+        return True
+
+    async def check_complex_tx_status(self, tx_hash: str, msg_label: str = "",
+                                      semaphore: Optional[asyncio.Semaphore] = None) -> bool:
+        """Same false success guards as NetworkProviders.check_complex_tx_status, expressed in rounds:
+        a success has to be seen at least two rounds after the wait started and still hold one round later."""
+        start_time = time.monotonic()
+        status = await self.check_simple_tx_status(tx_hash, msg_label, semaphore)
+        if not status:
+            return False
+
+        min_settle_time = 2 * self.round_duration - (time.monotonic() - start_time)
+        await asyncio.sleep(max(self.round_duration, min_settle_time))
+        return await self.check_simple_tx_status(tx_hash, msg_label, semaphore)
+
+    async def wait_for_txs_executed(self, tx_hashes: List[str]) -> Dict[str, Union[None, TransactionStatus]]:
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        statuses = await asyncio.gather(*[self.wait_for_tx_executed(tx_hash, semaphore=semaphore)
+                                          for tx_hash in tx_hashes])
+        return dict(zip(tx_hashes, statuses))
+
+    async def check_txs_status(self, tx_hashes: List[str], complex_check: bool = False) -> Dict[str, bool]:
+        """Awaits all given transactions concurrently. Returns the success flag of each transaction."""
+        check = self.check_complex_tx_status if complex_check else self.check_simple_tx_status
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        results = await asyncio.gather(*[check(tx_hash, semaphore=semaphore) for tx_hash in tx_hashes])
+        return dict(zip(tx_hashes, results))
+
+    def run_check_txs_status(self, tx_hashes: List[str], complex_check: bool = False) -> Dict[str, bool]:
+        """Blocking entry point for callers outside an event loop."""
+        return asyncio.run(self.check_txs_status(tx_hashes, complex_check))
+
+
+class TxStatusTracker:
+    """Resolves the status of many transactions in batches through the api multi-transaction endpoint,
+    instead of one get_transaction per hash. Hashes can be fed as they're broadcast (see broadcast_transactions);
+    completion callbacks receive (tx_hash, status) once per transaction."""
+
+    def __init__(self, api: ApiNetworkProvider, batch_size: int = TX_TRACKER_BATCH_SIZE,
+                 on_complete: Optional[Callable[[str, TransactionStatus], None]] = None):
+        self.api = api
+        self.batch_size = batch_size
+        self.callbacks: List[Callable[[str, TransactionStatus], None]] = [on_complete] if on_complete else []
+        self.pending: Dict[str, None] = {}     # insertion ordered set
+        self.completed: Dict[str, TransactionStatus] = {}
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._poller: Optional[threading.Thread] = None
+
+    def track(self, tx_hashes: Sequence[str]):
+        with self._lock:
+            for tx_hash in tx_hashes:
+                if tx_hash and tx_hash not in self.completed:
+                    self.pending[tx_hash] = None
+
+    def add_callback(self, callback: Callable[[str, TransactionStatus], None]):
+        self.callbacks.append(callback)
+
+    def _fetch_statuses(self, tx_hashes: List[str]) -> Dict[str, TransactionStatus]:
+        try:
+            response = self.api.do_get_generic("transactions", {"hashes": ",".join(tx_hashes),
+                                                                "size": len(tx_hashes),
+                                                                "fields": "txHash,status"})
+        except NetworkProviderError as e:
+            logger.debug(f"Failed to fetch status for {len(tx_hashes)} transactions: {e.data}")
+            return {}
+        return {tx["txHash"]: TransactionStatus(tx.get("status", "")) for tx in response if "txHash" in tx}
+
+    def poll(self) -> int:
+        """Runs one resolution pass over all pending hashes. Returns the number of newly completed transactions."""
+        with self._lock:
+            pending = list(self.pending)
+
+        resolved: Dict[str, TransactionStatus] = {}
+        for chunk in split_to_chunks(pending, self.batch_size):
+            statuses = self._fetch_statuses(chunk)
+            resolved.update({tx_hash: status for tx_hash, status in statuses.items() if status.is_completed})
+
+        with self._lock:
+            for tx_hash, status in resolved.items():
+                self.pending.pop(tx_hash, None)
+                self.completed[tx_hash] = status
+
+        for tx_hash, status in resolved.items():
+            for callback in self.callbacks:
+                try:
+                    callback(tx_hash, status)
+                except Exception as ex:
+                    logger.error(f"Transaction status callback failed for {tx_hash}: {ex}")
+        return len(resolved)
+
+    def wait(self, timeout: Optional[float] = None, poll_interval: float = API_TX_STATUS_REFETCH_DELAY) -> bool:
+        """Polls until no transaction is pending or the timeout expires. Returns True if everything resolved."""
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        while self.pending:
+            self.poll()
+            if not self.pending:
+                break
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(poll_interval)
+        return True
+
+    def start(self, poll_interval: float = API_TX_STATUS_REFETCH_DELAY):
+        """Keeps polling in a background thread until stop() is called."""
+        def run():
+            while not self._stop_event.is_set():
+                if self.pending:
+                    self.poll()
+                self._stop_event.wait(poll_interval)
+
+        self._stop_event.clear()
+        self._poller = threading.Thread(target=run, daemon=True)
+        self._poller.start()
+
+    def stop(self):
+        self._stop_event.set()
+        if self._poller is not None:
+            self._poller.join()
+            self._poller = None
+
+    def get_counts(self) -> Dict[str, int]:
+        with self._lock:
+            failed = sum(1 for status in self.completed.values() if status.is_failed)
+            return {
+                "success": len(self.completed) - failed,
+                "fail": failed,
+                "pending": len(self.pending),
+            }
+
+    def get_failed_hashes(self) -> List[str]:
+        with self._lock:
+            return [tx_hash for tx_hash, status in self.completed.items() if status.is_failed]
+
+    def report(self) -> str:
+        counts = self.get_counts()
+        return f"Transactions: {counts['success']} successful, {counts['fail']} failed, {counts['pending']} pending"
+
+
 def _get_flags_from_code_metadata(code_metadata: CodeMetadata) -> tuple[bool, bool, bool, bool]:
     return code_metadata.upgradeable, code_metadata.readable, code_metadata.payable, code_metadata.payable_by_contract
 
@@ -317,6 +890,7 @@ def _prep_legacy_args(args: List[Any]) -> List[Any]:
 def prepare_deploy_tx(deployer: Account, network_config: NetworkConfig,
                       gas_limit: int, contract_file: Path, code_metadata: CodeMetadata,
                       args: list = None, value: int = 0, abi: Abi = None) -> Transaction:
+    start = time.perf_counter()
     config = TransactionsFactoryConfig(chain_id=network_config.chain_id)
 
     logger.debug(f"Deploy arguments: {args}")
@@ -336,8 +910,10 @@ def prepare_deploy_tx(deployer: Account, network_config: NetworkConfig,
         is_payable=payable,
         is_payable_by_sc=payable_by_contract,
     )
-    tx.nonce = deployer.nonce
+    tx.nonce = deployer.reserve_nonce()
+    built = time.perf_counter()
     tx.signature = deployer.sign_transaction(tx)
+    notify_tx_built(tx, built - start, time.perf_counter() - built)
 
     return tx
 
@@ -345,6 +921,7 @@ def prepare_deploy_tx(deployer: Account, network_config: NetworkConfig,
 def prepare_upgrade_tx(contract_address: Address, deployer: Account, network_config: NetworkConfig,
                        gas_limit: int, contract_file: Path, code_metadata: CodeMetadata,
                        args: list = None, value: int = 0, abi: Abi = None) -> Transaction:
+    start = time.perf_counter()
     config = TransactionsFactoryConfig(chain_id=network_config.chain_id)
 
     logger.debug(f"Upgrade arguments: {args}")
@@ -365,16 +942,20 @@ def prepare_upgrade_tx(contract_address: Address, deployer: Account, network_con
         is_payable=payable,
         is_payable_by_sc=payable_by_contract,
     )
-    tx.nonce = deployer.nonce
+    tx.nonce = deployer.reserve_nonce()
+    built = time.perf_counter()
     tx.signature = deployer.sign_transaction(tx)
+    notify_tx_built(tx, built - start, time.perf_counter() - built)
 
     return tx
 
 
 def prepare_contract_call_tx(contract_address: Address, deployer: Account,
                              network_config: NetworkConfig, gas_limit: int,
-                             function: str, args: list, value: int = 0, abi: Abi = None) -> Transaction:
+                             function: str, args: list, value: int = 0, abi: Abi = None,
+                             sign: bool = True) -> Transaction:
 
+    start = time.perf_counter()
     config = TransactionsFactoryConfig(chain_id=network_config.chain_id)
     
     logger.debug(f"Contract call arguments: {args}")
@@ -389,8 +970,11 @@ def prepare_contract_call_tx(contract_address: Address, deployer: Account,
         call_args,
         int(value)
     )
-    tx.nonce = deployer.nonce
-    tx.signature = deployer.sign_transaction(tx)
+    tx.nonce = deployer.reserve_nonce()
+    built = time.perf_counter()
+    if sign:
+        tx.signature = deployer.sign_transaction(tx)
+        notify_tx_built(tx, built - start, time.perf_counter() - built)
 
     return tx
 
@@ -399,6 +983,7 @@ def prepare_multiesdtnfttransfer_to_endpoint_call_tx(contract_address: Address,
                                                      network_config: NetworkConfig, gas_limit: int,
                                                      endpoint: str, endpoint_args: list, tokens: List[ESDTToken],
                                                      value: int = 0, abi: Abi = None) -> Transaction:
+    start = time.perf_counter()
     config = TransactionsFactoryConfig(chain_id=network_config.chain_id)
     payment_tokens = [token.to_token_transfer() for token in tokens]
     
@@ -415,8 +1000,10 @@ def prepare_multiesdtnfttransfer_to_endpoint_call_tx(contract_address: Address,
         int(value),
         payment_tokens
     )
-    tx.nonce = user.nonce
+    tx.nonce = user.reserve_nonce()
+    built = time.perf_counter()
     tx.signature = user.sign_transaction(tx)
+    notify_tx_built(tx, built - start, time.perf_counter() - built)
 
     return tx
 
@@ -427,6 +1014,7 @@ def prepare_multiesdtnfttransfer_tx(destination: Address, user: Account,
     """
     TODO: cleanup: gas_limit and value are ignored for this transaction type
     """
+    start = time.perf_counter()
     config = TransactionsFactoryConfig(chain_id=network_config.chain_id)
     payment_tokens = [token.to_token_transfer() for token in tokens]
 
@@ -436,12 +1024,15 @@ def prepare_multiesdtnfttransfer_tx(destination: Address, user: Account,
         destination,
         payment_tokens
     )
-    tx.nonce = user.nonce
+    tx.nonce = user.reserve_nonce()
+    built = time.perf_counter()
     tx.signature = user.sign_transaction(tx)
+    notify_tx_built(tx, built - start, time.perf_counter() - built)
     return tx
 
 
 def send_deploy_tx(tx: Transaction, proxy: ProxyNetworkProvider) -> str:
+    start = time.perf_counter()
     try:
         tx_hash = proxy.send_transaction(tx).hex()
         log_explorer_transaction(tx_hash, proxy.url)
@@ -450,19 +1041,24 @@ def send_deploy_tx(tx: Transaction, proxy: ProxyNetworkProvider) -> str:
         traceback.print_exception(*sys.exc_info())
         tx_hash = ""
 
+    notify_tx_sent([tx], [tx_hash], time.perf_counter() - start)
     return tx_hash
 
 
 def send_contract_call_tx(tx: Transaction, proxy: ProxyNetworkProvider) -> str:
+    start = time.perf_counter()
     try:
         tx_hash = proxy.send_transaction(tx).hex()
         # TODO: check if needed to wait for tx to be processed
         log_explorer_transaction(tx_hash, proxy.url)
+        note_sent_transaction(tx.sender.to_bech32(), tx_hash)
     except Exception as ex:
         log_step_fail(f"Failed to send tx due to: {ex}")
         traceback.print_exception(*sys.exc_info())
+        notify_tx_sent([tx], [""], time.perf_counter() - start)
         return ""
 
+    notify_tx_sent([tx], [tx_hash], time.perf_counter() - start)
     return tx_hash
 
 
@@ -473,7 +1069,7 @@ def multi_esdt_endpoint_call(function_purpose: str, proxy: ProxyNetworkProvider,
         opt: type[str..]: endpoint arguments
     """
     logger.debug(function_purpose)
-    network_config = proxy.get_network_config()     # TODO: find solution to avoid this call
+    network_config = get_network_config(proxy)
     tx_hash = ""
 
     if len(args) < 1:
@@ -484,7 +1080,7 @@ def multi_esdt_endpoint_call(function_purpose: str, proxy: ProxyNetworkProvider,
     tx = prepare_multiesdtnfttransfer_to_endpoint_call_tx(contract, user, network_config,
                                                           gas, endpoint, ep_args, args[0], value, abi)
     tx_hash = send_contract_call_tx(tx, proxy)
-    user.nonce += 1 if tx_hash != "" else 0
+    user.commit_nonce(tx.nonce, tx_hash != "")
 
     return tx_hash
 
@@ -495,7 +1091,7 @@ def multi_esdt_transfer(proxy: ProxyNetworkProvider, gas: int, user: Account, de
     """
     logger.debug(f"Sending multi esdt transfer to {dest}")
     logger.debug(f"Args: {args}")
-    network_config = proxy.get_network_config()     # TODO: find solution to avoid this call
+    network_config = get_network_config(proxy)
     tx_hash = ""
 
     if len(args) < 1:
@@ -504,7 +1100,7 @@ def multi_esdt_transfer(proxy: ProxyNetworkProvider, gas: int, user: Account, de
 
     tx = prepare_multiesdtnfttransfer_tx(dest, user, network_config, gas, args)
     tx_hash = send_contract_call_tx(tx, proxy)
-    user.nonce += 1 if tx_hash != "" else 0
+    user.commit_nonce(tx.nonce, tx_hash != "")
 
     return tx_hash
 
@@ -516,11 +1112,11 @@ def endpoint_call(proxy: ProxyNetworkProvider, gas: int, user: Account, contract
     """
     logger.debug(f"Calling {endpoint} at {contract.bech32()}")
     logger.debug(f"Args: {args}")
-    network_config = proxy.get_network_config()     # TODO: find solution to avoid this call
+    network_config = get_network_config(proxy)
 
     tx = prepare_contract_call_tx(contract, user, network_config, gas, endpoint, args, value, abi)
     tx_hash = send_contract_call_tx(tx, proxy)
-    user.nonce += 1 if tx_hash != "" else 0
+    user.commit_nonce(tx.nonce, tx_hash != "")
 
     return tx_hash
 
@@ -528,16 +1124,16 @@ def endpoint_call(proxy: ProxyNetworkProvider, gas: int, user: Account, contract
 def deploy(contract_label: str, proxy: ProxyNetworkProvider, gas: int,
            owner: Account, bytecode_path: str, metadata: CodeMetadata, args: list, value: int = 0, abi: Abi = None) -> Tuple[str, str]:
     logger.debug(f"Deploy {contract_label}")
-    network_config = proxy.get_network_config()     # TODO: find solution to avoid this call
+    network_config = get_network_config(proxy)
     tx_hash, contract_address = "", ""
     processed_bytecode_path = get_file_from_url_or_path(bytecode_path)
 
     tx = prepare_deploy_tx(owner, network_config, gas, processed_bytecode_path, metadata, args, value, abi)
     tx_hash = send_deploy_tx(tx, proxy)
 
+    owner.commit_nonce(tx.nonce, tx_hash != "")
     if tx_hash:
         contract_address = get_deployed_address_from_tx(tx_hash, proxy)
-        owner.nonce += 1
 
     return tx_hash, contract_address
 
@@ -546,12 +1142,12 @@ def upgrade_call(contract_label: str, proxy: ProxyNetworkProvider, gas: int,
                  owner: Account, contract: Address, bytecode_path: str, metadata: CodeMetadata,
                  args: list, value: int = 0, abi: Abi = None) -> str:
     logger.debug(f"Upgrade {contract_label} contract")
-    network_config = proxy.get_network_config()     # TODO: find solution to avoid this call
+    network_config = get_network_config(proxy)
     processed_bytecode_path = get_file_from_url_or_path(bytecode_path)
 
     tx = prepare_upgrade_tx(contract, owner, network_config, gas, processed_bytecode_path, metadata, args, value, abi)
     tx_hash = send_contract_call_tx(tx, proxy)
-    owner.nonce += 1 if tx_hash != "" else 0
+    owner.commit_nonce(tx.nonce, tx_hash != "")
 
     return tx_hash
 
@@ -599,7 +1195,7 @@ def get_event_from_tx(event_id: str, tx_hash: str, proxy: ProxyNetworkProvider)
 
 
 def get_deployed_address_from_tx(tx_hash: str, proxy: ProxyNetworkProvider) -> str:
-    if "localhost" in proxy.url:
+    if config.CHAIN_SIMULATOR:
         proxy.do_post_generic(f"simulator/generate-blocks/1", {})
     event = get_event_from_tx("SCDeploy", tx_hash, proxy)
     if event is None:
@@ -607,27 +1203,180 @@ def get_deployed_address_from_tx(tx_hash: str, proxy: ProxyNetworkProvider) -> s
     return event.address.to_bech32()
 
 
-def broadcast_transactions(transactions: List[Transaction], proxy: ProxyNetworkProvider,
-                           chunk_size: int, sleep: int = 0, confirm_yes: bool = False):
-    chunks = list(split_to_chunks(transactions, chunk_size))
+class TokenBucket:
+    """Blocking token bucket: acquire(n) waits until n tokens are available; refills at rate tokens per second."""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else rate
+        self.tokens = self.capacity
+        self._last_refill = time.monotonic()
+
+    def set_rate(self, rate: float):
+        self._refill()
+        self.rate = rate
+        self.capacity = rate
+        self.tokens = min(self.tokens, self.capacity)
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self._last_refill) * self.rate)
+        self._last_refill = now
+
+    def acquire(self, amount: float):
+        # requests larger than the bucket are paid in capacity sized slices, so they take as long as they cost
+        while amount > 0:
+            part = min(amount, self.capacity)
+            self._refill()
+            while self.tokens < part:
+                time.sleep((part - self.tokens) / self.rate)
+                self._refill()
+            self.tokens -= part
+            amount -= part
+
+
+def is_throttling_error(error: Exception) -> bool:
+    message = str(error).lower()
+    return any(marker in message for marker in BROADCAST_THROTTLING_ERRORS)
+
+
+def is_transport_error(error: Exception) -> bool:
+    """Whether the request failed before the proxy could answer it, e.g. a dropped connection."""
+    cause = error.data if isinstance(error, NetworkProviderError) else error
+    return isinstance(cause, requests.RequestException) and not isinstance(cause, requests.HTTPError)
+
+
+class TransactionBroadcaster:
+    """Broadcasts transactions through send-multiple with:
+    - an optional token bucket rate limit (transactions per second), lowered when the proxy throttles (backpressure)
+    - one queue per sender shard, drained round robin, with up to max_workers chunks in flight
+    - retries, up to max_retries each, for chunks the proxy throttled or never received; transactions the proxy
+      rejected (bad nonce, balance, signature) are dropped, since sending them again fails the same way"""
+
+    def __init__(self, proxy: ProxyNetworkProvider, rate: Optional[float] = BROADCAST_RATE,
+                 chunk_size: int = BROADCAST_CHUNK_SIZE,
+                 max_workers: int = BROADCAST_WORKERS, max_retries: int = BROADCAST_MAX_RETRIES,
+                 min_rate: float = BROADCAST_MIN_RATE, max_rate: float = BROADCAST_MAX_RATE,
+                 tracker: Optional[TxStatusTracker] = None):
+        self.proxy = proxy
+        self.chunk_size = chunk_size
+        self.max_workers = max_workers
+        self.max_retries = max_retries
+        self.min_rate = min_rate
+        # no rate broadcasts as fast as the workers go
+        self.max_rate = max(max_rate, rate) if rate else max_rate
+        self.bucket = TokenBucket(rate) if rate else None
+        self.tracker = tracker
+        self.stats = {"submitted": 0, "accepted": 0, "retried": 0, "dropped": 0}
+        self.elapsed = 0.0
+        self._last_slowdown = 0.0
+
+    def _send_chunk(self, chunk: List[Tuple[int, Transaction, int]]) -> Tuple[List[str], bool, bool]:
+        """Returns the chunk's hashes, whether the proxy throttled the request and whether it is worth retrying."""
+        transactions = [tx for _, tx, _ in chunk]
+        start = time.perf_counter()
+        throttled = retryable = False
+        try:
+            _, sent_hashes = self.proxy.send_transactions(transactions)
+            hashes = [tx_hash.hex() for tx_hash in sent_hashes]
+        except Exception as ex:
+            logger.debug(f"Failed to send chunk of {len(chunk)} transactions: {ex}")
+            hashes = [""] * len(chunk)
+            throttled = is_throttling_error(ex)
+            retryable = throttled or is_transport_error(ex)
+        notify_tx_sent(transactions, hashes, time.perf_counter() - start)
+        return hashes, throttled, retryable
+
+    def _adapt_rate(self, accepted: int, total: int, throttled: bool):
+        if self.bucket is None:
+            return
+        # transactions rejected for cause (bad nonce, balance) are no sign of load, only throttling slows down
+        if throttled:
+            # chunks already in flight were sent at the old rate, so slow down at most once per interval
+            if time.monotonic() - self._last_slowdown < BROADCAST_SLOWDOWN_INTERVAL:
+                return
+            self._last_slowdown = time.monotonic()
+            self.bucket.set_rate(max(self.min_rate, self.bucket.rate / 2))
+            logger.debug(f"Proxy throttled a chunk of {total}. Lowering rate to {self.bucket.rate:.0f} tx/s")
+        elif accepted / total >= BROADCAST_BACKPRESSURE_RATIO and self.bucket.rate < self.max_rate:
+            self.bucket.set_rate(min(self.max_rate, self.bucket.rate * 1.1))
+
+    def broadcast(self, transactions: List[Transaction]) -> List[str]:
+        """Returns the hashes aligned with the given transactions; empty for transactions that were never accepted."""
+        hashes = [""] * len(transactions)
+        queues: Dict[int, deque] = {}
+        for index, tx in enumerate(transactions):
+            shard = WrapperAddress(tx.sender.to_bech32()).get_shard()
+            queues.setdefault(shard, deque()).append((index, tx, 0))
+
+        def handle(future: Future):
+            chunk, (chunk_hashes, throttled, retryable) = futures.pop(future), future.result()
+            accepted = 0
+            for (index, tx, attempts), tx_hash in zip(chunk, chunk_hashes):
+                if tx_hash:
+                    hashes[index] = tx_hash
+                    accepted += 1
+                elif retryable and attempts < self.max_retries:
+                    self.stats["retried"] += 1
+                    queues[WrapperAddress(tx.sender.to_bech32()).get_shard()].append((index, tx, attempts + 1))
+                else:
+                    self.stats["dropped"] += 1
+                    reason = f"after {self.max_retries} retries" if retryable else "(rejected by the proxy)"
+                    log_step_fail(f"Transaction with nonce {tx.nonce} from {tx.sender.to_bech32()} "
+                                  f"not accepted {reason}")
+            self.stats["accepted"] += accepted
+            if self.tracker is not None:
+                self.tracker.track([tx_hash for tx_hash in chunk_hashes if tx_hash])
+            self._adapt_rate(accepted, len(chunk), throttled)
+
+        start_time = time.monotonic()
+        futures: Dict[Future, List[Tuple[int, Transaction, int]]] = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while futures or any(queues.values()):
+                for queue in queues.values():
+                    if not queue:
+                        continue
+                    chunk = [queue.popleft() for _ in range(min(self.chunk_size, len(queue)))]
+                    if self.bucket is not None:
+                        self.bucket.acquire(len(chunk))
+                    self.stats["submitted"] += len(chunk)
+                    futures[executor.submit(self._send_chunk, chunk)] = chunk
+
+                    if len(futures) >= self.max_workers:
+                        done, _ = wait(list(futures), return_when=FIRST_COMPLETED)
+                        for future in done:
+                            handle(future)
+
+                if futures and not any(queues.values()):
+                    done, _ = wait(list(futures), return_when=FIRST_COMPLETED)
+                    for future in done:
+                        handle(future)
+
+        self.elapsed = time.monotonic() - start_time
+        logger.info(self.report())
+        return hashes
+
+    def get_tps(self) -> float:
+        return self.stats["accepted"] / self.elapsed if self.elapsed else 0.0
+
+    def report(self) -> str:
+        return (f"Broadcast {self.stats['accepted']} accepted, {self.stats['dropped']} dropped, "
+                f"{self.stats['retried']} retries in {self.elapsed:.1f}s ({self.get_tps():.1f} tx/s)")
 
-    logger.debug(f"{len(transactions)} transactions have been prepared, in {len(chunks)} chunks of size {chunk_size}")
-    get_continue_confirmation(confirm_yes)
 
-    chunk_index = 0
-    hashes = []
-    for chunk in chunks:
-        logger.debug(f"... chunk {chunk_index} out of {len(chunks)}")
-
-        num_sent, sent_hashes = proxy.send_transactions(chunk)
-        if len(chunk) != num_sent:
-            logger.debug(f"sent {num_sent} instead of {len(chunk)}")
-
-        chunk_index += 1
-        hashes.extend([hash.hex() for hash in sent_hashes])
+def broadcast_transactions(transactions: List[Transaction], proxy: ProxyNetworkProvider,
+                           chunk_size: int, sleep: int = 0, confirm_yes: bool = False,
+                           tracker: Optional[TxStatusTracker] = None, rate: Optional[float] = None):
+    """Broadcasts through a TransactionBroadcaster. Unthrottled unless a rate (transactions per second) is given;
+    a sleep between chunks gives a rate of chunk_size / sleep. A given rate is lowered when the proxy throttles."""
+    logger.debug(f"{len(transactions)} transactions have been prepared, in chunks of size {chunk_size}")
+    get_continue_confirmation(confirm_yes)
 
-        if sleep is not None:
-            time.sleep(sleep)
+    if rate is None and sleep:
+        rate = chunk_size / sleep
+    broadcaster = TransactionBroadcaster(proxy, rate=rate, chunk_size=chunk_size, max_rate=rate or BROADCAST_MAX_RATE,
+                                         tracker=tracker)
+    hashes = broadcaster.broadcast(transactions)
 
     logger.debug(f"Hashes: {hashes}")
     return hashes